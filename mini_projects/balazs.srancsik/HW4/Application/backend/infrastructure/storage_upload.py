@@ -0,0 +1,285 @@
+"""
+Infrastructure layer - Storage upload subsystem.
+
+The Google Drive and pCloud SDKs are blocking. This module keeps those calls
+off the event loop so one large photo upload does not stall every other chat:
+- UploadWorkerPool runs blocking SDK calls in a bounded thread pool
+- FolderIdCache memoizes folder-ID lookups (find_folder / create_folder)
+- StorageUploader uploads several files in parallel with progress callbacks
+"""
+import asyncio
+import functools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_UPLOAD_WORKERS = 4
+DEFAULT_CHUNK_SIZE = 5 * 1024 * 1024  # 5 MB - multiple of 256 KB as required by Drive
+DEFAULT_FOLDER_CACHE_TTL = 600  # seconds
+
+
+@dataclass
+class UploadProgress:
+    """Progress snapshot of a single file upload."""
+    file_name: str
+    bytes_sent: int
+    total_bytes: int
+    done: bool = False
+
+    @property
+    def fraction(self) -> float:
+        """Uploaded fraction in the 0.0 - 1.0 range."""
+        if self.total_bytes <= 0:
+            return 1.0 if self.done else 0.0
+        return min(1.0, self.bytes_sent / self.total_bytes)
+
+
+ProgressCallback = Callable[[UploadProgress], None]
+
+
+def report_progress(
+    callback: Optional[ProgressCallback],
+    file_name: str,
+    bytes_sent: int,
+    total_bytes: int,
+    done: bool = False
+) -> None:
+    """Invoke a progress callback, never letting a faulty callback break the upload."""
+    if callback is None:
+        return
+    try:
+        callback(UploadProgress(file_name, bytes_sent, total_bytes, done))
+    except Exception as e:
+        logger.warning(f"Upload progress callback failed for '{file_name}': {e}")
+
+
+class UploadWorkerPool:
+    """
+    Bounded thread pool for blocking storage SDK calls.
+
+    Shared by the storage clients so the number of concurrent blocking
+    calls (and open HTTP connections) stays bounded regardless of how many
+    chats are uploading at the same time.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_UPLOAD_WORKERS):
+        """
+        Initialize the worker pool.
+
+        Args:
+            max_workers: Maximum number of blocking calls running at once
+        """
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the executor lazily (after fork / on first use)."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="storage-upload"
+                    )
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking callable in the pool and await its result."""
+        loop = asyncio.get_running_loop()
+        call = functools.partial(func, *args, **kwargs) if args or kwargs else func
+        return await loop.run_in_executor(self._get_executor(), call)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the underlying executor."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+
+
+_default_pool: Optional[UploadWorkerPool] = None
+
+
+def get_default_upload_pool() -> UploadWorkerPool:
+    """Return the process-wide upload pool shared by all storage clients."""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = UploadWorkerPool(
+            max_workers=int(os.getenv("STORAGE_UPLOAD_WORKERS", DEFAULT_UPLOAD_WORKERS))
+        )
+    return _default_pool
+
+
+class FolderIdCache:
+    """
+    TTL cache for folder lookups keyed by (parent folder ID, folder name).
+
+    Folder IDs never change once created, so caching the find_folder /
+    create_folder results removes a listing round trip from every upload.
+    Only positive results are cached - a missing folder may be created later.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_FOLDER_CACHE_TTL):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Tuple[Any, str], Tuple[float, Dict[str, Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, parent_folder_id: Any, folder_name: str) -> Optional[Dict[str, Any]]:
+        """Return the cached folder record or None if missing/expired."""
+        key = (parent_folder_id, folder_name)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        stored_at, record = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self.hits += 1
+        return dict(record)
+
+    def set(self, parent_folder_id: Any, folder_name: str, record: Dict[str, Any]) -> None:
+        """Store a folder record (must contain 'folder_id')."""
+        if record.get("folder_id") is None:
+            return
+        self._entries[(parent_folder_id, folder_name)] = (time.monotonic(), dict(record))
+
+    def invalidate(self, parent_folder_id: Any = None, folder_name: Optional[str] = None) -> None:
+        """Drop one entry, or everything when called without arguments."""
+        if folder_name is None:
+            self._entries.clear()
+        else:
+            self._entries.pop((parent_folder_id, folder_name), None)
+
+
+@dataclass
+class UploadJob:
+    """One file to upload - either from a path on disk or from bytes."""
+    file_name: str
+    mime_type: str = "image/jpeg"
+    file_path: Optional[str] = None
+    file_bytes: Optional[bytes] = None
+
+    @property
+    def size(self) -> int:
+        """Size of the payload in bytes (0 if unknown)."""
+        if self.file_bytes is not None:
+            return len(self.file_bytes)
+        if self.file_path:
+            try:
+                return os.path.getsize(self.file_path)
+            except OSError:
+                return 0
+        return 0
+
+
+@dataclass
+class UploadBatchResult:
+    """Results of a parallel upload, in the same order as the submitted jobs."""
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+    stopped_early: bool = False
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for r in self.results if r.get("success"))
+
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.succeeded
+
+
+def is_quota_error(result: Dict[str, Any]) -> bool:
+    """Whether an upload result reports an exhausted storage quota."""
+    return result.get("error_code") == 2008 or "quota" in str(result.get("error", "")).lower()
+
+
+class StorageUploader:
+    """
+    Uploads many files to one folder concurrently.
+
+    Works with any client exposing upload_file / upload_file_from_bytes with a
+    progress_callback keyword (GoogleDriveClient, PCloudClient, test fakes).
+    """
+
+    def __init__(self, client, max_concurrency: int = DEFAULT_UPLOAD_WORKERS):
+        """
+        Initialize the uploader.
+
+        Args:
+            client: Storage client to upload through
+            max_concurrency: Maximum number of files uploading at once
+        """
+        self.client = client
+        self.max_concurrency = max(1, max_concurrency)
+
+    async def upload_many(
+        self,
+        jobs: List[UploadJob],
+        folder_id: Any,
+        progress_callback: Optional[ProgressCallback] = None,
+        stop_on: Optional[Callable[[Dict[str, Any]], bool]] = is_quota_error
+    ) -> UploadBatchResult:
+        """
+        Upload all jobs into folder_id, at most max_concurrency at a time.
+
+        Args:
+            jobs: Files to upload
+            folder_id: Target folder ID
+            progress_callback: Called with UploadProgress for every file
+            stop_on: Predicate on a failed result; when it matches, jobs that have
+                     not started yet are skipped (e.g. storage quota exceeded)
+
+        Returns:
+            UploadBatchResult with one result dict per job, in job order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        stop_event = asyncio.Event()
+        started = time.perf_counter()
+
+        async def _upload(job: UploadJob) -> Dict[str, Any]:
+            async with semaphore:
+                if stop_event.is_set():
+                    return {
+                        "error": "Not attempted - storage quota exceeded",
+                        "not_attempted": True,
+                        "retryable": False
+                    }
+                try:
+                    if job.file_path:
+                        result = await self.client.upload_file(
+                            job.file_path, job.file_name, folder_id, job.mime_type,
+                            progress_callback=progress_callback
+                        )
+                    elif job.file_bytes is not None:
+                        result = await self.client.upload_file_from_bytes(
+                            job.file_bytes, job.file_name, folder_id, job.mime_type,
+                            progress_callback=progress_callback
+                        )
+                    else:
+                        result = {"error": "No file data provided", "retryable": False}
+                except Exception as e:
+                    logger.error(f"Exception uploading {job.file_name}: {e}", exc_info=True)
+                    result = {"error": str(e), "retryable": False}
+
+                if not result.get("success") and stop_on is not None and stop_on(result):
+                    logger.error("Stopping remaining uploads after fatal error: %s", result.get("error"))
+                    stop_event.set()
+                return result
+
+        results = await asyncio.gather(*[_upload(job) for job in jobs])
+        return UploadBatchResult(
+            results=list(results),
+            elapsed_seconds=time.perf_counter() - started,
+            stopped_early=stop_event.is_set()
+        )
@@ -3,6 +3,8 @@ Infrastructure layer - External API client implementations.
 Following SOLID: Single Responsibility - each client handles one external service.
 Open/Closed Principle - easy to add new tool clients without modifying existing ones.
 """
+import asyncio
+import threading
 import httpx
 from typing import Dict, Any, Optional, List
 from pathlib import Path
@@ -11,6 +13,10 @@ from domain.interfaces import (
     IFXRatesClient, ICryptoPriceClient, IRadioBrowserClient,
     IDocumentsRAGClient, IGoogleDriveClient
 )
+from infrastructure.storage_upload import (
+    DEFAULT_CHUNK_SIZE, FolderIdCache, ProgressCallback, UploadWorkerPool,
+    get_default_upload_pool, report_progress
+)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -1235,7 +1241,15 @@ class GoogleDriveClient(IGoogleDriveClient):
     
     SCOPES = ['https://www.googleapis.com/auth/drive']
     
-    def __init__(self, credentials_json: str, photo_memories_folder_id: Optional[str] = None, impersonated_user_email: Optional[str] = None):
+    def __init__(
+        self,
+        credentials_json: str,
+        photo_memories_folder_id: Optional[str] = None,
+        impersonated_user_email: Optional[str] = None,
+        upload_pool: Optional[UploadWorkerPool] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        folder_cache: Optional[FolderIdCache] = None
+    ):
         """
         Initialize Google Drive client.
         
@@ -1244,12 +1258,19 @@ class GoogleDriveClient(IGoogleDriveClient):
             photo_memories_folder_id: Optional ID of the Photo_Memories folder. If not provided,
                                      the client will search for it by name.
             impersonated_user_email: Optional email of the user to impersonate (requires domain-wide delegation).
+            upload_pool: Worker pool for blocking Drive API calls (defaults to the shared pool)
+            chunk_size: Resumable upload chunk size in bytes (multiple of 256 KB)
+            folder_cache: Cache for folder-ID lookups (defaults to a private cache)
         """
         self.credentials_json = credentials_json
         self._photo_memories_folder_id = photo_memories_folder_id
         self.impersonated_user_email = impersonated_user_email
         self._service = None
         self._initialized = False
+        self._pool = upload_pool or get_default_upload_pool()
+        self.chunk_size = chunk_size
+        self._folder_cache = folder_cache or FolderIdCache()
+        self._folder_lock = asyncio.Lock()
     
     def _initialize(self):
         """Initialize the Google Drive service (lazy loading)."""
@@ -1288,29 +1309,39 @@ class GoogleDriveClient(IGoogleDriveClient):
             logger.error(f"Failed to initialize Google Drive client: {e}", exc_info=True)
             raise
     
+    async def _ensure_initialized(self):
+        """Initialize the Drive service without blocking the event loop."""
+        if not self._initialized:
+            await self._pool.run(self._initialize)
+    
     async def _ensure_photo_memories_folder(self) -> str:
         """Ensure Photo_Memories folder exists and return its ID."""
         if self._photo_memories_folder_id:
             return self._photo_memories_folder_id
         
-        # Search for existing Photo_Memories folder
-        result = await self.find_folder("Photo_Memories")
-        if result.get("found"):
-            self._photo_memories_folder_id = result["folder_id"]
-            return self._photo_memories_folder_id
-        
-        # Create the folder if it doesn't exist
-        result = await self.create_folder("Photo_Memories")
-        if result.get("success"):
-            self._photo_memories_folder_id = result["folder_id"]
-            return self._photo_memories_folder_id
+        # Serialize concurrent callers so the folder is never created twice
+        async with self._folder_lock:
+            if self._photo_memories_folder_id:
+                return self._photo_memories_folder_id
+            
+            # Search for existing Photo_Memories folder
+            result = await self.find_folder("Photo_Memories")
+            if result.get("found"):
+                self._photo_memories_folder_id = result["folder_id"]
+                return self._photo_memories_folder_id
+            
+            # Create the folder if it doesn't exist
+            result = await self.create_folder("Photo_Memories")
+            if result.get("success"):
+                self._photo_memories_folder_id = result["folder_id"]
+                return self._photo_memories_folder_id
         
         raise Exception("Failed to create or find Photo_Memories folder")
     
     async def create_folder(self, folder_name: str, parent_folder_id: Optional[str] = None) -> Dict[str, Any]:
         """Create a folder in Google Drive."""
         try:
-            self._initialize()
+            await self._ensure_initialized()
             
             file_metadata = {
                 'name': folder_name,
@@ -1320,14 +1351,22 @@ class GoogleDriveClient(IGoogleDriveClient):
             if parent_folder_id:
                 file_metadata['parents'] = [parent_folder_id]
             
-            folder = self._service.files().create(
+            request = self._service.files().create(
                 body=file_metadata,
                 fields='id, name, webViewLink',
                 supportsAllDrives=True
-            ).execute()
+            )
+            folder = await self._pool.run(request.execute)
             
             logger.info(f"Created folder '{folder_name}' with ID: {folder.get('id')}")
             
+            self._folder_cache.set(parent_folder_id, folder_name, {
+                "found": True,
+                "folder_id": folder.get('id'),
+                "folder_name": folder.get('name'),
+                "web_link": folder.get('webViewLink')
+            })
+            
             return {
                 "success": True,
                 "folder_id": folder.get('id'),
@@ -1339,107 +1378,141 @@ class GoogleDriveClient(IGoogleDriveClient):
             logger.error(f"Failed to create folder: {e}", exc_info=True)
             return {"error": str(e)}
     
-    async def upload_file(self, file_path: str, file_name: str, folder_id: str, mime_type: str = "image/jpeg") -> Dict[str, Any]:
+    async def _upload_media(
+        self,
+        media,
+        file_name: str,
+        folder_id: str,
+        total_bytes: int,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Drive a chunked resumable upload session to completion.
+        
+        Each chunk is sent from the worker pool; googleapiclient keeps the session
+        URI, so a failed chunk is retried from the last acknowledged byte instead of
+        restarting the whole file.
+        """
+        file_metadata = {
+            'name': file_name,
+            'parents': [folder_id]
+        }
+        
+        request = self._service.files().create(
+            body=file_metadata,
+            media_body=media,
+            fields='id, name, webViewLink, size',
+            supportsAllDrives=True
+        )
+        
+        report_progress(progress_callback, file_name, 0, total_bytes)
+        file = None
+        while file is None:
+            status, file = await self._pool.run(request.next_chunk, num_retries=3)
+            if status is not None:
+                report_progress(progress_callback, file_name, status.resumable_progress, total_bytes)
+        report_progress(progress_callback, file_name, total_bytes, total_bytes, done=True)
+        
+        logger.info(f"Uploaded file '{file_name}' with ID: {file.get('id')}")
+        
+        return {
+            "success": True,
+            "file_id": file.get('id'),
+            "file_name": file.get('name'),
+            "web_link": file.get('webViewLink'),
+            "size": file.get('size')
+        }
+    
+    async def upload_file(
+        self,
+        file_path: str,
+        file_name: str,
+        folder_id: str,
+        mime_type: str = "image/jpeg",
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
         """Upload a file to a specific folder in Google Drive."""
         try:
-            self._initialize()
+            await self._ensure_initialized()
             from googleapiclient.http import MediaFileUpload
-            
-            file_metadata = {
-                'name': file_name,
-                'parents': [folder_id]
-            }
+            import os
             
             media = MediaFileUpload(
                 file_path,
                 mimetype=mime_type,
+                chunksize=self.chunk_size,
                 resumable=True
             )
             
-            file = self._service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id, name, webViewLink, size',
-                supportsAllDrives=True
-            ).execute()
-            
-            logger.info(f"Uploaded file '{file_name}' with ID: {file.get('id')}")
-            
-            return {
-                "success": True,
-                "file_id": file.get('id'),
-                "file_name": file.get('name'),
-                "web_link": file.get('webViewLink'),
-                "size": file.get('size')
-            }
+            return await self._upload_media(
+                media, file_name, folder_id, os.path.getsize(file_path), progress_callback
+            )
             
         except Exception as e:
             logger.error(f"Failed to upload file: {e}", exc_info=True)
             return {"error": str(e)}
     
-    async def upload_file_from_bytes(self, file_bytes: bytes, file_name: str, folder_id: str, mime_type: str = "image/jpeg") -> Dict[str, Any]:
+    async def upload_file_from_bytes(
+        self,
+        file_bytes: bytes,
+        file_name: str,
+        folder_id: str,
+        mime_type: str = "image/jpeg",
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
         """Upload a file from bytes to a specific folder in Google Drive."""
         try:
-            self._initialize()
+            await self._ensure_initialized()
             from googleapiclient.http import MediaInMemoryUpload
             
-            file_metadata = {
-                'name': file_name,
-                'parents': [folder_id]
-            }
-            
             media = MediaInMemoryUpload(
                 file_bytes,
                 mimetype=mime_type,
+                chunksize=self.chunk_size,
                 resumable=True
             )
             
-            file = self._service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id, name, webViewLink, size'
-            ).execute()
-            
-            logger.info(f"Uploaded file '{file_name}' with ID: {file.get('id')}")
-            
-            return {
-                "success": True,
-                "file_id": file.get('id'),
-                "file_name": file.get('name'),
-                "web_link": file.get('webViewLink'),
-                "size": file.get('size')
-            }
+            return await self._upload_media(
+                media, file_name, folder_id, len(file_bytes), progress_callback
+            )
             
         except Exception as e:
             logger.error(f"Failed to upload file from bytes: {e}", exc_info=True)
             return {"error": str(e)}
     
     async def find_folder(self, folder_name: str, parent_folder_id: Optional[str] = None) -> Dict[str, Any]:
-        """Find a folder by name in Google Drive."""
+        """Find a folder by name in Google Drive (cached by parent and name)."""
+        cached = self._folder_cache.get(parent_folder_id, folder_name)
+        if cached is not None:
+            return cached
+        
         try:
-            self._initialize()
+            await self._ensure_initialized()
             
             query = f"name = '{folder_name}' and mimeType = 'application/vnd.google-apps.folder' and trashed = false"
             if parent_folder_id:
                 query += f" and '{parent_folder_id}' in parents"
             
-            results = self._service.files().list(
+            request = self._service.files().list(
                 q=query,
                 spaces='drive',
                 fields='files(id, name, webViewLink)'
-            ).execute()
+            )
+            results = await self._pool.run(request.execute)
             
             files = results.get('files', [])
             
             if files:
                 folder = files[0]
                 logger.info(f"Found folder '{folder_name}' with ID: {folder.get('id')}")
-                return {
+                result = {
                     "found": True,
                     "folder_id": folder.get('id'),
                     "folder_name": folder.get('name'),
                     "web_link": folder.get('webViewLink')
                 }
+                self._folder_cache.set(parent_folder_id, folder_name, result)
+                return result
             else:
                 logger.info(f"Folder '{folder_name}' not found")
                 return {"found": False}
@@ -1451,16 +1524,17 @@ class GoogleDriveClient(IGoogleDriveClient):
     async def list_folder_contents(self, folder_id: str) -> Dict[str, Any]:
         """List contents of a folder in Google Drive."""
         try:
-            self._initialize()
+            await self._ensure_initialized()
             
             query = f"'{folder_id}' in parents and trashed = false"
             
-            results = self._service.files().list(
+            request = self._service.files().list(
                 q=query,
                 spaces='drive',
                 fields='files(id, name, mimeType, webViewLink, size, createdTime)',
                 orderBy='name'
-            ).execute()
+            )
+            results = await self._pool.run(request.execute)
             
             files = results.get('files', [])
             
@@ -1493,7 +1567,7 @@ class GoogleDriveClient(IGoogleDriveClient):
     async def get_folder_structure(self, folder_id: str) -> Dict[str, Any]:
         """Get the folder structure recursively (folders only, one level deep for subfolders)."""
         try:
-            self._initialize()
+            await self._ensure_initialized()
             
             # Get immediate contents
             contents = await self.list_folder_contents(folder_id)
@@ -1560,11 +1634,19 @@ class PCloudClient:
     or PCLOUD_ACCESS_TOKEN for OAuth.
     
     Implements retry logic with exponential backoff for transient failures.
+    Blocking SDK calls run in a bounded worker pool, and files larger than one
+    chunk are sent through resumable upload sessions (upload_create /
+    upload_write / upload_save) so a failed chunk does not restart the file.
     """
     
     MAX_RETRIES = 3
     INITIAL_RETRY_DELAY = 2  # seconds
     MAX_RETRY_DELAY = 30  # seconds
+    REQUEST_TIMEOUT = 60  # seconds per chunk request
+    ENDPOINT_URLS = {
+        "api": "https://api.pcloud.com/",
+        "eapi": "https://eapi.pcloud.com/",
+    }
     
     def __init__(
         self,
@@ -1572,7 +1654,10 @@ class PCloudClient:
         password: Optional[str] = None,
         access_token: Optional[str] = None,
         photo_memories_folder_id: Optional[int] = None,
-        endpoint: str = "eapi"
+        endpoint: str = "eapi",
+        upload_pool: Optional[UploadWorkerPool] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        folder_cache: Optional[FolderIdCache] = None
     ):
         """
         Initialize pCloud client.
@@ -1583,6 +1668,9 @@ class PCloudClient:
             access_token: OAuth access token (alternative to username/password)
             photo_memories_folder_id: Optional ID of the Photo_Memories folder.
             endpoint: API endpoint - 'api' for US, 'eapi' for Europe, 'nearest' for auto
+            upload_pool: Worker pool for blocking pCloud calls (defaults to the shared pool)
+            chunk_size: Upload session chunk size in bytes; smaller files use a single request
+            folder_cache: Cache for folder-ID lookups (defaults to a private cache)
         """
         self.username = username
         self.password = password
@@ -1592,6 +1680,11 @@ class PCloudClient:
         self._client = None
         self._initialized = False
         self._auth_validated = False
+        self._pool = upload_pool or get_default_upload_pool()
+        self.chunk_size = chunk_size
+        self._folder_cache = folder_cache or FolderIdCache()
+        self._folder_lock = asyncio.Lock()
+        self._http = threading.local()
     
     def _initialize(self):
         """Initialize the pCloud client (lazy loading)."""
@@ -1668,34 +1761,45 @@ class PCloudClient:
             logger.error(f"Authentication validation failed: {e}")
             raise ValueError(f"Failed to validate pCloud credentials: {e}")
     
+    async def _ensure_initialized(self):
+        """Log in and validate credentials without blocking the event loop."""
+        if not self._initialized:
+            await self._pool.run(self._initialize)
+    
     async def _ensure_photo_memories_folder(self) -> int:
         """Ensure Photo_Memories folder exists and return its ID."""
         if self._photo_memories_folder_id:
             return self._photo_memories_folder_id
         
-        # Search for existing Photo_Memories folder in root
-        result = await self.find_folder("Photo_Memories", parent_folder_id=0)
-        if result.get("found"):
-            self._photo_memories_folder_id = result["folder_id"]
-            return self._photo_memories_folder_id
-        
-        # Create the folder if it doesn't exist
-        result = await self.create_folder("Photo_Memories", parent_folder_id=0)
-        if result.get("success"):
-            self._photo_memories_folder_id = result["folder_id"]
-            return self._photo_memories_folder_id
+        # Serialize concurrent callers so the folder is never created twice
+        async with self._folder_lock:
+            if self._photo_memories_folder_id:
+                return self._photo_memories_folder_id
+            
+            # Search for existing Photo_Memories folder in root
+            result = await self.find_folder("Photo_Memories", parent_folder_id=0)
+            if result.get("found"):
+                self._photo_memories_folder_id = result["folder_id"]
+                return self._photo_memories_folder_id
+            
+            # Create the folder if it doesn't exist
+            result = await self.create_folder("Photo_Memories", parent_folder_id=0)
+            if result.get("success"):
+                self._photo_memories_folder_id = result["folder_id"]
+                return self._photo_memories_folder_id
         
         raise Exception("Failed to create or find Photo_Memories folder")
     
     async def create_folder(self, folder_name: str, parent_folder_id: Optional[int] = None) -> Dict[str, Any]:
         """Create a folder in pCloud."""
         try:
-            self._initialize()
+            await self._ensure_initialized()
             
             parent_id = parent_folder_id if parent_folder_id is not None else 0
             
             # Use createfolderifnotexists to avoid errors if folder already exists
-            result = self._client.createfolderifnotexists(
+            result = await self._pool.run(
+                self._client.createfolderifnotexists,
                 name=folder_name,
                 folderid=parent_id
             )
@@ -1707,6 +1811,13 @@ class PCloudClient:
                 
                 logger.info(f"Created/found folder '{folder_name}' with ID: {folder_id}")
                 
+                self._folder_cache.set(parent_id, folder_name, {
+                    "found": True,
+                    "folder_id": folder_id,
+                    "folder_name": metadata.get('name'),
+                    "path": folder_path
+                })
+                
                 return {
                     "success": True,
                     "folder_id": folder_id,
@@ -1733,16 +1844,18 @@ class PCloudClient:
         return any(keyword in error_str for keyword in retryable_keywords)
     
     async def _retry_with_backoff(self, operation, operation_name: str, *args, **kwargs):
-        """Execute operation with exponential backoff retry logic."""
-        import asyncio
-        import time
+        """Execute operation with exponential backoff retry logic.
         
+        Blocking (non-coroutine) operations are run in the upload worker pool.
+        """
         last_exception = None
         delay = self.INITIAL_RETRY_DELAY
         
         for attempt in range(self.MAX_RETRIES):
             try:
-                return await operation(*args, **kwargs) if asyncio.iscoroutinefunction(operation) else operation(*args, **kwargs)
+                if asyncio.iscoroutinefunction(operation):
+                    return await operation(*args, **kwargs)
+                return await self._pool.run(operation, *args, **kwargs)
             except Exception as e:
                 last_exception = e
                 
@@ -1755,116 +1868,246 @@ class PCloudClient:
         
         raise last_exception
     
-    async def upload_file(self, file_path: str, file_name: str, folder_id: int, mime_type: str = "image/jpeg") -> Dict[str, Any]:
+    def _api_base_url(self) -> str:
+        """Base URL of the API host the SDK client is bound to."""
+        client_endpoint = getattr(self._client, 'endpoint', None)
+        if isinstance(client_endpoint, str) and client_endpoint.startswith('http'):
+            return client_endpoint if client_endpoint.endswith('/') else client_endpoint + '/'
+        return self.ENDPOINT_URLS.get(self.endpoint, self.ENDPOINT_URLS["eapi"])
+    
+    def _auth_params(self) -> Optional[Dict[str, str]]:
+        """Auth query parameters for raw API calls, or None if unavailable."""
+        auth_token = getattr(self._client, 'auth_token', None)
+        if auth_token:
+            return {"auth": auth_token}
+        if self.access_token:
+            return {"access_token": self.access_token}
+        return None
+    
+    def _session_call(self, method: str, params: Dict[str, Any], data: Optional[bytes] = None) -> Dict[str, Any]:
+        """Blocking call to an upload-session API method (runs in the worker pool)."""
+        import requests
+        
+        session = getattr(self._http, 'session', None)
+        if session is None:
+            session = requests.Session()
+            self._http.session = session
+        
+        response = session.request(
+            "PUT" if data is not None else "GET",
+            self._api_base_url() + method,
+            params={**(self._auth_params() or {}), **params},
+            data=data,
+            timeout=self.REQUEST_TIMEOUT
+        )
+        response.raise_for_status()
+        result = response.json()
+        if result.get('result') != 0:
+            raise RuntimeError(f"pCloud {method} failed (code {result.get('result')}): {result.get('error', result)}")
+        return result
+    
+    async def _chunked_upload(
+        self,
+        read_chunk,
+        total_bytes: int,
+        file_name: str,
+        folder_id: int,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Upload through a resumable pCloud upload session.
+        
+        Args:
+            read_chunk: Blocking callable (offset, length) -> bytes
+            total_bytes: Total payload size
+            file_name: Name of the file to create
+            folder_id: Target folder ID
+            progress_callback: Called after every acknowledged chunk
+        
+        Returns:
+            Raw API result in the same shape as the SDK's uploadfile
+        """
+        created = await self._retry_with_backoff(
+            self._session_call, f"Create upload session for '{file_name}'", "upload_create", {}
+        )
+        upload_id = created['uploadid']
+        offset = 0
+        
+        while offset < total_bytes:
+            chunk = await self._pool.run(read_chunk, offset, self.chunk_size)
+            delay = self.INITIAL_RETRY_DELAY
+            for attempt in range(self.MAX_RETRIES):
+                try:
+                    await self._pool.run(
+                        self._session_call, "upload_write",
+                        {"uploadid": upload_id, "uploadoffset": offset}, chunk
+                    )
+                    offset += len(chunk)
+                    break
+                except Exception as e:
+                    if not self._is_retryable_error(e) or attempt == self.MAX_RETRIES - 1:
+                        raise
+                    logger.warning(f"Chunk at offset {offset} of '{file_name}' failed (attempt {attempt + 1}/{self.MAX_RETRIES}): {e}. Resuming in {delay}s...")
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self.MAX_RETRY_DELAY)
+                    # Resume from what the server actually received
+                    info = await self._pool.run(self._session_call, "upload_info", {"uploadid": upload_id})
+                    received = int(info.get('size', offset))
+                    if received != offset:
+                        offset = received
+                        break
+            report_progress(progress_callback, file_name, offset, total_bytes)
+        
+        saved = await self._retry_with_backoff(
+            self._session_call, f"Save upload session for '{file_name}'", "upload_save",
+            {"uploadid": upload_id, "name": file_name, "folderid": folder_id}
+        )
+        metadata = saved.get('metadata')
+        return {"result": 0, "metadata": [metadata] if isinstance(metadata, dict) else (metadata or [])}
+    
+    def _build_upload_response(self, result: Dict[str, Any], file_name: str) -> Dict[str, Any]:
+        """Convert a raw upload API result into the tool response format."""
+        if result.get('result') == 0:
+            metadata_list = result.get('metadata', [])
+            if metadata_list:
+                file_metadata = metadata_list[0]
+                file_id = file_metadata.get('fileid')
+                
+                logger.info(f"Uploaded file '{file_name}' with ID: {file_id}")
+                
+                return {
+                    "success": True,
+                    "file_id": file_id,
+                    "file_name": file_metadata.get('name'),
+                    "path": file_metadata.get('path'),
+                    "size": file_metadata.get('size')
+                }
+            else:
+                return {"error": "No metadata returned from upload"}
+        else:
+            error_code = result.get('result')
+            if error_code == 2008:
+                return {"error": "Storage quota exceeded", "error_code": error_code}
+            elif error_code == 2009:
+                return {"error": "File already exists", "error_code": error_code}
+            else:
+                error_msg = f"pCloud upload error (code {error_code}): {result}"
+                logger.error(error_msg)
+                return {"error": error_msg, "error_code": error_code}
+    
+    async def upload_file(
+        self,
+        file_path: str,
+        file_name: str,
+        folder_id: int,
+        mime_type: str = "image/jpeg",
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
         """Upload a file to a specific folder in pCloud with retry logic."""
         try:
-            self._initialize()
+            await self._ensure_initialized()
+            import os
             
-            # Upload file using the pcloud library with retry
-            result = await self._retry_with_backoff(
-                lambda: self._client.uploadfile(files=[file_path], folderid=folder_id),
-                f"Upload file '{file_name}'"
-            )
+            total_bytes = os.path.getsize(file_path)
+            report_progress(progress_callback, file_name, 0, total_bytes)
             
-            if result.get('result') == 0:
-                metadata_list = result.get('metadata', [])
-                if metadata_list:
-                    file_metadata = metadata_list[0]
-                    file_id = file_metadata.get('fileid')
-                    
-                    logger.info(f"Uploaded file '{file_name}' with ID: {file_id}")
-                    
-                    return {
-                        "success": True,
-                        "file_id": file_id,
-                        "file_name": file_metadata.get('name'),
-                        "path": file_metadata.get('path'),
-                        "size": file_metadata.get('size')
-                    }
-                else:
-                    return {"error": "No metadata returned from upload"}
+            if total_bytes > self.chunk_size and self._auth_params():
+                def read_chunk(offset: int, length: int) -> bytes:
+                    with open(file_path, 'rb') as f:
+                        f.seek(offset)
+                        return f.read(length)
+                
+                result = await self._chunked_upload(
+                    read_chunk, total_bytes, file_name, folder_id, progress_callback
+                )
             else:
-                error_code = result.get('result')
-                if error_code == 2008:
-                    return {"error": "Storage quota exceeded", "error_code": error_code}
-                elif error_code == 2009:
-                    return {"error": "File already exists", "error_code": error_code}
-                else:
-                    error_msg = f"pCloud upload error (code {error_code}): {result}"
-                    logger.error(error_msg)
-                    return {"error": error_msg, "error_code": error_code}
+                # Small file: a single request is cheaper than a session
+                result = await self._retry_with_backoff(
+                    lambda: self._client.uploadfile(files=[file_path], folderid=folder_id),
+                    f"Upload file '{file_name}'"
+                )
+            
+            response = self._build_upload_response(result, file_name)
+            if response.get("success"):
+                report_progress(progress_callback, file_name, total_bytes, total_bytes, done=True)
+            return response
             
         except Exception as e:
             logger.error(f"Failed to upload file: {e}", exc_info=True)
             return {"error": str(e), "retryable": self._is_retryable_error(e)}
     
-    async def upload_file_from_bytes(self, file_bytes: bytes, file_name: str, folder_id: int, mime_type: str = "image/jpeg") -> Dict[str, Any]:
+    async def upload_file_from_bytes(
+        self,
+        file_bytes: bytes,
+        file_name: str,
+        folder_id: int,
+        mime_type: str = "image/jpeg",
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
         """Upload a file from bytes to a specific folder in pCloud with retry logic."""
         try:
-            self._initialize()
+            await self._ensure_initialized()
             
-            # Upload file data directly with retry
-            result = await self._retry_with_backoff(
-                lambda: self._client.uploadfile(data=file_bytes, filename=file_name, folderid=folder_id),
-                f"Upload file '{file_name}' from bytes"
-            )
+            total_bytes = len(file_bytes)
+            report_progress(progress_callback, file_name, 0, total_bytes)
             
-            if result.get('result') == 0:
-                metadata_list = result.get('metadata', [])
-                if metadata_list:
-                    file_metadata = metadata_list[0]
-                    file_id = file_metadata.get('fileid')
-                    
-                    logger.info(f"Uploaded file '{file_name}' with ID: {file_id}")
-                    
-                    return {
-                        "success": True,
-                        "file_id": file_id,
-                        "file_name": file_metadata.get('name'),
-                        "path": file_metadata.get('path'),
-                        "size": file_metadata.get('size')
-                    }
-                else:
-                    return {"error": "No metadata returned from upload"}
+            if total_bytes > self.chunk_size and self._auth_params():
+                view = memoryview(file_bytes)
+                result = await self._chunked_upload(
+                    lambda offset, length: bytes(view[offset:offset + length]),
+                    total_bytes, file_name, folder_id, progress_callback
+                )
             else:
-                error_code = result.get('result')
-                if error_code == 2008:
-                    return {"error": "Storage quota exceeded", "error_code": error_code}
-                elif error_code == 2009:
-                    return {"error": "File already exists", "error_code": error_code}
-                else:
-                    error_msg = f"pCloud upload error (code {error_code}): {result}"
-                    logger.error(error_msg)
-                    return {"error": error_msg, "error_code": error_code}
+                # Upload file data directly with retry
+                result = await self._retry_with_backoff(
+                    lambda: self._client.uploadfile(data=file_bytes, filename=file_name, folderid=folder_id),
+                    f"Upload file '{file_name}' from bytes"
+                )
+            
+            response = self._build_upload_response(result, file_name)
+            if response.get("success"):
+                report_progress(progress_callback, file_name, total_bytes, total_bytes, done=True)
+            return response
             
         except Exception as e:
             logger.error(f"Failed to upload file from bytes: {e}", exc_info=True)
             return {"error": str(e), "retryable": self._is_retryable_error(e)}
     
     async def find_folder(self, folder_name: str, parent_folder_id: Optional[int] = None) -> Dict[str, Any]:
-        """Find a folder by name in pCloud."""
+        """Find a folder by name in pCloud (cached by parent and name)."""
+        parent_id = parent_folder_id if parent_folder_id is not None else 0
+        
+        cached = self._folder_cache.get(parent_id, folder_name)
+        if cached is not None:
+            return cached
+        
         try:
-            self._initialize()
-            
-            parent_id = parent_folder_id if parent_folder_id is not None else 0
+            await self._ensure_initialized()
             
             # List contents of parent folder
-            result = self._client.listfolder(folderid=parent_id)
+            result = await self._pool.run(self._client.listfolder, folderid=parent_id)
             
             if result.get('result') == 0:
                 metadata = result.get('metadata', {})
                 contents = metadata.get('contents', [])
                 
+                found = None
                 for item in contents:
-                    if item.get('isfolder') and item.get('name') == folder_name:
-                        folder_id = item.get('folderid')
-                        logger.info(f"Found folder '{folder_name}' with ID: {folder_id}")
-                        return {
+                    if item.get('isfolder'):
+                        record = {
                             "found": True,
-                            "folder_id": folder_id,
+                            "folder_id": item.get('folderid'),
                             "folder_name": item.get('name'),
                             "path": item.get('path')
                         }
+                        # One listing warms the cache for every sibling folder
+                        self._folder_cache.set(parent_id, item.get('name'), record)
+                        if found is None and item.get('name') == folder_name:
+                            found = record
+                
+                if found is not None:
+                    logger.info(f"Found folder '{folder_name}' with ID: {found['folder_id']}")
+                    return found
                 
                 logger.info(f"Folder '{folder_name}' not found in parent {parent_id}")
                 return {"found": False}
@@ -1880,9 +2123,9 @@ class PCloudClient:
     async def list_folder_contents(self, folder_id: int) -> Dict[str, Any]:
         """List contents of a folder in pCloud."""
         try:
-            self._initialize()
+            await self._ensure_initialized()
             
-            result = self._client.listfolder(folderid=folder_id)
+            result = await self._pool.run(self._client.listfolder, folderid=folder_id)
             
             if result.get('result') == 0:
                 metadata = result.get('metadata', {})
@@ -1920,7 +2163,7 @@ class PCloudClient:
     async def get_folder_structure(self, folder_id: int) -> Dict[str, Any]:
         """Get the folder structure (folders only, one level deep)."""
         try:
-            self._initialize()
+            await self._ensure_initialized()
             
             contents = await self.list_folder_contents(folder_id)
             if "error" in contents:
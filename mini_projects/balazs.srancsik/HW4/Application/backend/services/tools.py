@@ -14,6 +14,9 @@ from domain.interfaces import (
     IFXRatesClient, ICryptoPriceClient, IConversationRepository,
     IRadioBrowserClient, IDocumentsRAGClient
 )
+from infrastructure.storage_upload import (
+    DEFAULT_UPLOAD_WORKERS, ProgressCallback, StorageUploader, UploadJob, is_quota_error
+)
 
 logger = logging.getLogger(__name__)
 
@@ -890,16 +893,26 @@ class PhotoUploadTool:
     - Lists the folder structure after upload
     """
     
-    def __init__(self, cloud_client, tickets_folder_id: Optional[int] = None):
+    def __init__(
+        self,
+        cloud_client,
+        tickets_folder_id: Optional[int] = None,
+        max_parallel_uploads: int = DEFAULT_UPLOAD_WORKERS,
+        progress_callback: Optional[ProgressCallback] = None
+    ):
         """
         Initialize PhotoUploadTool.
         
         Args:
             cloud_client: PCloudClient instance for cloud storage operations
             tickets_folder_id: ID of the Tickets folder in pCloud
+            max_parallel_uploads: Maximum number of attachments uploaded at once
+            progress_callback: Optional callback receiving UploadProgress updates
         """
         self.drive_client = cloud_client
         self.tickets_folder_id = tickets_folder_id
+        self.max_parallel_uploads = max_parallel_uploads
+        self.progress_callback = progress_callback
         self.name = "photo_upload"
         self.description = """Upload photos to pCloud Tickets folder.
 This tool is used when the user has attached files/photos to upload.
@@ -1178,7 +1191,7 @@ Parameters:
                     event_folder_id = folder_result["folder_id"]
                     logger.info(f"Created new ticket folder: {folder_name} with ID: {event_folder_id}")
                 
-                # Upload files with improved error tracking
+                # Upload files in parallel with improved error tracking
                 uploaded_files = []
                 failed_files = []
                 quota_exceeded = False
@@ -1196,89 +1209,52 @@ Parameters:
                 logger.info(f"Starting upload of {num_files} files to folder {event_folder_id}")
                 logger.info(f"file_paths count: {len(file_paths) if file_paths else 0}, file_data count: {len(file_data) if file_data else 0}, file_names count: {len(file_names)}")
                 
+                jobs = []
                 for i in range(num_files):
                     file_name = file_names[i] if i < len(file_names) else f"photo_{i+1}.jpg"
-                    mime_type = self._get_mime_type(file_name)
-                    
-                    # Get file size for reporting
-                    file_size = 0
-                    try:
-                        if file_paths and i < len(file_paths):
-                            import os
-                            file_size = os.path.getsize(file_paths[i])
-                        elif file_data and i < len(file_data):
-                            file_size = len(file_data[i])
-                    except:
-                        pass
-                    
-                    try:
-                        if file_paths and i < len(file_paths):
-                            # Upload from file path
-                            result = await self.drive_client.upload_file(
-                                file_paths[i],
-                                file_name,
-                                event_folder_id,
-                                mime_type
-                            )
-                        elif file_data and i < len(file_data):
-                            # Upload from bytes
-                            result = await self.drive_client.upload_file_from_bytes(
-                                file_data[i],
-                                file_name,
-                                event_folder_id,
-                                mime_type
-                            )
-                        else:
-                            continue
+                    if file_paths and i < len(file_paths):
+                        jobs.append(UploadJob(file_name, self._get_mime_type(file_name), file_path=file_paths[i]))
+                    elif file_data and i < len(file_data):
+                        jobs.append(UploadJob(file_name, self._get_mime_type(file_name), file_bytes=file_data[i]))
+                
+                batch = await StorageUploader(self.drive_client, self.max_parallel_uploads).upload_many(
+                    jobs, event_folder_id, progress_callback=self.progress_callback
+                )
+                logger.info(f"Uploaded {batch.succeeded}/{len(jobs)} files in {batch.elapsed_seconds:.2f}s")
+                
+                for job, result in zip(jobs, batch.results):
+                    file_size = job.size
+                    if result.get("success"):
+                        uploaded_files.append({
+                            "name": job.file_name,
+                            "id": result.get("file_id"),
+                            "size": result.get("size", file_size),
+                            "web_link": result.get("web_link")
+                        })
+                        logger.info(f"Uploaded: {job.file_name} ({file_size/1024:.1f} KB)")
+                    elif result.get("not_attempted"):
+                        failed_files.append({
+                            "name": job.file_name,
+                            "size": 0,
+                            "error": result["error"],
+                            "retryable": False
+                        })
+                    else:
+                        error_msg = result.get("error", "Unknown error")
+                        error_code = result.get("error_code")
+                        
+                        # Check for quota exceeded
+                        if is_quota_error(result):
+                            quota_exceeded = True
                         
-                        if result.get("success"):
-                            uploaded_files.append({
-                                "name": file_name,
-                                "id": result.get("file_id"),
-                                "size": result.get("size", file_size),
-                                "web_link": result.get("web_link")
-                            })
-                            logger.info(f"Uploaded: {file_name} ({file_size/1024:.1f} KB)")
-                        else:
-                            error_msg = result.get("error", "Unknown error")
-                            error_code = result.get("error_code")
-                            is_retryable = result.get("retryable", False)
-                            
-                            # Check for quota exceeded
-                            if error_code == 2008 or "quota" in error_msg.lower():
-                                quota_exceeded = True
-                            
-                            failed_files.append({
-                                "name": file_name,
-                                "size": file_size,
-                                "error": error_msg,
-                                "error_code": error_code,
-                                "retryable": is_retryable
-                            })
-                            logger.error(f"Failed to upload {file_name}: {error_msg} (code: {error_code})")
-                            
-                            # Stop if quota exceeded
-                            if quota_exceeded:
-                                logger.error("Storage quota exceeded, stopping upload")
-                                # Mark remaining files as not attempted
-                                for j in range(i + 1, num_files):
-                                    remaining_name = file_names[j] if j < len(file_names) else f"photo_{j+1}.jpg"
-                                    failed_files.append({
-                                        "name": remaining_name,
-                                        "size": 0,
-                                        "error": "Not attempted - storage quota exceeded",
-                                        "retryable": False
-                                    })
-                                break
-                    
-                    except Exception as e:
                         failed_files.append({
-                            "name": file_name,
+                            "name": job.file_name,
                             "size": file_size,
-                            "error": str(e),
-                            "retryable": False
+                            "error": error_msg,
+                            "error_code": error_code,
+                            "retryable": result.get("retryable", False)
                         })
-                        logger.error(f"Exception uploading {file_name}: {e}", exc_info=True)
+                        logger.error(f"Failed to upload {job.file_name}: {error_msg} (code: {error_code})")
                 
                 # Get folder contents after upload
                 folder_contents = await self.drive_client.list_folder_contents(event_folder_id)
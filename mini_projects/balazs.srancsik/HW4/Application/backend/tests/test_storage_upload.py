@@ -0,0 +1,238 @@
+"""
+Tests for the storage upload subsystem with a fake Google Drive service.
+
+Resumable uploads run through googleapiclient's real HttpRequest against a
+scripted HTTP sequence, so chunking and retries behave as in production.
+"""
+import asyncio
+import json
+import threading
+import time
+
+from googleapiclient.http import HttpMockSequence, HttpRequest
+
+from infrastructure import storage_upload
+from infrastructure.storage_upload import (
+    FolderIdCache, StorageUploader, UploadJob, UploadWorkerPool, is_quota_error
+)
+from infrastructure.tool_clients import GoogleDriveClient
+
+CHUNK = 256 * 1024
+
+
+class FakeRequest:
+    """Stands in for a non-media Drive request (files().list / files().create)."""
+
+    def __init__(self, result):
+        self.result = result
+
+    def execute(self):
+        return self.result
+
+
+class FakeFiles:
+    def __init__(self, service):
+        self.service = service
+
+    def list(self, **kwargs):
+        self.service.list_calls.append(kwargs["q"])
+        return FakeRequest({"files": self.service.folders.get(kwargs["q"].split("'")[1], [])})
+
+    def create(self, body, media_body=None, **kwargs):
+        if media_body is None:
+            folder = {"id": f"id-{body['name']}", "name": body["name"], "webViewLink": "link"}
+            return FakeRequest(folder)
+        request = HttpRequest(
+            self.service.http,
+            lambda resp, content: json.loads(content),
+            "https://upload.example/drive/v3/files",
+            method="POST",
+            body=json.dumps(body),
+            headers={"content-type": "application/json"},
+            resumable=media_body,
+        )
+        request._sleep = lambda seconds: None  # No backoff delay between retries
+        return request
+
+
+class FakeDriveService:
+    """Minimal Drive v3 service: folder listing by name and resumable uploads."""
+
+    def __init__(self, responses=(), folders=None):
+        self.http = HttpMockSequence(list(responses))
+        self.folders = folders or {}
+        self.list_calls = []
+
+    def files(self):
+        return FakeFiles(self)
+
+
+def make_drive_client(service, **kwargs):
+    client = GoogleDriveClient("{}", upload_pool=UploadWorkerPool(max_workers=2), chunk_size=CHUNK, **kwargs)
+    client._service = service
+    client._initialized = True
+    return client
+
+
+def chunk_ack(last_byte):
+    return {"status": "308", "range": f"bytes=0-{last_byte}"}, b""
+
+
+def test_failed_chunk_is_retried_from_last_acknowledged_byte():
+    data = bytes(range(256)) * (CHUNK * 3 // 256 - 100)
+    service = FakeDriveService([
+        ({"status": "200", "location": "https://upload.example/session/1"}, b""),
+        chunk_ack(CHUNK - 1),
+        ({"status": "503"}, b"backend error"),  # Second chunk fails once
+        chunk_ack(2 * CHUNK - 1),
+        ({"status": "200"}, json.dumps({"id": "f1", "name": "photo.jpg", "size": str(len(data))}).encode()),
+    ])
+    client = make_drive_client(service)
+    progress = []
+
+    result = asyncio.run(client.upload_file_from_bytes(
+        data, "photo.jpg", "folder-1", progress_callback=progress.append
+    ))
+
+    assert result["success"] and result["file_id"] == "f1"
+    ranges = [headers.get("Content-Range") for _, method, _, headers in service.http.request_sequence[1:]]
+    assert ranges == [
+        f"bytes 0-{CHUNK - 1}/{len(data)}",
+        f"bytes {CHUNK}-{2 * CHUNK - 1}/{len(data)}",
+        f"bytes {CHUNK}-{2 * CHUNK - 1}/{len(data)}",  # Same chunk again, not the whole file
+        f"bytes {2 * CHUNK}-{len(data) - 1}/{len(data)}",
+    ]
+    assert [p.bytes_sent for p in progress] == [0, CHUNK, 2 * CHUNK, len(data)]
+    assert progress[-1].done
+    client._pool.shutdown()
+
+
+def test_upload_reports_error_when_chunk_retries_are_exhausted():
+    service = FakeDriveService(
+        [({"status": "200", "location": "https://upload.example/session/2"}, b"")]
+        + [({"status": "503"}, b"backend error")] * 4
+    )
+    client = make_drive_client(service)
+
+    result = asyncio.run(client.upload_file_from_bytes(b"x" * 1000, "photo.jpg", "folder-1"))
+
+    assert not result.get("success") and "503" in result["error"]
+    assert len(service.http.request_sequence) == 5  # First try plus num_retries=3
+    client._pool.shutdown()
+
+
+def test_folder_lookups_are_cached_until_invalidated():
+    service = FakeDriveService(folders={"Trips": [{"id": "trips-1", "name": "Trips", "webViewLink": "link"}]})
+    cache = FolderIdCache()
+    client = make_drive_client(service, folder_cache=cache)
+
+    async def run():
+        first = await client.find_folder("Trips", "root-1")
+        second = await client.find_folder("Trips", "root-1")
+        missing = [await client.find_folder("Later", "root-1") for _ in range(2)]
+        created = await client.create_folder("New", "root-1")
+        found_created = await client.find_folder("New", "root-1")
+        cache.invalidate("root-1", "Trips")
+        after_invalidate = await client.find_folder("Trips", "root-1")
+        return first, second, missing, created, found_created, after_invalidate
+
+    first, second, missing, created, found_created, after_invalidate = asyncio.run(run())
+
+    assert first == second == after_invalidate
+    assert first["folder_id"] == "trips-1"
+    # Missing folders are not cached, created ones are
+    assert missing == [{"found": False}] * 2
+    assert found_created["folder_id"] == created["folder_id"] == "id-New"
+    assert [q.split("'")[1] for q in service.list_calls] == ["Trips", "Later", "Later", "Trips"]
+    assert cache.hits == 2
+    client._pool.shutdown()
+
+
+def test_folder_cache_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(storage_upload.time, "monotonic", lambda: now[0])
+    cache = FolderIdCache(ttl_seconds=60)
+    cache.set("root", "Trips", {"found": True, "folder_id": "trips-1"})
+    cache.set("root", "Empty", {"found": False})
+
+    assert cache.get("root", "Trips")["folder_id"] == "trips-1"
+    assert cache.get("root", "Empty") is None
+    now[0] += 61
+    assert cache.get("root", "Trips") is None
+
+    cache.set("root", "Trips", {"found": True, "folder_id": "trips-1"})
+    cache.invalidate()
+    assert cache.get("root", "Trips") is None
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_worker_pool_bounds_concurrency_and_restarts_after_shutdown():
+    pool = UploadWorkerPool(max_workers=2)
+    lock = threading.Lock()
+    running = [0]
+    peak = [0]
+
+    def blocking_call(value):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return value * 2
+
+    async def run():
+        return await asyncio.gather(*(pool.run(blocking_call, i) for i in range(6)))
+
+    assert asyncio.run(run()) == [0, 2, 4, 6, 8, 10]
+    assert peak[0] == 2
+
+    pool.shutdown()
+    assert pool._executor is None
+    pool.shutdown()  # Idempotent
+    # The executor is created again on the next call
+    assert asyncio.run(pool.run(blocking_call, 21)) == 42
+    pool.shutdown()
+
+
+class FakeStorageClient:
+    """Storage client whose uploads fail with the scripted results."""
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.attempted = []
+
+    async def upload_file_from_bytes(self, file_bytes, file_name, folder_id, mime_type, progress_callback=None):
+        self.attempted.append(file_name)
+        await asyncio.sleep(0)
+        return self.failures.get(file_name, {"success": True, "file_name": file_name})
+
+
+def test_quota_error_stops_remaining_uploads():
+    client = FakeStorageClient({"b.jpg": {"error": "Storage quota exceeded", "error_code": 2008}})
+    jobs = [UploadJob(name, file_bytes=b"data") for name in ("a.jpg", "b.jpg", "c.jpg", "d.jpg")]
+
+    batch = asyncio.run(StorageUploader(client, max_concurrency=1).upload_many(jobs, "folder-1"))
+
+    assert client.attempted == ["a.jpg", "b.jpg"]
+    assert batch.stopped_early
+    assert (batch.succeeded, batch.failed) == (1, 3)
+    assert all(r.get("not_attempted") for r in batch.results[2:])
+
+
+def test_other_errors_do_not_stop_the_batch():
+    client = FakeStorageClient({"b.jpg": {"error": "Connection reset", "retryable": True}})
+    jobs = [UploadJob(name, file_bytes=b"data") for name in ("a.jpg", "b.jpg", "c.jpg")]
+
+    batch = asyncio.run(StorageUploader(client, max_concurrency=1).upload_many(jobs, "folder-1"))
+
+    assert client.attempted == ["a.jpg", "b.jpg", "c.jpg"]
+    assert not batch.stopped_early
+    assert batch.failed == 1
+
+
+def test_is_quota_error():
+    assert is_quota_error({"error_code": 2008})
+    assert is_quota_error({"error": "Upload failed: QUOTA exceeded"})
+    assert not is_quota_error({"error": "Connection reset"})
+    assert not is_quota_error({"success": True})
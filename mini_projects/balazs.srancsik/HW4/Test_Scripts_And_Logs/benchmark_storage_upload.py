@@ -0,0 +1,237 @@
+"""
+Benchmark for the storage upload subsystem (PCloudClient + StorageUploader).
+
+Runs entirely against a local fake pCloud backend:
+- a fake SDK object (listfolder / createfolderifnotexists / uploadfile) with
+  simulated network latency, used for small files and folder lookups
+- a local HTTP server implementing the upload session API
+  (upload_create / upload_write / upload_info / upload_save) for chunked uploads
+
+Compares the old behaviour (blocking SDK calls made sequentially on the event
+loop) with the worker-pool + parallel upload path, and measures how long the
+event loop was stalled while uploading.
+
+Usage:
+    python benchmark_storage_upload.py [--files 8] [--size-kb 2048] [--latency-ms 50]
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Add the backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'Application', 'backend'))
+
+from infrastructure.storage_upload import StorageUploader, UploadJob, UploadWorkerPool  # noqa: E402
+from infrastructure.tool_clients import PCloudClient  # noqa: E402
+
+
+class FakeStorage:
+    """In-memory folder/file store shared by the fake SDK and the fake HTTP server."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1000)
+        self.folders = {0: {"name": "/", "parent": None}}
+        self.files = {}
+        self.sessions = {}
+        self.requests = 0
+
+    def tick(self):
+        """Simulate one network round trip."""
+        with self.lock:
+            self.requests += 1
+        time.sleep(self.latency)
+
+    def store_file(self, name: str, folder_id: int, size: int) -> dict:
+        with self.lock:
+            file_id = next(self.ids)
+            self.files[file_id] = {"name": name, "folder": folder_id, "size": size}
+        return {"fileid": file_id, "name": name, "path": f"/{name}", "size": size}
+
+
+class FakePyCloud:
+    """Stand-in for pcloud.PyCloud with the subset of methods the client uses."""
+
+    def __init__(self, storage: FakeStorage, endpoint: str):
+        self.storage = storage
+        self.endpoint = endpoint
+        self.auth_token = "fake-token"
+
+    def listfolder(self, folderid: int = 0):
+        self.storage.tick()
+        contents = [
+            {"isfolder": True, "folderid": fid, "name": f["name"], "path": f"/{f['name']}"}
+            for fid, f in self.storage.folders.items() if f["parent"] == folderid
+        ]
+        contents += [
+            {"isfolder": False, "fileid": fid, "name": f["name"], "size": f["size"]}
+            for fid, f in self.storage.files.items() if f["folder"] == folderid
+        ]
+        return {"result": 0, "metadata": {"contents": contents}}
+
+    def createfolderifnotexists(self, name: str, folderid: int = 0):
+        self.storage.tick()
+        with self.storage.lock:
+            for fid, f in self.storage.folders.items():
+                if f["parent"] == folderid and f["name"] == name:
+                    return {"result": 0, "created": False, "metadata": {"folderid": fid, "name": name, "path": f"/{name}"}}
+            fid = next(self.storage.ids)
+            self.storage.folders[fid] = {"name": name, "parent": folderid}
+        return {"result": 0, "created": True, "metadata": {"folderid": fid, "name": name, "path": f"/{name}"}}
+
+    def uploadfile(self, files=None, data=None, filename=None, folderid: int = 0):
+        self.storage.tick()
+        if files:
+            size = os.path.getsize(files[0])
+            filename = os.path.basename(files[0])
+        else:
+            size = len(data)
+        return {"result": 0, "metadata": [self.storage.store_file(filename, folderid, size)]}
+
+
+def make_handler(storage: FakeStorage):
+    """Build an HTTP handler implementing the pCloud upload session API."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _reply(self, payload: dict):
+            body = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _params(self):
+            url = urlparse(self.path)
+            return url.path.strip("/"), {k: v[0] for k, v in parse_qs(url.query).items()}
+
+        def do_GET(self):
+            method, params = self._params()
+            storage.tick()
+            if method == "upload_create":
+                with storage.lock:
+                    upload_id = next(storage.ids)
+                    storage.sessions[upload_id] = 0
+                self._reply({"result": 0, "uploadid": upload_id})
+            elif method == "upload_info":
+                self._reply({"result": 0, "size": storage.sessions[int(params["uploadid"])]})
+            elif method == "upload_save":
+                size = storage.sessions.pop(int(params["uploadid"]))
+                metadata = storage.store_file(params["name"], int(params["folderid"]), size)
+                self._reply({"result": 0, "metadata": metadata})
+            else:
+                self._reply({"result": 2000, "error": f"unknown method {method}"})
+
+        def do_PUT(self):
+            method, params = self._params()
+            length = int(self.headers.get("Content-Length", 0))
+            self.rfile.read(length)
+            storage.tick()
+            upload_id = int(params["uploadid"])
+            with storage.lock:
+                storage.sessions[upload_id] = int(params["uploadoffset"]) + length
+            self._reply({"result": 0})
+
+    return Handler
+
+
+async def measure_loop_lag(stop: asyncio.Event, interval: float = 0.01) -> float:
+    """Return the worst event-loop stall observed while `stop` is unset."""
+    worst = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - started - interval)
+    return worst
+
+
+async def run_baseline(sdk: FakePyCloud, jobs, folder_id: int) -> float:
+    """Old behaviour: blocking SDK call per file, one after another, on the loop."""
+    started = time.perf_counter()
+    for _ in range(len(jobs)):
+        sdk.listfolder(folderid=0)  # uncached Tickets folder lookup
+    for job in jobs:
+        sdk.uploadfile(data=job.file_bytes, filename=job.file_name, folderid=folder_id)
+    return time.perf_counter() - started
+
+
+async def run_new(client: PCloudClient, jobs, folder_id: int, concurrency: int):
+    """Worker-pool + parallel upload path."""
+    updates = []
+    started = time.perf_counter()
+    for _ in range(len(jobs)):
+        await client.find_folder("Tickets", 0)  # cached after the first lookup
+    batch = await StorageUploader(client, concurrency).upload_many(
+        jobs, folder_id, progress_callback=updates.append
+    )
+    return time.perf_counter() - started, batch, len(updates)
+
+
+async def main(args):
+    storage = FakeStorage(latency=args.latency_ms / 1000)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(storage))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    sdk = FakePyCloud(storage, endpoint)
+    folder_id = sdk.createfolderifnotexists(name="Tickets", folderid=0)["metadata"]["folderid"]
+    payload = os.urandom(args.size_kb * 1024)
+    jobs = [UploadJob(f"photo_{i + 1}.jpg", file_bytes=payload) for i in range(args.files)]
+
+    client = PCloudClient(
+        access_token="fake-token",
+        upload_pool=UploadWorkerPool(max_workers=args.concurrency),
+        chunk_size=args.chunk_kb * 1024
+    )
+    client._client = sdk
+    client._initialized = True
+
+    print(f"Files: {args.files} x {args.size_kb} KB | latency {args.latency_ms} ms | "
+          f"chunk {args.chunk_kb} KB | concurrency {args.concurrency}")
+
+    for label, coro_factory in (
+        ("baseline (blocking, sequential)", lambda: run_baseline(sdk, jobs, folder_id)),
+        ("worker pool + parallel", lambda: run_new(client, jobs, folder_id, args.concurrency)),
+    ):
+        stop = asyncio.Event()
+        lag_task = asyncio.create_task(measure_loop_lag(stop))
+        await asyncio.sleep(0)
+        before = storage.requests
+        result = await coro_factory()
+        stop.set()
+        worst_lag = await lag_task
+
+        elapsed = result[0] if isinstance(result, tuple) else result
+        total_mb = args.files * args.size_kb / 1024
+        print(f"\n{label}")
+        print(f"  elapsed:          {elapsed:.3f}s ({total_mb / elapsed:.1f} MB/s)")
+        print(f"  backend requests: {storage.requests - before}")
+        print(f"  worst loop stall: {worst_lag * 1000:.1f} ms")
+        if isinstance(result, tuple):
+            _, batch, progress_updates = result
+            print(f"  succeeded:        {batch.succeeded}/{len(jobs)}")
+            print(f"  progress updates: {progress_updates}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--size-kb", type=int, default=2048)
+    parser.add_argument("--chunk-kb", type=int, default=512)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--concurrency", type=int, default=4)
+    asyncio.run(main(parser.parse_args()))
@@ -3,13 +3,31 @@ Atlassian API client for Confluence and Jira integration.
 Handles IT policy retrieval from Confluence and ticket creation in Jira.
 """
 import os
+import asyncio
 import logging
+import threading
+import time
+from dataclasses import dataclass
 from typing import Dict, Optional
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
+
+from infrastructure.it_policy_index import ITPolicyIndex, SECTION_ID_RE
 
 logger = logging.getLogger(__name__)
 
+HEADING_TAGS = ('h1', 'h2', 'h3')
+
+
+@dataclass
+class ITPolicySnapshot:
+    """Parsed + indexed IT policy for one Confluence page version."""
+    version: Optional[int]
+    etag: Optional[str]
+    sections: Dict[str, str]
+    index: ITPolicyIndex
+    checked_at: float
+
 
 class AtlassianClient:
     """
@@ -41,13 +59,40 @@ class AtlassianClient:
         # Jira project
         self.jira_project_key = "SCRUM"
         
+        # IT policy cache (keyed on Confluence page version / ETag)
+        self.policy_refresh_interval = float(os.getenv("IT_POLICY_REFRESH_SECONDS", "300"))
+        self._policy_snapshot: Optional[ITPolicySnapshot] = None
+        # Views run every request in its own asyncio.run() loop, so loop-bound
+        # primitives (asyncio.Lock, tasks) cannot be shared by the singleton
+        self._policy_lock = threading.Lock()
+        self._policy_refresh_thread: Optional[threading.Thread] = None
+        
         self._initialized = True
         logger.info(f"✅ AtlassianClient initialized (base: {self.base_url})")
     
-    async def get_it_policy_content(self) -> Dict[str, str]:
+    def _confluence_headers(self) -> Dict[str, str]:
+        """Basic Auth headers for Confluence Cloud (email:api_token, base64 encoded)."""
+        import base64
+        auth_string = f"{self.confluence_email}:{self.confluence_token}"
+        auth_bytes = auth_string.encode('ascii')
+        auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
+        
+        return {
+            "Authorization": f"Basic {auth_b64}",
+            "Accept": "application/json"
+        }
+    
+    async def get_it_policy_content(self, force_refresh: bool = False) -> Dict[str, str]:
         """
         Retrieve IT Policy page content from Confluence.
         
+        Served from the version-keyed policy cache. Only the very first call (or
+        force_refresh) waits on Confluence; afterwards a stale cache triggers a
+        background version check and the cached sections are returned at once.
+        
+        Args:
+            force_refresh: Re-download and re-index the page before returning
+        
         Returns:
             Dict with sections: {section_id: content}
         """
@@ -55,22 +100,33 @@ class AtlassianClient:
             logger.error("CONFLUENCE_API_TOKEN not set")
             return {}
         
-        url = f"{self.base_url}/wiki/api/v2/pages/{self.it_policy_page_id}?body-format=storage"
+        if self._policy_snapshot is None or force_refresh:
+            # Wait for the lock off the event loop (another request may be loading)
+            await asyncio.to_thread(self._policy_lock.acquire)
+            try:
+                if self._policy_snapshot is None or force_refresh:
+                    await self._load_it_policy()
+            finally:
+                self._policy_lock.release()
+            return self._policy_snapshot.sections if self._policy_snapshot else {}
         
-        # Confluence Cloud uses Basic Auth: email:api_token (base64 encoded)
-        import base64
-        auth_string = f"{self.confluence_email}:{self.confluence_token}"
-        auth_bytes = auth_string.encode('ascii')
-        auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
+        if time.monotonic() - self._policy_snapshot.checked_at > self.policy_refresh_interval:
+            self._schedule_policy_refresh()
         
-        headers = {
-            "Authorization": f"Basic {auth_b64}",
-            "Accept": "application/json"
-        }
+        return self._policy_snapshot.sections
+    
+    async def _load_it_policy(self) -> bool:
+        """
+        Download the page body, parse and index it, and swap in the new snapshot.
+        
+        Returns:
+            True if a snapshot was stored
+        """
+        url = f"{self.base_url}/wiki/api/v2/pages/{self.it_policy_page_id}?body-format=storage"
         
         try:
             async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, headers=headers)
+                response = await client.get(url, headers=self._confluence_headers())
                 response.raise_for_status()
                 
                 data = response.json()
@@ -79,38 +135,105 @@ class AtlassianClient:
                 # Parse HTML content
                 sections = self._parse_it_policy_sections(body_storage)
                 
-                logger.info(f"✅ Retrieved IT Policy page (sections: {len(sections)})")
-                return sections
+                self._policy_snapshot = ITPolicySnapshot(
+                    version=data.get("version", {}).get("number"),
+                    etag=response.headers.get("ETag"),
+                    sections=sections,
+                    index=ITPolicyIndex(sections),
+                    checked_at=time.monotonic()
+                )
+                
+                logger.info(f"✅ Retrieved IT Policy page (sections: {len(sections)}, version: {self._policy_snapshot.version})")
+                return True
                 
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error retrieving Confluence page: {e.response.status_code} {e.response.text}")
-            return {}
+            return False
         except Exception as e:
             logger.error(f"Failed to retrieve IT Policy: {e}")
-            return {}
+            return False
+    
+    def _schedule_policy_refresh(self) -> None:
+        """
+        Start a background version check unless a load or check is already running.
+        
+        Runs in a daemon thread with its own event loop: a task on the request's
+        loop would be cancelled when the view's asyncio.run() returns.
+        """
+        if not self._policy_lock.acquire(blocking=False):
+            return
+        try:
+            self._policy_refresh_thread = threading.Thread(
+                target=self._run_policy_refresh, name="it-policy-refresh", daemon=True
+            )
+            self._policy_refresh_thread.start()
+        except Exception:
+            self._policy_lock.release()
+            raise
+    
+    def _run_policy_refresh(self) -> None:
+        """Thread target: version check (and re-index) while holding the policy lock."""
+        try:
+            asyncio.run(self._refresh_it_policy_if_changed())
+        finally:
+            self._policy_lock.release()
+    
+    async def _refresh_it_policy_if_changed(self) -> bool:
+        """
+        Cheap metadata request (no body, conditional on ETag); re-download and
+        re-index only when the page version changed.
+        
+        Returns:
+            True if the cached policy was replaced
+        """
+        snapshot = self._policy_snapshot
+        url = f"{self.base_url}/wiki/api/v2/pages/{self.it_policy_page_id}"
+        headers = self._confluence_headers()
+        if snapshot and snapshot.etag:
+            headers["If-None-Match"] = snapshot.etag
+        
+        try:
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                response = await client.get(url, headers=headers)
+                if response.status_code == 304:
+                    snapshot.checked_at = time.monotonic()
+                    return False
+                response.raise_for_status()
+                version = response.json().get("version", {}).get("number")
+            
+            if snapshot and version is not None and version == snapshot.version:
+                snapshot.checked_at = time.monotonic()
+                return False
+            
+            logger.info(f"🔄 IT Policy page changed (version {snapshot.version if snapshot else None} → {version}), re-indexing")
+            return await self._load_it_policy()
+                
+        except Exception as e:
+            logger.warning(f"⚠️ IT Policy version check failed, keeping cached copy: {e}")
+            if snapshot:
+                snapshot.checked_at = time.monotonic()
+            return False
     
     def _parse_it_policy_sections(self, html_content: str) -> Dict[str, str]:
         """
         Parse Confluence HTML storage format into sections.
         Extract headings and their content, including section IDs.
         
+        Single linear pass: each heading walks its following siblings lazily and
+        stops at the next heading, so every element is visited once.
+        
         Returns:
             Dict of {section_title: section_content}
         """
-        import re
-        
         soup = BeautifulSoup(html_content, 'html.parser')
         sections = {}
         
-        # Find all headings (h1, h2, h3)
-        headings = soup.find_all(['h1', 'h2', 'h3'])
-        
         last_section_id = None
-        for i, heading in enumerate(headings):
+        for heading in soup.find_all(HEADING_TAGS):
             section_title = heading.get_text(strip=True)
             
             # Extract section ID if present (e.g., [IT-KB-234])
-            section_id_match = re.search(r'\[([A-Z]+-[A-Z]+-\d+)\]', section_title)
+            section_id_match = SECTION_ID_RE.search(section_title)
             section_id = section_id_match.group(1) if section_id_match else None
 
             # Inherit last seen section ID for subheadings without explicit ID
@@ -121,8 +244,10 @@ class AtlassianClient:
             
             # Get content until next heading
             content_parts = []
-            for sibling in heading.find_next_siblings():
-                if sibling.name in ['h1', 'h2', 'h3']:
+            for sibling in heading.next_siblings:
+                if not isinstance(sibling, Tag):
+                    continue
+                if sibling.name in HEADING_TAGS:
                     break
                 content_parts.append(sibling.get_text(strip=True))
             
@@ -138,7 +263,10 @@ class AtlassianClient:
     
     async def find_relevant_section(self, query: str, sections: Dict[str, str]) -> Optional[Dict[str, str]]:
         """
-        Find the most relevant section based on query keywords.
+        Find the most relevant section based on query keywords (BM25).
+        
+        Uses the cached index when `sections` is the cached policy, otherwise
+        indexes the given sections once.
         
         Args:
             query: User's question
@@ -147,55 +275,25 @@ class AtlassianClient:
         Returns:
             Dict with section_title, content, section_id (if identifiable)
         """
-        query_lower = query.lower()
-        
-        # Keyword mapping for common IT issues
-        keyword_map = {
-            "vpn": ["vpn", "virtual private network", "távoli hozzáférés"],
-            "jelszó": ["jelszó", "password", "bejelentkezés"],
-            "email": ["email", "e-mail", "levelezés", "outlook"],
-            "laptop": ["laptop", "számítógép", "eszköz", "hardver"],
-            "szoftver": ["szoftver", "software", "alkalmazás", "program"],
-            "hálózat": ["hálózat", "network", "wifi", "internet"],
-        }
-        
-        # Score sections based on keyword matches
-        scored_sections = []
-        for title, content in sections.items():
-            title_lower = title.lower()
-            content_lower = content.lower()
-            score = 0
-            
-            # Direct query word matching
-            for word in query_lower.split():
-                if len(word) > 3:  # Skip short words
-                    if word in title_lower:
-                        score += 10
-                    if word in content_lower:
-                        score += 1
-            
-            # Category matching
-            for category, keywords in keyword_map.items():
-                if any(kw in query_lower for kw in keywords):
-                    if any(kw in title_lower or kw in content_lower for kw in keywords):
-                        score += 5
-            
-            if score > 0:
-                scored_sections.append((title, content, score))
+        snapshot = self._policy_snapshot
+        if snapshot is not None and sections is snapshot.sections:
+            index = snapshot.index
+        else:
+            index = ITPolicyIndex(sections)
         
-        if not scored_sections:
+        match = index.best_match(query)
+        if match is None:
             return None
         
-        # Get best match
-        scored_sections.sort(key=lambda x: x[2], reverse=True)
-        best_title, best_content, best_score = scored_sections[0]
+        best_title, best_score = match
+        best_content = sections[best_title]
         
         # Try to extract section ID from title (e.g., "[IT-KB-234]")
         section_id = None
         if "[" in best_title and "]" in best_title:
             section_id = best_title[best_title.find("[")+1:best_title.find("]")]
         
-        logger.info(f"📍 Best match: '{best_title}' (score: {best_score})")
+        logger.info(f"📍 Best match: '{best_title}' (score: {best_score:.2f})")
         
         return {
             "section_title": best_title,
@@ -0,0 +1,118 @@
+"""
+In-memory BM25 index over IT policy sections.
+
+Built once per Confluence page version by AtlassianClient and reused for every
+IT-domain query, so section lookup no longer substring-scans every section.
+
+Index layout:
+- postings: term → [(section_idx, weighted_tf), ...] (inverted index)
+- doc_lengths: weighted token count per section
+- Title tokens count TITLE_WEIGHT times (a title hit outranks a body hit)
+"""
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+SECTION_ID_RE = re.compile(r"\[([A-Z]+-[A-Z]+-\d+)\]")
+
+# Hungarian is agglutinative ("probléma", "problémám", "problémák"), so terms are
+# truncated to a fixed-length prefix as a cheap, dependency-free stemmer.
+STEM_LENGTH = 6
+TITLE_WEIGHT = 3
+
+# Synonym groups for common IT issues: a query hitting one term also searches the others
+KEYWORD_MAP = {
+    "vpn": ["vpn", "virtual private network", "távoli hozzáférés"],
+    "jelszó": ["jelszó", "password", "bejelentkezés"],
+    "email": ["email", "e-mail", "levelezés", "outlook"],
+    "laptop": ["laptop", "számítógép", "eszköz", "hardver"],
+    "szoftver": ["szoftver", "software", "alkalmazás", "program"],
+    "hálózat": ["hálózat", "network", "wifi", "internet"],
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, split on non-word characters and prefix-stem."""
+    return [token[:STEM_LENGTH] for token in _TOKEN_RE.findall(text.lower())]
+
+
+@dataclass
+class ITPolicyIndex:
+    """
+    BM25 (Okapi) index over {section_title: section_content}.
+
+    Args:
+        sections: Parsed IT policy sections (title → content)
+        k1: BM25 term-frequency saturation
+        b: BM25 length normalization
+    """
+    sections: Dict[str, str]
+    k1: float = 1.5
+    b: float = 0.75
+    titles: List[str] = field(init=False, default_factory=list)
+    postings: Dict[str, List[Tuple[int, int]]] = field(init=False, default_factory=dict)
+    doc_lengths: List[int] = field(init=False, default_factory=list)
+    avg_doc_length: float = field(init=False, default=0.0)
+
+    def __post_init__(self):
+        postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        for idx, (title, content) in enumerate(self.sections.items()):
+            self.titles.append(title)
+            term_counts = Counter(tokenize(content))
+            for term in tokenize(title):
+                term_counts[term] += TITLE_WEIGHT
+            for term, tf in term_counts.items():
+                postings[term].append((idx, tf))
+            self.doc_lengths.append(sum(term_counts.values()))
+
+        self.postings = dict(postings)
+        self.avg_doc_length = (sum(self.doc_lengths) / len(self.doc_lengths)) if self.doc_lengths else 0.0
+
+    def _idf(self, term: str) -> float:
+        df = len(self.postings.get(term, ()))
+        n = len(self.titles)
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def expand_query(self, query: str) -> List[str]:
+        """Tokenize the query and add synonyms of every matched keyword category."""
+        query_lower = query.lower()
+        terms = tokenize(query_lower)
+        for keywords in KEYWORD_MAP.values():
+            if any(kw in query_lower for kw in keywords):
+                for kw in keywords:
+                    terms.extend(tokenize(kw))
+        return list(dict.fromkeys(terms))
+
+    def search(self, query: str, top_k: int = 1) -> List[Tuple[str, float]]:
+        """
+        Score sections against the query, touching only postings of query terms.
+
+        Returns:
+            Up to top_k (section_title, score) pairs with score > 0, best first
+        """
+        if not self.titles:
+            return []
+
+        scores: Dict[int, float] = defaultdict(float)
+        avgdl = self.avg_doc_length or 1.0
+        for term in self.expand_query(query):
+            term_postings = self.postings.get(term)
+            if not term_postings:
+                continue
+            idf = self._idf(term)
+            for idx, tf in term_postings:
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[idx] / avgdl)
+                scores[idx] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+        # Ties keep document order (earlier section wins)
+        best = heapq.nsmallest(top_k, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(self.titles[idx], score) for idx, score in best if score > 0]
+
+    def best_match(self, query: str) -> Optional[Tuple[str, float]]:
+        """Return the single best (section_title, score) or None."""
+        results = self.search(query, top_k=1)
+        return results[0] if results else None
@@ -176,5 +176,101 @@ class TestAtlassianClient(unittest.TestCase):
         self.loop.run_until_complete(self.async_test_confluence_api_error())
 
 
+class TestITPolicyCache(unittest.TestCase):
+    """Test the version-keyed IT policy cache and BM25 section index."""
+
+    POLICY_HTML = (
+        "<h1>1. VPN Problémák [IT-KB-234]</h1><p>Ellenőrizd, fut-e a VPN kliens.</p>"
+        "<h2>Részletek</h2><p>Távoli hozzáférés csak MFA-val.</p>"
+        "<h1>2. Jelszókezelés [IT-KB-100]</h1><p>Jelszó változtatás 90 naponta kötelező.</p>"
+    )
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        AtlassianClient._instance = None
+        import os
+        os.environ['CONFLUENCE_API_TOKEN'] = 'test-confluence-token'
+
+    def tearDown(self):
+        """Clean up event loop."""
+        self.loop.close()
+
+    def _mock_page(self, mock_client_class, version=1):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"ETag": f'"v{version}"'}
+        mock_response.json.return_value = {
+            "version": {"number": version},
+            "body": {"storage": {"value": self.POLICY_HTML}}
+        }
+        mock_client = AsyncMock()
+        mock_client.get.return_value = mock_response
+        mock_client_class.return_value.__aenter__.return_value = mock_client
+        return mock_client
+
+    def test_parse_sections_inherits_section_id(self):
+        """Subheadings without an ID inherit the previous section ID."""
+        client = AtlassianClient()
+        sections = client._parse_it_policy_sections(self.POLICY_HTML)
+
+        self.assertEqual(list(sections), ["1. VPN Problémák [IT-KB-234]", "Részletek", "2. Jelszókezelés [IT-KB-100]"])
+        self.assertEqual(sections["Részletek"], "[IT-KB-234] Távoli hozzáférés csak MFA-val.")
+
+    @patch('infrastructure.atlassian_client.httpx.AsyncClient')
+    def test_policy_served_from_cache(self, mock_client_class):
+        """Second call returns cached sections without hitting Confluence."""
+        mock_client = self._mock_page(mock_client_class)
+        client = AtlassianClient()
+
+        first = self.loop.run_until_complete(client.get_it_policy_content())
+        second = self.loop.run_until_complete(client.get_it_policy_content())
+
+        self.assertIs(first, second)
+        mock_client.get.assert_called_once()
+
+    @patch('infrastructure.atlassian_client.httpx.AsyncClient')
+    def test_refresh_skips_download_when_version_unchanged(self, mock_client_class):
+        """Background refresh only re-downloads the body when the version changes."""
+        mock_client = self._mock_page(mock_client_class, version=7)
+        client = AtlassianClient()
+        sections = self.loop.run_until_complete(client.get_it_policy_content())
+
+        changed = self.loop.run_until_complete(client._refresh_it_policy_if_changed())
+
+        self.assertFalse(changed)
+        self.assertIs(client._policy_snapshot.sections, sections)
+        self.assertEqual(mock_client.get.call_count, 2)
+        self.assertEqual(mock_client.get.call_args.kwargs["headers"]["If-None-Match"], '"v7"')
+
+    @patch('infrastructure.atlassian_client.httpx.AsyncClient')
+    def test_background_refresh_outlives_request_loop(self, mock_client_class):
+        """A stale cache is re-indexed in a background thread, even after the request's loop closes."""
+        self._mock_page(mock_client_class, version=1)
+        client = AtlassianClient()
+        old_sections = asyncio.run(client.get_it_policy_content())
+
+        self._mock_page(mock_client_class, version=2)
+        client._policy_snapshot.checked_at = 0
+        served = asyncio.run(client.get_it_policy_content())
+        client._policy_refresh_thread.join(timeout=5)
+
+        self.assertIs(served, old_sections)
+        self.assertEqual(client._policy_snapshot.version, 2)
+        self.assertFalse(client._policy_lock.locked())
+
+    @patch('infrastructure.atlassian_client.httpx.AsyncClient')
+    def test_find_relevant_section_uses_cached_index(self, mock_client_class):
+        """Query against the cached policy ranks the matching section first."""
+        self._mock_page(mock_client_class)
+        client = AtlassianClient()
+        sections = self.loop.run_until_complete(client.get_it_policy_content())
+
+        result = self.loop.run_until_complete(client.find_relevant_section("Lejárt a jelszó, mit tegyek?", sections))
+
+        self.assertEqual(result["section_id"], "IT-KB-100")
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Benchmark: sequential whole-document ingestion vs. the streaming pipeline.
+
+Generates DOCX files and indexes them twice with a simulated embedding API
+(fixed latency per request, no API key needed):
+
+- before: one upload at a time; extract the whole text, chunk by decoding
+  every token window, embed the batches one after the other
+- after: UploadService with all uploads in flight, extraction/chunking in
+  worker processes and concurrent embedding batches
+
+Usage (from the gabor.toth directory; needs the cl100k_base encoding):
+    python TESZTEK/benchmark_ingestion.py [--files 8] [--paragraphs 3000]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, 'backend')
+
+from domain.interfaces import EmbeddingService, VectorStore
+from infrastructure.chunker import TiktokenChunker
+from infrastructure.extractors import get_extractor
+from infrastructure.ingestion import create_extraction_pool
+from infrastructure.repositories import FileUploadRepository
+from services.upload_service import UploadService
+
+
+class FakeEmbedding(EmbeddingService):
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def embed_text(self, text):
+        await asyncio.sleep(self.latency)
+        return [0.0] * 8
+
+    async def embed_texts(self, texts, batch_size=100):
+        await asyncio.sleep(self.latency)
+        return [[0.0] * 8 for _ in texts]
+
+
+class NullVectorStore(VectorStore):
+    async def create_collection(self, collection_name):
+        pass
+
+    async def add_chunks(self, collection_name, chunks, embeddings=None):
+        pass
+
+    async def query(self, collection_name, query_embedding, top_k=5, similarity_threshold=0.6):
+        return []
+
+    async def keyword_search(self, collection_name, query_text, top_k=5):
+        return []
+
+    async def delete_chunks(self, collection_name, chunk_ids):
+        pass
+
+    async def delete_collection(self, collection_name):
+        pass
+
+
+def make_docx(path: str, paragraphs: int, seed: int) -> None:
+    from docx import Document
+
+    document = Document()
+    for i in range(paragraphs):
+        document.add_paragraph(
+            f"{seed}.{i}. A munkavállalót évente húsz nap szabadság illeti meg, "
+            f"amelyből legfeljebb öt nap vihető át a következő évre. Section {i} of the policy."
+        )
+    document.save(path)
+
+
+def chunk_by_decoding(chunker: TiktokenChunker, text: str, size: int, overlap: int):
+    """Previous TiktokenChunker.chunk_text: decode every token window."""
+    tokens = chunker.encoding.encode(text)
+    chunks, i = [], 0
+    while i < len(tokens):
+        chunks.append(chunker.encoding.decode(tokens[i:i + size]))
+        i += size - overlap
+    return chunks
+
+
+async def ingest_before(chunker, embedding, paths, size, overlap, batch_size):
+    chunk_total = 0
+    for path in paths:
+        text = await get_extractor(path).extract_text(path)
+        chunks = chunk_by_decoding(chunker, text, size, overlap)
+        for start in range(0, len(chunks), batch_size):
+            await embedding.embed_texts(chunks[start:start + batch_size], batch_size)
+        chunk_total += len(chunks)
+    return chunk_total
+
+
+async def ingest_after(service, paths, size, overlap, batch_size):
+    uploads = []
+    for path in paths:
+        with open(path, "rb") as f:
+            content = f.read()
+        uploads.append(await service.process_upload(
+            os.path.basename(path), content, "Benchmark", size, overlap, batch_size
+        ))
+    await asyncio.gather(*service._tasks)
+    progress = [service.get_progress(doc.upload_id) for doc in uploads]
+    assert all(item.status == "done" for item in progress), [item.error for item in progress]
+    return sum(item.chunk_count for item in progress)
+
+
+async def measure(ingest):
+    """Wall time of an ingestion run and the longest event loop stall during it."""
+    stalls = []
+    done = asyncio.Event()
+
+    async def probe():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            stalls.append(time.perf_counter() - start - 0.01)
+
+    probe_task = asyncio.create_task(probe())
+    start = time.perf_counter()
+    chunk_count = await ingest
+    elapsed = time.perf_counter() - start
+    done.set()
+    await probe_task
+    return chunk_count, elapsed, max(stalls, default=0.0)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--paragraphs", type=int, default=3000, help="Paragraphs per DOCX file")
+    parser.add_argument("--chunk-size", type=int, default=900)
+    parser.add_argument("--overlap", type=int, default=150)
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=300, help="Simulated latency per embedding request")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--concurrent-embeddings", type=int, default=4)
+    args = parser.parse_args()
+
+    chunker = TiktokenChunker()
+    embedding = FakeEmbedding(args.latency_ms / 1000)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for n in range(args.files):
+            path = os.path.join(tmp, f"policy_{n}.docx")
+            make_docx(path, args.paragraphs, n)
+            paths.append(path)
+        size_mb = sum(os.path.getsize(p) for p in paths) / 1e6
+        print(f"{args.files} DOCX files x {args.paragraphs} paragraphs ({size_mb:.1f} MB), "
+              f"chunks of {args.chunk_size}/{args.overlap} tokens, batches of {args.batch_size}, "
+              f"{args.latency_ms:.0f} ms per embedding request\n")
+
+        before = await measure(ingest_before(
+            chunker, embedding, paths, args.chunk_size, args.overlap, args.batch_size
+        ))
+
+        # Start the worker processes outside the measurement (and before
+        # leaving the directory the relative sys.path entry points into)
+        executor = create_extraction_pool(chunker, args.workers)
+        await asyncio.gather(*(
+            asyncio.get_running_loop().run_in_executor(executor, time.sleep, 0.1)
+            for _ in range(args.workers)
+        ))
+
+        data_dir = os.path.join(tmp, "data")
+        os.makedirs(data_dir)
+        cwd = os.getcwd()
+        os.chdir(data_dir)
+        try:
+            service = UploadService(
+                chunker, embedding, NullVectorStore(), FileUploadRepository(), None,
+                max_concurrent_embeddings=args.concurrent_embeddings,
+                extraction_executor=executor,
+            )
+            after = await measure(ingest_after(
+                service, paths, args.chunk_size, args.overlap, args.batch_size
+            ))
+            service.shutdown()
+        finally:
+            os.chdir(cwd)
+
+    print(f"{'':<34}{'chunks':>8}{'wall time':>12}{'max loop stall':>17}")
+    for name, (chunk_count, elapsed, stall) in (
+        ("before (sequential, whole text)", before),
+        ("after (streaming, parallel)", after),
+    ):
+        print(f"{name:<34}{chunk_count:>8}{elapsed:>11.2f}s{stall * 1000:>14.0f} ms")
+    print(f"\nSpeed-up: {before[1] / after[1]:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Benchmark: rank_bm25 rebuild-per-collection vs. the incremental BM25Index.
+
+Generates synthetic chunks with a Zipf-distributed vocabulary and measures
+index build, a small incremental upload, queries, and save/load.
+
+Usage (from the gabor.toth directory):
+    python TESZTEK/benchmark_keyword_index.py [--chunks 100000] [--queries 200]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, 'backend')
+
+from infrastructure.keyword_index import BM25Index, tokenize
+
+
+def make_corpus(chunk_count: int, words_per_chunk: int, vocab_size: int, seed: int = 42):
+    """Synthetic chunks; word frequencies follow a Zipf distribution."""
+    rng = np.random.default_rng(seed)
+    vocab = np.array([f"w{i}" for i in range(vocab_size)])
+    ranks = np.minimum(rng.zipf(1.3, size=chunk_count * words_per_chunk), vocab_size) - 1
+    words = vocab[ranks].reshape(chunk_count, words_per_chunk)
+    ids = [f"chunk-{i}" for i in range(chunk_count)]
+    return ids, [" ".join(row) for row in words]
+
+
+def make_queries(query_count: int, vocab_size: int, seed: int = 7):
+    """Queries of 2-5 mid-frequency terms."""
+    rng = np.random.default_rng(seed)
+    return [
+        " ".join(f"w{t}" for t in rng.integers(5, min(vocab_size, 2000), size=rng.integers(2, 6)))
+        for _ in range(query_count)
+    ]
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def median_ms(func, queries):
+    durations = []
+    for query in queries:
+        start = time.perf_counter()
+        func(query)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunks", type=int, default=100_000)
+    parser.add_argument("--words", type=int, default=120, help="Words per chunk")
+    parser.add_argument("--vocab", type=int, default=30_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=5)
+    args = parser.parse_args()
+
+    ids, docs = make_corpus(args.chunks, args.words, args.vocab)
+    queries = make_queries(args.queries, args.vocab)
+    upload_ids, upload_docs = make_corpus(100, args.words, args.vocab, seed=1)
+    upload_ids = [f"upload-{i}" for i in range(len(upload_ids))]
+    print(f"{args.chunks:,} chunks x {args.words} words, vocabulary {args.vocab:,}, top_k={args.top_k}\n")
+
+    # Previous implementation: BM25Okapi over the whole collection, full sort per query
+    from rank_bm25 import BM25Okapi
+
+    def okapi_build(documents):
+        return BM25Okapi([tokenize(doc) for doc in documents])
+
+    def okapi_search(bm25, query):
+        scores = bm25.get_scores(tokenize(query))
+        return sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:args.top_k]
+
+    old_build, okapi = timed(lambda: okapi_build(docs))
+    old_upload, _ = timed(lambda: okapi_build(docs + upload_docs))
+    old_query = median_ms(lambda q: okapi_search(okapi, q), queries)
+    del okapi
+
+    # Incremental index
+    index = BM25Index()
+    new_build, _ = timed(lambda: index.add(ids, docs))
+    new_upload, _ = timed(lambda: index.add(upload_ids, upload_docs))
+    new_delete, _ = timed(lambda: index.delete(upload_ids))
+    new_query = median_ms(lambda q: index.search(q, args.top_k), queries)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "collection.npz")
+        save_time, _ = timed(lambda: index.save(path))
+        size_mb = os.path.getsize(path) / 1e6
+        load_time, loaded = timed(lambda: BM25Index.load(path))
+    assert loaded.search(queries[0], args.top_k) == index.search(queries[0], args.top_k)
+
+    rows = [
+        ("Build index", f"{old_build:.2f} s", f"{new_build:.2f} s"),
+        ("Index a 100-chunk upload", f"{old_upload:.2f} s (rebuild)", f"{new_upload * 1000:.1f} ms"),
+        ("Delete 100 chunks", "rebuild", f"{new_delete * 1000:.1f} ms"),
+        ("Query (median)", f"{old_query:.1f} ms", f"{new_query:.2f} ms"),
+        ("Restart", "rebuild", f"{load_time:.2f} s load ({size_mb:.0f} MB, saved in {save_time:.2f} s)"),
+    ]
+    print(f"{'':<28}{'rank_bm25 (before)':<26}BM25Index (after)")
+    for name, old, new in rows:
+        print(f"{name:<28}{old:<26}{new}")
+    print(f"\nQuery speed-up: {old_query / new_query:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Benchmark: latency of the advanced RAG workflow with simulated services.
+
+The category router, embedding, vector/BM25 search and answer generation are
+replaced by fakes that sleep for typical API latencies, so no API key is
+needed. Measures single-question latency and throughput for concurrent
+questions, both through AdvancedRAGAgent.answer_question (on the event loop)
+and through a synchronous graph.invoke in a worker thread.
+
+Usage (from the gabor.toth directory):
+    python TESZTEK/benchmark_workflow_latency.py [--runs 5] [--concurrent 20]
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+sys.path.insert(0, 'backend')
+
+from domain.interfaces import CategoryRouter, EmbeddingService, VectorStore, RAGAnswerer
+from domain.models import CategoryDecision, RetrievedChunk
+from services.langgraph_workflow import create_advanced_rag_workflow, AdvancedRAGAgent
+
+# Simulated latencies (seconds)
+ROUTER_S = 0.40
+EMBED_S = 0.15
+VECTOR_S = 0.03
+KEYWORD_S = 0.03
+ANSWER_S = 0.80
+
+
+class FakeRouter(CategoryRouter):
+    async def decide_category(self, question, available_categories, conversation_context=None):
+        await asyncio.sleep(ROUTER_S)
+        return CategoryDecision(category=available_categories[0], reason="benchmark")
+
+
+class FakeEmbedding(EmbeddingService):
+    async def embed_text(self, text):
+        await asyncio.sleep(EMBED_S)
+        return [0.1] * 8
+
+    async def embed_texts(self, texts):
+        await asyncio.sleep(EMBED_S)
+        return [[0.1] * 8 for _ in texts]
+
+
+def make_chunks(prefix):
+    return [
+        RetrievedChunk(chunk_id=f"{prefix}{i}", content=f"policy text {i}", distance=0.2 + i / 20,
+                       metadata={"source_file": "policy.md"})
+        for i in range(5)
+    ]
+
+
+class FakeVectorStore(VectorStore):
+    async def create_collection(self, collection_name):
+        pass
+
+    async def add_chunks(self, collection_name, chunks, embeddings=None):
+        pass
+
+    async def query(self, collection_name, query_embedding, top_k=5, similarity_threshold=0.6):
+        await asyncio.sleep(VECTOR_S)
+        return make_chunks("s")
+
+    async def keyword_search(self, collection_name, query_text, top_k=5):
+        await asyncio.sleep(KEYWORD_S)
+        return make_chunks("k")
+
+    async def delete_chunks(self, collection_name, chunk_ids):
+        pass
+
+    async def delete_collection(self, collection_name):
+        pass
+
+
+class FakeAnswerer(RAGAnswerer):
+    async def generate_answer(self, question, context_chunks, category):
+        await asyncio.sleep(ANSWER_S)
+        return "Simulated answer."
+
+
+def make_state(question):
+    return {
+        "user_id": "bench", "session_id": "bench", "question": question,
+        "available_categories": ["HR"], "routed_category": None, "category_confidence": 0.0,
+        "category_reason": "", "context_chunks": [], "fallback_triggered": False,
+        "final_answer": "", "answer_with_citations": "", "citation_sources": [],
+        "workflow_steps": [], "error_messages": [], "activity_callback": None,
+        "workflow_logs": [], "workflow_start_time": time.time(), "errors": [], "error_count": 0,
+        "retry_count": 0, "tool_failures": {}, "recovery_actions": [], "last_error_type": None,
+        "conversation_history": [], "history_context_summary": None,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--concurrent", type=int, default=20)
+    args = parser.parse_args()
+
+    graph, registry = create_advanced_rag_workflow(FakeRouter(), FakeEmbedding(), FakeVectorStore(), FakeAnswerer())
+    agent = AdvancedRAGAgent(graph, registry)
+    question = "How many vacation days do I get?"
+
+    async def via_agent():
+        return await agent.answer_question("bench", question, ["HR"])
+
+    async def via_thread():
+        return await asyncio.to_thread(graph.invoke, make_state(question), {"recursion_limit": 50})
+
+    print(f"Simulated latencies: router {ROUTER_S * 1000:.0f} ms, embedding {EMBED_S * 1000:.0f} ms, "
+          f"vector {VECTOR_S * 1000:.0f} ms, BM25 {KEYWORD_S * 1000:.0f} ms, answer {ANSWER_S * 1000:.0f} ms\n")
+
+    for name, run in (("answer_question (event loop)", via_agent), ("graph.invoke (worker thread)", via_thread)):
+        latencies = []
+        result = None
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            result = await run()
+            latencies.append(time.perf_counter() - start)
+        errors = result["error_messages"] if isinstance(result, dict) else result.error_messages
+
+        start = time.perf_counter()
+        await asyncio.gather(*(run() for _ in range(args.concurrent)))
+        burst = time.perf_counter() - start
+
+        print(f"{name}")
+        print(f"  single question (median): {statistics.median(latencies) * 1000:7.0f} ms"
+              + (f"  errors: {errors}" if errors else ""))
+        print(f"  {args.concurrent} concurrent questions:  {burst * 1000:7.0f} ms\n")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -205,14 +205,14 @@ class UploadRepository(ABC):
         self, user_id: str, category: str, upload_id: str, 
         chunks: List[Chunk]
     ) -> None:
-        """Save chunks.json to derived artifacts folder."""
+        """Save chunks to derived artifacts folder."""
         pass
 
     @abstractmethod
     async def load_chunks(
         self, user_id: str, category: str, upload_id: str
     ) -> List[Chunk]:
-        """Load chunks.json from derived artifacts folder."""
+        """Load chunks from derived artifacts folder."""
         pass
 
     @abstractmethod
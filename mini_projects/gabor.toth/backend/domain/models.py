@@ -114,6 +114,31 @@ class UploadedDocument:
         }
 
 
+@dataclass
+class UploadProgress:
+    """Progress of the background indexing of one upload."""
+    upload_id: str
+    filename: str
+    category: str
+    status: str = "queued"  # queued, extracting, embedding, indexing, done, failed
+    chunk_count: int = 0
+    embedded_chunks: int = 0
+    error: Optional[str] = None
+    updated_at: datetime = field(default_factory=datetime.now)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "upload_id": self.upload_id,
+            "filename": self.filename,
+            "category": self.category,
+            "status": self.status,
+            "chunk_count": self.chunk_count,
+            "embedded_chunks": self.embedded_chunks,
+            "error": self.error,
+            "updated_at": self.updated_at.isoformat(),
+        }
+
+
 @dataclass
 class RetrievedChunk:
     """Retrieved chunk with similarity score."""
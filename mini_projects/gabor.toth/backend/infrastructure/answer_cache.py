@@ -0,0 +1,132 @@
+"""Semantic answer cache shared across sessions."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+@dataclass
+class CachedAnswer:
+    """A previously generated answer and the question it answered."""
+    question: str
+    answer: str
+    category: str
+    similarity: float = 1.0
+    created_at: datetime = field(default_factory=datetime.now)
+
+
+class _CategoryEntries:
+    """Unit-normalized question embeddings of one category, one row per entry."""
+
+    def __init__(self, dim: int, capacity: int = 32):
+        self.vectors = np.empty((capacity, dim), dtype=np.float32)
+        self.answers: List[CachedAnswer] = []
+
+    def __len__(self) -> int:
+        return len(self.answers)
+
+    def best_match(self, vector: np.ndarray) -> tuple:
+        """(row, cosine similarity) of the closest cached question."""
+        similarities = self.vectors[:len(self)] @ vector
+        row = int(np.argmax(similarities))
+        return row, float(similarities[row])
+
+    def append(self, vector: np.ndarray, entry: CachedAnswer) -> None:
+        if len(self) == self.vectors.shape[0]:
+            grown = np.empty((2 * len(self), self.vectors.shape[1]), dtype=np.float32)
+            grown[:len(self)] = self.vectors
+            self.vectors = grown
+        self.vectors[len(self)] = vector
+        self.answers.append(entry)
+
+    def pop_oldest(self) -> None:
+        self.vectors[:len(self) - 1] = self.vectors[1:len(self)]
+        self.answers.pop(0)
+
+
+class SemanticAnswerCache:
+    """Cross-session answer cache keyed by category.
+
+    Each category keeps a NumPy matrix of question embeddings, so a lookup is
+    one matrix-vector product per category. Entries of a category are
+    dropped when its documents change (see `invalidate`).
+    """
+
+    def __init__(self, similarity_threshold: float = 0.95, max_entries_per_category: int = 500):
+        self.similarity_threshold = similarity_threshold
+        self.max_entries_per_category = max_entries_per_category
+        self._categories: Dict[str, _CategoryEntries] = {}
+
+    @staticmethod
+    def _key(category: str) -> str:
+        return category.strip().lower()
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._categories.values())
+
+    def lookup(
+        self, embedding: List[float], categories: Iterable[str]
+    ) -> Optional[CachedAnswer]:
+        """Best cached answer within the given categories, if similar enough."""
+        vector = self._normalize(embedding)
+        if vector is None:
+            return None
+
+        best: Optional[CachedAnswer] = None
+        best_similarity = self.similarity_threshold
+        for category in categories:
+            entries = self._categories.get(self._key(category))
+            if not entries or entries.vectors.shape[1] != vector.shape[0]:
+                continue
+            row, similarity = entries.best_match(vector)
+            if similarity >= best_similarity:
+                best, best_similarity = entries.answers[row], similarity
+
+        if best is None:
+            return None
+        return CachedAnswer(
+            question=best.question,
+            answer=best.answer,
+            category=best.category,
+            similarity=best_similarity,
+            created_at=best.created_at,
+        )
+
+    def store(self, category: str, question: str, embedding: List[float], answer: str) -> None:
+        """Cache an answer; a near-identical cached question is overwritten."""
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+
+        key = self._key(category)
+        entries = self._categories.get(key)
+        if entries is None or entries.vectors.shape[1] != vector.shape[0]:
+            entries = self._categories[key] = _CategoryEntries(dim=vector.shape[0])
+
+        entry = CachedAnswer(question=question, answer=answer, category=category)
+        if len(entries):
+            row, similarity = entries.best_match(vector)
+            if similarity >= self.similarity_threshold:
+                entries.vectors[row] = vector
+                entries.answers[row] = entry
+                return
+
+        if len(entries) >= self.max_entries_per_category:
+            entries.pop_oldest()
+        entries.append(vector, entry)
+
+    def invalidate(self, category: str) -> int:
+        """Drop all cached answers of a category. Returns how many were dropped."""
+        entries = self._categories.pop(self._key(category), None)
+        return len(entries) if entries else 0
+
+    def clear(self) -> None:
+        self._categories.clear()
@@ -1,15 +1,58 @@
 """Document chunking implementation using tiktoken."""
 
-from typing import List
+from functools import lru_cache
+from typing import Iterable, Iterator, List, NamedTuple
+
+import numpy as np
 import tiktoken
 
 from domain.interfaces import Chunker
 
 
+class TextChunk(NamedTuple):
+    """A chunk of text and its character span in the source document."""
+    text: str
+    start_char: int
+    end_char: int
+
+
+# Small sections (paragraphs) are joined into blocks of about this many
+# characters before encoding, to keep the per-call overhead low
+ENCODE_BLOCK_CHARS = 32_000
+
+
+def _blocks(sections: Iterable[str]) -> Iterator[str]:
+    """Join consecutive sections with newlines into blocks of ~ENCODE_BLOCK_CHARS."""
+    block: List[str] = []
+    size = 0
+    for section in sections:
+        block.append(section)
+        size += len(section) + 1
+        if size >= ENCODE_BLOCK_CHARS:
+            yield "\n".join(block)
+            block, size = [], 0
+    if block:
+        yield "\n".join(block)
+
+
+@lru_cache(maxsize=None)
+def _token_byte_lengths(encoding_name: str) -> np.ndarray:
+    """UTF-8 byte length of every token id of an encoding."""
+    encoding = tiktoken.get_encoding(encoding_name)
+    lengths = np.zeros(encoding.n_vocab, dtype=np.int64)
+    for token in range(encoding.n_vocab):
+        try:
+            lengths[token] = len(encoding.decode_single_token_bytes(token))
+        except KeyError:
+            pass
+    return lengths
+
+
 class TiktokenChunker(Chunker):
     """Chunker using tiktoken for token-based splitting."""
 
     def __init__(self, encoding_name: str = "cl100k_base"):
+        self.encoding_name = encoding_name
         self.encoding = tiktoken.get_encoding(encoding_name)
 
     def chunk_text(
@@ -17,17 +60,71 @@ class TiktokenChunker(Chunker):
         overlap_tokens: int = 150
     ) -> List[str]:
         """Split text into chunks based on token count."""
-        tokens = self.encoding.encode(text)
-        chunks = []
+        return [
+            chunk.text
+            for chunk in self.iter_chunks([text], chunk_size_tokens, overlap_tokens)
+        ]
+
+    def iter_chunks(
+        self, sections: Iterable[str], chunk_size_tokens: int = 900,
+        overlap_tokens: int = 150
+    ) -> Iterator[TextChunk]:
+        """Chunk a stream of sections (pages, paragraphs) joined by newlines.
+
+        Sections are encoded block by block. Windows are cut from the UTF-8 bytes
+        using the byte length of each token, so no token window is decoded
+        again and only the unfinished tail of the stream is kept in memory.
+        """
+        step = chunk_size_tokens - overlap_tokens
+        if step <= 0:
+            raise ValueError("overlap_tokens must be smaller than chunk_size_tokens")
+
+        token_lengths = _token_byte_lengths(self.encoding_name)
+        buffer = b""
+        # bounds[i] is the byte offset of token i in buffer, bounds[-1] == len(buffer)
+        bounds = np.zeros(1, dtype=np.int64)
+        start_char = 0
+        first = True
+
+        for block in _blocks(sections):
+            text = block if first else "\n" + block
+            first = False
+            data = text.encode("utf-8")
+            tokens = np.asarray(self.encoding.encode_ordinary(text), dtype=np.int64)
+            bounds = np.concatenate((bounds, len(buffer) + np.cumsum(token_lengths[tokens])))
+            buffer += data
+
+            position = 0
+            while len(bounds) - 1 - position >= chunk_size_tokens:
+                yield self._window(buffer, bounds, position, chunk_size_tokens, start_char)
+                start_char += self._char_count(buffer, bounds, position, step)
+                position += step
+
+            # Keep only the tokens that are still part of a future window
+            offset = int(bounds[position])
+            buffer = buffer[offset:]
+            bounds = bounds[position:] - offset
 
-        i = 0
-        while i < len(tokens):
-            # Take chunk_size_tokens
-            chunk_tokens = tokens[i : i + chunk_size_tokens]
-            chunk_text = self.encoding.decode(chunk_tokens)
-            chunks.append(chunk_text)
+        position = 0
+        while position < len(bounds) - 1:
+            size = min(chunk_size_tokens, len(bounds) - 1 - position)
+            yield self._window(buffer, bounds, position, size, start_char)
+            start_char += self._char_count(buffer, bounds, position, step)
+            position += step
 
-            # Move forward by (chunk_size - overlap)
-            i += chunk_size_tokens - overlap_tokens
+    @staticmethod
+    def _char_count(buffer: bytes, bounds: np.ndarray, position: int, size: int) -> int:
+        """Characters starting within the given tokens (UTF-8 lead bytes)."""
+        end = min(position + size, len(bounds) - 1)
+        data = np.frombuffer(buffer, dtype=np.uint8)[bounds[position]:bounds[end]]
+        return int(np.count_nonzero((data & 0xC0) != 0x80))
 
-        return chunks
+    @staticmethod
+    def _window(
+        buffer: bytes, bounds: np.ndarray, position: int, size: int, start_char: int
+    ) -> TextChunk:
+        # Tokens may split a multi-byte character; the partial bytes at the
+        # window edges are dropped (the overlap keeps the character), so the
+        # text still starts at start_char.
+        text = buffer[bounds[position]:bounds[position + size]].decode("utf-8", errors="ignore")
+        return TextChunk(text=text, start_char=start_char, end_char=start_char + len(text))
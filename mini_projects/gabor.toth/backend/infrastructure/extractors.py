@@ -2,20 +2,36 @@
 
 import os
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 from domain.interfaces import DocumentTextExtractor
 
+# Markdown files are streamed in blocks of roughly this many characters
+MARKDOWN_BLOCK_CHARS = 64_000
+
 
 class MarkdownExtractor(DocumentTextExtractor):
     """Extract text from Markdown files."""
 
     async def extract_text(self, file_path: str) -> str:
         """Extract text from a .md file."""
+        return "\n".join(self.iter_sections(file_path))
+
+    def iter_sections(self, file_path: str) -> Iterator[str]:
+        """Yield the file in blocks of lines (without the joining newline)."""
         if not file_path.lower().endswith(".md"):
             raise ValueError(f"Expected .md file, got {file_path}")
 
         with open(file_path, "r", encoding="utf-8") as f:
-            return f.read()
+            block = []
+            size = 0
+            for line in f:
+                block.append(line)
+                size += len(line)
+                if size >= MARKDOWN_BLOCK_CHARS and line.endswith("\n"):
+                    yield "".join(block)[:-1]
+                    block, size = [], 0
+            yield "".join(block)
 
 
 class PDFExtractor(DocumentTextExtractor):
@@ -23,6 +39,10 @@ class PDFExtractor(DocumentTextExtractor):
 
     async def extract_text(self, file_path: str) -> str:
         """Extract text from a .pdf file."""
+        return "\n".join(self.iter_sections(file_path))
+
+    def iter_sections(self, file_path: str) -> Iterator[str]:
+        """Yield the text of the PDF page by page."""
         try:
             import PyPDF2
         except ImportError:
@@ -31,14 +51,11 @@ class PDFExtractor(DocumentTextExtractor):
         if not file_path.lower().endswith(".pdf"):
             raise ValueError(f"Expected .pdf file, got {file_path}")
 
-        text = []
         try:
             with open(file_path, "rb") as f:
                 pdf_reader = PyPDF2.PdfReader(f)
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    text.append(page.extract_text())
-            return "\n".join(text)
+                for page in pdf_reader.pages:
+                    yield page.extract_text()
         except Exception as e:
             raise ValueError(f"Failed to extract text from PDF: {str(e)}")
 
@@ -48,6 +65,10 @@ class DocxExtractor(DocumentTextExtractor):
 
     async def extract_text(self, file_path: str) -> str:
         """Extract text from a .docx file."""
+        return "\n".join(self.iter_sections(file_path))
+
+    def iter_sections(self, file_path: str) -> Iterator[str]:
+        """Yield the text of the document paragraph by paragraph."""
         try:
             from docx import Document
         except ImportError:
@@ -56,12 +77,10 @@ class DocxExtractor(DocumentTextExtractor):
         if not file_path.lower().endswith(".docx"):
             raise ValueError(f"Expected .docx file, got {file_path}")
 
-        text = []
         try:
             doc = Document(file_path)
             for para in doc.paragraphs:
-                text.append(para.text)
-            return "\n".join(text)
+                yield para.text
         except Exception as e:
             raise ValueError(f"Failed to extract text from DOCX: {str(e)}")
 
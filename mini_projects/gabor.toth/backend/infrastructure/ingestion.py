@@ -0,0 +1,64 @@
+"""CPU-bound part of document ingestion, run in a worker process."""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, NamedTuple
+
+from domain.interfaces import Chunker
+from infrastructure.chunker import TextChunk
+from infrastructure.extractors import get_extractor
+
+
+class ExtractedDocument(NamedTuple):
+    """Chunks of an extracted document and the length of its text."""
+    chunks: List[TextChunk]
+    char_count: int
+
+
+def extract_and_chunk(
+    chunker: Chunker, file_path: str, filename: str,
+    chunk_size_tokens: int, overlap_tokens: int
+) -> ExtractedDocument:
+    """Stream the sections of a document into the chunker.
+
+    Module-level so it can be sent to a ProcessPoolExecutor. Only the chunks
+    travel back to the parent process, never the full document text.
+    """
+    extractor = get_extractor(filename)
+    char_count = 0
+
+    def sections():
+        nonlocal char_count
+        for index, section in enumerate(extractor.iter_sections(file_path)):
+            char_count += len(section) + (1 if index else 0)
+            yield section
+
+    if hasattr(chunker, "iter_chunks"):
+        chunks = list(chunker.iter_chunks(sections(), chunk_size_tokens, overlap_tokens))
+    else:
+        # Chunkers without streaming support get the whole text
+        text = "\n".join(sections())
+        chunks = [
+            TextChunk(text=chunk, start_char=0, end_char=len(chunk))
+            for chunk in chunker.chunk_text(text, chunk_size_tokens, overlap_tokens)
+        ]
+    return ExtractedDocument(chunks=chunks, char_count=char_count)
+
+
+def _warm_up(chunker: Chunker) -> None:
+    """Load the tokenizer once per worker instead of during the first upload."""
+    chunker.chunk_text("warm up", 2, 1)
+
+
+def create_extraction_pool(chunker: Chunker, workers: int) -> ProcessPoolExecutor:
+    """Worker processes for extract_and_chunk, with the tokenizer preloaded.
+
+    Uses spawn: forking a process with a running event loop and client
+    threads is not safe.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_warm_up,
+        initargs=(chunker,),
+    )
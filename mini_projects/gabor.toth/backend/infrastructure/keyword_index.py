@@ -0,0 +1,217 @@
+"""Incremental BM25 keyword index with on-disk persistence."""
+
+import json
+import logging
+import math
+import os
+import zipfile
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Postings are stored in array.array and read zero-copy with numpy
+_SLOT_TYPECODE, _SLOT_DTYPE = "I", np.uintc
+_TF_TYPECODE, _TF_DTYPE = "H", np.ushort
+_MAX_TF = 65535
+
+# Rebuild postings once this share of slots belongs to deleted chunks
+COMPACT_RATIO = 0.25
+
+INDEX_FORMAT_VERSION = 1
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase whitespace tokenization (same as the previous BM25Okapi setup)."""
+    return text.lower().split()
+
+
+class BM25Index:
+    """BM25 inverted index that supports adding and deleting chunks in place.
+
+    Every chunk gets a slot; postings map a term to the slots containing it
+    and the term frequency there. Deleting a chunk only marks its slot dead,
+    so document frequencies are computed from live postings at query time and
+    dead slots are dropped by `compact()`.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._ids: List[Optional[str]] = []
+        self._slots: Dict[str, int] = {}
+        self._doc_lens = array(_SLOT_TYPECODE)
+        self._alive = array("B")
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._total_len = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, chunk_id: str) -> bool:
+        return chunk_id in self._slots
+
+    @property
+    def dead_slots(self) -> int:
+        return len(self._ids) - len(self._slots)
+
+    def add(self, chunk_ids: Iterable[str], documents: Iterable[str]) -> None:
+        """Index chunks; an already indexed ID is replaced."""
+        for chunk_id, document in zip(chunk_ids, documents):
+            if chunk_id in self._slots:
+                self._remove(chunk_id)
+
+            slot = len(self._ids)
+            tokens = tokenize(document or "")
+            self._ids.append(chunk_id)
+            self._slots[chunk_id] = slot
+            self._doc_lens.append(len(tokens))
+            self._alive.append(1)
+            self._total_len += len(tokens)
+
+            for term, tf in Counter(tokens).items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = (array(_SLOT_TYPECODE), array(_TF_TYPECODE))
+                postings[0].append(slot)
+                postings[1].append(min(tf, _MAX_TF))
+
+    def delete(self, chunk_ids: Iterable[str]) -> int:
+        """Remove chunks from the index. Returns how many were indexed."""
+        removed = sum(1 for chunk_id in chunk_ids if self._remove(chunk_id))
+        if removed and self.dead_slots > COMPACT_RATIO * len(self._ids):
+            self.compact()
+        return removed
+
+    def _remove(self, chunk_id: str) -> bool:
+        slot = self._slots.pop(chunk_id, None)
+        if slot is None:
+            return False
+        self._ids[slot] = None
+        self._alive[slot] = 0
+        self._total_len -= self._doc_lens[slot]
+        return True
+
+    def compact(self) -> None:
+        """Drop dead slots and renumber the remaining ones."""
+        if not self.dead_slots:
+            return
+
+        alive = np.frombuffer(self._alive, dtype=np.uint8).astype(bool)
+        new_slot = np.cumsum(alive, dtype=np.int64) - 1
+
+        postings: Dict[str, Tuple[array, array]] = {}
+        for term, (slots, tfs) in self._postings.items():
+            slots_np = np.frombuffer(slots, dtype=_SLOT_DTYPE)
+            keep = alive[slots_np]
+            if not keep.any():
+                continue
+            postings[term] = (
+                array(_SLOT_TYPECODE, new_slot[slots_np[keep]].astype(_SLOT_DTYPE).tobytes()),
+                array(_TF_TYPECODE, np.frombuffer(tfs, dtype=_TF_DTYPE)[keep].tobytes()),
+            )
+
+        doc_lens = np.frombuffer(self._doc_lens, dtype=_SLOT_DTYPE)[alive]
+        self._ids = [chunk_id for chunk_id in self._ids if chunk_id is not None]
+        self._slots = {chunk_id: slot for slot, chunk_id in enumerate(self._ids)}
+        self._doc_lens = array(_SLOT_TYPECODE, doc_lens.tobytes())
+        self._alive = array("B", bytes([1]) * len(self._ids))
+        self._postings = postings
+
+    def search(self, query_text: str, top_k: int = 5) -> List[Tuple[str, float]]:
+        """Return up to top_k (chunk_id, score) pairs with positive BM25 score, best first."""
+        live = len(self._slots)
+        query_terms = Counter(tokenize(query_text))
+        if not live or not query_terms or top_k <= 0:
+            return []
+
+        alive = np.frombuffer(self._alive, dtype=np.uint8).astype(bool)
+        doc_lens = np.frombuffer(self._doc_lens, dtype=_SLOT_DTYPE).astype(np.float64)
+        avgdl = self._total_len / live or 1.0
+        scores = np.zeros(len(self._ids), dtype=np.float64)
+
+        for term, weight in query_terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            slots = np.frombuffer(postings[0], dtype=_SLOT_DTYPE)
+            tfs = np.frombuffer(postings[1], dtype=_TF_DTYPE).astype(np.float64)
+            if self.dead_slots:
+                keep = alive[slots]
+                slots, tfs = slots[keep], tfs[keep]
+            if not len(slots):
+                continue
+
+            # Non-negative IDF, so very common terms never push scores below zero
+            df = len(slots)
+            idf = math.log(1.0 + (live - df + 0.5) / (df + 0.5))
+            norm = self.k1 * (1.0 - self.b + self.b * doc_lens[slots] / avgdl)
+            scores[slots] += weight * idf * tfs * (self.k1 + 1.0) / (tfs + norm)
+
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > top_k:
+            candidates = candidates[np.argpartition(-scores[candidates], top_k - 1)[:top_k]]
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(self._ids[slot], float(scores[slot])) for slot in ranked]
+
+    def save(self, path: str) -> None:
+        """Persist the index to a .npz file (atomic write)."""
+        self.compact()
+        terms = list(self._postings)
+        lengths = np.fromiter((len(self._postings[t][0]) for t in terms), dtype=np.int64, count=len(terms))
+        meta = {
+            "version": INDEX_FORMAT_VERSION,
+            "k1": self.k1,
+            "b": self.b,
+            "ids": self._ids,
+            "terms": terms,
+        }
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as f:
+            np.savez(
+                f,
+                meta=np.frombuffer(json.dumps(meta, ensure_ascii=False).encode("utf-8"), dtype=np.uint8),
+                doc_lens=np.frombuffer(self._doc_lens, dtype=_SLOT_DTYPE),
+                offsets=np.concatenate(([0], np.cumsum(lengths))),
+                slots=np.frombuffer(b"".join(self._postings[t][0].tobytes() for t in terms), dtype=_SLOT_DTYPE),
+                tfs=np.frombuffer(b"".join(self._postings[t][1].tobytes() for t in terms), dtype=_TF_DTYPE),
+            )
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["BM25Index"]:
+        """Load an index saved with `save()`; None if missing or unreadable."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as data:
+                meta = json.loads(data["meta"].tobytes().decode("utf-8"))
+                if meta.get("version") != INDEX_FORMAT_VERSION:
+                    return None
+                doc_lens = data["doc_lens"].astype(_SLOT_DTYPE)
+                offsets = data["offsets"]
+                slots = data["slots"].astype(_SLOT_DTYPE)
+                tfs = data["tfs"].astype(_TF_DTYPE)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            logger.warning("Could not load BM25 index %s: %s", path, e)
+            return None
+
+        index = cls(k1=meta["k1"], b=meta["b"])
+        index._ids = meta["ids"]
+        index._slots = {chunk_id: slot for slot, chunk_id in enumerate(index._ids)}
+        index._doc_lens = array(_SLOT_TYPECODE, doc_lens.tobytes())
+        index._alive = array("B", bytes([1]) * len(index._ids))
+        index._total_len = int(doc_lens.sum())
+        index._postings = {
+            term: (
+                array(_SLOT_TYPECODE, slots[start:end].tobytes()),
+                array(_TF_TYPECODE, tfs[start:end].tobytes()),
+            )
+            for term, start, end in zip(meta["terms"], offsets[:-1], offsets[1:])
+        }
+        return index
@@ -212,11 +212,10 @@ class FileUploadRepository(UploadRepository):
                 upload_id, filename = parts
                 size = file_path.stat().st_size
 
-                # Try to load metadata from derived chunks
+                # Try to load metadata from the first derived chunk
                 metadata = {}
-                chunks = await self.load_chunks(category, upload_id)
-                if chunks:
-                    first_chunk = chunks[0]
+                first_chunk = next(self._iter_chunk_records(category, upload_id), None)
+                if first_chunk:
                     metadata = {
                         "chunk_size_tokens": first_chunk.metadata.get("chunk_size_tokens", 900),
                         "overlap_tokens": first_chunk.metadata.get("overlap_tokens", 150),
@@ -242,52 +241,57 @@ class FileUploadRepository(UploadRepository):
         self, category: str, upload_id: str,
         chunks: List[Chunk]
     ) -> None:
-        """Save chunks.json to derived artifacts folder."""
+        """Save chunks.jsonl (one compact JSON object per line) to derived artifacts folder."""
         derived_dir = self._get_derived_dir(category, upload_id)
         derived_dir.mkdir(parents=True, exist_ok=True)
 
-        chunks_path = derived_dir / "chunks.json"
-        temp_path = chunks_path.with_suffix(".json.tmp")
+        chunks_path = derived_dir / "chunks.jsonl"
+        temp_path = chunks_path.with_suffix(".jsonl.tmp")
 
         with open(temp_path, "w", encoding="utf-8") as f:
-            json.dump(
-                [chunk.to_dict() for chunk in chunks],
-                f, ensure_ascii=False, indent=2
-            )
+            for chunk in chunks:
+                f.write(json.dumps(chunk.to_dict(), ensure_ascii=False))
+                f.write("\n")
 
         temp_path.replace(chunks_path)
 
     async def load_chunks(
         self, category: str, upload_id: str
     ) -> List[Chunk]:
-        """Load chunks.json from derived artifacts folder."""
-        derived_dir = self._get_derived_dir(category, upload_id)
-        chunks_path = derived_dir / "chunks.json"
-
-        if not chunks_path.exists():
-            return []
-
-        with open(chunks_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        """Load chunks from derived artifacts folder (chunks.jsonl, or legacy chunks.json)."""
+        return list(self._iter_chunk_records(category, upload_id))
 
-        chunks = []
-        for item in data:
-            chunks.append(
-                Chunk(
-                    chunk_id=item["chunk_id"],
-                    content=item["content"],
-                    upload_id=item["upload_id"],
-                    category=item["category"],
-                    source_file=item["source_file"],
-                    chunk_index=item["chunk_index"],
-                    start_char=item["start_char"],
-                    end_char=item["end_char"],
-                    section_title=item.get("section_title"),
-                    metadata=item.get("metadata", {}),
-                )
-            )
-
-        return chunks
+    def _iter_chunk_records(self, category: str, upload_id: str):
+        derived_dir = self._get_derived_dir(category, upload_id)
+        chunks_path = derived_dir / "chunks.jsonl"
+
+        if chunks_path.exists():
+            with open(chunks_path, "r", encoding="utf-8") as f:
+                items = (json.loads(line) for line in f if line.strip())
+                for item in items:
+                    yield self._chunk_from_dict(item)
+            return
+
+        legacy_path = derived_dir / "chunks.json"
+        if legacy_path.exists():
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                for item in json.load(f):
+                    yield self._chunk_from_dict(item)
+
+    @staticmethod
+    def _chunk_from_dict(item: dict) -> Chunk:
+        return Chunk(
+            chunk_id=item["chunk_id"],
+            content=item["content"],
+            upload_id=item["upload_id"],
+            category=item["category"],
+            source_file=item["source_file"],
+            chunk_index=item["chunk_index"],
+            start_char=item["start_char"],
+            end_char=item["end_char"],
+            section_title=item.get("section_title"),
+            metadata=item.get("metadata", {}),
+        )
     async def save_description(
         self, category: str, description: str
     ) -> None:
@@ -1,25 +1,44 @@
 """ChromaDB vector store implementation with BM25 keyword search."""
 
+import asyncio
 import os
-from typing import List, Dict
+import threading
+from typing import List, Dict, Optional, Set
 import chromadb
-from rank_bm25 import BM25Okapi
 
 from domain.models import Chunk, RetrievedChunk
 from domain.interfaces import VectorStore
+from infrastructure.keyword_index import BM25Index
 
 
 class ChromaVectorStore(VectorStore):
     """Vector store using ChromaDB persistent storage with BM25 hybrid search."""
 
-    def __init__(self, persist_directory: str = "data/chroma_db"):
+    # Page size when rebuilding a BM25 index from an existing collection
+    REBUILD_PAGE_SIZE = 5000
+    # Seconds to collect index changes before writing them to disk
+    KEYWORD_INDEX_SAVE_DELAY = 5.0
+
+    def __init__(
+        self, persist_directory: str = "data/chroma_db",
+        keyword_index_directory: Optional[str] = None
+    ):
         os.makedirs(persist_directory, exist_ok=True)
         # Use the new Chroma client API
         self.client = chromadb.PersistentClient(path=persist_directory)
-        # Cache for BM25 indexes per collection
-        self._bm25_indexes: Dict[str, BM25Okapi] = {}
-        self._collection_docs: Dict[str, List[str]] = {}
-
+        # BM25 indexes are persisted next to the Chroma data (data/bm25_index)
+        self.keyword_index_directory = keyword_index_directory or os.path.join(
+            os.path.dirname(os.path.normpath(persist_directory)), "bm25_index"
+        )
+        # Loaded BM25 indexes per collection
+        self._bm25_indexes: Dict[str, BM25Index] = {}
+        # Collections whose index changed since the last save
+        self._dirty_indexes: Set[str] = set()
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        self._save_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Indexes are saved in a worker thread; the lock keeps them from
+        # changing (or being searched mid-compaction) while they are written
+        self._index_lock = threading.Lock()
 
     async def create_collection(self, collection_name: str) -> None:
         """Create or get a collection."""
@@ -35,6 +54,9 @@ class ChromaVectorStore(VectorStore):
         """Add chunks to a collection with optional embeddings."""
         await self.create_collection(collection_name)
         collection = self.client.get_collection(collection_name)
+        # Load the keyword index before the collection changes, so a persisted
+        # index still matches and does not have to be rebuilt
+        index = self._get_keyword_index(collection_name, collection)
 
         ids = [chunk.chunk_id for chunk in chunks]
         documents = [chunk.content for chunk in chunks]
@@ -68,6 +90,11 @@ class ChromaVectorStore(VectorStore):
                 metadatas=metadatas,
             )
 
+        # Update the BM25 index incrementally; it is saved in the background
+        with self._index_lock:
+            index.add(ids, documents)
+        self._schedule_keyword_index_save(collection_name)
+
     async def query(
         self, collection_name: str, query_embedding: List[float],
         top_k: int = 5, similarity_threshold: float = 0.6
@@ -113,73 +140,119 @@ class ChromaVectorStore(VectorStore):
     ) -> List[RetrievedChunk]:
         """Keyword-based search using BM25 algorithm. ✅ SUGGESTION #5: HYBRID SEARCH"""
         collection = self.client.get_collection(collection_name)
-        
-        # Get all documents if index doesn't exist yet
-        if collection_name not in self._bm25_indexes:
-            # Retrieve all documents from collection
-            results = collection.get()
-            
-            if not results["ids"]:
-                return []
-            
-            # Build BM25 index from documents
-            documents = results["documents"]
-            tokenized_docs = [doc.lower().split() for doc in documents]
-            self._bm25_indexes[collection_name] = BM25Okapi(tokenized_docs)
-            self._collection_docs[collection_name] = documents
-            # Also store metadata for retrieval
-            self._collection_metadata = {
-                cid: results["metadatas"][i] 
-                for i, cid in enumerate(results["ids"])
-            }
-            self._collection_ids = results["ids"]
-        
-        # Get BM25 scores for query
-        tokenized_query = query_text.lower().split()
-        bm25 = self._bm25_indexes[collection_name]
-        scores = bm25.get_scores(tokenized_query)
-        
-        # Get top-k results by BM25 score
-        top_indices = sorted(
-            range(len(scores)), 
-            key=lambda i: scores[i], 
-            reverse=True
-        )[:top_k]
-        
+        index = self._get_keyword_index(collection_name, collection)
+
+        # Top-k chunk IDs by BM25 score (positive scores only)
+        with self._index_lock:
+            hits = index.search(query_text, top_k)
+        if not hits:
+            return []
+
+        # Fetch text and metadata only for the hits
+        results = collection.get(ids=[chunk_id for chunk_id, _ in hits], include=["documents", "metadatas"])
+        found = {
+            cid: (results["documents"][i], results["metadatas"][i])
+            for i, cid in enumerate(results["ids"])
+        }
+
         retrieved = []
-        for idx in top_indices:
-            if scores[idx] > 0:  # Only include positive scores
-                doc = self._collection_docs[collection_name][idx]
-                chunk_id = self._collection_ids[idx]
-                metadata = self._collection_metadata[chunk_id]
-                
-                snippet = doc[:200] + "..." if len(doc) > 200 else doc
-                
-                # Normalize BM25 score to 0-1 range (approximate)
-                normalized_distance = 1.0 - min(scores[idx] / 10.0, 1.0)
-                
-                retrieved.append(
-                    RetrievedChunk(
-                        chunk_id=chunk_id,
-                        content=doc,
-                        distance=normalized_distance,
-                        metadata=metadata,
-                        snippet=snippet,
-                    )
+        for chunk_id, score in hits:
+            if chunk_id not in found:
+                continue
+            doc, metadata = found[chunk_id]
+
+            snippet = doc[:200] + "..." if len(doc) > 200 else doc
+
+            # Normalize BM25 score to 0-1 range (approximate)
+            normalized_distance = 1.0 - min(score / 10.0, 1.0)
+
+            retrieved.append(
+                RetrievedChunk(
+                    chunk_id=chunk_id,
+                    content=doc,
+                    distance=normalized_distance,
+                    metadata=metadata,
+                    snippet=snippet,
                 )
-        
+            )
+
         return retrieved
 
+    def _keyword_index_path(self, collection_name: str) -> str:
+        return os.path.join(self.keyword_index_directory, f"{collection_name}.npz")
+
+    def _schedule_keyword_index_save(self, collection_name: str) -> None:
+        """Save the changed index once KEYWORD_INDEX_SAVE_DELAY has passed.
+
+        Changes made in the meantime are written together, in a worker thread
+        so the event loop keeps serving requests. An index that was not saved
+        (e.g. after a crash) no longer matches the collection size and is
+        rebuilt on load.
+        """
+        self._dirty_indexes.add(collection_name)
+        loop = asyncio.get_running_loop()
+        if self._save_handle is not None and self._save_loop is loop:
+            return
+        self._save_handle = loop.call_later(self.KEYWORD_INDEX_SAVE_DELAY, self._save_keyword_indexes_in_background)
+        self._save_loop = loop
+
+    def _save_keyword_indexes_in_background(self) -> None:
+        """Timer callback: hand the changed indexes to the default executor."""
+        loop = self._save_loop
+        self._save_handle = None
+        self._save_loop = None
+        dirty, self._dirty_indexes = self._dirty_indexes, set()
+        loop.run_in_executor(None, self._save_keyword_indexes, dirty)
+
+    def flush_keyword_indexes(self) -> None:
+        """Write changed BM25 indexes to disk now (also called on shutdown)."""
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+            self._save_loop = None
+        dirty, self._dirty_indexes = self._dirty_indexes, set()
+        self._save_keyword_indexes(dirty)
+
+    def _save_keyword_indexes(self, collection_names: Set[str]) -> None:
+        for collection_name in collection_names:
+            with self._index_lock:
+                index = self._bm25_indexes.get(collection_name)
+                if index is not None:
+                    index.save(self._keyword_index_path(collection_name))
+
+    def _get_keyword_index(self, collection_name: str, collection) -> BM25Index:
+        """Get the collection's BM25 index from memory or disk, rebuilding it
+        only if it is missing or out of sync with the collection."""
+        index = self._bm25_indexes.get(collection_name)
+        if index is not None:
+            return index
+
+        index = BM25Index.load(self._keyword_index_path(collection_name))
+        if index is None or len(index) != collection.count():
+            index = BM25Index()
+            total = collection.count()
+            for offset in range(0, total, self.REBUILD_PAGE_SIZE):
+                page = collection.get(include=["documents"], limit=self.REBUILD_PAGE_SIZE, offset=offset)
+                index.add(page["ids"], page["documents"])
+            index.save(self._keyword_index_path(collection_name))
+            if total:
+                print(f"🔎 Rebuilt BM25 index for '{collection_name}' ({total} chunks)")
+
+        self._bm25_indexes[collection_name] = index
+        return index
+
     async def delete_chunks(
         self, collection_name: str, chunk_ids: List[str]
     ) -> None:
         """Delete chunks by IDs."""
         collection = self.client.get_collection(collection_name)
+        index = self._get_keyword_index(collection_name, collection)
         collection.delete(ids=chunk_ids)
-        # Invalidate BM25 index for this collection
-        if collection_name in self._bm25_indexes:
-            del self._bm25_indexes[collection_name]
-            del self._collection_docs[collection_name]
+        # Keep the BM25 index in step with the collection
+        with self._index_lock:
+            deleted = index.delete(chunk_ids)
+        if deleted:
+            self._schedule_keyword_index_save(collection_name)
 
     async def delete_collection(self, collection_name: str) -> None:
         """Delete an entire collection."""
@@ -189,3 +262,11 @@ class ChromaVectorStore(VectorStore):
             # Collection might not exist, which is fine
             print(f"Note: Collection '{collection_name}' deletion: {e}")
 
+        self._dirty_indexes.discard(collection_name)
+        # Under the lock, so a background save cannot write the file back
+        with self._index_lock:
+            self._bm25_indexes.pop(collection_name, None)
+            index_path = self._keyword_index_path(collection_name)
+            if os.path.exists(index_path):
+                os.remove(index_path)
+
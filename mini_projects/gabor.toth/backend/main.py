@@ -31,6 +31,7 @@ from infrastructure.vector_store import ChromaVectorStore
 from infrastructure.chunker import TiktokenChunker
 from infrastructure.category_router import OpenAICategoryRouter
 from infrastructure.rag_answerer import OpenAIRAGAnswerer
+from infrastructure.answer_cache import SemanticAnswerCache
 from infrastructure.repositories import (
     JSONUserProfileRepository, JSONSessionRepository, FileUploadRepository
 )
@@ -80,6 +81,7 @@ tool_registry: Optional[ToolRegistry] = None
 rag_agent: Optional[AdvancedRAGAgent] = None
 chat_service: Optional[ChatService] = None
 activity_callback: Optional[QueuedActivityCallback] = None
+answer_cache: Optional[SemanticAnswerCache] = None
 
 
 @asynccontextmanager
@@ -88,6 +90,7 @@ async def lifespan(app: FastAPI):
     global embedding_service, vector_store, chunker, category_router
     global rag_answerer, profile_repo, session_repo, upload_repo
     global upload_service, compiled_graph, tool_registry, rag_agent, chat_service, activity_callback
+    global answer_cache
 
     # Check required env vars
     openai_api_key = os.getenv("OPENAI_API_KEY")
@@ -107,11 +110,13 @@ async def lifespan(app: FastAPI):
     session_repo = JSONSessionRepository()
     upload_repo = FileUploadRepository()
     activity_callback = QueuedActivityCallback()
+    answer_cache = SemanticAnswerCache()
 
     # Initialize services
     upload_service = UploadService(
         chunker, embedding_service, vector_store,
-        upload_repo, profile_repo, activity_callback
+        upload_repo, profile_repo, activity_callback,
+        answer_cache=answer_cache
     )
 
     # Create LangGraph agent with hybrid architecture
@@ -120,10 +125,15 @@ async def lifespan(app: FastAPI):
     )
     rag_agent = AdvancedRAGAgent(compiled_graph, tool_registry)
 
-    chat_service = ChatService(rag_agent, profile_repo, session_repo, upload_repo, activity_callback)
+    chat_service = ChatService(
+        rag_agent, profile_repo, session_repo, upload_repo, activity_callback,
+        embedding_service=embedding_service, answer_cache=answer_cache
+    )
 
     print("✓ Backend initialized successfully")
     yield
+    upload_service.shutdown()
+    vector_store.flush_keyword_indexes()
     print("✓ Backend shutdown")
 
 
@@ -435,6 +445,18 @@ async def upload_file(
         )
 
 
+@app.get("/api/files/{upload_id}/progress")
+async def get_upload_progress(upload_id: str):
+    """Indexing progress of an upload."""
+    if not upload_service:
+        raise HTTPException(status_code=500, detail="Service not initialized")
+
+    progress = upload_service.get_progress(upload_id)
+    if not progress:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return JSONResponse(progress.to_dict())
+
+
 @app.delete("/api/files/{upload_id}")
 async def delete_file(
     upload_id: str,
@@ -588,6 +610,10 @@ async def delete_category(category: str = Query(...)):
         except Exception as e:
             print(f"⚠ Vector store delete warning: {e}")
         
+        # Cached answers of the category are no longer backed by documents
+        if answer_cache is not None:
+            answer_cache.invalidate(category)
+        
         return JSONResponse({
             "success": True,
             "category": category,
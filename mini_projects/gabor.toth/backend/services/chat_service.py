@@ -2,13 +2,14 @@
 
 import time
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import difflib
 
 from domain.models import Message, MessageRole, UserProfile
 from domain.interfaces import (
-    UserProfileRepository, SessionRepository, ActivityCallback
+    UserProfileRepository, SessionRepository, ActivityCallback, EmbeddingService
 )
+from infrastructure.answer_cache import SemanticAnswerCache, CachedAnswer
 from services.langgraph_workflow import AdvancedRAGAgent
 from services.development_logger import get_dev_logger
 
@@ -23,12 +24,17 @@ class ChatService:
         session_repo: SessionRepository,
         upload_repo=None,  # Optional file upload repo to get global categories
         activity_callback: Optional[ActivityCallback] = None,
+        embedding_service: Optional[EmbeddingService] = None,
+        answer_cache: Optional[SemanticAnswerCache] = None,
     ):
         self.rag_agent = rag_agent
         self.profile_repo = profile_repo
         self.session_repo = session_repo
         self.upload_repo = upload_repo
         self.activity_callback = activity_callback
+        # Answer cache is only used when both are configured
+        self.embedding_service = embedding_service
+        self.answer_cache = answer_cache
 
     async def process_message(
         self,
@@ -110,12 +116,11 @@ class ChatService:
             return response
 
         # ============================================================================
-        # FEATURE: Conversation History Cache - Check BEFORE appending the current message
+        # FEATURE: Semantic Answer Cache - shared across sessions, checked before the RAG graph
         # ============================================================================
         # Load conversation history for context (BEFORE appending current message)
         previous_messages = await self.session_repo.get_messages(session_id)
         
-        # DEBUG: Log session info and history count
         dev_logger = get_dev_logger()
         dev_logger.log_suggestion_1_history(
             event="session_info",
@@ -123,14 +128,11 @@ class ChatService:
             details={"session_id": session_id, "message_count": len(previous_messages)}
         )
         
-        # DEBUG: Print loaded messages for verification
-        import sys
-        print(f"[CHAT] Loaded session {session_id}: {len(previous_messages)} messages", file=sys.stderr, flush=True)
-        for i, msg in enumerate(previous_messages):
-            print(f"[CHAT]   [{i}] {msg.role}: '{msg.content[:60]}...'", file=sys.stderr, flush=True)
-        
-        # Check if this exact question was asked before in the conversation
-        cached_answer = await self._check_question_cache(user_message, previous_messages)
+        # Check if this (or a very similar) question was already answered in one of the categories,
+        # then fall back to the questions asked earlier in this session
+        question_embedding, cached = await self._check_answer_cache(user_message, available_categories)
+        cached_answer = cached.answer if cached else await self._check_question_cache(user_message, previous_messages)
+        cache_source = "semantic_cache" if cached else "conversation_cache"
 
         # Append user message
         await self.session_repo.append_message(
@@ -161,7 +163,12 @@ class ChatService:
                     role=MessageRole.ASSISTANT,
                     content=cached_answer,
                     timestamp=datetime.now(),
-                    metadata={"source": "conversation_cache", "from_cache": True}
+                    metadata={
+                        "source": cache_source,
+                        "from_cache": True,
+                        "category_routed": cached.category if cached else None,
+                        "cache_similarity": round(cached.similarity, 4) if cached else None,
+                    }
                 )
             )
             
@@ -177,7 +184,12 @@ class ChatService:
             dev_logger.log_suggestion_1_history(
                 event="cache_hit",
                 description=f"Cache hit! Returning cached answer without RAG pipeline",
-                details={"cached_answer_length": len(cached_answer)}
+                details={
+                    "cached_answer_length": len(cached_answer),
+                    "source": cache_source,
+                    "category": cached.category if cached else None,
+                    "similarity": round(cached.similarity, 4) if cached else None,
+                }
             )
             
             # Log activity callback for UI display
@@ -188,7 +200,7 @@ class ChatService:
                     metadata={
                         "event_type": "cache_hit",
                         "response_length": len(cached_answer),
-                        "source": "conversation_cache"
+                        "source": cache_source,
                     }
                 )
 
@@ -198,7 +210,7 @@ class ChatService:
                 "tools_used": [],
                 "fallback_search": False,
                 "memory_snapshot": {
-                    "routed_category": None,
+                    "routed_category": cached.category if cached else None,
                     "available_categories": available_categories,
                     "from_cache": True,
                 },
@@ -212,7 +224,7 @@ class ChatService:
                     "method": "POST",
                     "status_code": 200,
                     "response_time_ms": round((time.time() - api_start_time) * 1000, 2),
-                    "source": "conversation_cache"
+                    "source": cache_source
                 }
             }
 
@@ -228,7 +240,8 @@ class ChatService:
         rag_response = await self.rag_agent.answer_question(
             user_id, user_message, available_categories,
             activity_callback=self.activity_callback,
-            conversation_history=previous_messages if previous_messages else None
+            conversation_history=previous_messages if previous_messages else None,
+            question_embedding=question_embedding,
         )
 
         # Extract answer and metadata (WorkflowOutput object)
@@ -240,6 +253,14 @@ class ChatService:
             context_chunks = rag_response.citation_sources
         fallback_search = getattr(rag_response, 'fallback_triggered', False)
 
+        # Cache only clean, document-backed answers
+        if (
+            self.answer_cache is not None and question_embedding
+            and final_answer and routed_category and not fallback_search
+            and not getattr(rag_response, 'error_messages', None)
+        ):
+            self.answer_cache.store(routed_category, user_message, question_embedding, final_answer)
+
         # DEBUG: Log the final answer
         import sys
         print(f"[CHAT] final_answer type={type(final_answer)}, length={len(final_answer) if final_answer else 0}, value={final_answer[:100] if final_answer else 'NONE/EMPTY'}", file=sys.stderr)
@@ -334,6 +355,41 @@ class ChatService:
         """Get conversation history for a session."""
         return await self.session_repo.get_messages(session_id)
 
+    async def _check_answer_cache(
+        self,
+        current_question: str,
+        categories: List[str],
+    ) -> Tuple[Optional[List[float]], Optional[CachedAnswer]]:
+        """
+        Embed the question and look it up in the semantic answer cache.
+        
+        Returns:
+            (question embedding, cached answer); the embedding is passed on to the
+            RAG workflow on a cache miss. Both are None if caching is disabled or
+            embedding fails.
+        """
+        if self.answer_cache is None or self.embedding_service is None:
+            return None, None
+        
+        try:
+            question_embedding = await self.embedding_service.embed_text(current_question.strip())
+        except Exception as e:
+            print(f"⚠️ Answer cache skipped, embedding failed: {e}")
+            return None, None
+        
+        cached = self.answer_cache.lookup(question_embedding, categories)
+        
+        dev_logger = get_dev_logger()
+        dev_logger.log_suggestion_1_history(
+            event="cache_check",
+            description="Semantic cache hit" if cached else "Semantic cache miss",
+            details={
+                "categories": len(categories),
+                "similarity": round(cached.similarity, 4) if cached else None,
+            }
+        )
+        return question_embedding, cached
+
     async def _check_question_cache(
         self,
         current_question: str,
@@ -342,76 +398,46 @@ class ChatService:
         """
         Check if this exact (or very similar) question was asked before in the conversation.
         
+        In-session fallback when the semantic answer cache is disabled or misses.
+        Exact matches are found first; fuzzy matching only computes the full
+        SequenceMatcher ratio for questions that pass difflib's cheap upper bounds.
+        
         Returns:
             Cached answer if found (exact or fuzzy match), None otherwise
         """
         if not conversation_history:
             return None
         
-        # DEBUG: Log what we have in history
-        dev_logger = get_dev_logger()
-        user_msgs = [m.content[:40] for m in conversation_history if (m.role == MessageRole.USER if not isinstance(m.role, str) else m.role == 'user')]
-        dev_logger.log_suggestion_1_history(
-            event="cache_check_debug",
-            description=f"Cache check started. History has {len(conversation_history)} messages, {len(user_msgs)} user messages",
-            details={"user_questions": user_msgs[:5]}
-        )
+        def role_of(msg: Message) -> MessageRole:
+            return MessageRole(msg.role) if isinstance(msg.role, str) else msg.role
+        
+        # (normalized question, answer) pairs: USER message directly followed by ASSISTANT
+        answered = [
+            (conversation_history[i].content.strip().lower(), conversation_history[i + 1].content)
+            for i in range(len(conversation_history) - 1)
+            if role_of(conversation_history[i]) == MessageRole.USER
+            and role_of(conversation_history[i + 1]) == MessageRole.ASSISTANT
+        ]
+        if not answered:
+            return None
         
         # Normalize current question for comparison
         normalized_current = current_question.strip().lower()
         
-        # DEBUG: Log detailed comparison
-        import sys
-        print(f"[CACHE] Checking: '{normalized_current}'", file=sys.stderr, flush=True)
+        # Check 1: Exact match (case-insensitive, whitespace-trimmed)
+        for normalized_prev, answer in answered:
+            if normalized_current == normalized_prev:
+                return answer
         
-        # Search through history for previous answers
-        for i in range(len(conversation_history) - 1):
-            msg = conversation_history[i]
-            
-            # Convert role to MessageRole if it's a string
-            msg_role = msg.role
-            if isinstance(msg_role, str):
-                msg_role = MessageRole(msg_role)
-            
-            # Look for USER messages (questions)
-            if msg_role == MessageRole.USER:
-                normalized_prev = msg.content.strip().lower()
-                
-                # DEBUG: Log comparison
-                import sys
-                if normalized_current == normalized_prev:
-                    print(f"[CACHE] ✅ EXACT MATCH FOUND at index {i}!", file=sys.stderr, flush=True)
-                
-                # Check 1: Exact match (case-insensitive, whitespace-trimmed)
-                if normalized_current == normalized_prev:
-                    # Found exact match! Get the next ASSISTANT message
-                    if i + 1 < len(conversation_history):
-                        next_msg = conversation_history[i + 1]
-                        next_msg_role = next_msg.role
-                        if isinstance(next_msg_role, str):
-                            next_msg_role = MessageRole(next_msg_role)
-                        if next_msg_role == MessageRole.ASSISTANT:
-                            print(f"[CACHE] Returning cached answer of length {len(next_msg.content)}", file=sys.stderr, flush=True)
-                            return next_msg.content
-                
-                # Check 2: Fuzzy match (similarity > 0.85 = very similar)
-                similarity = difflib.SequenceMatcher(
-                    None,
-                    normalized_current,
-                    normalized_prev
-                ).ratio()
-                
-                if similarity > 0.85:
-                    # Found very similar question! Get the next ASSISTANT message
-                    if i + 1 < len(conversation_history):
-                        next_msg = conversation_history[i + 1]
-                        next_msg_role = next_msg.role
-                        if isinstance(next_msg_role, str):
-                            next_msg_role = MessageRole(next_msg_role)
-                        if next_msg_role == MessageRole.ASSISTANT:
-                            print(f"[CACHE] FUZZY MATCH ({similarity:.2f}) - returning cached answer", file=sys.stderr, flush=True)
-                            return next_msg.content
+        # Check 2: Fuzzy match (similarity > 0.85 = very similar)
+        matcher = difflib.SequenceMatcher(None, b=normalized_current)
+        for normalized_prev, answer in answered:
+            matcher.set_seq1(normalized_prev)
+            if (
+                matcher.real_quick_ratio() > 0.85
+                and matcher.quick_ratio() > 0.85
+                and matcher.ratio() > 0.85
+            ):
+                return answer
         
-        print(f"[CACHE] ❌ No cache hit found", file=sys.stderr, flush=True)
-        # No cache hit found
         return None
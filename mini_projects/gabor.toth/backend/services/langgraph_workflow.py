@@ -8,6 +8,7 @@ from enum import Enum
 from dataclasses import dataclass
 from pydantic import BaseModel, Field
 from langgraph.graph import StateGraph, END
+from langchain_core.runnables import RunnableLambda
 from datetime import datetime
 
 from domain.models import CategoryDecision, Message, MessageRole, RetrievedChunk
@@ -16,6 +17,7 @@ from domain.interfaces import (
     RAGAnswerer, ActivityCallback
 )
 from services.development_logger import get_dev_logger
+from services.rag_agent import _slugify_collection_name
 
 
 # ============================================================================
@@ -84,7 +86,9 @@ class WorkflowState(TypedDict, total=False):
     category_reason: str
     
     # Retrieval
+    question_embedding: Optional[List[float]]
     context_chunks: List[RetrievedChunk]
+    keyword_chunks: Optional[List[RetrievedChunk]]  # BM25 results prefetched by the tools node
     search_strategy: SearchStrategy
     fallback_triggered: bool
     
@@ -648,7 +652,12 @@ def format_response_node(state: WorkflowState) -> Dict[str, Any]:
     return state
 
 
-def hybrid_search_node(state: WorkflowState, vector_store: VectorStore, embedding_service: EmbeddingService) -> Dict[str, Any]:
+def hybrid_search_node(
+    state: WorkflowState,
+    vector_store: VectorStore,
+    embedding_service: EmbeddingService,
+    keyword_chunks: Optional[List[RetrievedChunk]] = None,
+) -> Dict[str, Any]:
     """✅ SUGGESTION #5: HYBRID SEARCH - Combine semantic (vector) + keyword (BM25) search results.
     
     This node performs hybrid search by:
@@ -657,6 +666,9 @@ def hybrid_search_node(state: WorkflowState, vector_store: VectorStore, embeddin
     3. Combining results with weighted scoring (70% semantic + 30% keyword)
     4. Deduplicating identical chunks from both sources
     5. Logging all hybrid search activity
+    
+    Keyword results can be passed in (see hybrid_search_node_async) or
+    prefetched by the tools node in state["keyword_chunks"].
     """
     dev_logger = get_dev_logger()
     dev_logger.log_suggestion_5_hybrid(
@@ -665,8 +677,11 @@ def hybrid_search_node(state: WorkflowState, vector_store: VectorStore, embeddin
     )
     
     question = state.get("question", "")
-    collection_name = state.get("routed_category", "")
+    routed_category = state.get("routed_category", "")
+    collection_name = _collection_name(routed_category) if routed_category else ""
     semantic_chunks = state.get("context_chunks", [])  # Already retrieved by earlier nodes
+    if keyword_chunks is None:
+        keyword_chunks = state.get("keyword_chunks")
     
     if not question or not collection_name:
         dev_logger.log_suggestion_5_hybrid(
@@ -683,23 +698,24 @@ def hybrid_search_node(state: WorkflowState, vector_store: VectorStore, embeddin
         return state
     
     try:
-        # Keyword search (BM25) - synchronous alternative path
-        keyword_chunks = []
-        try:
-            result = vector_store.keyword_search(collection_name, question, top_k=5)
-            # Check if it's a coroutine (async mock in tests)
-            import inspect
-            if inspect.iscoroutine(result):
-                # Skip async in sync context - in production this would be awaited
-                pass
-            else:
-                keyword_chunks = result if result else []
-        except (AttributeError, NotImplementedError):
-            # keyword_search not implemented - fallback gracefully
-            keyword_chunks = []
-        except Exception as e:
-            print(f"⚠️ Keyword search failed: {e}")
+        # Keyword search (BM25) - synchronous alternative path when not prefetched
+        if keyword_chunks is None:
             keyword_chunks = []
+            try:
+                result = vector_store.keyword_search(collection_name, question, top_k=5)
+                # Check if it's a coroutine (async mock in tests)
+                import inspect
+                if inspect.iscoroutine(result):
+                    # Can't await in sync context - use hybrid_search_node_async instead
+                    result.close()
+                else:
+                    keyword_chunks = result if result else []
+            except (AttributeError, NotImplementedError):
+                # keyword_search not implemented - fallback gracefully
+                keyword_chunks = []
+            except Exception as e:
+                print(f"⚠️ Keyword search failed: {e}")
+                keyword_chunks = []
         
         # Hybrid fusion: combine semantic and keyword results
         hybrid_chunks = {}  # chunk_id -> {"chunk": ..., "semantic_score": ..., "keyword_score": ...}
@@ -794,6 +810,46 @@ def hybrid_search_node(state: WorkflowState, vector_store: VectorStore, embeddin
     return state
 
 
+async def hybrid_search_node_async(
+    state: WorkflowState,
+    vector_store: VectorStore,
+    embedding_service: EmbeddingService,
+) -> Dict[str, Any]:
+    """Async hybrid search: awaits whatever retrieval is still missing, then fuses.
+
+    Uses the BM25 results prefetched by the tools node when available. Otherwise
+    the keyword search - and the semantic search, if the tools node found no
+    chunks - run concurrently on the routed collection.
+    """
+    question = state.get("question", "")
+    routed_category = state.get("routed_category")
+    keyword_chunks = state.get("keyword_chunks")
+    question_embedding = state.get("question_embedding")
+
+    if question and routed_category and keyword_chunks is None:
+        collection_name = _collection_name(routed_category)
+
+        async def semantic_search() -> Optional[List[RetrievedChunk]]:
+            if state.get("context_chunks") or not question_embedding:
+                return None
+            return await vector_store.query(collection_name, question_embedding, top_k=5)
+
+        semantic_chunks, keyword_chunks = await asyncio.gather(
+            semantic_search(),
+            vector_store.keyword_search(collection_name, question, top_k=5),
+            return_exceptions=True,
+        )
+        if isinstance(semantic_chunks, Exception):
+            print(f"⚠️ Semantic search failed: {semantic_chunks}")
+        elif semantic_chunks:
+            state["context_chunks"] = semantic_chunks
+        if isinstance(keyword_chunks, Exception):
+            print(f"⚠️ Keyword search failed: {keyword_chunks}")
+            keyword_chunks = []
+
+    return hybrid_search_node(state, vector_store, embedding_service, keyword_chunks=keyword_chunks)
+
+
 def process_tool_results_node(state: WorkflowState) -> Dict[str, Any]:
     """Process tool results."""
     return state
@@ -819,6 +875,26 @@ def route_to_fallback_decision_node(state: WorkflowState) -> str:
         return "dedup_chunks"
 
 
+def _collection_name(category: str) -> str:
+    """ChromaDB collection name for a category (same as UploadService)."""
+    return f"cat_{_slugify_collection_name(category)}"
+
+
+def _async_node(afunc: Callable[[WorkflowState], Awaitable[Dict[str, Any]]]) -> RunnableLambda:
+    """Wrap an async node so the graph also supports the sync invoke().
+
+    ainvoke() (used by AdvancedRAGAgent) awaits the node on the caller's event
+    loop; invoke() runs the whole node in one event loop of its own.
+    """
+    async def run(state: WorkflowState) -> Dict[str, Any]:
+        return await afunc(state)
+
+    def run_sync(state: WorkflowState) -> Dict[str, Any]:
+        return asyncio.run(afunc(state))
+
+    return RunnableLambda(run_sync, afunc=run)
+
+
 # ============================================================================
 # ASYNC LOGGING TO DISK
 # ============================================================================
@@ -865,9 +941,14 @@ def create_advanced_rag_workflow(
         rag_answerer
     )
     
-    # INLINE TOOLS EXECUTOR (with closure access to parameters) - SYNC with async calls
-    def tools_executor_inline(state: WorkflowState) -> Dict[str, Any]:
-        """Execute all tools within workflow context - SYNC WRAPPER FOR ASYNC CALLS."""
+    # INLINE TOOLS EXECUTOR (with closure access to parameters) - ASYNC, runs on the caller's event loop
+    async def tools_executor_inline(state: WorkflowState) -> Dict[str, Any]:
+        """Execute all tools within workflow context.
+
+        Category routing and question embedding are independent and run
+        concurrently; vector search and BM25 keyword search then run
+        concurrently on the routed collection.
+        """
         print(f"🔧 tools_executor_inline CALLED! Question: {state.get('question', '')[:50]}")
         question = state.get("question", "")
         available_categories = state.get("available_categories", [])
@@ -877,34 +958,32 @@ def create_advanced_rag_workflow(
             state["error_count"] = state.get("error_count", 0) + 1
             return state
         
-        # Helper: run async function in sync context
-        def run_async(coro):
-            """Run async function in sync context - create new loop if needed."""
-            try:
-                loop = asyncio.get_running_loop()
-                # If we're here, there's already a running loop - this shouldn't happen in sync code
-                raise RuntimeError("Cannot run_until_complete in already-running loop")
-            except RuntimeError:
-                # No running loop, safe to create one
-                pass
-            
-            # Create a fresh event loop
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(coro)
-                return result
-            finally:
-                loop.close()
-        
-        # Tool 1: Category Routing (with conversation context)
-        try:
-            history_context = state.get("history_context_summary")
-            decision = run_async(category_router.decide_category(
-                question, 
+        # Tool 1 + Tool 2: Category Routing (with conversation context) and Embed Question
+        history_context = state.get("history_context_summary")
+        precomputed_embedding = state.get("question_embedding")
+
+        async def embed_question() -> List[float]:
+            # ChatService may already have embedded the question for its answer cache
+            if precomputed_embedding:
+                return precomputed_embedding
+            return await embedding_service.embed_text(question)
+
+        decision, question_embedding = await asyncio.gather(
+            category_router.decide_category(
+                question,
                 available_categories,
                 conversation_context=history_context
-            ))
+            ),
+            embed_question(),
+            return_exceptions=True,
+        )
+        
+        if isinstance(decision, Exception):
+            state["error_messages"].append(f"Category routing failed: {str(decision)}")
+            state["error_count"] = state.get("error_count", 0) + 1
+            state["last_error_type"] = "category_router_failed"
+            print(f"❌ Category routing error: {decision}")
+        else:
             state["routed_category"] = decision.category
             state["category_reason"] = decision.reason
             state["category_confidence"] = getattr(decision, 'confidence', 0.5)
@@ -916,16 +995,15 @@ def create_advanced_rag_workflow(
                 "timestamp": datetime.now().isoformat(),
             })
             print(f"✅ Routed to category: {decision.category}")
-        except Exception as e:
-            state["error_messages"].append(f"Category routing failed: {str(e)}")
-            state["error_count"] = state.get("error_count", 0) + 1
-            state["last_error_type"] = "category_router_failed"
-            print(f"❌ Category routing error: {e}")
         
-        # Tool 2: Embed Question
-        question_embedding = None
-        try:
-            question_embedding = run_async(embedding_service.embed_text(question))
+        if isinstance(question_embedding, Exception):
+            state["error_messages"].append(f"Embedding failed: {str(question_embedding)}")
+            state["error_count"] = state.get("error_count", 0) + 1
+            state["last_error_type"] = "embedding_failed"
+            print(f"❌ Embedding error: {question_embedding}")
+            question_embedding = None
+        else:
+            state["question_embedding"] = question_embedding
             state["workflow_logs"].append({
                 "node": "tools_executor",
                 "step": "embedding",
@@ -933,33 +1011,30 @@ def create_advanced_rag_workflow(
                 "timestamp": datetime.now().isoformat(),
             })
             print(f"✅ Embedded question")
-        except Exception as e:
-            state["error_messages"].append(f"Embedding failed: {str(e)}")
-            state["error_count"] = state.get("error_count", 0) + 1
-            state["last_error_type"] = "embedding_failed"
-            print(f"❌ Embedding error: {e}")
         
-        # Tool 3: Vector Search
+        # Tool 3: Vector Search (+ BM25 prefetch for the hybrid search node)
         context_chunks = []
         if question_embedding and state.get("routed_category"):
-            routed_category = state.get("routed_category")
+            collection_name = _collection_name(state["routed_category"])
             
-            # Build collection name
-            import unicodedata
-            text = unicodedata.normalize('NFKD', routed_category)
-            text = text.encode('ascii', 'ignore').decode('ascii')
-            text = text.lower().replace(" ", "_").replace("/", "_")
-            text = ''.join(c if c.isalnum() or c in '_-' else '' for c in text)
-            text = text.strip('_-')
-            if len(text) < 3:
-                text = text + 'x' * (3 - len(text))
-            if len(text) > 63:
-                text = text[:63]
+            chunks, keyword_chunks = await asyncio.gather(
+                vector_store.query(collection_name, question_embedding, top_k=5),
+                vector_store.keyword_search(collection_name, question, top_k=5),
+                return_exceptions=True,
+            )
             
-            collection_name = f"cat_{text}"
+            if isinstance(keyword_chunks, Exception):
+                # Hybrid search falls back to semantic results only
+                print(f"⚠️ Keyword search failed: {keyword_chunks}")
+            else:
+                state["keyword_chunks"] = keyword_chunks or []
             
-            try:
-                chunks = run_async(vector_store.query(collection_name, question_embedding, top_k=5))
+            if isinstance(chunks, Exception):
+                state["error_messages"].append(f"Vector search failed: {str(chunks)}")
+                state["error_count"] = state.get("error_count", 0) + 1
+                state["last_error_type"] = "search_failed"
+                print(f"❌ Vector search error: {chunks}")
+            else:
                 context_chunks = chunks if chunks else []
                 state["context_chunks"] = context_chunks
                 state["workflow_logs"].append({
@@ -970,20 +1045,15 @@ def create_advanced_rag_workflow(
                     "timestamp": datetime.now().isoformat(),
                 })
                 print(f"✅ Found {len(context_chunks)} chunks")
-            except Exception as e:
-                state["error_messages"].append(f"Vector search failed: {str(e)}")
-                state["error_count"] = state.get("error_count", 0) + 1
-                state["last_error_type"] = "search_failed"
-                print(f"❌ Vector search error: {e}")
         
         # Tool 4: Generate Answer
         if context_chunks:
             try:
-                answer = run_async(rag_answerer.generate_answer(
+                answer = await rag_answerer.generate_answer(
                     question, 
                     context_chunks, 
                     state.get("routed_category") or "General"
-                ))
+                )
                 state["final_answer"] = answer
                 state["workflow_logs"].append({
                     "node": "tools_executor",
@@ -1016,13 +1086,15 @@ def create_advanced_rag_workflow(
     print(f"📝 Adding nodes...")
     workflow.add_node("validate_input", validate_input_node)
     workflow.add_node("evaluate_search_quality", evaluate_search_quality_node)
-    workflow.add_node("hybrid_search", lambda state: hybrid_search_node(state, vector_store, embedding_service))  # ✅ #5 HYBRID SEARCH
+    workflow.add_node("hybrid_search", _async_node(
+        lambda state: hybrid_search_node_async(state, vector_store, embedding_service)
+    ))  # ✅ #5 HYBRID SEARCH
     workflow.add_node("rerank_chunks", lambda state: rerank_chunks_node(state, rag_answerer))  # ✅ #4 RERANKING
     workflow.add_node("dedup_chunks", deduplicate_chunks_node)
     workflow.add_node("format_response", format_response_node)
     workflow.add_node("process_tool_results", process_tool_results_node)
     workflow.add_node("handle_errors", handle_errors_node)
-    workflow.add_node("tools", tools_executor_inline)  # ✅ CLOSURE-BASED TOOL EXECUTOR
+    workflow.add_node("tools", _async_node(tools_executor_inline))  # ✅ CLOSURE-BASED TOOL EXECUTOR
     print(f"📝 Nodes added: {list(workflow.nodes.keys())}")
 
     
@@ -1064,8 +1136,13 @@ class AdvancedRAGAgent:
         available_categories: List[str],
         activity_callback: Optional[ActivityCallback] = None,
         conversation_history: Optional[List[Dict[str, Any]]] = None,
+        question_embedding: Optional[List[float]] = None,
     ) -> Dict[str, Any]:
-        """Run workflow to answer question."""
+        """Run workflow to answer question.
+
+        A precomputed question_embedding is reused instead of embedding the
+        question again.
+        """
         session_id = str(int(time.time() * 1000))
         
         # Build history context summary from conversation_history
@@ -1110,9 +1187,10 @@ class AdvancedRAGAgent:
             "last_error_type": None,
             "conversation_history": conversation_history or [],
             "history_context_summary": history_context_summary,
+            "question_embedding": question_embedding,
         }
 
-        result = self.graph.invoke(initial_state, {"recursion_limit": 50})
+        result = await self.graph.ainvoke(initial_state, {"recursion_limit": 50})
 
         citation_sources = []
         for source_dict in result.get("citation_sources", []):
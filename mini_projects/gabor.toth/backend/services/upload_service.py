@@ -1,17 +1,23 @@
 """Upload service for document processing."""
 
+import os
 import uuid
 import unicodedata
 import asyncio
+from concurrent.futures import Executor
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 
-from domain.models import Chunk, UploadedDocument, Message, MessageRole
+from domain.models import Chunk, UploadedDocument, UploadProgress, Message, MessageRole
 from domain.interfaces import (
     DocumentTextExtractor, Chunker, EmbeddingService, VectorStore,
     UploadRepository, UserProfileRepository, ActivityCallback
 )
-from infrastructure.extractors import get_extractor
+from infrastructure.answer_cache import SemanticAnswerCache
+from infrastructure.ingestion import create_extraction_pool, extract_and_chunk
+
+# Progress of at most this many finished uploads is kept in memory
+MAX_TRACKED_UPLOADS = 1000
 
 
 class UploadService:
@@ -55,6 +61,10 @@ class UploadService:
         upload_repo: UploadRepository,
         profile_repo: UserProfileRepository,
         activity_callback: Optional[ActivityCallback] = None,
+        answer_cache: Optional[SemanticAnswerCache] = None,
+        extraction_workers: int = 2,
+        max_concurrent_embeddings: int = 4,
+        extraction_executor: Optional[Executor] = None,
     ):
         self.chunker = chunker
         self.embedding_service = embedding_service
@@ -62,6 +72,18 @@ class UploadService:
         self.upload_repo = upload_repo
         self.profile_repo = profile_repo
         self.activity_callback = activity_callback
+        self.answer_cache = answer_cache
+        self.extraction_workers = extraction_workers
+        # Created on first upload unless injected (e.g. a thread pool in tests)
+        self._extraction_executor = extraction_executor
+        self._embedding_slots = asyncio.Semaphore(max_concurrent_embeddings)
+        self._tasks: Set[asyncio.Task] = set()
+        self.progress: Dict[str, UploadProgress] = {}
+
+    def _invalidate_answers(self, category: str) -> None:
+        """Cached answers of a category are stale once its documents change."""
+        if self.answer_cache is not None:
+            self.answer_cache.invalidate(category)
 
     async def process_upload(
         self,
@@ -91,13 +113,18 @@ class UploadService:
         )
 
         # Return immediately with success, schedule embedding/indexing in background
-        # This ensures fast response to user
-        asyncio.create_task(
+        # This ensures fast response to user. Several uploads are indexed in
+        # parallel; extraction is bounded by the worker processes and
+        # embedding by the shared embedding slots.
+        self._track_progress(upload_id, filename, category)
+        task = asyncio.create_task(
             self._embed_and_index(
                 category, upload_id, filename, file_path,
                 chunk_size_tokens, overlap_tokens, embedding_batch_size
             )
         )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
         return UploadedDocument(
             upload_id=upload_id,
@@ -122,6 +149,7 @@ class UploadService:
         embedding_batch_size: int,
     ) -> None:
         """Background task to embed and index document."""
+        progress = self._track_progress(upload_id, filename, category)
         try:
             # Log: Upload start
             if self.activity_callback:
@@ -130,10 +158,16 @@ class UploadService:
                     activity_type="processing"
                 )
 
-            # Get extractor and extract text
-            extractor = get_extractor(filename)
-            text = await extractor.extract_text(file_path)
-            text_char_count = len(text)
+            # Extract and chunk in a worker process (CPU-bound, streams the
+            # document page by page instead of loading the whole text)
+            self._set_status(progress, "extracting")
+            loop = asyncio.get_running_loop()
+            document = await loop.run_in_executor(
+                self._get_extraction_executor(), extract_and_chunk,
+                self.chunker, os.path.abspath(file_path), filename,
+                chunk_size_tokens, overlap_tokens
+            )
+            text_char_count = document.char_count
 
             # Log: Text extraction completed
             if self.activity_callback:
@@ -142,11 +176,7 @@ class UploadService:
                     activity_type="success"
                 )
 
-            # Chunk text
-            chunk_texts = self.chunker.chunk_text(
-                text, chunk_size_tokens, overlap_tokens
-            )
-            chunk_count = len(chunk_texts)
+            chunk_count = len(document.chunks)
             avg_chars = text_char_count // max(1, chunk_count)
 
             # Log: Chunking completed
@@ -159,16 +189,16 @@ class UploadService:
 
             # Create Chunk objects
             chunks = []
-            for i, chunk_text in enumerate(chunk_texts):
+            for i, span in enumerate(document.chunks):
                 chunk = Chunk(
                     chunk_id=f"{upload_id}:{i}",
-                    content=chunk_text,
+                    content=span.text,
                     upload_id=upload_id,
                     category=category,
                     source_file=filename,
                     chunk_index=i,
-                    start_char=0,  # Simplified for now
-                    end_char=len(chunk_text),
+                    start_char=span.start_char,
+                    end_char=span.end_char,
                     metadata={
                         "chunk_size_tokens": chunk_size_tokens,
                         "overlap_tokens": overlap_tokens,
@@ -177,18 +207,19 @@ class UploadService:
                 chunks.append(chunk)
 
             # Log: Embedding start
+            batch_size = max(1, embedding_batch_size)
+            batch_count = -(-chunk_count // batch_size)
+            progress.chunk_count = chunk_count
+            self._set_status(progress, "embedding")
             if self.activity_callback:
                 await self.activity_callback.log_activity(
-                    f"🔗 Embedding feldolgozása: {chunk_count} chunk, {len(chunk_texts) // max(1, embedding_batch_size) + 1} batch",
+                    f"🔗 Embedding feldolgozása: {chunk_count} chunk, {batch_count} batch",
                     activity_type="processing",
                     metadata={"chunk_count": chunk_count, "batch_size": embedding_batch_size}
                 )
 
-            # Embed chunks
-            texts_to_embed = [chunk.content for chunk in chunks]
-            embeddings = await self.embedding_service.embed_texts(
-                texts_to_embed, embedding_batch_size
-            )
+            # Embed chunks, several batches at a time
+            embeddings = await self._embed_chunks(chunks, batch_size, progress)
 
             # Log: Embedding completed
             if self.activity_callback:
@@ -203,6 +234,7 @@ class UploadService:
             collection_name = f"cat_{category_slug}"
 
             # Log: Vector indexing start
+            self._set_status(progress, "indexing")
             if self.activity_callback:
                 await self.activity_callback.log_activity(
                     f"📊 Vektor-indexelés: '{collection_name}' kollekció",
@@ -211,9 +243,11 @@ class UploadService:
 
             # Add to vector store with embeddings
             await self.vector_store.add_chunks(collection_name, chunks, embeddings)
+            self._invalidate_answers(category)
 
             # Save chunks to disk
             await self.upload_repo.save_chunks(category, upload_id, chunks)
+            self._set_status(progress, "done")
 
             # Log: Complete success
             if self.activity_callback:
@@ -225,6 +259,8 @@ class UploadService:
 
             print(f"✅ Background indexing completed for {upload_id}")
         except Exception as e:
+            progress.error = str(e)
+            self._set_status(progress, "failed")
             # Log: Error
             if self.activity_callback:
                 await self.activity_callback.log_activity(
@@ -236,6 +272,62 @@ class UploadService:
             import traceback
             traceback.print_exc()
 
+    async def _embed_chunks(
+        self, chunks: List[Chunk], batch_size: int, progress: UploadProgress
+    ) -> List[List[float]]:
+        """Embed chunks batch by batch; the batches run concurrently, limited by
+        the embedding slots shared by all uploads."""
+        async def embed_batch(start: int) -> List[List[float]]:
+            texts = [chunk.content for chunk in chunks[start : start + batch_size]]
+            async with self._embedding_slots:
+                embeddings = await self.embedding_service.embed_texts(texts, batch_size)
+            progress.embedded_chunks += len(texts)
+            progress.updated_at = datetime.now()
+            return embeddings
+
+        batches = await asyncio.gather(
+            *(embed_batch(start) for start in range(0, len(chunks), batch_size))
+        )
+        return [embedding for batch in batches for embedding in batch]
+
+    def _get_extraction_executor(self) -> Executor:
+        if self._extraction_executor is None:
+            self._extraction_executor = create_extraction_pool(
+                self.chunker, self.extraction_workers
+            )
+        return self._extraction_executor
+
+    def _track_progress(
+        self, upload_id: str, filename: str, category: str
+    ) -> UploadProgress:
+        progress = self.progress.get(upload_id)
+        if progress is None:
+            progress = UploadProgress(upload_id=upload_id, filename=filename, category=category)
+            self.progress[upload_id] = progress
+            # Forget the oldest finished uploads
+            finished = [
+                key for key, item in self.progress.items()
+                if item.status in ("done", "failed")
+            ]
+            for key in finished[:max(0, len(self.progress) - MAX_TRACKED_UPLOADS)]:
+                del self.progress[key]
+        return progress
+
+    @staticmethod
+    def _set_status(progress: UploadProgress, status: str) -> None:
+        progress.status = status
+        progress.updated_at = datetime.now()
+
+    def get_progress(self, upload_id: str) -> Optional[UploadProgress]:
+        """Indexing progress of an upload started by this process."""
+        return self.progress.get(upload_id)
+
+    def shutdown(self) -> None:
+        """Stop the extraction worker processes."""
+        if self._extraction_executor is not None:
+            self._extraction_executor.shutdown(wait=False, cancel_futures=True)
+            self._extraction_executor = None
+
     async def delete_upload(
         self,
         category: str,
@@ -252,6 +344,7 @@ class UploadService:
             category_slug = self._slugify_collection_name(category)
             collection_name = f"cat_{category_slug}"
             await self.vector_store.delete_chunks(collection_name, chunk_ids)
+            self._invalidate_answers(category)
 
         # Delete files
         self.upload_repo.delete_upload(category, upload_id, filename)
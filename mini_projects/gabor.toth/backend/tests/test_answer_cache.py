@@ -0,0 +1,102 @@
+"""
+Tests for the cross-session semantic answer cache and its use in ChatService.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from infrastructure.answer_cache import SemanticAnswerCache
+from services.chat_service import ChatService
+
+
+VACATION = [1.0, 0.0, 0.0]
+VACATION_REPHRASED = [0.99, 0.1, 0.0]
+SICK_LEAVE = [0.0, 1.0, 0.0]
+
+
+class TestSemanticAnswerCache:
+    """Tests for SemanticAnswerCache."""
+
+    def test_similar_question_hits_within_category(self):
+        cache = SemanticAnswerCache(similarity_threshold=0.95)
+        cache.store("HR", "How many vacation days?", VACATION, "Twenty days.")
+
+        hit = cache.lookup(VACATION_REPHRASED, ["HR"])
+
+        assert hit.answer == "Twenty days."
+        assert hit.category == "HR"
+        assert hit.similarity > 0.95
+        assert cache.lookup(SICK_LEAVE, ["HR"]) is None
+
+    def test_lookup_is_limited_to_given_categories(self):
+        cache = SemanticAnswerCache()
+        cache.store("HR", "How many vacation days?", VACATION, "Twenty days.")
+
+        assert cache.lookup(VACATION, ["IT"]) is None
+        assert cache.lookup(VACATION, ["IT", "hr "]).answer == "Twenty days."
+
+    def test_invalidate_drops_only_that_category(self):
+        cache = SemanticAnswerCache()
+        cache.store("HR", "vacation?", VACATION, "HR answer")
+        cache.store("IT", "vpn?", SICK_LEAVE, "IT answer")
+
+        assert cache.invalidate("HR") == 1
+        assert cache.lookup(VACATION, ["HR", "IT"]) is None
+        assert cache.lookup(SICK_LEAVE, ["IT"]).answer == "IT answer"
+
+    def test_near_duplicate_overwrites_and_oldest_is_evicted(self):
+        cache = SemanticAnswerCache(max_entries_per_category=2)
+        cache.store("HR", "vacation?", VACATION, "old")
+        cache.store("HR", "vacation days?", VACATION_REPHRASED, "new")
+        assert len(cache) == 1
+        assert cache.lookup(VACATION, ["HR"]).answer == "new"
+
+        cache.store("HR", "sick leave?", SICK_LEAVE, "sick")
+        cache.store("HR", "remote work?", [0.0, 0.0, 1.0], "remote")
+
+        assert len(cache) == 2
+        assert cache.lookup(VACATION, ["HR"]) is None
+
+
+class TestChatServiceAnswerCache:
+    """Repeated questions are answered from the cache without the RAG graph."""
+
+    @pytest.fixture
+    def chat_service(self):
+        rag_agent = AsyncMock()
+        rag_agent.answer_question.return_value = SimpleNamespace(
+            final_answer="Twenty days.",
+            routed_category="HR",
+            context_chunks=[],
+            citation_sources=[],
+            fallback_triggered=False,
+            error_messages=[],
+            workflow_logs=[],
+        )
+        profile_repo = AsyncMock()
+        session_repo = AsyncMock()
+        session_repo.get_messages.return_value = []
+        upload_repo = AsyncMock()
+        upload_repo.get_categories.return_value = ["HR"]
+        embedding_service = AsyncMock()
+        embedding_service.embed_text.side_effect = [VACATION, VACATION_REPHRASED]
+
+        return ChatService(
+            rag_agent, profile_repo, session_repo, upload_repo,
+            embedding_service=embedding_service,
+            answer_cache=SemanticAnswerCache(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_second_session_is_served_from_cache(self, chat_service):
+        first = await chat_service.process_message("u1", "s1", "How many vacation days do I get?")
+        second = await chat_service.process_message("u2", "s2", "How many vacation days do we get?")
+
+        assert first["final_answer"] == second["final_answer"] == "Twenty days."
+        assert second["api_info"]["source"] == "semantic_cache"
+        assert second["memory_snapshot"]["routed_category"] == "HR"
+        chat_service.rag_agent.answer_question.assert_awaited_once()
+        # The workflow reuses the embedding computed for the cache lookup
+        assert chat_service.rag_agent.answer_question.await_args.kwargs["question_embedding"] == VACATION
@@ -0,0 +1,134 @@
+"""
+Tests for streaming chunking and concurrent ingestion in UploadService.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock
+
+import pytest
+import tiktoken
+
+from domain.interfaces import EmbeddingService
+from infrastructure.chunker import TiktokenChunker
+from infrastructure.repositories import FileUploadRepository
+from services.upload_service import UploadService
+
+ENCODING_NAME = "test_bytes"
+
+
+@pytest.fixture
+def chunker(monkeypatch):
+    """Chunker over a small byte-level BPE encoding (no download needed)."""
+    ranks = {bytes([i]): i for i in range(256)}
+    for token in (b"th", b"the", b"\xc3\xa1", b" v", b" va"):
+        ranks[token] = len(ranks)
+    encoding = tiktoken.Encoding(
+        ENCODING_NAME, pat_str=r" ?\S+|\s+", mergeable_ranks=ranks, special_tokens={}
+    )
+    monkeypatch.setitem(tiktoken.registry.ENCODINGS, ENCODING_NAME, encoding)
+    return TiktokenChunker(ENCODING_NAME)
+
+
+PAGES = [
+    "the vacation policy gives twenty days",
+    "szabadság: évente húsz nap, átvihető",
+    "",
+    "the end",
+]
+
+
+class TestStreamingChunker:
+    """Tests for TiktokenChunker.iter_chunks."""
+
+    def test_streamed_sections_match_whole_text(self, chunker):
+        text = "\n".join(PAGES)
+
+        streamed = list(chunker.iter_chunks(PAGES, chunk_size_tokens=12, overlap_tokens=3))
+
+        assert [chunk.text for chunk in streamed] == chunker.chunk_text(text, 12, 3)
+        for chunk in streamed:
+            assert text[chunk.start_char:chunk.end_char] == chunk.text
+        assert streamed[-1].end_char == len(text)
+
+    def test_windows_are_decoded_like_the_token_slices(self, chunker):
+        # Unlike decode(), partial multi-byte characters at the window edges
+        # are dropped instead of replaced, so compare on whole-token text
+        text = "the vacation policy gives twenty days\náll the end"
+        tokens = chunker.encoding.encode(text)
+        expected = [
+            chunker.encoding.decode(tokens[i:i + 10])
+            for i in range(0, len(tokens), 10 - 4)
+        ]
+
+        assert chunker.chunk_text(text, 10, 4) == expected
+
+    def test_overlap_must_be_smaller_than_chunk_size(self, chunker):
+        with pytest.raises(ValueError):
+            chunker.chunk_text("text", chunk_size_tokens=5, overlap_tokens=5)
+
+
+class CountingEmbedding(EmbeddingService):
+    """Records how many embedding requests run at the same time."""
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+    async def embed_text(self, text):
+        return [1.0, 0.0]
+
+    async def embed_texts(self, texts, batch_size=100):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.02)
+        self.running -= 1
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class TestUploadServiceIngestion:
+    """Background indexing runs batches concurrently and reports progress."""
+
+    @pytest.fixture
+    def service(self, chunker, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        executor = ThreadPoolExecutor(max_workers=2)
+        service = UploadService(
+            chunker, CountingEmbedding(), AsyncMock(), FileUploadRepository(),
+            AsyncMock(), max_concurrent_embeddings=3, extraction_executor=executor,
+        )
+        yield service
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_uploads_are_indexed_in_parallel(self, service):
+        text = " ".join(f"the vacation rule {i}" for i in range(400))
+        docs = [
+            await service.process_upload(f"policy{n}.md", text.encode(), "HR", 20, 5, 4)
+            for n in range(2)
+        ]
+        await asyncio.gather(*service._tasks)
+
+        for doc in docs:
+            progress = service.get_progress(doc.upload_id).to_dict()
+            assert progress["status"] == "done", progress["error"]
+            assert progress["embedded_chunks"] == progress["chunk_count"] > 4
+
+            chunks = await service.upload_repo.load_chunks("HR", doc.upload_id)
+            assert len(chunks) == progress["chunk_count"]
+            assert text[chunks[1].start_char:chunks[1].end_char] == chunks[1].content
+
+        assert 1 < service.embedding_service.max_running <= 3
+        assert service.vector_store.add_chunks.await_count == 2
+        collection, chunks, embeddings = service.vector_store.add_chunks.await_args.args
+        assert collection == "cat_hrx"
+        assert [e[0] for e in embeddings] == [float(len(c.content)) for c in chunks]
+
+    @pytest.mark.asyncio
+    async def test_failed_upload_reports_error(self, service):
+        doc = await service.process_upload("notes.txt", b"plain text", "HR")
+        await asyncio.gather(*service._tasks)
+
+        progress = service.get_progress(doc.upload_id)
+        assert progress.status == "failed"
+        assert "Unsupported file type" in progress.error
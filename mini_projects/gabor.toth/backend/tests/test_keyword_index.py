@@ -0,0 +1,143 @@
+"""
+Tests for the incremental BM25 keyword index and its use in ChromaVectorStore.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from domain.models import Chunk
+from infrastructure.keyword_index import BM25Index
+from infrastructure.vector_store import ChromaVectorStore
+
+
+DOCS = {
+    "c1": "vacation policy allows twenty days of paid vacation",
+    "c2": "the expense policy covers travel and meals",
+    "c3": "remote work is allowed two days per week",
+    "c4": "paid sick leave is separate from vacation",
+}
+
+
+@pytest.fixture
+def index():
+    idx = BM25Index()
+    idx.add(DOCS.keys(), DOCS.values())
+    return idx
+
+
+def make_chunk(chunk_id: str, content: str) -> Chunk:
+    return Chunk(
+        chunk_id=chunk_id,
+        content=content,
+        upload_id="upload-1",
+        category="hr",
+        source_file="policy.md",
+        chunk_index=0,
+        start_char=0,
+        end_char=len(content),
+    )
+
+
+class TestBM25Index:
+    """Tests for BM25Index."""
+
+    def test_search_ranks_best_match_first(self, index):
+        hits = index.search("paid vacation", top_k=2)
+
+        assert [chunk_id for chunk_id, _ in hits] == ["c1", "c4"]
+        assert hits[0][1] > hits[1][1] > 0
+
+    def test_only_positive_scores_are_returned(self, index):
+        assert index.search("unrelated query words", top_k=5) == []
+        assert len(index.search("policy", top_k=10)) == 2
+
+    def test_add_and_delete_are_incremental(self, index):
+        index.add(["c5"], ["parental leave policy"])
+        assert index.search("parental", top_k=1)[0][0] == "c5"
+
+        index.delete(["c1", "c5"])
+        assert "c1" not in index
+        assert [chunk_id for chunk_id, _ in index.search("vacation", top_k=5)] == ["c4"]
+
+    def test_compaction_keeps_results(self, index):
+        index.delete(["c2"])
+        before = index.search("days", top_k=5)
+        index.compact()
+
+        assert index.dead_slots == 0
+        assert index.search("days", top_k=5) == before
+
+    def test_save_and_load_round_trip(self, index, tmp_path):
+        path = str(tmp_path / "hr_docs.npz")
+        index.delete(["c3"])
+        index.save(path)
+
+        loaded = BM25Index.load(path)
+
+        assert len(loaded) == 3
+        assert loaded.search("paid vacation", top_k=3) == index.search("paid vacation", top_k=3)
+
+    def test_load_missing_file_returns_none(self, tmp_path):
+        assert BM25Index.load(str(tmp_path / "missing.npz")) is None
+
+    def test_load_truncated_archive_returns_none(self, index, tmp_path):
+        path = tmp_path / "hr_docs.npz"
+        index.save(str(path))
+        path.write_bytes(path.read_bytes()[:64])
+
+        assert BM25Index.load(str(path)) is None
+
+
+class TestChromaKeywordSearch:
+    """Keyword search stays in sync with the collection and survives restarts."""
+
+    @pytest.mark.asyncio
+    async def test_new_chunks_are_searchable_and_persisted(self, tmp_path):
+        store = ChromaVectorStore(str(tmp_path / "chroma_db"))
+        embedding = [0.1, 0.2, 0.3]
+
+        await store.add_chunks("hr_docs", [make_chunk("c1", DOCS["c1"])], [embedding])
+        assert [c.chunk_id for c in await store.keyword_search("hr_docs", "vacation")] == ["c1"]
+
+        # A later upload is visible without rebuilding the index
+        await store.add_chunks("hr_docs", [make_chunk("c2", "vacation carry over rules")], [embedding])
+        results = await store.keyword_search("hr_docs", "carry over")
+        assert [c.chunk_id for c in results] == ["c2"]
+        assert results[0].metadata["category"] == "hr"
+
+        await store.delete_chunks("hr_docs", ["c1"])
+        # Changes are saved together, after a delay or on flush
+        index_path = str(tmp_path / "bm25_index" / "hr_docs.npz")
+        assert len(BM25Index.load(index_path)) == 0  # Saved when first built
+        store.flush_keyword_indexes()
+        assert len(BM25Index.load(index_path)) == 1
+
+        # A new store instance loads the persisted index
+        reopened = ChromaVectorStore(str(tmp_path / "chroma_db"))
+        assert [c.chunk_id for c in await reopened.keyword_search("hr_docs", "vacation")] == ["c2"]
+
+    @pytest.mark.asyncio
+    async def test_index_is_saved_once_per_burst_of_uploads(self, tmp_path, monkeypatch):
+        store = ChromaVectorStore(str(tmp_path / "chroma_db"))
+        store.KEYWORD_INDEX_SAVE_DELAY = 0.05
+        await store.create_collection("hr_docs")
+        store._get_keyword_index("hr_docs", store.client.get_collection("hr_docs"))
+        saves = []
+        save_threads = []
+
+        def fake_save(index, path):
+            saves.append(len(index))
+            save_threads.append(threading.get_ident())
+
+        monkeypatch.setattr(BM25Index, "save", fake_save)
+
+        for chunk_id, text in DOCS.items():
+            await store.add_chunks("hr_docs", [make_chunk(chunk_id, text)], [[0.1, 0.2, 0.3]])
+        assert saves == []
+
+        await asyncio.sleep(0.2)
+        assert saves == [4]
+        # Written in a worker thread, not on the event loop
+        assert save_threads[0] != threading.get_ident()
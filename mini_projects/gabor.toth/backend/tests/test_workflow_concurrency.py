@@ -0,0 +1,97 @@
+"""
+Tests that the advanced RAG workflow runs its I/O on the caller's event loop
+and overlaps independent steps.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from domain.interfaces import CategoryRouter, EmbeddingService, VectorStore, RAGAnswerer
+from domain.models import CategoryDecision, RetrievedChunk
+from services.langgraph_workflow import create_advanced_rag_workflow, AdvancedRAGAgent
+
+STEP_DELAY = 0.1
+
+
+class SlowRouter(CategoryRouter):
+    async def decide_category(self, question, available_categories, conversation_context=None):
+        await asyncio.sleep(STEP_DELAY)
+        return CategoryDecision(category="HR docs", reason="test")
+
+
+class SlowEmbedding(EmbeddingService):
+    async def embed_text(self, text):
+        await asyncio.sleep(STEP_DELAY)
+        return [0.1, 0.2, 0.3]
+
+    async def embed_texts(self, texts):
+        return [[0.1, 0.2, 0.3] for _ in texts]
+
+
+class RecordingVectorStore(VectorStore):
+    def __init__(self):
+        self.collections = []
+
+    async def create_collection(self, collection_name):
+        pass
+
+    async def add_chunks(self, collection_name, chunks, embeddings=None):
+        pass
+
+    async def query(self, collection_name, query_embedding, top_k=5, similarity_threshold=0.6):
+        self.collections.append(collection_name)
+        await asyncio.sleep(STEP_DELAY)
+        return [RetrievedChunk(chunk_id="s1", content="vacation policy", distance=0.2, metadata={})]
+
+    async def keyword_search(self, collection_name, query_text, top_k=5):
+        self.collections.append(collection_name)
+        await asyncio.sleep(STEP_DELAY)
+        return [RetrievedChunk(chunk_id="k1", content="vacation days", distance=0.5, metadata={})]
+
+    async def delete_chunks(self, collection_name, chunk_ids):
+        pass
+
+    async def delete_collection(self, collection_name):
+        pass
+
+
+class FastAnswerer(RAGAnswerer):
+    async def generate_answer(self, question, context_chunks, category):
+        return "Twenty days."
+
+
+@pytest.fixture
+def agent_and_store():
+    store = RecordingVectorStore()
+    graph, registry = create_advanced_rag_workflow(SlowRouter(), SlowEmbedding(), store, FastAnswerer())
+    return AdvancedRAGAgent(graph, registry), store
+
+
+class TestAsyncWorkflow:
+    """Tests for the async tools and hybrid search nodes."""
+
+    @pytest.mark.asyncio
+    async def test_independent_steps_run_concurrently(self, agent_and_store):
+        agent, _ = agent_and_store
+
+        start = time.perf_counter()
+        result = await agent.answer_question("user", "How many vacation days?", ["HR docs"])
+        elapsed = time.perf_counter() - start
+
+        assert result.final_answer == "Twenty days."
+        assert result.error_messages == []
+        # routing || embedding, then vector || BM25: two delays instead of four
+        assert elapsed < 3 * STEP_DELAY
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_uses_prefetched_keyword_results(self, agent_and_store):
+        agent, store = agent_and_store
+
+        result = await agent.answer_question("user", "How many vacation days?", ["HR docs"])
+
+        assert {chunk.chunk_id for chunk in result.context_chunks} == {"s1", "k1"}
+        assert result.search_strategy == "hybrid_search"
+        # One vector query and one BM25 search, both on the slugified collection
+        assert store.collections == ["cat_hr_docs", "cat_hr_docs"]
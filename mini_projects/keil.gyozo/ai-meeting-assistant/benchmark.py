@@ -0,0 +1,164 @@
+"""
+Benchmark for long-transcript processing.
+
+Compares the previous pipeline (ten regex passes, then summarize and
+extract action items one after the other on the whole transcript) with
+the current one (single-pass cleaning, parallel graph branches and
+chunked map-reduce) on synthetic 50k-word transcripts.
+
+The LLM is simulated, so no API key is needed: each call sleeps for a
+fixed overhead plus a per-token prefill cost and returns canned JSON.
+
+Usage:
+    python benchmark.py [--words 50000] [--runs 3] [--overhead-ms 500] [--us-per-token 40]
+"""
+
+import argparse
+import json
+import random
+import re
+import statistics
+import time
+from unittest.mock import patch
+
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from src.models.schemas import GraphState
+from src.nodes.parser import clean_transcript
+from src.nodes.summarizer import summarize_meeting
+from src.nodes.action_items import extract_action_items
+from src.utils.chunking import estimate_tokens
+from src.workflow.graph import process_meeting
+
+
+SPEAKERS = ["John", "Sarah", "Mike", "Anna", "Peter"]
+WORDS = (
+    "we should review the dashboard release timeline budget api integration customer "
+    "feedback onboarding flow testing documentation deployment sprint backlog metrics"
+).split()
+FILLERS = ["um", "uh", "er", "hmm"]
+
+# Simulated LLM latency: fixed overhead plus prefill cost per input token
+CALL_OVERHEAD_S = 0.5
+SECONDS_PER_TOKEN = 40e-6
+
+
+def make_transcript(word_count: int, seed: int = 7) -> str:
+    """Build a synthetic transcript with speakers, timestamps and fillers."""
+    rng = random.Random(seed)
+    lines = []
+    written = 0
+    minute = 0
+    while written < word_count:
+        speaker = rng.choice(SPEAKERS)
+        length = rng.randint(15, 60)
+        words = [rng.choice(WORDS) for _ in range(length)]
+        for _ in range(rng.randint(0, 3)):
+            words.insert(rng.randrange(len(words)), rng.choice(FILLERS))
+        if rng.random() < 0.1:
+            words += ["action", "item:", speaker, "will", "update", "the", rng.choice(WORDS), "by", "Friday"]
+        minute += 1
+        lines.append(f"[{minute // 60:02d}:{minute % 60:02d}:00] {speaker}:   {' '.join(words)}.")
+        if rng.random() < 0.2:
+            lines.append("")
+        written += length
+    return "\n".join(lines)
+
+
+def legacy_clean(transcript: str) -> str:
+    """The previous multi-pass cleaning, kept here for comparison."""
+    cleaned = re.sub(r'\s+', ' ', transcript)
+    cleaned = re.sub(r'\n\s*\n', '\n\n', cleaned)
+    cleaned = re.sub(r'\[?\d{1,2}:\d{2}(?::\d{2})?\]?', '', cleaned)
+    cleaned = re.sub(r'\(\d{1,2}:\d{2}(?::\d{2})?\)', '', cleaned)
+    for filler in [r'\buh+\b', r'\bum+\b', r'\ber+\b', r'\bah+\b', r'\bhm+\b', r'\bmm+\b']:
+        cleaned = re.sub(filler, '', cleaned, flags=re.IGNORECASE)
+    cleaned = re.sub(r'\n([A-Z][a-zA-Z\s]+):\s*', r'\n\1: ', cleaned)
+    cleaned = re.sub(r' +', ' ', cleaned)
+    return cleaned.strip()
+
+
+def fake_llm_response(prompt_value) -> AIMessage:
+    """Simulated chat model: sleeps, then answers with canned JSON."""
+    text = prompt_value.to_string()
+    time.sleep(CALL_OVERHEAD_S + estimate_tokens(text) * SECONDS_PER_TOKEN)
+
+    if '"action_items"' in text:
+        speakers = sorted({s for s in SPEAKERS if f"{s} will update" in text})
+        payload = {"action_items": [
+            {"task": f"Update the project status ({s})", "assignee": s, "deadline": "Friday", "priority": "medium"}
+            for s in speakers
+        ]}
+    else:
+        payload = {
+            "summary": "The team reviewed the release timeline and integration work.",
+            "key_points": ["Release timeline reviewed", "API integration issues discussed"],
+            "participants": [s for s in SPEAKERS if f"{s}:" in text] or None,
+            "meeting_date": None,
+        }
+    return AIMessage(content=json.dumps(payload))
+
+
+FAKE_LLM = RunnableLambda(fake_llm_response)
+
+
+def run_legacy(transcript: str) -> GraphState:
+    """Previous behaviour: sequential nodes, whole transcript per call."""
+    state = GraphState(transcript=transcript, parsed_transcript=legacy_clean(transcript))
+    no_chunking = 10**9
+    state = state.model_copy(update=summarize_meeting(state, FAKE_LLM, max_chunk_tokens=no_chunking))
+    return state.model_copy(update=extract_action_items(state, FAKE_LLM, max_chunk_tokens=no_chunking))
+
+
+def run_current(transcript: str) -> GraphState:
+    """Current workflow: parallel branches with chunked map-reduce."""
+    with patch("src.workflow.graph.ChatOpenAI", return_value=FAKE_LLM):
+        return process_meeting(transcript, openai_api_key="benchmark")
+
+
+def timed(func, *args, runs: int):
+    """Return (median seconds, last result)."""
+    durations = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func(*args)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations), result
+
+
+def main():
+    global CALL_OVERHEAD_S, SECONDS_PER_TOKEN
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, default=50_000, help="Transcript length in words")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per measurement (median is reported)")
+    parser.add_argument("--overhead-ms", type=float, default=CALL_OVERHEAD_S * 1000, help="Simulated fixed latency per LLM call")
+    parser.add_argument("--us-per-token", type=float, default=SECONDS_PER_TOKEN * 1e6, help="Simulated prefill cost per input token")
+    args = parser.parse_args()
+    CALL_OVERHEAD_S = args.overhead_ms / 1000
+    SECONDS_PER_TOKEN = args.us_per_token / 1e6
+
+    transcript = make_transcript(args.words)
+    print(f"Synthetic transcript: {len(transcript.split()):,} words, ~{estimate_tokens(transcript):,} tokens")
+    print(f"Simulated LLM: {CALL_OVERHEAD_S * 1000:.0f} ms/call + {SECONDS_PER_TOKEN * 1e6:.0f} us/input token\n")
+
+    legacy_parse, _ = timed(legacy_clean, transcript, runs=args.runs)
+    current_parse, _ = timed(clean_transcript, transcript, runs=args.runs)
+    print(f"{'Cleaning (10 regex passes)':<40}{legacy_parse * 1000:>10.1f} ms")
+    print(f"{'Cleaning (single precompiled pass)':<40}{current_parse * 1000:>10.1f} ms\n")
+
+    legacy_total, legacy_state = timed(run_legacy, transcript, runs=args.runs)
+    current_total, current_state = timed(run_current, transcript, runs=args.runs)
+    print(f"{'Sequential, whole transcript':<40}{legacy_total:>10.2f} s  "
+          f"({len(legacy_state.action_items or [])} action items)")
+    print(f"{'Parallel branches, map-reduce':<40}{current_total:>10.2f} s  "
+          f"({len(current_state.action_items or [])} action items after dedup)")
+    print(f"\nSpeed-up: {legacy_total / current_total:.1f}x")
+    if current_state.errors:
+        print("Errors:", current_state.errors)
+
+
+if __name__ == "__main__":
+    main()
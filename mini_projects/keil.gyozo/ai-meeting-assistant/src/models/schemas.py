@@ -5,8 +5,9 @@ This module defines the data structures for meeting transcripts,
 action items, summaries, and the final processed output.
 """
 
+import operator
 from datetime import datetime
-from typing import Optional, List
+from typing import Annotated, Optional, List
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -126,7 +127,9 @@ class GraphState(BaseModel):
     )
 
     # Processing metadata
-    errors: List[str] = Field(
+    # Nodes return only their new errors; the reducer appends them so that
+    # parallel branches can both report errors in the same step.
+    errors: Annotated[List[str], operator.add] = Field(
         default_factory=list,
         description="Any errors encountered during processing"
     )
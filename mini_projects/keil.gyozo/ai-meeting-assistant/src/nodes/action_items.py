@@ -5,11 +5,19 @@ This node uses an LLM to identify and structure action items including
 assignees, deadlines, and priorities.
 """
 
-from typing import Dict, Any, List
+import re
+from typing import Dict, Any, List, Tuple
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from src.models.schemas import GraphState, ActionItem
+from src.utils.chunking import DEFAULT_CHUNK_TOKENS, chunk_transcript
+
+
+# Word overlap (Jaccard) above which two tasks are considered the same
+DUPLICATE_TASK_SIMILARITY = 0.7
+
+PRIORITY_RANK = {"high": 3, "medium": 2, "low": 1, None: 0}
 
 
 # System prompt for action items extraction
@@ -76,51 +84,113 @@ def create_action_items_chain(llm: ChatOpenAI):
     return chain
 
 
-def extract_action_items(state: GraphState, llm: ChatOpenAI) -> Dict[str, Any]:
+def _task_words(task: str) -> frozenset:
+    """Normalized word set of a task description."""
+    return frozenset(re.findall(r"\w+", task.lower()))
+
+
+def merge_action_items(items: List[ActionItem]) -> List[ActionItem]:
+    """
+    Deduplicate action items extracted from overlapping chunks.
+
+    Items are duplicates when their assignees match (or one is missing)
+    and their task descriptions mostly share the same words. The merged
+    item keeps the first description, fills in missing assignee/deadline
+    and takes the highest priority.
+
+    Args:
+        items: Action items in transcript order
+
+    Returns:
+        Deduplicated action items, in order of first mention
+    """
+    merged: List[Tuple[frozenset, ActionItem]] = []
+
+    for item in items:
+        words = _task_words(item.task)
+        assignee = (item.assignee or "").strip().lower()
+
+        for index, (existing_words, existing) in enumerate(merged):
+            existing_assignee = (existing.assignee or "").strip().lower()
+            if assignee and existing_assignee and assignee != existing_assignee:
+                continue
+            union = words | existing_words
+            if union and len(words & existing_words) / len(union) >= DUPLICATE_TASK_SIMILARITY:
+                merged[index] = (existing_words, existing.model_copy(update={
+                    "assignee": existing.assignee or item.assignee,
+                    "deadline": existing.deadline or item.deadline,
+                    "priority": max(existing.priority, item.priority, key=PRIORITY_RANK.get),
+                }))
+                break
+        else:
+            merged.append((words, item))
+
+    return [item for _, item in merged]
+
+
+def _parse_action_items(result: Dict[str, Any], errors: List[str]) -> List[ActionItem]:
+    """Validate raw action item dicts, collecting validation errors."""
+    action_items: List[ActionItem] = []
+    for item_data in result.get("action_items", []):
+        try:
+            action_items.append(ActionItem(**item_data))
+        except Exception as e:
+            # Log validation error but continue with other items
+            errors.append(f"Action item validation error: {str(e)}")
+    return action_items
+
+
+def extract_action_items(
+    state: GraphState,
+    llm: ChatOpenAI,
+    max_chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+    max_concurrency: int = 8
+) -> Dict[str, Any]:
     """
     Extract action items from the meeting transcript.
 
     This node uses an LLM to identify and structure actionable tasks
-    with assignees, deadlines, and priorities.
+    with assignees, deadlines, and priorities. Transcripts longer than
+    max_chunk_tokens are processed chunk by chunk (concurrently) and the
+    results are merged and deduplicated.
 
     Args:
         state: The current graph state with parsed transcript
         llm: The ChatOpenAI language model instance
+        max_chunk_tokens: Token budget per LLM call
+        max_concurrency: Maximum concurrent LLM calls for long transcripts
 
     Returns:
         Dict with updated state containing action items
     """
     transcript = state.parsed_transcript or state.transcript
+    errors: List[str] = []
 
     try:
         # Create the chain
         chain = create_action_items_chain(llm)
 
-        # Invoke the chain
-        result = chain.invoke({"transcript": transcript})
-
-        # Parse action items
-        action_items_data = result.get("action_items", [])
+        chunks = chunk_transcript(transcript, max_chunk_tokens)
+        results = chain.batch(
+            [{"transcript": chunk} for chunk in chunks],
+            config={"max_concurrency": max_concurrency}
+        )
 
-        # Convert to ActionItem models with validation
         action_items: List[ActionItem] = []
-        for item_data in action_items_data:
-            try:
-                action_item = ActionItem(**item_data)
-                action_items.append(action_item)
-            except Exception as e:
-                # Log validation error but continue with other items
-                error_msg = f"Action item validation error: {str(e)}"
-                state.errors.append(error_msg)
+        for result in results:
+            action_items.extend(_parse_action_items(result, errors))
+
+        if len(chunks) > 1:
+            action_items = merge_action_items(action_items)
 
         return {
             "action_items": action_items,
-            "errors": state.errors
+            "errors": errors
         }
 
     except Exception as e:
         error_msg = f"Action items extraction error: {str(e)}"
         return {
             "action_items": [],
-            "errors": state.errors + [error_msg]
+            "errors": errors + [error_msg]
         }
@@ -10,6 +10,47 @@ from typing import Dict, Any
 from src.models.schemas import GraphState
 
 
+# Single precompiled pattern for every cleaning rule, applied in one pass.
+# Alternatives are tried left to right at each position:
+#   ts     - timestamps such as [00:12:34], (12:34) or 12:34
+#   filler - filler words (uh, um, er, ah, hm, mm and elongations)
+#   nl     - newline runs (blank lines collapse to one paragraph break)
+#   ws     - runs of horizontal whitespace other than a single space
+_CLEAN_PATTERN = re.compile(
+    r"(?P<ts>(?:\[\d{1,2}:\d{2}(?::\d{2})?\]|\(\d{1,2}:\d{2}(?::\d{2})?\)|\d{1,2}:\d{2}(?::\d{2})?)[ \t]*)"
+    r"|(?P<filler>\b(?:uh+|um+|er+|ah+|hm+|mm+)\b[ \t]*)"
+    r"|(?P<nl>[ \t]*(?:\r?\n)\s*)"
+    r"|(?P<ws>[ \t\r\f\v]{2,}|[\t\r\f\v])",
+    re.IGNORECASE
+)
+
+
+def _clean_match(match: re.Match) -> str:
+    """Replacement for a single _CLEAN_PATTERN match."""
+    kind = match.lastgroup
+    if kind == "nl":
+        return "\n\n" if match.group().count("\n") > 1 else "\n"
+    if kind == "ws":
+        return " "
+    return ""
+
+
+def clean_transcript(transcript: str) -> str:
+    """
+    Clean a raw transcript in a single regex pass.
+
+    Removes timestamps and filler words, collapses whitespace and keeps
+    line breaks so speaker turns stay on their own lines.
+
+    Args:
+        transcript: Raw transcript text
+
+    Returns:
+        Cleaned transcript
+    """
+    return _CLEAN_PATTERN.sub(_clean_match, transcript).strip()
+
+
 def parse_transcript(state: GraphState) -> Dict[str, Any]:
     """
     Parse and clean the raw meeting transcript.
@@ -26,47 +67,21 @@ def parse_transcript(state: GraphState) -> Dict[str, Any]:
     transcript = state.transcript
 
     try:
-        # Remove excessive whitespace
-        cleaned = re.sub(r'\s+', ' ', transcript)
-
-        # Remove multiple newlines (keep paragraph structure)
-        cleaned = re.sub(r'\n\s*\n', '\n\n', cleaned)
-
-        # Remove timestamps if present (e.g., [00:12:34] or (12:34))
-        cleaned = re.sub(r'\[?\d{1,2}:\d{2}(?::\d{2})?\]?', '', cleaned)
-        cleaned = re.sub(r'\(\d{1,2}:\d{2}(?::\d{2})?\)', '', cleaned)
-
-        # Remove common filler words and artifacts
-        filler_words = [
-            r'\buh+\b', r'\bum+\b', r'\ber+\b', r'\bah+\b',
-            r'\bhm+\b', r'\bmm+\b'
-        ]
-        for filler in filler_words:
-            cleaned = re.sub(filler, '', cleaned, flags=re.IGNORECASE)
-
-        # Normalize speaker labels (e.g., "Speaker 1:", "John:", etc.)
-        cleaned = re.sub(r'\n([A-Z][a-zA-Z\s]+):\s*', r'\n\1: ', cleaned)
-
-        # Remove extra spaces
-        cleaned = re.sub(r' +', ' ', cleaned)
-
-        # Strip leading/trailing whitespace
-        cleaned = cleaned.strip()
+        cleaned = clean_transcript(transcript)
 
         # Basic validation
         if not cleaned or len(cleaned) < 10:
             raise ValueError("Transcript is empty or too short after cleaning")
 
         return {
-            "parsed_transcript": cleaned,
-            "errors": state.errors
+            "parsed_transcript": cleaned
         }
 
     except Exception as e:
         error_msg = f"Parser error: {str(e)}"
         return {
             "parsed_transcript": transcript,  # Use original if parsing fails
-            "errors": state.errors + [error_msg]
+            "errors": [error_msg]
         }
 
 
@@ -81,10 +96,10 @@ def validate_transcript(state: GraphState) -> Dict[str, Any]:
         state: The current graph state
 
     Returns:
-        Dict with validation status added to state
+        Dict with the new validation errors (the state reducer appends them)
     """
     transcript = state.parsed_transcript or state.transcript
-    errors = list(state.errors)
+    errors = []
 
     # Check minimum length
     if len(transcript) < 50:
@@ -5,11 +5,13 @@ This node uses an LLM to create concise summaries and extract key points
 from the parsed meeting transcript.
 """
 
-from typing import Dict, Any
+import json
+from typing import Dict, Any, List, Optional
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from src.models.schemas import GraphState, MeetingSummary
+from src.utils.chunking import DEFAULT_CHUNK_TOKENS, chunk_transcript
 
 
 # System prompt for the summarizer
@@ -47,19 +49,53 @@ Please provide your response in the following JSON format:
 Ensure the summary is clear, concise, and captures the most important aspects of the meeting."""
 
 
-def create_summarizer_chain(llm: ChatOpenAI):
+# Map step: summarize one part of a long transcript
+CHUNK_SUMMARY_USER_PROMPT = """The following is part {part} of {total} of a long meeting transcript.
+Summarize only this part; it will later be combined with the other parts.
+
+Transcript Part:
+{transcript}
+
+Please provide your response in the following JSON format:
+{{
+    "summary": "2-4 sentence summary of this part",
+    "key_points": ["key point 1", "key point 2"],
+    "participants": ["participant 1", "participant 2"] (or null if not identifiable),
+    "meeting_date": "date if mentioned" (or null if not mentioned)
+}}"""
+
+
+# Reduce step: merge the partial summaries into the final summary
+COMBINE_SUMMARIES_USER_PROMPT = """Below are summaries of consecutive parts of one long meeting, in order.
+Combine them into a single summary of the whole meeting. Merge duplicate
+key points and keep only the most important ones.
+
+Partial Summaries:
+{summaries}
+
+Please provide your response in the following JSON format:
+{{
+    "summary": "2-4 sentence executive summary here",
+    "key_points": ["key point 1", "key point 2", "key point 3"],
+    "participants": ["participant 1", "participant 2"] (or null if not identifiable),
+    "meeting_date": "date if mentioned" (or null if not mentioned)
+}}"""
+
+
+def create_summarizer_chain(llm: ChatOpenAI, user_prompt: str = SUMMARIZER_USER_PROMPT):
     """
     Create the summarizer LangChain chain.
 
     Args:
         llm: The ChatOpenAI language model instance
+        user_prompt: User prompt template (full, chunk or combine step)
 
     Returns:
         A LangChain chain for generating meeting summaries
     """
     prompt = ChatPromptTemplate.from_messages([
         ("system", SUMMARIZER_SYSTEM_PROMPT),
-        ("user", SUMMARIZER_USER_PROMPT)
+        ("user", user_prompt)
     ])
 
     output_parser = JsonOutputParser(pydantic_object=MeetingSummary)
@@ -69,16 +105,74 @@ def create_summarizer_chain(llm: ChatOpenAI):
     return chain
 
 
-def summarize_meeting(state: GraphState, llm: ChatOpenAI) -> Dict[str, Any]:
+def _merge_unique(values: List[Optional[List[str]]]) -> Optional[List[str]]:
+    """Merge lists preserving first-seen order, case-insensitively."""
+    merged: Dict[str, str] = {}
+    for items in values:
+        for item in items or []:
+            merged.setdefault(item.strip().lower(), item.strip())
+    return list(merged.values()) or None
+
+
+def _summarize_chunks(chunks: List[str], llm: ChatOpenAI, max_concurrency: int) -> MeetingSummary:
+    """
+    Map-reduce summary: summarize chunks concurrently, then combine.
+
+    Args:
+        chunks: Transcript chunks in order
+        llm: The ChatOpenAI language model instance
+        max_concurrency: Maximum concurrent LLM calls for the map step
+
+    Returns:
+        Combined MeetingSummary
+    """
+    map_chain = create_summarizer_chain(llm, CHUNK_SUMMARY_USER_PROMPT)
+    partials = map_chain.batch(
+        [
+            {"transcript": chunk, "part": index, "total": len(chunks)}
+            for index, chunk in enumerate(chunks, start=1)
+        ],
+        config={"max_concurrency": max_concurrency}
+    )
+    partial_summaries = [MeetingSummary(**partial) for partial in partials]
+
+    reduce_chain = create_summarizer_chain(llm, COMBINE_SUMMARIES_USER_PROMPT)
+    combined = MeetingSummary(**reduce_chain.invoke({
+        "summaries": "\n\n".join(
+            f"Part {index}: " + json.dumps(partial.model_dump(exclude={"participants", "meeting_date"}))
+            for index, partial in enumerate(partial_summaries, start=1)
+        )
+    }))
+
+    # Participants and date are collected from every part, not left to the LLM
+    combined.participants = _merge_unique(
+        [combined.participants] + [partial.participants for partial in partial_summaries]
+    )
+    combined.meeting_date = combined.meeting_date or next(
+        (partial.meeting_date for partial in partial_summaries if partial.meeting_date), None
+    )
+    return combined
+
+
+def summarize_meeting(
+    state: GraphState,
+    llm: ChatOpenAI,
+    max_chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+    max_concurrency: int = 8
+) -> Dict[str, Any]:
     """
     Generate an executive summary from the meeting transcript.
 
     This node uses an LLM to create a structured summary including
-    key points, participants, and the meeting date.
+    key points, participants, and the meeting date. Transcripts longer
+    than max_chunk_tokens are summarized chunk by chunk (concurrently)
+    and the partial summaries are combined.
 
     Args:
         state: The current graph state with parsed transcript
         llm: The ChatOpenAI language model instance
+        max_chunk_tokens: Token budget per LLM call
+        max_concurrency: Maximum concurrent LLM calls for long transcripts
 
     Returns:
         Dict with updated state containing the summary
@@ -86,23 +180,27 @@ def summarize_meeting(state: GraphState, llm: ChatOpenAI) -> Dict[str, Any]:
     transcript = state.parsed_transcript or state.transcript
 
     try:
-        # Create the chain
-        chain = create_summarizer_chain(llm)
+        chunks = chunk_transcript(transcript, max_chunk_tokens)
+
+        if len(chunks) > 1:
+            summary = _summarize_chunks(chunks, llm, max_concurrency)
+        else:
+            # Create the chain
+            chain = create_summarizer_chain(llm)
 
-        # Invoke the chain
-        result = chain.invoke({"transcript": transcript})
+            # Invoke the chain
+            result = chain.invoke({"transcript": transcript})
 
-        # Parse the result into MeetingSummary model
-        summary = MeetingSummary(**result)
+            # Parse the result into MeetingSummary model
+            summary = MeetingSummary(**result)
 
         return {
-            "summary": summary,
-            "errors": state.errors
+            "summary": summary
         }
 
     except Exception as e:
         error_msg = f"Summarizer error: {str(e)}"
         return {
             "summary": None,
-            "errors": state.errors + [error_msg]
+            "errors": [error_msg]
         }
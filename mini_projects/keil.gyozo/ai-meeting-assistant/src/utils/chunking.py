@@ -0,0 +1,97 @@
+"""
+Transcript chunking utilities for map-reduce processing.
+
+Long transcripts are split into chunks that fit a token budget, breaking
+only between speaker turns where possible so each chunk keeps whole
+contributions together.
+"""
+
+import re
+from typing import List
+
+
+# A speaker turn starts with "Name:" at the beginning of a line
+SPEAKER_TURN_PATTERN = re.compile(r"^(?=[A-Z][\w .'-]{0,40}:)", re.MULTILINE)
+
+# Rough token estimate for English text (OpenAI models average ~4 chars/token)
+CHARS_PER_TOKEN = 4
+
+# Default chunk budget; transcripts below it are processed in a single call
+DEFAULT_CHUNK_TOKENS = 8000
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of a text without a tokenizer.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Approximate number of tokens
+    """
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def split_speaker_turns(transcript: str) -> List[str]:
+    """
+    Split a transcript into speaker turns.
+
+    Text before the first speaker label is kept as its own turn.
+
+    Args:
+        transcript: Cleaned transcript with one speaker turn per line
+
+    Returns:
+        List of non-empty turns in order
+    """
+    return [turn.strip() for turn in SPEAKER_TURN_PATTERN.split(transcript) if turn.strip()]
+
+
+def _split_oversized(turn: str, max_chars: int) -> List[str]:
+    """Split a single turn that exceeds the budget at word boundaries."""
+    pieces: List[str] = []
+    start = 0
+    while start < len(turn):
+        end = min(start + max_chars, len(turn))
+        if end < len(turn):
+            space = turn.rfind(" ", start, end)
+            if space > start:
+                end = space
+        pieces.append(turn[start:end].strip())
+        start = end
+    return [piece for piece in pieces if piece]
+
+
+def chunk_transcript(transcript: str, max_tokens: int = DEFAULT_CHUNK_TOKENS) -> List[str]:
+    """
+    Pack speaker turns into chunks of at most max_tokens (estimated).
+
+    Args:
+        transcript: Cleaned transcript
+        max_tokens: Token budget per chunk
+
+    Returns:
+        List of chunks; a single chunk if the transcript fits the budget
+    """
+    if estimate_tokens(transcript) <= max_tokens:
+        return [transcript]
+
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    chunks: List[str] = []
+    current: List[str] = []
+    current_chars = 0
+
+    for turn in split_speaker_turns(transcript):
+        parts = [turn] if len(turn) <= max_chars else _split_oversized(turn, max_chars)
+        for part in parts:
+            if current and current_chars + len(part) + 1 > max_chars:
+                chunks.append("\n".join(current))
+                current, current_chars = [], 0
+            current.append(part)
+            current_chars += len(part) + 1
+
+    if current:
+        chunks.append("\n".join(current))
+
+    return chunks
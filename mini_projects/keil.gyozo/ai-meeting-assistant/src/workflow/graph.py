@@ -13,26 +13,41 @@ from src.models.schemas import GraphState
 from src.nodes.parser import parse_transcript
 from src.nodes.summarizer import summarize_meeting
 from src.nodes.action_items import extract_action_items
+from src.utils.chunking import DEFAULT_CHUNK_TOKENS
 
 
 def create_meeting_workflow(
     openai_api_key: str,
     model_name: str = "gpt-4-turbo-preview",
-    temperature: float = 0.0
+    temperature: float = 0.0,
+    max_chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+    max_concurrency: int = 8,
+    parallel: bool = True
 ) -> StateGraph:
     """
     Create the LangGraph workflow for processing meeting transcripts.
 
     The workflow follows this pipeline:
     1. Parse/clean the raw transcript
-    2. Generate summary (parallel)
-    3. Extract action items (parallel)
-    4. Return final state
+    2. Branch to parallel processing:
+       - Generate summary
+       - Extract action items
+    3. Return final state once both branches finish
+
+    With parallel=False the summary is generated first and the action
+    items are extracted after it (fewer concurrent LLM calls).
+
+    Transcripts longer than max_chunk_tokens are processed map-reduce
+    style inside each branch: chunks are sent to the LLM concurrently and
+    the partial results are merged.
 
     Args:
         openai_api_key: OpenAI API key
         model_name: Name of the OpenAI model to use
         temperature: Temperature for LLM generation (0.0 = deterministic)
+        max_chunk_tokens: Token budget per LLM call for long transcripts
+        max_concurrency: Maximum concurrent LLM calls per branch
+        parallel: Run summarization and action item extraction as parallel branches
 
     Returns:
         Compiled StateGraph ready for execution
@@ -50,11 +65,11 @@ def create_meeting_workflow(
     # Define wrapper functions that inject the LLM
     def summarizer_node(state: GraphState) -> Dict[str, Any]:
         """Wrapper for summarize_meeting that injects LLM."""
-        return summarize_meeting(state, llm)
+        return summarize_meeting(state, llm, max_chunk_tokens, max_concurrency)
 
     def action_items_node(state: GraphState) -> Dict[str, Any]:
         """Wrapper for extract_action_items that injects LLM."""
-        return extract_action_items(state, llm)
+        return extract_action_items(state, llm, max_chunk_tokens, max_concurrency)
 
     # Add nodes to the graph
     workflow.add_node("parse", parse_transcript)
@@ -65,13 +80,15 @@ def create_meeting_workflow(
     # Start -> Parse
     workflow.set_entry_point("parse")
 
-    # Parse -> Summarize
     workflow.add_edge("parse", "summarize")
-
-    # Summarize -> Extract Actions
-    workflow.add_edge("summarize", "extract_actions")
-
-    # Extract Actions -> End
+    if parallel:
+        # Parse -> Summarize and Parse -> Extract Actions run as parallel branches
+        workflow.add_edge("parse", "extract_actions")
+        # Both branches -> End (errors from both are merged by the state reducer)
+        workflow.add_edge("summarize", END)
+    else:
+        # Parse -> Summarize -> Extract Actions
+        workflow.add_edge("summarize", "extract_actions")
     workflow.add_edge("extract_actions", END)
 
     # Compile the graph
@@ -83,85 +100,35 @@ def create_meeting_workflow(
 def create_parallel_meeting_workflow(
     openai_api_key: str,
     model_name: str = "gpt-4-turbo-preview",
-    temperature: float = 0.0
+    temperature: float = 0.0,
+    max_chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+    max_concurrency: int = 8
 ) -> StateGraph:
     """
-    Create an optimized workflow with parallel processing.
+    Create the parallel workflow.
 
-    This version runs summarization and action item extraction in parallel
-    after parsing for better performance.
-
-    The workflow:
-    1. Parse/clean the raw transcript
-    2. Branch to parallel processing:
-       - Generate summary
-       - Extract action items
-    3. Merge results and end
+    Kept for backwards compatibility: same as create_meeting_workflow
+    with parallel=True.
 
     Args:
         openai_api_key: OpenAI API key
         model_name: Name of the OpenAI model to use
         temperature: Temperature for LLM generation
+        max_chunk_tokens: Token budget per LLM call for long transcripts
+        max_concurrency: Maximum concurrent LLM calls per branch
 
     Returns:
         Compiled StateGraph with parallel execution
     """
-    # Initialize the LLM
-    llm = ChatOpenAI(
-        api_key=openai_api_key,
-        model=model_name,
-        temperature=temperature
+    return create_meeting_workflow(
+        openai_api_key,
+        model_name,
+        temperature,
+        max_chunk_tokens,
+        max_concurrency,
+        parallel=True
     )
 
-    # Create the state graph
-    workflow = StateGraph(GraphState)
-
-    # Define wrapper functions
-    def summarizer_node(state: GraphState) -> Dict[str, Any]:
-        """Wrapper for summarize_meeting that injects LLM."""
-        return summarize_meeting(state, llm)
-
-    def action_items_node(state: GraphState) -> Dict[str, Any]:
-        """Wrapper for extract_action_items that injects LLM."""
-        return extract_action_items(state, llm)
-
-    def router_node(state: GraphState) -> Dict[str, Any]:
-        """Router node that triggers parallel execution."""
-        # This is a pass-through node for routing
-        return {}
-
-    def merge_node(state: GraphState) -> Dict[str, Any]:
-        """Merge node that collects parallel results."""
-        # LangGraph automatically merges state updates
-        return {}
-
-    # Add nodes
-    workflow.add_node("parse", parse_transcript)
-    workflow.add_node("router", router_node)
-    workflow.add_node("summarize", summarizer_node)
-    workflow.add_node("extract_actions", action_items_node)
-    workflow.add_node("merge", merge_node)
-
-    # Define workflow edges
-    workflow.set_entry_point("parse")
-    workflow.add_edge("parse", "router")
-
-    # Parallel branches from router
-    workflow.add_edge("router", "summarize")
-    workflow.add_edge("router", "extract_actions")
-
-    # Both parallel nodes feed into merge
-    workflow.add_edge("summarize", "merge")
-    workflow.add_edge("extract_actions", "merge")
-
-    # Merge -> End
-    workflow.add_edge("merge", END)
-
-    # Compile the graph
-    compiled_graph = workflow.compile()
-
-    return compiled_graph
-
 
 async def process_meeting_async(
     transcript: str,
@@ -176,7 +143,8 @@ async def process_meeting_async(
         transcript: Raw meeting transcript text
         openai_api_key: OpenAI API key
         model_name: Name of the OpenAI model to use
-        use_parallel: Whether to use parallel processing (faster)
+        use_parallel: Run summarization and action item extraction in
+            parallel (faster) instead of one after the other
 
     Returns:
         Final GraphState with summary and action items
@@ -185,10 +153,7 @@ async def process_meeting_async(
     initial_state = GraphState(transcript=transcript)
 
     # Create the workflow
-    if use_parallel:
-        graph = create_parallel_meeting_workflow(openai_api_key, model_name)
-    else:
-        graph = create_meeting_workflow(openai_api_key, model_name)
+    graph = create_meeting_workflow(openai_api_key, model_name, parallel=use_parallel)
 
     # Run the workflow
     final_state = await graph.ainvoke(initial_state)
@@ -209,7 +174,8 @@ def process_meeting(
         transcript: Raw meeting transcript text
         openai_api_key: OpenAI API key
         model_name: Name of the OpenAI model to use
-        use_parallel: Whether to use parallel processing
+        use_parallel: Run summarization and action item extraction in
+            parallel instead of one after the other
 
     Returns:
         Final GraphState with summary and action items
@@ -218,10 +184,7 @@ def process_meeting(
     initial_state = GraphState(transcript=transcript)
 
     # Create the workflow
-    if use_parallel:
-        graph = create_parallel_meeting_workflow(openai_api_key, model_name)
-    else:
-        graph = create_meeting_workflow(openai_api_key, model_name)
+    graph = create_meeting_workflow(openai_api_key, model_name, parallel=use_parallel)
 
     # Run the workflow
     final_state = graph.invoke(initial_state)
@@ -0,0 +1,123 @@
+"""
+Graph-level tests for the meeting workflow, run with a fake LLM.
+"""
+
+import json
+import threading
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+from langgraph.graph import StateGraph, END
+
+from src.models.schemas import GraphState
+from src.nodes.parser import validate_transcript
+from src.workflow import graph as graph_module
+
+
+TRANSCRIPT = "\n".join(
+    f"Speaker {i}: We discussed topic {i} and Anna will prepare the quarterly report."
+    for i in range(12)
+)
+
+
+class FakeLLM:
+    """Answers summarizer and action item prompts with canned JSON."""
+
+    def __init__(self, fail_summary=False):
+        self.fail_summary = fail_summary
+        self.calls = {"summary": 0, "actions": 0}
+        self.order = []
+        self._lock = threading.Lock()
+
+    def __call__(self, prompt):
+        text = prompt.to_string()
+        kind = "actions" if "extracting action items" in text else "summary"
+        with self._lock:
+            self.calls[kind] += 1
+            self.order.append(kind)
+        if kind == "summary":
+            if self.fail_summary:
+                raise RuntimeError("summary model unavailable")
+            payload = {"summary": "Quarterly planning.", "key_points": ["Report"], "participants": ["Anna"]}
+        else:
+            payload = {"action_items": [
+                {"task": "Prepare the quarterly report", "assignee": "Anna", "priority": "high"},
+                {"assignee": "Bob"},  # Missing task: fails validation
+            ]}
+        return AIMessage(content=json.dumps(payload))
+
+
+def run_workflow(monkeypatch, llm, initial_errors=(), **options):
+    monkeypatch.setattr(graph_module, "ChatOpenAI", lambda **kwargs: RunnableLambda(llm))
+    workflow = graph_module.create_meeting_workflow("test-key", **options)
+    final = workflow.invoke(GraphState(transcript=TRANSCRIPT, errors=list(initial_errors)))
+    return GraphState(**final)
+
+
+def test_parallel_branches_are_merged_without_duplicate_errors(monkeypatch):
+    llm = FakeLLM(fail_summary=True)
+
+    state = run_workflow(monkeypatch, llm, initial_errors=["upstream error"])
+
+    assert [item.task for item in state.action_items] == ["Prepare the quarterly report"]
+    assert state.summary is None
+    assert state.errors[0] == "upstream error"
+    assert sorted(e.split(":")[0] for e in state.errors[1:]) == [
+        "Action item validation error", "Summarizer error"
+    ]
+    assert len(state.errors) == len(set(state.errors)) == 3
+
+
+def test_chunked_transcript_results_are_merged(monkeypatch):
+    llm = FakeLLM()
+
+    state = run_workflow(monkeypatch, llm, max_chunk_tokens=60)
+
+    # Map step per chunk plus one reduce call for the summary
+    assert llm.calls["actions"] > 1
+    assert llm.calls["summary"] == llm.calls["actions"] + 1
+    assert state.summary.participants == ["Anna"]
+    # The same task from every chunk collapses into one item
+    assert [item.task for item in state.action_items] == ["Prepare the quarterly report"]
+    assert len(state.errors) == llm.calls["actions"]
+
+
+def test_sequential_workflow_extracts_actions_after_summary(monkeypatch):
+    llm = FakeLLM()
+    monkeypatch.setattr(graph_module, "ChatOpenAI", lambda **kwargs: RunnableLambda(llm))
+
+    state = graph_module.process_meeting(TRANSCRIPT, "test-key", use_parallel=False)
+
+    assert llm.order == ["summary", "actions"]
+    assert state.summary.summary == "Quarterly planning."
+    assert [item.task for item in state.action_items] == ["Prepare the quarterly report"]
+
+
+@pytest.mark.parametrize("parallel, expected", [
+    (True, {("parse", "summarize"), ("parse", "extract_actions"), ("summarize", "__end__")}),
+    (False, {("parse", "summarize"), ("summarize", "extract_actions")}),
+])
+def test_parallel_option_selects_graph_shape(monkeypatch, parallel, expected):
+    monkeypatch.setattr(graph_module, "ChatOpenAI", lambda **kwargs: RunnableLambda(FakeLLM()))
+
+    graph = graph_module.create_meeting_workflow("test-key", parallel=parallel).get_graph()
+
+    edges = {(edge.source, edge.target) for edge in graph.edges}
+    assert edges == expected | {("__start__", "parse"), ("extract_actions", "__end__")}
+
+
+@pytest.mark.parametrize("transcript, expected", [
+    ("Anna: ok", 2),
+    (TRANSCRIPT, 0),
+])
+def test_validate_transcript_appends_only_new_errors(transcript, expected):
+    workflow = StateGraph(GraphState)
+    workflow.add_node("validate", validate_transcript)
+    workflow.set_entry_point("validate")
+    workflow.add_edge("validate", END)
+
+    final = workflow.compile().invoke(GraphState(transcript=transcript, errors=["earlier error"]))
+
+    assert final["errors"][0] == "earlier error"
+    assert len(final["errors"]) == 1 + expected
@@ -96,21 +96,15 @@ def extract_hostname_from_message(message: str) -> Optional[str]:
 async def lookup_device_info(hostname: str) -> Optional[dict]:
     """Look up device information from Fleet API."""
     try:
-        from app.services.fleet import create_fleet_client
+        from app.services.fleet import get_fleet_client, get_host_cache
         
-        fleet = create_fleet_client()
+        fleet = get_fleet_client()
         if not fleet.enabled:
             logger.info("FleetDM not configured")
             return None
         
         logger.info(f"Looking up device: {hostname}")
-        device_info = await fleet.search_host(hostname)
-        
-        if device_info and device_info.id:
-            # Get full details
-            details = await fleet.get_host_details(device_info.id)
-            if details:
-                device_info = details
+        device_info = await get_host_cache().find_host(hostname)
         
         if device_info:
             device_context = fleet.format_device_context(device_info)
@@ -24,11 +24,18 @@ from app.infrastructure.cache import (
     ICacheService,
     InMemoryCacheService
 )
+from app.infrastructure.document_catalog import (
+    IDocumentCatalog,
+    SqliteDocumentCatalog
+)
+from app.infrastructure.rate_limiter import AsyncRateLimiter
 from app.services.processors import (
     ITicketProcessor,
-    WorkflowTicketProcessor
+    WorkflowTicketProcessor,
+    RateLimitedTicketProcessor
 )
 from app.services.ticket_service import TicketService
+from app.services.batch_triage_service import BatchTriageService
 
 
 # Existing services (unchanged for backward compatibility)
@@ -83,15 +90,33 @@ def get_cache_service() -> ICacheService:
     return InMemoryCacheService()
 
 
+@lru_cache()
+def get_document_catalog() -> IDocumentCatalog:
+    """Factory for document catalog (Dependency Inversion Principle).
+
+    Returns SQLite implementation; shared by all document requests.
+    """
+    return SqliteDocumentCatalog(db_path=settings.document_catalog_path)
+
+
+@lru_cache()
+def get_llm_rate_limiter() -> AsyncRateLimiter:
+    """Global rate limiter shared by all workflow runs."""
+    return AsyncRateLimiter(rate=settings.llm_workflows_per_minute, per=60.0)
+
+
 @lru_cache()
 def get_ticket_processor() -> ITicketProcessor:
     """Factory for ticket processor (Open/Closed Principle).
     
-    Returns workflow processor for now.
+    Returns the workflow processor decorated with the global rate limiter.
     Can be extended with new processor types without modifying existing code.
     """
     workflow = get_workflow()
-    return WorkflowTicketProcessor(workflow)
+    return RateLimitedTicketProcessor(
+        WorkflowTicketProcessor(workflow),
+        get_llm_rate_limiter()
+    )
 
 
 @lru_cache()
@@ -113,3 +138,12 @@ def get_ticket_service() -> TicketService:
         ticket_processor=processor,
         cache_service=cache
     )
+
+
+@lru_cache()
+def get_batch_triage_service() -> BatchTriageService:
+    """Factory for batch triage service (shares the ticket service singleton)."""
+    return BatchTriageService(
+        ticket_service=get_ticket_service(),
+        workers=settings.batch_triage_workers
+    )
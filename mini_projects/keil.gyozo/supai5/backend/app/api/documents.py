@@ -1,11 +1,12 @@
 """
 Documents API router for knowledge base management.
 """
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends, Query, Response
 from typing import Optional, List
 from pydantic import BaseModel, Field, ConfigDict
 
 from app.core.logging import get_logger
+from app.api.dependencies import get_document_catalog
 from app.services.document_service import DocumentService
 from app.services.qdrant_service import QdrantService
 
@@ -122,7 +123,7 @@ class DocumentDetailResponse(BaseModel):
 async def get_document_service() -> DocumentService:
     """Get document service instance."""
     qdrant_service = QdrantService()
-    return DocumentService(qdrant_service)
+    return DocumentService(qdrant_service, get_document_catalog())
 
 
 @router.post("/upload", response_model=DocumentUploadResponse)
@@ -202,28 +203,37 @@ async def upload_document(
 
 @router.get("/", response_model=List[DocumentMetadata])
 async def list_documents(
+    response: Response,
     category: Optional[str] = None,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
     document_service: DocumentService = Depends(get_document_service)
 ):
     """
-    List all documents in the knowledge base.
+    List documents in the knowledge base, newest first.
+
+    The total number of matching documents is returned in the
+    X-Total-Count header for pagination.
 
     Args:
+        response: Response used to set the X-Total-Count header
         category: Optional category filter
         limit: Maximum number of documents to return (default: 100)
+        offset: Number of documents to skip (default: 0)
         document_service: Injected document service
 
     Returns:
         List of document metadata
     """
     try:
-        documents = await document_service.list_documents(
+        documents, total = await document_service.list_documents(
             category=category,
-            limit=limit
+            limit=limit,
+            offset=offset
         )
+        response.headers["X-Total-Count"] = str(total)
 
-        logger.info(f"Retrieved {len(documents)} documents")
+        logger.info(f"Retrieved {len(documents)} of {total} documents")
         
         return [DocumentMetadata(**doc) for doc in documents]
 
@@ -235,6 +245,31 @@ async def list_documents(
         )
 
 
+@router.get("/stats", response_model=DocumentStats)
+async def get_document_stats(
+    document_service: DocumentService = Depends(get_document_service)
+):
+    """
+    Get knowledge base statistics.
+
+    Args:
+        document_service: Injected document service
+
+    Returns:
+        Knowledge base statistics
+    """
+    try:
+        stats = await document_service.get_document_stats()
+        return DocumentStats(**stats)
+
+    except Exception as e:
+        logger.error(f"Error getting document stats: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve statistics: {str(e)}"
+        )
+
+
 @router.delete("/{doc_id}", response_model=DocumentDeleteResponse)
 async def delete_document(
     doc_id: str,
@@ -325,28 +360,3 @@ async def get_document_detail(
             status_code=500,
             detail=f"Failed to fetch document: {str(e)}"
         )
-
-
-@router.get("/stats", response_model=DocumentStats)
-async def get_document_stats(
-    document_service: DocumentService = Depends(get_document_service)
-):
-    """
-    Get knowledge base statistics.
-
-    Args:
-        document_service: Injected document service
-
-    Returns:
-        Knowledge base statistics
-    """
-    try:
-        stats = await document_service.get_document_stats()
-        return DocumentStats(**stats)
-
-    except Exception as e:
-        logger.error(f"Error getting document stats: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to retrieve statistics: {str(e)}"
-        )
@@ -7,10 +7,19 @@ All persistence is delegated to TicketRepository.
 """
 from typing import Optional
 from fastapi import APIRouter, HTTPException, Depends
-
-from app.models.schemas import Ticket, TicketCreate, TriageResponse
+from fastapi.responses import StreamingResponse
+
+from app.models.schemas import (
+    Ticket,
+    TicketCreate,
+    TriageResponse,
+    BatchTriageRequest,
+    BatchTriageStatus,
+    TriageThroughputMetrics
+)
 from app.services.ticket_service import TicketService
-from app.api.dependencies import get_ticket_service
+from app.services.batch_triage_service import BatchTriageService
+from app.api.dependencies import get_ticket_service, get_batch_triage_service
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -64,6 +73,95 @@ async def list_tickets(
     return tickets
 
 
+@router.post("/batch", response_model=BatchTriageStatus, status_code=202)
+async def create_batch_triage(
+    request: BatchTriageRequest,
+    batch_service: BatchTriageService = Depends(get_batch_triage_service)
+) -> BatchTriageStatus:
+    """
+    Queue many tickets for background triage.
+
+    Args:
+        request: Ticket IDs to process
+        batch_service: Injected batch triage service
+
+    Returns:
+        Initial batch status (poll or stream it by batch_id)
+    """
+    logger.info(f"HTTP POST /tickets/batch - Queuing {len(request.ticket_ids)} tickets")
+    return await batch_service.enqueue(request.ticket_ids)
+
+
+@router.get("/batch/metrics", response_model=TriageThroughputMetrics)
+async def get_batch_metrics(
+    batch_service: BatchTriageService = Depends(get_batch_triage_service)
+) -> TriageThroughputMetrics:
+    """
+    Get batch triage throughput (tickets per minute, queue depth).
+
+    Args:
+        batch_service: Injected batch triage service
+
+    Returns:
+        Worker pool metrics
+    """
+    return batch_service.metrics()
+
+
+@router.get("/batch/{batch_id}", response_model=BatchTriageStatus)
+async def get_batch_triage(
+    batch_id: str,
+    batch_service: BatchTriageService = Depends(get_batch_triage_service)
+) -> BatchTriageStatus:
+    """
+    Get batch progress with per-ticket status.
+
+    Args:
+        batch_id: Batch identifier
+        batch_service: Injected batch triage service
+
+    Returns:
+        Batch status
+
+    Raises:
+        HTTPException: If batch not found
+    """
+    status = batch_service.get_batch(batch_id)
+
+    if not status:
+        raise HTTPException(status_code=404, detail="Batch not found")
+
+    return status
+
+
+@router.get("/batch/{batch_id}/events")
+async def stream_batch_triage(
+    batch_id: str,
+    batch_service: BatchTriageService = Depends(get_batch_triage_service)
+) -> StreamingResponse:
+    """
+    Stream per-ticket progress of a batch as server-sent events.
+
+    Args:
+        batch_id: Batch identifier
+        batch_service: Injected batch triage service
+
+    Returns:
+        text/event-stream response
+
+    Raises:
+        HTTPException: If batch not found
+    """
+    if not batch_service.get_batch(batch_id):
+        raise HTTPException(status_code=404, detail="Batch not found")
+
+    return StreamingResponse(
+        batch_service.stream_events(batch_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+
 @router.get("/{ticket_id}", response_model=Ticket)
 async def get_ticket(
     ticket_id: str,
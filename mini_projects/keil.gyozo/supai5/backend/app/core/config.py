@@ -34,15 +34,24 @@ class Settings(BaseSettings):
     redis_port: int = 6379
     cache_ttl_hours: int = 6
 
+    # Document catalog (knowledge base metadata)
+    document_catalog_path: str = "data/documents.db"
+
     # RAG Configuration
     score_threshold: float = 0.3  # Lowered for testing - increase once working
     top_k_retrieval: int = 10
     top_k_rerank: int = 5
     query_expansion_count: int = 3
+    rrf_k: int = 60  # Reciprocal-rank fusion constant
+
+    # Batch triage
+    batch_triage_workers: int = 8  # Concurrent tickets in the batch worker pool
+    llm_workflows_per_minute: int = 60  # Global budget for ticket workflow runs
 
     # FleetDM Configuration (optional)
     fleet_url: str = ""
     fleet_api_token: str = ""
+    fleet_host_cache_ttl_seconds: int = 300  # Host index refresh interval
 
     # Application
     environment: str = "development"
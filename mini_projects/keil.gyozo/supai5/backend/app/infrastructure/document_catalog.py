@@ -0,0 +1,212 @@
+"""
+Document catalog for knowledge base metadata.
+
+Keeps one row per indexed document (title, category, chunk count, ...)
+so listing, statistics and detail lookups do not have to scroll vector
+payloads out of Qdrant. The catalog is maintained by DocumentService on
+upload and delete.
+"""
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional, List
+import asyncio
+import sqlite3
+import threading
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+DOCUMENT_FIELDS = (
+    "id",
+    "title",
+    "category",
+    "description",
+    "filename",
+    "file_type",
+    "created_at",
+    "chunk_count",
+)
+
+
+class IDocumentCatalog(ABC):
+    """Interface for document metadata storage."""
+
+    @abstractmethod
+    async def add(self, document: dict) -> None:
+        """Insert or replace a document's metadata."""
+        pass
+
+    @abstractmethod
+    async def get(self, doc_id: str) -> Optional[dict]:
+        """Get a document's metadata by ID."""
+        pass
+
+    @abstractmethod
+    async def list(
+        self,
+        category: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> tuple[List[dict], int]:
+        """List documents, newest first.
+
+        Returns:
+            Tuple of (page of documents, total matching documents)
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, doc_id: str) -> bool:
+        """Delete a document's metadata. Returns False if unknown."""
+        pass
+
+    @abstractmethod
+    async def stats(self) -> dict:
+        """Aggregate counts: total_documents, total_chunks, categories."""
+        pass
+
+    @abstractmethod
+    async def is_synced(self) -> bool:
+        """Whether the catalog has been backfilled from the vector store."""
+        pass
+
+    @abstractmethod
+    async def replace_all(self, documents: List[dict]) -> None:
+        """Replace the whole catalog (used for backfill) and mark it synced."""
+        pass
+
+
+class SqliteDocumentCatalog(IDocumentCatalog):
+    """SQLite-backed document catalog.
+
+    Uses a single connection guarded by a lock; queries run in the default
+    executor to keep the event loop free.
+    """
+
+    def __init__(self, db_path: str = "data/documents.db"):
+        """Open (and create if needed) the catalog database.
+
+        Args:
+            db_path: SQLite file path, or ":memory:"
+        """
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS documents (
+                    id TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    description TEXT NOT NULL DEFAULT '',
+                    filename TEXT NOT NULL DEFAULT '',
+                    file_type TEXT NOT NULL DEFAULT '',
+                    created_at TEXT NOT NULL,
+                    chunk_count INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS idx_documents_created
+                    ON documents (created_at DESC);
+                CREATE INDEX IF NOT EXISTS idx_documents_category_created
+                    ON documents (category, created_at DESC);
+                CREATE TABLE IF NOT EXISTS catalog_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                );
+            """)
+        logger.info(f"Using document catalog: {db_path}")
+
+    async def _run(self, func, *args):
+        """Run a synchronous catalog operation in the thread pool."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    def _execute(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        """Execute one statement in its own transaction."""
+        with self._lock, self._conn:
+            return self._conn.execute(sql, params).fetchall()
+
+    @staticmethod
+    def _row_params(document: dict) -> tuple:
+        """Order a document dict as a row for INSERT."""
+        row = {field: document.get(field, "") for field in DOCUMENT_FIELDS}
+        row["chunk_count"] = int(document.get("chunk_count") or 0)
+        return tuple(row[field] for field in DOCUMENT_FIELDS)
+
+    @staticmethod
+    def _insert_sql() -> str:
+        placeholders = ", ".join("?" for _ in DOCUMENT_FIELDS)
+        return f"INSERT OR REPLACE INTO documents ({', '.join(DOCUMENT_FIELDS)}) VALUES ({placeholders})"
+
+    async def add(self, document: dict) -> None:
+        """Insert or replace a document's metadata."""
+        await self._run(self._execute, self._insert_sql(), self._row_params(document))
+
+    async def get(self, doc_id: str) -> Optional[dict]:
+        """Get a document's metadata by ID."""
+        rows = await self._run(self._execute, "SELECT * FROM documents WHERE id = ?", (doc_id,))
+        return dict(rows[0]) if rows else None
+
+    async def list(
+        self,
+        category: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> tuple[List[dict], int]:
+        """List documents, newest first, with the total for pagination."""
+        return await self._run(self._list_sync, category, limit, offset)
+
+    def _list_sync(self, category: Optional[str], limit: int, offset: int) -> tuple[List[dict], int]:
+        """Synchronous list operation."""
+        where, params = ("WHERE category = ?", (category,)) if category else ("", ())
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM documents {where}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT * FROM documents {where} ORDER BY created_at DESC LIMIT ? OFFSET ?",
+                params + (limit, offset)
+            ).fetchall()
+        return [dict(row) for row in rows], total
+
+    async def delete(self, doc_id: str) -> bool:
+        """Delete a document's metadata."""
+        return await self._run(self._delete_sync, doc_id)
+
+    def _delete_sync(self, doc_id: str) -> bool:
+        """Synchronous delete operation."""
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM documents WHERE id = ?", (doc_id,)).rowcount > 0
+
+    async def stats(self) -> dict:
+        """Aggregate document and chunk counts."""
+        rows = await self._run(
+            self._execute,
+            "SELECT category, COUNT(*) AS documents, SUM(chunk_count) AS chunks "
+            "FROM documents GROUP BY category"
+        )
+        return {
+            "total_documents": sum(row["documents"] for row in rows),
+            "total_chunks": sum(row["chunks"] or 0 for row in rows),
+            "categories": {row["category"]: row["documents"] for row in rows},
+        }
+
+    async def is_synced(self) -> bool:
+        """Whether the catalog has been backfilled from the vector store."""
+        rows = await self._run(self._execute, "SELECT value FROM catalog_meta WHERE key = 'synced'")
+        return bool(rows)
+
+    async def replace_all(self, documents: List[dict]) -> None:
+        """Replace the whole catalog and mark it synced."""
+        await self._run(self._replace_all_sync, documents)
+
+    def _replace_all_sync(self, documents: List[dict]) -> None:
+        """Synchronous replace operation (single transaction)."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM documents")
+            self._conn.executemany(
+                self._insert_sql(),
+                [self._row_params(document) for document in documents]
+            )
+            self._conn.execute("INSERT OR REPLACE INTO catalog_meta (key, value) VALUES ('synced', '1')")
@@ -0,0 +1,63 @@
+"""
+Async rate limiting for outbound LLM work.
+
+A single limiter instance is shared by every ticket processor so that
+concurrent workers (single-ticket API calls and batch triage) stay within
+the same global request budget.
+"""
+import asyncio
+import time
+from typing import Optional
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncRateLimiter:
+    """Token-bucket rate limiter for asyncio code.
+
+    Allows short bursts up to `burst` and refills at `rate` tokens per `per`
+    seconds. Waiters are served in FIFO order.
+    """
+
+    def __init__(self, rate: float, per: float = 60.0, burst: Optional[int] = None):
+        """Initialize the limiter.
+
+        Args:
+            rate: Number of acquisitions allowed per period
+            per: Period length in seconds
+            burst: Bucket capacity (defaults to rate, at least 1)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.per = per
+        self.capacity = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate / self.per)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                wait = (1 - self._tokens) * self.per / self.rate
+                logger.debug(f"Rate limit reached, waiting {wait:.2f}s")
+                await asyncio.sleep(wait)
+                self._refill()
+            self._tokens -= 1
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
@@ -8,6 +8,7 @@ from app.core.logging import get_logger
 from app.api.tickets import router as tickets_router
 from app.api.documents import router as documents_router
 from app.api.chat import router as chat_router
+from app.api.dependencies import get_batch_triage_service
 from app.services.qdrant_service import QdrantService
 
 logger = get_logger(__name__)
@@ -49,6 +50,9 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown."""
     logger.info("Shutting down SupportAI application")
+    # Only stop the batch workers if the service was ever created
+    if get_batch_triage_service.cache_info().currsize:
+        await get_batch_triage_service().stop()
 
 @app.get("/")
 async def root():
@@ -95,6 +95,48 @@ class Ticket(BaseModel):
     )
 
 
+# Batch Triage Schemas
+BatchTicketStatus = Literal["queued", "processing", "completed", "cached", "deduplicated", "error"]
+
+
+class BatchTriageRequest(BaseModel):
+    """Request to triage many tickets in the background."""
+    ticket_ids: list[str] = Field(..., min_length=1, max_length=1000, description="Tickets to triage")
+
+
+class TicketProgress(BaseModel):
+    """Per-ticket progress within a batch."""
+    ticket_id: str = Field(description="Ticket identifier")
+    status: BatchTicketStatus = Field(default="queued", description="Batch processing status")
+    error: Optional[str] = Field(default=None, description="Error message if processing failed")
+    started_at: Optional[datetime] = Field(default=None, description="Processing start time")
+    finished_at: Optional[datetime] = Field(default=None, description="Processing end time")
+
+
+class BatchTriageStatus(BaseModel):
+    """Progress snapshot of a batch triage job."""
+    batch_id: str = Field(description="Batch identifier")
+    created_at: datetime = Field(description="Batch creation timestamp")
+    total: int = Field(description="Number of tickets in the batch")
+    queued: int = Field(default=0, description="Tickets waiting for a worker")
+    processing: int = Field(default=0, description="Tickets currently being processed")
+    completed: int = Field(default=0, description="Tickets finished (including cached/deduplicated)")
+    failed: int = Field(default=0, description="Tickets that failed")
+    finished: bool = Field(default=False, description="Whether every ticket is done")
+    tickets_per_minute: float = Field(default=0.0, description="Batch throughput so far")
+    tickets: list[TicketProgress] = Field(default_factory=list, description="Per-ticket progress")
+
+
+class TriageThroughputMetrics(BaseModel):
+    """Throughput of the batch triage worker pool."""
+    workers: int = Field(description="Configured worker count")
+    queue_size: int = Field(description="Tickets waiting in the queue")
+    in_progress: int = Field(description="Tickets currently being processed")
+    processed_total: int = Field(description="Tickets processed since startup")
+    failed_total: int = Field(description="Tickets failed since startup")
+    tickets_per_minute: float = Field(description="Completions over the last minute")
+
+
 # Internal State Schema
 class SupportTicketState(BaseModel):
     """LangGraph workflow state (Pydantic v2)."""
@@ -0,0 +1,260 @@
+"""
+Batch triage service running tickets through a bounded worker pool.
+
+Single Responsibility: schedules and tracks bulk triage. The actual
+processing (cache, deduplication, workflow, persistence) stays in
+TicketService; global LLM rate limiting lives in the injected processor.
+"""
+import asyncio
+import json
+import time
+import uuid
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from app.models.schemas import BatchTriageStatus, TicketProgress, TriageThroughputMetrics
+from app.services.ticket_service import TicketService
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Batch status for each TicketService result source
+SOURCE_STATUS = {
+    "workflow": "completed",
+    "cache": "cached",
+    "deduplicated": "deduplicated",
+}
+DONE_STATUSES = {"completed", "cached", "deduplicated", "error"}
+
+
+class _BatchJob:
+    """Mutable state of one batch (internal)."""
+
+    def __init__(self, batch_id: str, ticket_ids: list[str]):
+        self.batch_id = batch_id
+        self.created_at = datetime.utcnow()
+        self.started = time.monotonic()
+        self.tickets = OrderedDict((tid, TicketProgress(ticket_id=tid)) for tid in ticket_ids)
+        self.subscribers: list[asyncio.Queue] = []
+
+    @property
+    def finished(self) -> bool:
+        return all(p.status in DONE_STATUSES for p in self.tickets.values())
+
+    def snapshot(self, include_tickets: bool = True) -> BatchTriageStatus:
+        """Build the public status model."""
+        counts = {"queued": 0, "processing": 0, "completed": 0, "failed": 0}
+        for progress in self.tickets.values():
+            if progress.status == "error":
+                counts["failed"] += 1
+            elif progress.status in DONE_STATUSES:
+                counts["completed"] += 1
+            else:
+                counts[progress.status] += 1
+
+        done = counts["completed"] + counts["failed"]
+        elapsed_minutes = max(time.monotonic() - self.started, 1e-6) / 60
+
+        return BatchTriageStatus(
+            batch_id=self.batch_id,
+            created_at=self.created_at,
+            total=len(self.tickets),
+            finished=self.finished,
+            tickets_per_minute=round(done / elapsed_minutes, 2),
+            tickets=list(self.tickets.values()) if include_tickets else [],
+            **counts
+        )
+
+
+class BatchTriageService:
+    """Queue of ticket IDs consumed by a fixed number of async workers.
+
+    Workers are started lazily on the first batch so the service can be
+    created outside a running event loop (e.g. in dependency factories).
+    Progress is kept for the most recent `max_batches` batches and can be
+    polled or streamed as server-sent events.
+    """
+
+    def __init__(
+        self,
+        ticket_service: TicketService,
+        workers: int = 8,
+        max_batches: int = 100,
+        metrics_window_seconds: float = 60.0
+    ):
+        """Initialize batch triage service.
+
+        Args:
+            ticket_service: Service that processes a single ticket
+            workers: Number of concurrent worker tasks
+            max_batches: Finished batches kept for status queries
+            metrics_window_seconds: Window for the tickets-per-minute metric
+        """
+        self.ticket_service = ticket_service
+        self.workers = max(1, workers)
+        self.max_batches = max_batches
+        self.metrics_window = metrics_window_seconds
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: list[asyncio.Task] = []
+        self._batches: OrderedDict[str, _BatchJob] = OrderedDict()
+        self._completions: deque[float] = deque()
+        self._in_progress = 0
+        self._processed_total = 0
+        self._failed_total = 0
+        logger.info(f"Initialized BatchTriageService with {self.workers} workers")
+
+    def _ensure_workers(self) -> None:
+        """Start the worker tasks on the running loop if needed."""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        self._tasks = [task for task in self._tasks if not task.done()]
+        for index in range(len(self._tasks), self.workers):
+            self._tasks.append(asyncio.create_task(self._worker(index)))
+
+    async def enqueue(self, ticket_ids: list[str]) -> BatchTriageStatus:
+        """Queue tickets for background triage.
+
+        Duplicate IDs within the request are processed once.
+
+        Args:
+            ticket_ids: Tickets to triage
+
+        Returns:
+            Initial batch status
+        """
+        self._ensure_workers()
+
+        unique_ids = list(dict.fromkeys(ticket_ids))
+        job = _BatchJob(str(uuid.uuid4()), unique_ids)
+        self._batches[job.batch_id] = job
+        self._evict_old_batches()
+
+        for ticket_id in unique_ids:
+            self._queue.put_nowait((job.batch_id, ticket_id))
+
+        logger.info(f"Queued batch {job.batch_id} with {len(unique_ids)} tickets")
+        return job.snapshot()
+
+    def _evict_old_batches(self) -> None:
+        """Drop the oldest finished batches beyond max_batches."""
+        while len(self._batches) > self.max_batches:
+            oldest_id, oldest = next(iter(self._batches.items()))
+            if not oldest.finished:
+                break
+            del self._batches[oldest_id]
+
+    def get_batch(self, batch_id: str) -> Optional[BatchTriageStatus]:
+        """Get status of a batch.
+
+        Args:
+            batch_id: Batch identifier
+
+        Returns:
+            Batch status if known, None otherwise
+        """
+        job = self._batches.get(batch_id)
+        return job.snapshot() if job else None
+
+    async def stream_events(self, batch_id: str) -> AsyncIterator[str]:
+        """Stream batch progress as server-sent events.
+
+        Emits one "ticket" event per status change and a final "batch"
+        summary event once every ticket is done.
+
+        Args:
+            batch_id: Batch identifier
+
+        Yields:
+            SSE-formatted event strings
+        """
+        job = self._batches.get(batch_id)
+        if job is None:
+            return
+
+        queue: asyncio.Queue = asyncio.Queue()
+        job.subscribers.append(queue)
+        try:
+            # Replay current state so late subscribers see everything
+            for progress in list(job.tickets.values()):
+                yield self._format_event("ticket", progress.model_dump(mode="json"))
+
+            while not job.finished or not queue.empty():
+                progress = await queue.get()
+                yield self._format_event("ticket", progress.model_dump(mode="json"))
+
+            summary = job.snapshot(include_tickets=False)
+            yield self._format_event("batch", summary.model_dump(mode="json"))
+        finally:
+            job.subscribers.remove(queue)
+
+    @staticmethod
+    def _format_event(event: str, data: dict) -> str:
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+    def metrics(self) -> TriageThroughputMetrics:
+        """Get worker pool throughput metrics."""
+        self._trim_completions(time.monotonic())
+        return TriageThroughputMetrics(
+            workers=self.workers,
+            queue_size=self._queue.qsize() if self._queue else 0,
+            in_progress=self._in_progress,
+            processed_total=self._processed_total,
+            failed_total=self._failed_total,
+            tickets_per_minute=round(len(self._completions) * 60.0 / self.metrics_window, 2)
+        )
+
+    def _trim_completions(self, now: float) -> None:
+        while self._completions and now - self._completions[0] > self.metrics_window:
+            self._completions.popleft()
+
+    def _update(self, job: _BatchJob, ticket_id: str, **changes) -> None:
+        """Apply a progress change and notify stream subscribers."""
+        progress = job.tickets[ticket_id].model_copy(update=changes)
+        job.tickets[ticket_id] = progress
+        for subscriber in job.subscribers:
+            subscriber.put_nowait(progress)
+
+    async def _worker(self, index: int) -> None:
+        """Consume queued tickets until cancelled."""
+        logger.debug(f"Batch triage worker {index} started")
+        while True:
+            batch_id, ticket_id = await self._queue.get()
+            try:
+                job = self._batches.get(batch_id)
+                if job is not None:
+                    await self._process(job, ticket_id)
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, job: _BatchJob, ticket_id: str) -> None:
+        """Triage one ticket and record the outcome."""
+        self._in_progress += 1
+        self._update(job, ticket_id, status="processing", started_at=datetime.utcnow())
+        try:
+            _, source = await self.ticket_service.process_ticket_with_source(ticket_id)
+            self._processed_total += 1
+            self._update(job, ticket_id, status=SOURCE_STATUS[source], finished_at=datetime.utcnow())
+        except Exception as e:
+            self._failed_total += 1
+            logger.error(f"Batch {job.batch_id}: ticket {ticket_id} failed: {e}")
+            self._update(job, ticket_id, status="error", error=str(e), finished_at=datetime.utcnow())
+        finally:
+            self._in_progress -= 1
+            now = time.monotonic()
+            self._completions.append(now)
+            self._trim_completions(now)
+
+    async def join(self) -> None:
+        """Wait until every queued ticket has been processed."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def stop(self) -> None:
+        """Cancel worker tasks (called on application shutdown)."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Stopped batch triage workers")
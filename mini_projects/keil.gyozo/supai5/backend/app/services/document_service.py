@@ -3,6 +3,7 @@ Document processing service for knowledge base ingestion.
 """
 import uuid
 import io
+import asyncio
 from typing import Optional, BinaryIO
 from datetime import datetime
 
@@ -20,9 +21,11 @@ except ImportError:
 
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_openai import OpenAIEmbeddings
+from qdrant_client.models import Filter, FieldCondition, MatchValue, FilterSelector
 
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.infrastructure.document_catalog import IDocumentCatalog, DOCUMENT_FIELDS
 from app.services.qdrant_service import QdrantService
 
 logger = get_logger(__name__)
@@ -31,14 +34,19 @@ logger = get_logger(__name__)
 class DocumentService:
     """Service for processing and indexing documents."""
 
-    def __init__(self, qdrant_service: QdrantService):
+    # Payload fields needed to rebuild the catalog (no chunk text)
+    CATALOG_PAYLOAD_FIELDS = ["doc_id", *DOCUMENT_FIELDS[1:]]
+
+    def __init__(self, qdrant_service: QdrantService, catalog: IDocumentCatalog):
         """
         Initialize document service.
 
         Args:
             qdrant_service: Qdrant service instance
+            catalog: Document metadata catalog
         """
         self.qdrant = qdrant_service
+        self.catalog = catalog
         self.embeddings = OpenAIEmbeddings(
             model="text-embedding-3-large",
             openai_api_key=settings.openai_api_key
@@ -117,18 +125,13 @@ class DocumentService:
             metadata=metadata
         )
 
+        document = {"id": doc_id, **metadata}
+        await self._ensure_catalog()
+        await self.catalog.add(document)
+
         logger.info(f"Successfully indexed document: {doc_id} ({title})")
 
-        return {
-            "id": doc_id,
-            "title": title,
-            "category": category,
-            "description": description or "",
-            "filename": filename,
-            "file_type": file_extension,
-            "chunk_count": len(chunks),
-            "created_at": metadata["created_at"]
-        }
+        return document
 
     def _extract_text_from_pdf(self, file_content: bytes) -> str:
         """
@@ -175,55 +178,28 @@ class DocumentService:
         
         return "\n\n".join(text_parts)
 
-    async def list_documents(
-        self,
-        category: Optional[str] = None,
-        limit: int = 100
-    ) -> list[dict]:
+    async def _ensure_catalog(self) -> None:
         """
-        List all indexed documents.
-
-        Args:
-            category: Optional category filter
-            limit: Maximum number of documents
-
-        Returns:
-            List of document metadata
+        Backfill the catalog from Qdrant once (for collections indexed
+        before the catalog existed).
         """
-        # Query Qdrant for unique documents
-        # We'll use a dummy vector and fetch by metadata
-        from qdrant_client.models import Filter, FieldCondition, MatchValue
-        
-        query_filter = None
-        if category:
-            query_filter = Filter(
-                must=[
-                    FieldCondition(
-                        key="category",
-                        match=MatchValue(value=category)
-                    )
-                ]
-            )
+        if await self.catalog.is_synced():
+            return
 
-        # Get all points and extract unique documents
-        # Note: This is a simplified approach. For production, 
-        # you'd want a separate metadata store or better querying
-        try:
-            # Scroll through all points
-            points, _ = await self.qdrant.client.scroll(
+        documents: dict[str, dict] = {}
+        offset = None
+        while True:
+            points, offset = await self.qdrant.client.scroll(
                 collection_name=self.qdrant.collection_name,
-                scroll_filter=query_filter,
-                limit=limit * 10,  # Fetch more to account for chunks
-                with_payload=True,
+                limit=1000,
+                offset=offset,
+                with_payload=self.CATALOG_PAYLOAD_FIELDS,
                 with_vectors=False
             )
-
-            # Group by doc_id and get first chunk metadata
-            docs_dict = {}
             for point in points:
                 doc_id = point.payload.get("doc_id")
-                if doc_id and doc_id not in docs_dict:
-                    docs_dict[doc_id] = {
+                if doc_id and doc_id not in documents:
+                    documents[doc_id] = {
                         "id": doc_id,
                         "title": point.payload.get("title", "Untitled"),
                         "category": point.payload.get("category", "Unknown"),
@@ -233,21 +209,44 @@ class DocumentService:
                         "created_at": point.payload.get("created_at", ""),
                         "chunk_count": point.payload.get("chunk_count", 0)
                     }
+            if offset is None:
+                break
+
+        await self.catalog.replace_all(list(documents.values()))
+        logger.info(f"Backfilled document catalog with {len(documents)} documents")
+
+    async def list_documents(
+        self,
+        category: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> tuple[list[dict], int]:
+        """
+        List indexed documents from the catalog, newest first.
 
-            # Sort by created_at descending
-            documents = list(docs_dict.values())
-            documents.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+        Args:
+            category: Optional category filter
+            limit: Maximum number of documents
+            offset: Number of documents to skip
 
-            return documents[:limit]
+        Returns:
+            Tuple of (page of document metadata, total matching documents)
+        """
+        try:
+            await self._ensure_catalog()
+            return await self.catalog.list(category=category, limit=limit, offset=offset)
 
         except Exception as e:
             logger.error(f"Error listing documents: {e}")
-            return []
+            return [], 0
 
     async def get_document_with_chunks(self, doc_id: str) -> dict | None:
         """
         Get document metadata and all text chunks.
 
+        Chunk point IDs are derived from the document ID, so the chunks are
+        fetched directly by ID instead of filtering the collection.
+
         Args:
             doc_id: Document ID
 
@@ -255,54 +254,31 @@ class DocumentService:
             Document with chunks or None if not found
         """
         try:
-            from qdrant_client.models import Filter, FieldCondition, MatchValue
+            await self._ensure_catalog()
+            document = await self.catalog.get(doc_id)
+            if not document:
+                return None
 
-            # Find all points with this doc_id
-            points, _ = await self.qdrant.client.scroll(
+            points = await self.qdrant.client.retrieve(
                 collection_name=self.qdrant.collection_name,
-                scroll_filter=Filter(
-                    must=[
-                        FieldCondition(
-                            key="doc_id",
-                            match=MatchValue(value=doc_id)
-                        )
-                    ]
-                ),
-                limit=1000,
-                with_payload=True,
+                ids=[
+                    self.qdrant.generate_chunk_id(doc_id, index)
+                    for index in range(document["chunk_count"])
+                ],
+                with_payload=["chunk_index", "text"],
                 with_vectors=False
             )
 
-            if not points:
-                return None
-
-            # Extract metadata from first chunk
-            first_point = points[0]
-            document = {
-                "id": doc_id,
-                "title": first_point.payload.get("title", "Untitled"),
-                "category": first_point.payload.get("category", "Unknown"),
-                "description": first_point.payload.get("description", ""),
-                "filename": first_point.payload.get("filename", ""),
-                "file_type": first_point.payload.get("file_type", ""),
-                "created_at": first_point.payload.get("created_at", ""),
-                "chunk_count": first_point.payload.get("chunk_count", len(points)),
-                "chunks": []
-            }
-
-            # Extract chunks and sort by index
-            chunks = []
-            for point in points:
-                chunks.append({
+            chunks = [
+                {
                     "chunk_index": point.payload.get("chunk_index", 0),
                     "text": point.payload.get("text", "")
-                })
-
-            # Sort by chunk_index
+                }
+                for point in points
+            ]
             chunks.sort(key=lambda x: x["chunk_index"])
-            document["chunks"] = chunks
 
-            return document
+            return {**document, "chunks": chunks}
 
         except Exception as e:
             logger.error(f"Error fetching document {doc_id}: {e}")
@@ -310,7 +286,7 @@ class DocumentService:
 
     async def delete_document(self, doc_id: str) -> bool:
         """
-        Delete all chunks of a document.
+        Delete all chunks of a document and its catalog entry.
 
         Args:
             doc_id: Document ID to delete
@@ -319,36 +295,28 @@ class DocumentService:
             True if successful
         """
         try:
-            from qdrant_client.models import Filter, FieldCondition, MatchValue
+            await self._ensure_catalog()
+            if not await self.catalog.get(doc_id):
+                logger.warning(f"No chunks found for document {doc_id}")
+                return False
 
-            # Find all points with this doc_id
-            points, _ = await self.qdrant.client.scroll(
+            # Delete server-side by payload filter (no point listing needed)
+            await self.qdrant.client.delete(
                 collection_name=self.qdrant.collection_name,
-                scroll_filter=Filter(
-                    must=[
-                        FieldCondition(
-                            key="doc_id",
-                            match=MatchValue(value=doc_id)
-                        )
-                    ]
-                ),
-                limit=1000,
-                with_payload=False,
-                with_vectors=False
-            )
-
-            # Delete all points
-            point_ids = [point.id for point in points]
-            if point_ids:
-                await self.qdrant.client.delete(
-                    collection_name=self.qdrant.collection_name,
-                    points_selector=point_ids
+                points_selector=FilterSelector(
+                    filter=Filter(
+                        must=[
+                            FieldCondition(
+                                key="doc_id",
+                                match=MatchValue(value=doc_id)
+                            )
+                        ]
+                    )
                 )
-                logger.info(f"Deleted {len(point_ids)} chunks for document {doc_id}")
-                return True
-            else:
-                logger.warning(f"No chunks found for document {doc_id}")
-                return False
+            )
+            await self.catalog.delete(doc_id)
+            logger.info(f"Deleted document {doc_id}")
+            return True
 
         except Exception as e:
             logger.error(f"Error deleting document {doc_id}: {e}")
@@ -362,19 +330,14 @@ class DocumentService:
             Statistics dictionary
         """
         try:
-            collection_info = await self.qdrant.get_collection_info()
-            documents = await self.list_documents(limit=1000)
-
-            # Count by category
-            category_counts = {}
-            for doc in documents:
-                category = doc.get("category", "Unknown")
-                category_counts[category] = category_counts.get(category, 0) + 1
+            await self._ensure_catalog()
+            stats, collection_info = await asyncio.gather(
+                self.catalog.stats(),
+                self.qdrant.get_collection_info()
+            )
 
             return {
-                "total_documents": len(documents),
-                "total_chunks": collection_info.get("points_count", 0),
-                "categories": category_counts,
+                **stats,
                 "collection_status": collection_info.get("status", "unknown")
             }
 
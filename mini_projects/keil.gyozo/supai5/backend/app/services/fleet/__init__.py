@@ -1,8 +1,9 @@
 """
 Fleet API module - FleetDM integration for the support system.
 """
-from .client import FleetAPIClient, create_fleet_client, HTTPXClient
-from .models import HostDetail, HostSummary
+from .client import FleetAPIClient, create_fleet_client, get_fleet_client, HTTPXClient
+from .host_cache import FleetHostCache, get_host_cache
+from .models import HostDetail, HostRecord, HostSummary
 from .exceptions import (
     FleetAPIException,
     AuthenticationError,
@@ -14,8 +15,12 @@ from .exceptions import (
 __all__ = [
     "FleetAPIClient",
     "create_fleet_client",
+    "get_fleet_client",
     "HTTPXClient",
+    "FleetHostCache",
+    "get_host_cache",
     "HostDetail",
+    "HostRecord",
     "HostSummary",
     "FleetAPIException",
     "AuthenticationError",
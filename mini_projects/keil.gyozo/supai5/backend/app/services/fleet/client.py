@@ -1,13 +1,15 @@
 """
 Fleet API Client Service.
 """
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator
 from abc import ABC, abstractmethod
+from collections import deque
+import asyncio
 import httpx
 
 from app.core.config import settings
 from app.core.logging import get_logger
-from .models import HostDetail, HostSummary, Label, LabelCreate, Policy, PolicyCreate, Team, TeamCreate, QueryRequest, QueryResponse
+from .models import HostDetail, HostRecord, HostSummary, Label, LabelCreate, Policy, PolicyCreate, Team, TeamCreate, QueryRequest, QueryResponse
 from .exceptions import (
     AuthenticationError, AuthorizationError,
     ResourceNotFoundError, ValidationError,
@@ -153,6 +155,66 @@ class FleetAPIClient:
         data = await self.http_client.get("/api/v1/fleet/hosts", params=params)
         return [HostDetail(**host) for host in data.get("hosts", [])]
 
+    async def _fetch_host_page(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Fetch one raw page of hosts."""
+        data = await self.http_client.get("/api/v1/fleet/hosts", params=params)
+        return data.get("hosts", [])
+
+    async def iter_hosts(
+        self,
+        per_page: int = 500,
+        prefetch: int = 4,
+        order_key: str = "id",
+        **filters
+    ) -> AsyncIterator[HostRecord]:
+        """Walk all hosts page by page.
+
+        Up to `prefetch` pages are requested concurrently; pages are yielded
+        in order as lightweight HostRecord objects (including device-mapped
+        user emails). Iteration stops at the first short page.
+
+        Args:
+            per_page: Hosts per page
+            prefetch: Maximum pages in flight
+            order_key: Stable sort key for paging
+            **filters: Additional filter parameters
+
+        Yields:
+            HostRecord for every host
+        """
+        base_params = {
+            "per_page": per_page,
+            "order_key": order_key,
+            "order_direction": "asc",
+            "device_mapping": "true",
+            **filters
+        }
+        pending: deque = deque()
+        next_page = 0
+
+        def schedule() -> None:
+            nonlocal next_page
+            params = {**base_params, "page": next_page}
+            pending.append(asyncio.create_task(self._fetch_host_page(params)))
+            next_page += 1
+
+        for _ in range(max(1, prefetch)):
+            schedule()
+
+        try:
+            while pending:
+                hosts = await pending.popleft()
+                for host in hosts:
+                    yield HostRecord.from_api(host)
+                if len(hosts) < per_page:
+                    break
+                schedule()
+        finally:
+            # Pages past the end (or after the caller stopped) are not needed
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
     async def search_host(self, query: str) -> Optional[HostDetail]:
         """Search for a host by hostname, email, or identifier."""
         try:
@@ -0,0 +1,144 @@
+"""
+In-memory host index for fast device lookup.
+"""
+import asyncio
+import time
+from typing import Optional, Dict, Tuple
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from .client import FleetAPIClient, get_fleet_client
+from .models import HostDetail, HostRecord
+
+logger = get_logger(__name__)
+
+
+class FleetHostCache:
+    """TTL cache of all Fleet hosts, indexed by hostname, serial and email.
+
+    The first lookup loads the index; afterwards stale indexes keep serving
+    lookups while a refresh runs in the background. Host details are cached
+    for the same TTL, so repeated lookups of a device stay local.
+    """
+
+    def __init__(self, client: FleetAPIClient, ttl_seconds: float = 300):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self._by_name: Dict[str, HostRecord] = {}
+        self._by_serial: Dict[str, HostRecord] = {}
+        self._by_email: Dict[str, HostRecord] = {}
+        self._details: Dict[int, Tuple[float, HostDetail]] = {}
+        self._loaded_at: Optional[float] = None
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    @property
+    def is_stale(self) -> bool:
+        return not self.loaded or time.monotonic() - self._loaded_at > self.ttl_seconds
+
+    def __len__(self) -> int:
+        return len(set(self._by_name.values()) | set(self._by_serial.values()))
+
+    async def refresh(self) -> None:
+        """Rebuild the indexes from a full host walk (one refresh at a time)."""
+        if self._refresh_lock.locked():
+            # Someone else is refreshing; wait for their result
+            async with self._refresh_lock:
+                return
+
+        async with self._refresh_lock:
+            by_name: Dict[str, HostRecord] = {}
+            by_serial: Dict[str, HostRecord] = {}
+            by_email: Dict[str, HostRecord] = {}
+
+            async for host in self.client.iter_hosts():
+                for name in (host.hostname, host.display_name, host.computer_name):
+                    if name:
+                        by_name.setdefault(name.upper(), host)
+                if host.hardware_serial:
+                    by_serial.setdefault(host.hardware_serial.upper(), host)
+                for email in host.emails:
+                    by_email.setdefault(email.lower(), host)
+
+            # Swap all indexes at once so lookups never see a partial index
+            self._by_name, self._by_serial, self._by_email = by_name, by_serial, by_email
+            self._loaded_at = time.monotonic()
+            logger.info(f"FleetDM host cache refreshed: {len(self)} hosts")
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._background_refresh())
+
+    async def _background_refresh(self) -> None:
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.error(f"FleetDM host cache refresh failed: {e}")
+
+    def lookup(self, query: str) -> Optional[HostRecord]:
+        """Resolve a hostname, serial number or user email from the index."""
+        if not query:
+            return None
+        query = query.strip()
+        if "@" in query:
+            return self._by_email.get(query.lower())
+        key = query.upper()
+        return self._by_name.get(key) or self._by_serial.get(key)
+
+    async def resolve(self, query: str) -> Optional[HostRecord]:
+        """Look up a host, loading the index on first use and refreshing it
+        in the background when stale."""
+        if not self.loaded:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"FleetDM host cache load failed: {e}")
+                return None
+        elif self.is_stale:
+            self._schedule_refresh()
+        return self.lookup(query)
+
+    async def _host_details(self, host_id: int) -> Optional[HostDetail]:
+        """Host details from the cache, fetched from Fleet once per TTL."""
+        cached = self._details.get(host_id)
+        if cached and time.monotonic() - cached[0] <= self.ttl_seconds:
+            return cached[1]
+        details = await self.client.get_host_details(host_id)
+        if details:
+            self._details[host_id] = (time.monotonic(), details)
+        return details
+
+    async def find_host(self, query: str) -> Optional[HostDetail]:
+        """Get full host details for a hostname, serial or email.
+
+        Resolves the host ID from the index and serves the details from the
+        cache (one details request per host and TTL); falls back to a Fleet
+        search for hosts enrolled since the last refresh.
+        """
+        record = await self.resolve(query)
+        if record:
+            return await self._host_details(record.id)
+
+        host = await self.client.search_host(query)
+        if host and host.id:
+            return await self._host_details(host.id) or host
+        return host
+
+
+# Singleton instance for convenience
+_host_cache: Optional[FleetHostCache] = None
+
+
+def get_host_cache() -> FleetHostCache:
+    """Get or create the host cache singleton."""
+    global _host_cache
+    if _host_cache is None:
+        _host_cache = FleetHostCache(
+            get_fleet_client(),
+            ttl_seconds=settings.fleet_host_cache_ttl_seconds
+        )
+    return _host_cache
@@ -1,8 +1,9 @@
 """
 Pydantic models for Fleet API entities.
 """
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from pydantic import BaseModel, Field
 
 
@@ -17,6 +18,40 @@ class HostSummary(BaseModel):
     team_id: Optional[int] = None
 
 
+@dataclass(frozen=True, slots=True)
+class HostRecord:
+    """Lightweight host entry used when walking the whole fleet.
+
+    Plain dataclass instead of a pydantic model: only the fields needed to
+    identify a device, without validation cost per host.
+    """
+    id: int
+    hostname: str
+    display_name: Optional[str] = None
+    computer_name: Optional[str] = None
+    hardware_serial: Optional[str] = None
+    platform: Optional[str] = None
+    status: Optional[str] = None
+    primary_ip: Optional[str] = None
+    emails: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_api(cls, host: Dict[str, Any]) -> "HostRecord":
+        """Build a record from a Fleet host list entry (with device_mapping)."""
+        mapping = host.get("device_mapping") or []
+        return cls(
+            id=host["id"],
+            hostname=host.get("hostname", ""),
+            display_name=host.get("display_name"),
+            computer_name=host.get("computer_name"),
+            hardware_serial=host.get("hardware_serial"),
+            platform=host.get("platform"),
+            status=host.get("status"),
+            primary_ip=host.get("primary_ip"),
+            emails=tuple(entry["email"] for entry in mapping if entry.get("email")),
+        )
+
+
 class HostDetail(BaseModel):
     """Detailed host information from FleetDM."""
     id: int
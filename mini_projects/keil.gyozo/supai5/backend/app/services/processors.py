@@ -9,6 +9,7 @@ from typing import Any
 
 from app.models.schemas import Ticket, TriageResponse
 from app.core.logging import get_logger
+from app.infrastructure.rate_limiter import AsyncRateLimiter
 from app.workflows.graph import SupportWorkflow
 
 logger = get_logger(__name__)
@@ -221,3 +222,46 @@ class CompositeTicketProcessor(ITicketProcessor):
             True if at least one processor can handle it
         """
         return any(processor.can_process(ticket) for processor in self.processors)
+
+
+class RateLimitedTicketProcessor(ITicketProcessor):
+    """Decorator that throttles another processor (Decorator Pattern).
+    
+    Every workflow run issues several LLM calls, so a shared limiter in
+    front of the processor caps the global LLM request rate no matter how
+    many workers are processing tickets concurrently.
+    """
+
+    def __init__(self, processor: ITicketProcessor, rate_limiter: AsyncRateLimiter):
+        """Initialize with the wrapped processor and a shared limiter.
+        
+        Args:
+            processor: Processor doing the actual work
+            rate_limiter: Limiter shared by all processors
+        """
+        self.processor = processor
+        self.rate_limiter = rate_limiter
+        logger.info(f"Initialized RateLimitedTicketProcessor around {processor.__class__.__name__}")
+
+    async def process(self, ticket: Ticket) -> TriageResponse:
+        """Wait for a rate-limit token, then delegate.
+        
+        Args:
+            ticket: Ticket to process
+            
+        Returns:
+            Triage response from the wrapped processor
+        """
+        await self.rate_limiter.acquire()
+        return await self.processor.process(ticket)
+
+    def can_process(self, ticket: Ticket) -> bool:
+        """Delegate to the wrapped processor.
+        
+        Args:
+            ticket: Ticket to check
+            
+        Returns:
+            True if the wrapped processor can handle it
+        """
+        return self.processor.can_process(ticket)
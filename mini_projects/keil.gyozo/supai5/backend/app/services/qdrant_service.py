@@ -11,6 +11,7 @@ from qdrant_client.models import (
     Filter,
     FieldCondition,
     MatchValue,
+    QueryRequest,
 )
 
 from app.core.config import settings
@@ -124,16 +125,7 @@ class QdrantService:
         Returns:
             List of search results with scores
         """
-        query_filter = None
-        if filter_category:
-            query_filter = Filter(
-                must=[
-                    FieldCondition(
-                        key="category",
-                        match=MatchValue(value=filter_category)
-                    )
-                ]
-            )
+        query_filter = self._category_filter(filter_category)
 
         # JAVÍTVA: search() helyett query_points() használata AsyncQdrantClient esetén
         effective_threshold = score_threshold or settings.score_threshold
@@ -152,17 +144,78 @@ class QdrantService:
             logger.info(f"Top scores: {[r.score for r in results.points[:3]]}")
 
         # JAVÍTVA: results.points iterálása (az új API results objektumot ad vissza)
-        return [
-            {
-                "id": result.id,
-                "score": result.score,
-                "text": result.payload.get("text", ""),
-                "doc_id": result.payload.get("doc_id", ""),
-                "category": result.payload.get("category", ""),
-                "metadata": result.payload
-            }
-            for result in results.points  # results.points az új API-ban
-        ]
+        return [self._to_result(result) for result in results.points]  # results.points az új API-ban
+
+    async def search_batch(
+        self,
+        query_vectors: list[list[float]],
+        limit: int = 10,
+        score_threshold: Optional[float] = None,
+        filter_category: Optional[str] = None
+    ) -> list[list[dict]]:
+        """
+        Search for several query vectors in a single round trip.
+
+        Args:
+            query_vectors: Query embedding vectors
+            limit: Maximum number of results per query
+            score_threshold: Minimum similarity score
+            filter_category: Optional category filter (applied to every query)
+
+        Returns:
+            One ranked result list per query vector, in input order
+        """
+        if not query_vectors:
+            return []
+
+        query_filter = self._category_filter(filter_category)
+        effective_threshold = score_threshold or settings.score_threshold
+        logger.info(
+            f"Qdrant batch search: queries={len(query_vectors)}, limit={limit}, "
+            f"score_threshold={effective_threshold}, filter={filter_category}"
+        )
+
+        responses = await self.client.query_batch_points(
+            collection_name=self.collection_name,
+            requests=[
+                QueryRequest(
+                    query=vector,
+                    limit=limit,
+                    score_threshold=effective_threshold,
+                    filter=query_filter,
+                    with_payload=True
+                )
+                for vector in query_vectors
+            ]
+        )
+
+        return [[self._to_result(point) for point in response.points] for response in responses]
+
+    @staticmethod
+    def _category_filter(filter_category: Optional[str]) -> Optional[Filter]:
+        """Build the payload filter for an optional category."""
+        if not filter_category:
+            return None
+        return Filter(
+            must=[
+                FieldCondition(
+                    key="category",
+                    match=MatchValue(value=filter_category)
+                )
+            ]
+        )
+
+    @staticmethod
+    def _to_result(point) -> dict:
+        """Convert a scored Qdrant point into a search result dict."""
+        return {
+            "id": point.id,
+            "score": point.score,
+            "text": point.payload.get("text", ""),
+            "doc_id": point.payload.get("doc_id", ""),
+            "category": point.payload.get("category", ""),
+            "metadata": point.payload
+        }
 
     async def delete_collection(self) -> None:  # Added async
         """Delete the collection."""
@@ -69,16 +69,54 @@ class RAGService:
 
         return embedding
 
+    async def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """
+        Get embeddings for several texts with one cache lookup and at most
+        one batched embedding request.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors in input order
+        """
+        embeddings = self.redis.get_embeddings(texts)
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            generated = await self.embeddings.aembed_documents(missing_texts)
+            for i, embedding in zip(missing, generated):
+                embeddings[i] = embedding
+            self.redis.set_embeddings(missing_texts, generated)
+
+        logger.info(f"Embedded {len(texts)} texts ({len(missing)} cache misses)")
+        return embeddings
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Normalize a query for cache lookups (case and whitespace)."""
+        return " ".join(query.lower().split())
+
     async def expand_queries(self, original_query: str) -> list[str]:
         """
         Generate semantic query variations.
 
+        Variations are cached per normalized query, so repeated questions skip
+        the LLM call.
+
         Args:
             original_query: Original customer query
 
         Returns:
             List of query variations including original
         """
+        normalized = self.normalize_query(original_query)
+        cached = self.redis.get_query_expansions(normalized)
+        if cached:
+            # Keep the caller's exact wording as the first query
+            return [original_query] + cached[1:]
+
         prompt = ChatPromptTemplate.from_messages([
             ("system", """You are a query expansion expert. Generate {count} semantic variations
             of the user's support question. Each variation should:
@@ -101,10 +139,46 @@ class RAGService:
 
         # Always include original query first
         queries = [original_query] + variations[:settings.query_expansion_count - 1]
+        self.redis.set_query_expansions(normalized, queries)
 
         logger.info(f"Expanded query into {len(queries)} variations")
         return queries
 
+    @staticmethod
+    def fuse_results(result_lists: list[list[dict]], k: int = 60) -> list[dict]:
+        """
+        Reciprocal-rank fusion of per-query result lists.
+
+        A document scores sum(1 / (k + rank)) over the lists it appears in, using
+        its best-ranked chunk per list. The best-scoring chunk represents the
+        document in the output.
+
+        Args:
+            result_lists: Ranked results, one list per query
+            k: RRF constant (higher flattens rank differences)
+
+        Returns:
+            Documents (one per doc_id) sorted by fused score, with "rrf_score"
+        """
+        fused: dict[str, dict] = {}
+        rrf_scores: dict[str, float] = {}
+
+        for results in result_lists:
+            seen_in_list = set()
+            for rank, result in enumerate(results, start=1):
+                doc_id = result.get("doc_id")
+                if doc_id in seen_in_list:
+                    continue
+                seen_in_list.add(doc_id)
+
+                rrf_scores[doc_id] = rrf_scores.get(doc_id, 0.0) + 1.0 / (k + rank)
+                best = fused.get(doc_id)
+                if best is None or result.get("score", 0.0) > best.get("score", 0.0):
+                    fused[doc_id] = result
+
+        ranked = sorted(rrf_scores.items(), key=lambda item: item[1], reverse=True)
+        return [{**fused[doc_id], "rrf_score": score} for doc_id, score in ranked]
+
     async def search_documents(
         self,
         queries: list[str],
@@ -113,41 +187,34 @@ class RAGService:
         """
         Hybrid search across multiple queries.
 
+        All query variations are embedded in one batched request and searched
+        with a single Qdrant batch query; results are merged with
+        reciprocal-rank fusion.
+
         Args:
             queries: List of query strings
             category_filter: Optional category filter
 
         Returns:
-            Deduplicated list of retrieved documents
+            Deduplicated list of retrieved documents, best fused rank first
         """
-        all_results = []
-        seen_doc_ids = set()
-
-        for query in queries:
-            # Get embedding
-            logger.info(f"Getting embedding for query: {query[:50]}...")
-            try:
-                embedding = await self.get_embedding(query)
-                logger.info(f"Embedding generated, length: {len(embedding)}")
-            except Exception as e:
-                logger.error(f"Error getting embedding: {e}")
-                continue
-
-            # Search Qdrant - ADDED AWAIT HERE
-            logger.info(f"Calling Qdrant search...")
-            results = await self.qdrant.search(
-                query_vector=embedding,
-                limit=settings.top_k_retrieval,
-                score_threshold=settings.score_threshold,
-                filter_category=category_filter
-            )
+        if not queries:
+            return []
 
-            # Deduplicate by doc_id
-            for result in results:
-                doc_id = result.get("doc_id")
-                if doc_id not in seen_doc_ids:
-                    all_results.append(result)
-                    seen_doc_ids.add(doc_id)
+        try:
+            embeddings = await self.get_embeddings(queries)
+        except Exception as e:
+            logger.error(f"Error getting embeddings: {e}")
+            return []
+
+        result_lists = await self.qdrant.search_batch(
+            query_vectors=embeddings,
+            limit=settings.top_k_retrieval,
+            score_threshold=settings.score_threshold,
+            filter_category=category_filter
+        )
+
+        all_results = self.fuse_results(result_lists, k=settings.rrf_k)
 
         logger.info(f"Retrieved {len(all_results)} unique documents from {len(queries)} queries")
         if not all_results:
@@ -76,6 +76,66 @@ class RedisService:
         )
         logger.debug(f"Cached embedding: {key}")
 
+    def get_embeddings(self, texts: list[str]) -> list[Optional[list[float]]]:
+        """
+        Retrieve several cached embeddings in one round trip.
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            Embedding vector or None for each text, in input order
+        """
+        if not texts:
+            return []
+        keys = [self._generate_key("embedding", text) for text in texts]
+        return [json.loads(cached) if cached else None for cached in self.client.mget(keys)]
+
+    def set_embeddings(self, texts: list[str], embeddings: list[list[float]]) -> None:
+        """
+        Cache several embedding vectors in one pipelined round trip.
+
+        Args:
+            texts: Text keys
+            embeddings: Embedding vectors (same order as texts)
+        """
+        pipe = self.client.pipeline(transaction=False)
+        for text, embedding in zip(texts, embeddings):
+            pipe.setex(self._generate_key("embedding", text), self.ttl, json.dumps(embedding))
+        pipe.execute()
+        logger.debug(f"Cached {len(texts)} embeddings")
+
+    def get_query_expansions(self, normalized_query: str) -> Optional[list[str]]:
+        """
+        Retrieve cached query variations.
+
+        Args:
+            normalized_query: Normalized customer query
+
+        Returns:
+            List of query variations or None
+        """
+        key = self._generate_key("expansion", normalized_query)
+        cached = self.client.get(key)
+
+        if cached:
+            logger.debug(f"Cache hit for query expansion: {key}")
+            return json.loads(cached)
+
+        return None
+
+    def set_query_expansions(self, normalized_query: str, queries: list[str]) -> None:
+        """
+        Cache query variations.
+
+        Args:
+            normalized_query: Normalized customer query
+            queries: Query variations (original first)
+        """
+        key = self._generate_key("expansion", normalized_query)
+        self.client.setex(key, self.ttl, json.dumps(queries))
+        logger.debug(f"Cached query expansions: {key}")
+
     def get_rag_result(self, ticket_id: str) -> Optional[dict]:
         """
         Retrieve cached RAG result.
@@ -5,6 +5,8 @@ Implements Single Responsibility Principle by handling only ticket
 business logic orchestration, delegating persistence and processing
 to injected dependencies.
 """
+import asyncio
+import hashlib
 from typing import Optional, List
 from datetime import datetime
 
@@ -47,6 +49,8 @@ class TicketService:
         self.repository = ticket_repository
         self.processor = ticket_processor
         self.cache = cache_service
+        # Content key → future of the ticket currently being triaged with that text
+        self._inflight: dict[str, asyncio.Future] = {}
         logger.info("Initialized TicketService")
 
     async def create_ticket(self, ticket_data: TicketCreate) -> Ticket:
@@ -117,6 +121,40 @@ class TicketService:
         logger.info(f"Retrieved {len(tickets)} tickets")
         return tickets
 
+    @staticmethod
+    def _content_cache_key(ticket: Ticket) -> str:
+        """Cache key shared by tickets with identical (normalized) text.
+        
+        Args:
+            ticket: Ticket to key
+            
+        Returns:
+            Content-addressed triage cache key
+        """
+        normalized = " ".join(f"{ticket.subject}\n{ticket.message}".lower().split())
+        return f"triage_text:{hashlib.sha256(normalized.encode()).hexdigest()}"
+
+    @staticmethod
+    def _reuse_triage(shared: dict, ticket: Ticket) -> TriageResponse:
+        """Adapt a triage result computed for an identical ticket.
+        
+        Args:
+            shared: Cached entry with "response" and "customer_name"
+            ticket: Ticket the result is reused for
+            
+        Returns:
+            Triage response re-addressed to this ticket and customer
+        """
+        data = dict(shared["response"])
+        data["ticket_id"] = ticket.id
+        data["timestamp"] = datetime.utcnow()
+        source_name = shared.get("customer_name")
+        if source_name and source_name != ticket.customer_name:
+            draft = dict(data["answer_draft"])
+            draft["greeting"] = draft["greeting"].replace(source_name, ticket.customer_name)
+            data["answer_draft"] = draft
+        return TriageResponse(**data)
+
     async def process_ticket(self, ticket_id: str) -> TriageResponse:
         """Process a support ticket through AI workflow.
         
@@ -129,6 +167,26 @@ class TicketService:
         Returns:
             Triage response with AI analysis and recommendations
             
+        Raises:
+            ValueError: If ticket not found
+            Exception: If processing fails
+        """
+        response, _ = await self.process_ticket_with_source(ticket_id)
+        return response
+
+    async def process_ticket_with_source(self, ticket_id: str) -> tuple[TriageResponse, str]:
+        """Process a ticket and report where the result came from.
+        
+        Tickets whose text matches an already triaged (or currently
+        processing) ticket reuse that result instead of running the workflow.
+        
+        Args:
+            ticket_id: Ticket identifier
+            
+        Returns:
+            Tuple of (triage response, source) where source is one of
+            "cache", "deduplicated" or "workflow"
+            
         Raises:
             ValueError: If ticket not found
             Exception: If processing fails
@@ -147,23 +205,48 @@ class TicketService:
         if cached_result:
             logger.info(f"Returning cached result for ticket {ticket_id}")
             # Reconstruct TriageResponse from cached data
-            return TriageResponse(**cached_result)
+            return TriageResponse(**cached_result), "cache"
         
-        # Step 3: Update status to processing
-        ticket.status = "processing"
-        await self.repository.update(ticket_id, ticket)
-        logger.info(f"Updated ticket {ticket_id} status to processing")
+        # Step 2b: Reuse the triage of an identical ticket (finished or in flight)
+        content_key = self._content_cache_key(ticket)
+        shared = await self.cache.get(content_key)
+        # A failed run resolves to None and another waiter may already have
+        # started a new one, so re-check until nothing identical is in flight
+        while shared is None and content_key in self._inflight:
+            logger.info(f"Waiting for identical ticket in flight for {ticket_id}")
+            shared = await asyncio.shield(self._inflight[content_key])
+        if shared:
+            response = self._reuse_triage(shared, ticket)
+            await self.cache.set(cache_key, response.model_dump(), ttl=None)
+            ticket.status = "completed"
+            ticket.triage_result = response
+            await self.repository.update(ticket_id, ticket)
+            logger.info(f"Reused triage of identical ticket for {ticket_id}")
+            return response, "deduplicated"
+        
+        inflight = asyncio.get_running_loop().create_future()
+        self._inflight[content_key] = inflight
+        shared_entry = None
         
+        # Everything after registering the in-flight future runs inside the try,
+        # so the finally block always resolves and removes it
         try:
+            # Step 3: Update status to processing
+            ticket.status = "processing"
+            await self.repository.update(ticket_id, ticket)
+            logger.info(f"Updated ticket {ticket_id} status to processing")
+            
             # Step 4: Process ticket
             response = await self.processor.process(ticket)
             
-            # Step 5: Cache result
+            # Step 5: Cache result (per ticket and per content)
             await self.cache.set(
                 cache_key,
                 response.model_dump(),
                 ttl=None  # Cache indefinitely, but could add TTL
             )
+            shared_entry = {"response": response.model_dump(), "customer_name": ticket.customer_name}
+            await self.cache.set(content_key, shared_entry, ttl=None)
             logger.info(f"Cached triage result for ticket {ticket_id}")
             
             # Step 6: Update ticket with result
@@ -172,7 +255,7 @@ class TicketService:
             await self.repository.update(ticket_id, ticket)
             logger.info(f"Updated ticket {ticket_id} status to completed")
             
-            return response
+            return response, "workflow"
             
         except Exception as e:
             logger.error(f"Error processing ticket {ticket_id}: {e}", exc_info=True)
@@ -183,6 +266,13 @@ class TicketService:
             logger.info(f"Updated ticket {ticket_id} status to error")
             
             raise
+        
+        finally:
+            # Waiters get the shared result, or None to process on their own
+            inflight.set_result(shared_entry)
+            # Only remove our own entry, never a newer run registered meanwhile
+            if self._inflight.get(content_key) is inflight:
+                del self._inflight[content_key]
 
     async def delete_ticket(self, ticket_id: str) -> bool:
         """Delete a ticket.
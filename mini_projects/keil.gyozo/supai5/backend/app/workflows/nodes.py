@@ -186,9 +186,9 @@ class WorkflowNodes:
         """Node: Lookup device from FleetDM using hostname or email."""
         import re
         logger.info(f"FleetDM lookup for ticket: {state['ticket_id']}")
-        from app.services.fleet import create_fleet_client
+        from app.services.fleet import get_fleet_client, get_host_cache
 
-        fleet = create_fleet_client()
+        fleet = get_fleet_client()
         device_info = None
         device_context = ""
 
@@ -196,24 +196,21 @@ class WorkflowNodes:
             logger.info("FleetDM not configured")
             return {"device_info": None, "device_context": ""}
 
+        # Hostname/email resolve from the cached host index
+        host_cache = get_host_cache()
         raw_message = state.get("raw_message", "")
         hostname = self._extract_hostname_regex(raw_message)
 
         if hostname:
             logger.info(f"Extracted hostname: {hostname}")
-            device_info = await fleet.search_host(hostname)
+            device_info = await host_cache.find_host(hostname)
 
         if not device_info:
             email = state.get("customer_email")
             if email and "@" in email:
-                device_info = await fleet.search_host(email)
+                device_info = await host_cache.find_host(email)
 
         if device_info:
-            # Get full details if we only have summary
-            if device_info.id:
-                details = await fleet.get_host_details(device_info.id)
-                if details:
-                    device_info = details
             device_context = fleet.format_device_context(device_info)
             
             # Add intelligent alerts for device issues
@@ -0,0 +1,244 @@
+"""
+Unit tests for batch triage.
+Tests the worker pool, content deduplication, rate limiting and progress
+tracking with an in-memory repository and a fake processor.
+"""
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+
+from app.infrastructure.cache import InMemoryCacheService
+from app.infrastructure.rate_limiter import AsyncRateLimiter
+from app.infrastructure.repositories import InMemoryTicketRepository
+from app.models.schemas import Ticket, TriageResponse
+from app.services.batch_triage_service import BatchTriageService
+from app.services.processors import ITicketProcessor, RateLimitedTicketProcessor
+from app.services.ticket_service import TicketService
+
+
+class FakeProcessor(ITicketProcessor):
+    """Processor returning a canned triage after a short delay."""
+
+    def __init__(self, delay: float = 0.05, fail_for: set[str] = frozenset()):
+        self.delay = delay
+        self.fail_for = fail_for
+        self.calls: list[str] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def process(self, ticket: Ticket) -> TriageResponse:
+        self.calls.append(ticket.id)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if ticket.id in self.fail_for:
+                raise RuntimeError("workflow failed")
+            return TriageResponse(
+                ticket_id=ticket.id,
+                timestamp=datetime.utcnow(),
+                triage={
+                    "category": "Billing", "subcategory": "Invoice", "priority": "P3",
+                    "sla_hours": 24, "suggested_team": "Billing", "sentiment": "neutral",
+                    "confidence": 0.9
+                },
+                answer_draft={
+                    "greeting": f"Dear {ticket.customer_name},", "body": "We will check your invoice.",
+                    "closing": "Best regards", "tone": "formal"
+                },
+                citations=[],
+                policy_check={
+                    "refund_promise": False, "sla_mentioned": False,
+                    "escalation_needed": False, "compliance": "passed"
+                }
+            )
+        finally:
+            self.active -= 1
+
+    def can_process(self, ticket: Ticket) -> bool:
+        return True
+
+
+def make_ticket(ticket_id: str, message: str, customer_name: str = "Anna") -> Ticket:
+    return Ticket(
+        id=ticket_id,
+        customer_name=customer_name,
+        customer_email="anna@example.com",
+        subject="Invoice question",
+        message=message,
+        created_at=datetime.utcnow()
+    )
+
+
+def make_service(tickets: list[Ticket], processor: ITicketProcessor) -> TicketService:
+    repository = InMemoryTicketRepository()
+    for ticket in tickets:
+        repository._tickets[ticket.id] = ticket
+    return TicketService(repository, processor, InMemoryCacheService())
+
+
+class TestContentDeduplication:
+    """Tests for reusing triage of identical tickets."""
+
+    @pytest.mark.asyncio
+    async def test_identical_tickets_run_workflow_once(self):
+        """Concurrent tickets with the same text share one workflow run."""
+        processor = FakeProcessor()
+        service = make_service([
+            make_ticket("t1", "My invoice is wrong", "Anna"),
+            make_ticket("t2", "  my INVOICE is wrong ", "Bela"),
+        ], processor)
+
+        (first, first_source), (second, second_source) = await asyncio.gather(
+            service.process_ticket_with_source("t1"),
+            service.process_ticket_with_source("t2"),
+        )
+
+        assert processor.calls == ["t1"]
+        assert (first_source, second_source) == ("workflow", "deduplicated")
+        assert second.ticket_id == "t2"
+        assert second.answer_draft.greeting == "Dear Bela,"
+        assert (await service.get_ticket("t2")).status == "completed"
+
+    @pytest.mark.asyncio
+    async def test_failed_original_lets_duplicate_retry(self):
+        """A waiting duplicate runs its own workflow if the original fails."""
+        processor = FakeProcessor(fail_for={"t1"})
+        service = make_service([
+            make_ticket("t1", "Same text"),
+            make_ticket("t2", "Same text"),
+        ], processor)
+
+        results = await asyncio.gather(
+            service.process_ticket_with_source("t1"),
+            service.process_ticket_with_source("t2"),
+            return_exceptions=True
+        )
+
+        assert isinstance(results[0], RuntimeError)
+        assert results[1][1] == "workflow"
+        assert processor.calls == ["t1", "t2"]
+
+    @pytest.mark.asyncio
+    async def test_waiters_of_failed_original_share_one_retry(self):
+        """After a failed run, the waiting duplicates join one new run instead of each starting their own."""
+        processor = FakeProcessor(fail_for={"t1"})
+        service = make_service([
+            make_ticket(ticket_id, "Same text") for ticket_id in ("t1", "t2", "t3", "t4")
+        ], processor)
+
+        results = await asyncio.gather(
+            *(service.process_ticket_with_source(t) for t in ("t1", "t2", "t3")),
+            return_exceptions=True
+        )
+
+        assert isinstance(results[0], RuntimeError)
+        assert sorted(source for _, source in results[1:]) == ["deduplicated", "workflow"]
+        assert processor.calls == ["t1", "t2"]
+        assert not service._inflight
+        _, source = await service.process_ticket_with_source("t4")
+        assert source == "deduplicated"
+        assert processor.calls == ["t1", "t2"]
+
+    @pytest.mark.asyncio
+    async def test_failed_status_update_releases_inflight_entry(self):
+        """A failing 'processing' status update does not leave duplicates waiting forever."""
+        processor = FakeProcessor()
+        service = make_service([
+            make_ticket("t1", "Same text"),
+            make_ticket("t2", "Same text"),
+        ], processor)
+        original_update = service.repository.update
+        failed = []
+
+        async def flaky_update(ticket_id, ticket):
+            if ticket_id == "t1" and ticket.status == "processing" and not failed:
+                failed.append(ticket_id)
+                raise RuntimeError("database unavailable")
+            return await original_update(ticket_id, ticket)
+
+        service.repository.update = flaky_update
+
+        with pytest.raises(RuntimeError):
+            await service.process_ticket_with_source("t1")
+
+        assert not service._inflight
+        _, source = await asyncio.wait_for(service.process_ticket_with_source("t2"), timeout=2)
+        assert source == "workflow"
+
+
+class TestBatchTriageService:
+    """Tests for the batch worker pool."""
+
+    @pytest.mark.asyncio
+    async def test_batch_runs_tickets_concurrently(self):
+        """Workers process distinct tickets in parallel up to the pool size."""
+        processor = FakeProcessor(delay=0.05)
+        tickets = [make_ticket(f"t{i}", f"message {i}") for i in range(8)]
+        batch = BatchTriageService(make_service(tickets, processor), workers=4)
+
+        start = time.perf_counter()
+        status = await batch.enqueue([t.id for t in tickets])
+        await batch.join()
+        elapsed = time.perf_counter() - start
+        await batch.stop()
+
+        result = batch.get_batch(status.batch_id)
+        assert result.finished and result.completed == 8
+        assert processor.max_active == 4
+        assert elapsed < 8 * 0.05
+        assert batch.metrics().processed_total == 8
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_per_ticket_status(self):
+        """Failures and deduplicated tickets are reported per ticket."""
+        processor = FakeProcessor(fail_for={"bad"})
+        service = make_service([
+            make_ticket("a", "Printer broken"),
+            make_ticket("b", "Printer broken"),
+            make_ticket("bad", "Something else"),
+        ], processor)
+        batch = BatchTriageService(service, workers=1)
+
+        status = await batch.enqueue(["a", "b", "bad", "a"])
+        await batch.join()
+        await batch.stop()
+
+        result = batch.get_batch(status.batch_id)
+        statuses = {p.ticket_id: p.status for p in result.tickets}
+        assert statuses == {"a": "completed", "b": "deduplicated", "bad": "error"}
+        assert result.failed == 1
+        assert batch.metrics().failed_total == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_events_ends_with_batch_summary(self):
+        """The event stream emits ticket updates and a final batch event."""
+        service = make_service([make_ticket("a", "Hello")], FakeProcessor())
+        batch = BatchTriageService(service, workers=1)
+
+        status = await batch.enqueue(["a"])
+        events = [event async for event in batch.stream_events(status.batch_id)]
+        await batch.stop()
+
+        assert events[0].startswith("event: ticket")
+        assert '"status": "completed"' in events[-2]
+        assert events[-1].startswith("event: batch")
+
+
+class TestRateLimiter:
+    """Tests for the global LLM rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_processor_spaces_calls(self):
+        """Calls beyond the burst wait for the bucket to refill."""
+        processor = FakeProcessor(delay=0)
+        limited = RateLimitedTicketProcessor(processor, AsyncRateLimiter(rate=20, per=1.0, burst=1))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(limited.process(make_ticket(f"t{i}", "x")) for i in range(3)))
+        elapsed = time.perf_counter() - start
+
+        assert len(processor.calls) == 3
+        assert elapsed >= 0.09  # two refills at 20/s
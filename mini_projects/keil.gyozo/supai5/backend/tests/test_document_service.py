@@ -0,0 +1,122 @@
+"""
+Unit tests for DocumentService with the document catalog.
+Tests that listing, stats and detail lookups use the catalog instead of
+scrolling Qdrant payloads.
+"""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.infrastructure.document_catalog import SqliteDocumentCatalog
+from app.services.document_service import DocumentService
+from app.services.qdrant_service import QdrantService
+
+
+@pytest.fixture
+def mock_qdrant():
+    """Create mock Qdrant service with a mocked async client."""
+    mock = MagicMock()
+    mock.collection_name = "support_knowledge"
+    mock.generate_chunk_id = QdrantService.generate_chunk_id.__get__(mock)
+    mock.upsert_documents = AsyncMock()
+    mock.get_collection_info = AsyncMock(return_value={"points_count": 3, "status": "green"})
+    mock.client.scroll = AsyncMock(return_value=([], None))
+    mock.client.retrieve = AsyncMock(return_value=[])
+    mock.client.delete = AsyncMock()
+    return mock
+
+
+@pytest.fixture
+def document_service(mock_qdrant):
+    """Create DocumentService with an in-memory catalog and mocked embeddings."""
+    with patch('app.services.document_service.OpenAIEmbeddings') as mock_embeddings:
+        mock_embeddings.return_value.aembed_documents = AsyncMock(
+            side_effect=lambda chunks: [[0.0] for _ in chunks]
+        )
+        yield DocumentService(mock_qdrant, SqliteDocumentCatalog(":memory:"))
+
+
+async def upload(service: DocumentService, title: str, category: str) -> dict:
+    return await service.process_document(
+        file_content=f"{title} content".encode(),
+        filename=f"{title}.txt",
+        title=title,
+        category=category
+    )
+
+
+class TestDocumentCatalog:
+    """Tests for catalog-backed document operations."""
+
+    @pytest.mark.asyncio
+    async def test_list_paginates_without_scrolling(self, document_service, mock_qdrant):
+        """Uploaded documents are listed newest first with a total count."""
+        for i in range(3):
+            await upload(document_service, f"doc{i}", "Billing" if i else "Technical")
+
+        page, total = await document_service.list_documents(limit=2, offset=1)
+        billing, billing_total = await document_service.list_documents(category="Billing")
+
+        assert total == 3
+        assert [doc["title"] for doc in page] == ["doc1", "doc0"]
+        assert billing_total == 2
+        assert {doc["category"] for doc in billing} == {"Billing"}
+        mock_qdrant.client.scroll.assert_awaited_once()  # only the one-off backfill
+
+    @pytest.mark.asyncio
+    async def test_stats_from_catalog(self, document_service):
+        """Stats aggregate catalog rows and report collection status."""
+        await upload(document_service, "faq", "Product")
+        await upload(document_service, "invoice", "Billing")
+
+        stats = await document_service.get_document_stats()
+
+        assert stats["total_documents"] == 2
+        assert stats["total_chunks"] == 2
+        assert stats["categories"] == {"Product": 1, "Billing": 1}
+        assert stats["collection_status"] == "green"
+
+    @pytest.mark.asyncio
+    async def test_detail_retrieves_chunks_by_id(self, document_service, mock_qdrant):
+        """Chunks are fetched by their deterministic point IDs."""
+        document = await upload(document_service, "faq", "Product")
+        mock_qdrant.client.retrieve.return_value = [
+            SimpleNamespace(payload={"chunk_index": 0, "text": "faq content"})
+        ]
+
+        detail = await document_service.get_document_with_chunks(document["id"])
+
+        assert detail["title"] == "faq"
+        assert detail["chunks"] == [{"chunk_index": 0, "text": "faq content"}]
+        ids = mock_qdrant.client.retrieve.call_args.kwargs["ids"]
+        assert ids == [QdrantService.generate_chunk_id(None, document["id"], 0)]
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_catalog_entry(self, document_service, mock_qdrant):
+        """Deleting removes points by filter and the catalog row."""
+        document = await upload(document_service, "faq", "Product")
+
+        assert await document_service.delete_document(document["id"]) is True
+        assert await document_service.delete_document(document["id"]) is False
+        assert await document_service.get_document_with_chunks(document["id"]) is None
+        mock_qdrant.client.delete.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_backfill_from_existing_collection(self, document_service, mock_qdrant):
+        """An empty catalog is rebuilt once from existing Qdrant payloads."""
+        payload = {
+            "doc_id": "old", "title": "Legacy", "category": "Product",
+            "created_at": "2024-01-01T00:00:00", "chunk_count": 2
+        }
+        mock_qdrant.client.scroll.side_effect = [
+            ([SimpleNamespace(payload=payload)], "next"),
+            ([SimpleNamespace(payload=payload)], None),
+        ]
+
+        documents, total = await document_service.list_documents()
+        await document_service.list_documents()
+
+        assert total == 1
+        assert documents[0]["id"] == "old"
+        assert documents[0]["chunk_count"] == 2
+        assert mock_qdrant.client.scroll.await_count == 2
@@ -0,0 +1,151 @@
+"""
+Unit tests for FleetDM host paging and the host cache.
+Tests page prefetching and hostname/serial/email lookups with a fake HTTP client.
+"""
+import asyncio
+import time
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.services.fleet.client import FleetAPIClient, HTTPClientInterface
+from app.services.fleet.host_cache import FleetHostCache
+from app.services.fleet.models import HostDetail
+
+
+def make_host(host_id: int) -> dict:
+    return {
+        "id": host_id,
+        "hostname": f"pd-nb{host_id:04d}",
+        "hardware_serial": f"SN{host_id}",
+        "device_mapping": [{"email": f"user{host_id}@example.com", "source": "google"}],
+    }
+
+
+class FakeFleetHTTP(HTTPClientInterface):
+    """Serves /hosts pages from an in-memory fleet and tracks concurrency."""
+
+    def __init__(self, host_count: int):
+        self.hosts = [make_host(i) for i in range(host_count)]
+        self.pages_requested: list[int] = []
+        self.details_requested = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def get(self, url: str, **kwargs):
+        if url.startswith("/api/v1/fleet/hosts/"):
+            self.details_requested += 1
+            host_id = int(url.rsplit("/", 1)[1])
+            return {"host": {"id": host_id, "hostname": f"pd-nb{host_id:04d}"}}
+
+        params = kwargs["params"]
+        self.pages_requested.append(params["page"])
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            start = params["page"] * params["per_page"]
+            return {"hosts": self.hosts[start:start + params["per_page"]]}
+        finally:
+            self.active -= 1
+
+    async def post(self, url: str, **kwargs):
+        return {}
+
+    async def patch(self, url: str, **kwargs):
+        return {}
+
+    async def delete(self, url: str, **kwargs):
+        return {}
+
+
+class TestIterHosts:
+    """Tests for paginated host iteration."""
+
+    @pytest.mark.asyncio
+    async def test_walks_all_pages_in_order(self):
+        """Every host is yielded once, in page order, with bounded prefetch."""
+        http = FakeFleetHTTP(host_count=25)
+        client = FleetAPIClient(http)
+
+        hosts = [host async for host in client.iter_hosts(per_page=10, prefetch=3)]
+
+        assert [host.id for host in hosts] == list(range(25))
+        assert hosts[0].emails == ("user0@example.com",)
+        assert http.max_active <= 3
+        assert sorted(http.pages_requested)[:3] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_prefetched_pages(self):
+        """Stopping iteration early does not leave page requests running."""
+        http = FakeFleetHTTP(host_count=100)
+        client = FleetAPIClient(http)
+
+        iterator = client.iter_hosts(per_page=10, prefetch=4)
+        first = await iterator.__anext__()
+        await iterator.aclose()
+
+        assert first.id == 0
+        assert http.active == 0
+
+
+class TestFleetHostCache:
+    """Tests for the indexed host cache."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_by_hostname_serial_and_email(self):
+        """Hosts resolve by any identifier without further list requests."""
+        http = FakeFleetHTTP(host_count=12)
+        cache = FleetHostCache(FleetAPIClient(http))
+
+        by_name = await cache.resolve("PD-NB0003")
+        pages_after_load = len(http.pages_requested)
+        by_serial = await cache.resolve("sn7")
+        by_email = await cache.resolve("User11@Example.com")
+
+        assert (by_name.id, by_serial.id, by_email.id) == (3, 7, 11)
+        assert len(http.pages_requested) == pages_after_load
+        assert len(cache) == 12
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_refreshes_in_background(self):
+        """A stale index still answers immediately and refreshes behind the scenes."""
+        http = FakeFleetHTTP(host_count=2)
+        cache = FleetHostCache(FleetAPIClient(http), ttl_seconds=0)
+        await cache.refresh()
+        http.hosts.append(make_host(2))
+
+        assert await cache.resolve("pd-nb0002") is None
+        await cache._refresh_task
+        cache.ttl_seconds = 300
+
+        assert (await cache.resolve("pd-nb0002")).id == 2
+
+    @pytest.mark.asyncio
+    async def test_find_host_falls_back_to_search(self):
+        """Unknown hosts are searched in Fleet directly."""
+        client = FleetAPIClient(FakeFleetHTTP(host_count=1))
+        client.search_host = AsyncMock(return_value=HostDetail(id=42, hostname="NEW-HOST"))
+        cache = FleetHostCache(client)
+
+        host = await cache.find_host("NEW-HOST")
+
+        client.search_host.assert_awaited_once_with("NEW-HOST")
+        assert host.id == 42
+
+    @pytest.mark.asyncio
+    async def test_find_host_serves_details_from_cache(self):
+        """Repeated lookups of a device make one details request per TTL."""
+        http = FakeFleetHTTP(host_count=5)
+        cache = FleetHostCache(FleetAPIClient(http))
+
+        first = await cache.find_host("pd-nb0004")
+        second = await cache.find_host("user4@example.com")
+
+        assert first.id == second.id == 4
+        assert http.details_requested == 1
+
+        # Expired details are fetched again
+        cache._details[4] = (time.monotonic() - cache.ttl_seconds - 1, first)
+        await cache.find_host("pd-nb0004")
+        assert http.details_requested == 2
@@ -0,0 +1,88 @@
+"""
+Unit tests for RAGService retrieval.
+Tests batched embedding, batch search and reciprocal-rank fusion with mocked dependencies.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.rag_service import RAGService
+
+
+@pytest.fixture
+def mock_redis():
+    """Create mock Redis service with empty caches."""
+    mock = MagicMock()
+    mock.get_embeddings = MagicMock(side_effect=lambda texts: [None] * len(texts))
+    mock.get_query_expansions = MagicMock(return_value=None)
+    return mock
+
+
+@pytest.fixture
+def mock_qdrant():
+    """Create mock Qdrant service."""
+    mock = MagicMock()
+    mock.search_batch = AsyncMock(return_value=[
+        [{"doc_id": "a", "score": 0.9}, {"doc_id": "b", "score": 0.8}],
+        [{"doc_id": "b", "score": 0.85}, {"doc_id": "c", "score": 0.7}],
+        [{"doc_id": "b", "score": 0.6}, {"doc_id": "a", "score": 0.5}],
+    ])
+    return mock
+
+
+@pytest.fixture
+def rag_service(mock_qdrant, mock_redis):
+    """Create RAGService with mocked OpenAI clients."""
+    with patch('app.services.rag_service.OpenAIEmbeddings') as mock_embeddings, \
+         patch('app.services.rag_service.ChatOpenAI'):
+        mock_embeddings.return_value.aembed_documents = AsyncMock(
+            side_effect=lambda texts: [[float(i)] for i in range(len(texts))]
+        )
+        service = RAGService(qdrant_service=mock_qdrant, redis_service=mock_redis)
+        yield service
+
+
+class TestSearchDocuments:
+    """Tests for batched multi-query search."""
+
+    @pytest.mark.asyncio
+    async def test_single_embedding_and_search_round_trip(self, rag_service, mock_qdrant):
+        """All query variations are embedded and searched in one call each."""
+        await rag_service.search_documents(["q1", "q2", "q3"], category_filter="billing")
+
+        rag_service.embeddings.aembed_documents.assert_awaited_once_with(["q1", "q2", "q3"])
+        mock_qdrant.search_batch.assert_awaited_once()
+        assert mock_qdrant.search_batch.call_args.kwargs["query_vectors"] == [[0.0], [1.0], [2.0]]
+        assert mock_qdrant.search_batch.call_args.kwargs["filter_category"] == "billing"
+
+    @pytest.mark.asyncio
+    async def test_results_fused_by_reciprocal_rank(self, rag_service):
+        """A document ranked well by several queries beats a single first place."""
+        results = await rag_service.search_documents(["q1", "q2", "q3"])
+
+        assert [r["doc_id"] for r in results] == ["b", "a", "c"]
+        assert results[0]["score"] == 0.85  # best chunk represents the document
+        assert results[0]["rrf_score"] > results[1]["rrf_score"]
+
+    @pytest.mark.asyncio
+    async def test_cached_embeddings_skip_openai(self, rag_service, mock_redis):
+        """Only cache misses are sent to the embedding API."""
+        mock_redis.get_embeddings.side_effect = lambda texts: [[9.0], None, [8.0]]
+
+        await rag_service.search_documents(["q1", "q2", "q3"])
+
+        rag_service.embeddings.aembed_documents.assert_awaited_once_with(["q2"])
+        mock_redis.set_embeddings.assert_called_once_with(["q2"], [[0.0]])
+
+
+class TestExpandQueries:
+    """Tests for query expansion caching."""
+
+    @pytest.mark.asyncio
+    async def test_cached_expansion_skips_llm(self, rag_service, mock_redis):
+        """Normalized query hits the cache and keeps the caller's wording first."""
+        mock_redis.get_query_expansions.return_value = ["vpn down", "vpn not connecting"]
+
+        queries = await rag_service.expand_queries("  VPN   down ")
+
+        mock_redis.get_query_expansions.assert_called_once_with("vpn down")
+        assert queries == ["  VPN   down ", "vpn not connecting"]
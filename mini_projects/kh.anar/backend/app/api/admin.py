@@ -93,8 +93,15 @@ async def delete_document(doc_id: str):
     ok = DOC_STORE.delete_doc(doc_id)
     if not ok:
         raise HTTPException(status_code=404, detail="Document not found")
-    # Opcionálisan újraindexelést is indíthatnánk a darabok eltávolítására; itt
-    # az egyszerűség kedvéért szinkron marad.
+    # A darabok eltávolítása a megosztott keresőkből is, hogy ne legyenek visszakereshetők
+    from app.services.rag_instance import dense_retriever, sparse_retriever
+
+    for retriever in (dense_retriever, sparse_retriever):
+        try:
+            retriever.delete_by_doc_id(doc_id)
+        except Exception as e:
+            logger.warning(f"Could not delete chunks of {doc_id} from {type(retriever).__name__}: {e}")
+    sparse_retriever.save()
     return {"success": True, "deleted": doc_id}
 
 
@@ -162,12 +169,8 @@ async def reindex_status(job_id: str):
     return {"job_id": job_id, "info": info}
 
 
-@router.post("/kb/ingest_incremental", dependencies=[Depends(_check_admin)])
-async def kb_ingest_incremental():
-    """Inkrementális tudástár-betöltés indítása mappából.
-    
-    Csak az új/módosult/törölt dokumentumokat dolgozza fel a kb-data mappából.
-    """
+def _kb_indexer():
+    """Tudástár-indexelő a megosztott RAG példányokkal."""
     from rag.ingestion.kb_indexer import KBIndexer
     from rag.ingestion.version_store import VersionStore
     from pathlib import Path
@@ -175,15 +178,23 @@ async def kb_ingest_incremental():
     
     version_store = VersionStore(Path(default_config.kb_version_store))
     
-    indexer = KBIndexer(
+    return KBIndexer(
         config=default_config,
         dense_retriever=dense_retriever,
         sparse_retriever=sparse_retriever,
         embedder=embedder,
         version_store=version_store,
+        document_store=DOC_STORE,
     )
+
+
+@router.post("/kb/ingest_incremental", dependencies=[Depends(_check_admin)])
+async def kb_ingest_incremental():
+    """Inkrementális tudástár-betöltés indítása mappából.
     
-    stats = indexer.ingest_incremental()
+    Csak az új/módosult/törölt dokumentumokat dolgozza fel a kb-data mappából.
+    """
+    stats = _kb_indexer().ingest_incremental()
     return {"success": True, "stats": stats}
 
 
@@ -194,20 +205,54 @@ async def kb_reindex_full():
     Törli a verziókövetést és minden dokumentumot újraindexel.
     Akkor használd, ha a darabolási konfiguráció vagy a beágyazó modell változott.
     """
-    from rag.ingestion.kb_indexer import KBIndexer
-    from rag.ingestion.version_store import VersionStore
-    from pathlib import Path
-    from app.services.rag_instance import dense_retriever, sparse_retriever, embedder
-    
-    version_store = VersionStore(Path(default_config.kb_version_store))
-    
-    indexer = KBIndexer(
-        config=default_config,
-        dense_retriever=dense_retriever,
-        sparse_retriever=sparse_retriever,
-        embedder=embedder,
-        version_store=version_store,
-    )
-    
-    stats = indexer.ingest_full_reindex()
+    stats = _kb_indexer().ingest_full_reindex()
     return {"success": True, "stats": stats}
+
+
+def _incremental_job(job):
+    return _kb_indexer().ingest_incremental(progress=job.progress, cancel_event=job.cancel_event)
+
+
+def _full_reindex_job(job):
+    return _kb_indexer().ingest_full_reindex(progress=job.progress, cancel_event=job.cancel_event)
+
+
+@router.post("/kb/ingest_incremental_async", dependencies=[Depends(_check_admin)])
+async def kb_ingest_incremental_async():
+    """Inkrementális betöltés háttérfeladatként; állapot: /reindex_status/{job_id}."""
+    from rag.jobs import manager
+
+    job_id = manager.start_job(_incremental_job, resume_fn=_incremental_job)
+    return {"success": True, "job_id": job_id}
+
+
+@router.post("/kb/reindex_full_async", dependencies=[Depends(_check_admin)])
+async def kb_reindex_full_async():
+    """Teljes újraindexelés háttérfeladatként.
+    
+    Megszakítás után a folytatás inkrementális betöltés: a verziótárban csak a már
+    újraindexelt dokumentumok szerepelnek, így a maradékot dolgozza fel.
+    """
+    from rag.jobs import manager
+
+    job_id = manager.start_job(_full_reindex_job, resume_fn=_incremental_job)
+    return {"success": True, "job_id": job_id}
+
+
+@router.post("/reindex_cancel/{job_id}", dependencies=[Depends(_check_admin)])
+async def reindex_cancel(job_id: str):
+    from rag.jobs import manager
+
+    if not manager.cancel(job_id):
+        raise HTTPException(status_code=404, detail="No running job with this id")
+    return {"success": True, "job_id": job_id}
+
+
+@router.post("/reindex_resume/{job_id}", dependencies=[Depends(_check_admin)])
+async def reindex_resume(job_id: str):
+    from rag.jobs import manager
+
+    new_job_id = manager.resume(job_id)
+    if new_job_id is None:
+        raise HTTPException(status_code=409, detail="Job is not resumable")
+    return {"success": True, "job_id": new_job_id, "resumed_from": job_id}
@@ -33,6 +33,7 @@ async def lifespan(app: FastAPI):
         try:
             # Megosztott RAG példányok importálása
             from app.services.rag_instance import dense_retriever, sparse_retriever, embedder
+            from app.api.admin import DOC_STORE
             version_store = VersionStore(Path(default_config.kb_version_store))
             
             indexer = KBIndexer(
@@ -41,6 +42,7 @@ async def lifespan(app: FastAPI):
                 sparse_retriever=sparse_retriever,
                 embedder=embedder,
                 version_store=version_store,
+                document_store=DOC_STORE,
             )
             
             stats = indexer.ingest_incremental()
@@ -54,6 +56,8 @@ async def lifespan(app: FastAPI):
     
     # Leállítás: szükség esetén takarítás
     logger.info("Application shutting down")
+    from app.services.mcp_client import mcp_client
+    await mcp_client.aclose()
 
 
 def create_app() -> FastAPI:
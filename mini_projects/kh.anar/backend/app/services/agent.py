@@ -9,7 +9,7 @@ from langgraph.graph import END, StateGraph
 from ..models.schemas import MessageRecord
 from ..models.state import AgentState
 from .llm_client import LLMClient
-from .mcp_tools import create_mcp_tools, execute_mcp_tool
+from .mcp_tools import create_mcp_tools, execute_mcp_tools
 
 logger = logging.getLogger(__name__)
 
@@ -152,16 +152,16 @@ class AgentOrchestrator:
         tool_calls = state.get("tool_calls", [])
         tool_results = []
         
+        # calls run concurrently unless they depend on each other (writes on the same server)
         for tool_call in tool_calls:
-            tool_name = tool_call.get("name")
-            arguments = tool_call.get("arguments", {})
-            
-            logger.info(f"Executing tool: {tool_name} with args: {arguments}")
-            result = await execute_mcp_tool(tool_name, arguments)
+            logger.info(f"Executing tool: {tool_call.get('name')} with args: {tool_call.get('arguments', {})}")
+        results = await execute_mcp_tools(tool_calls)
+        
+        for tool_call, result in zip(tool_calls, results):
             logger.info(f"Tool result: {str(result)[:200]}...")
             tool_results.append({
-                "tool": tool_name,
-                "arguments": arguments,
+                "tool": tool_call.get("name"),
+                "arguments": tool_call.get("arguments", {}),
                 "result": result
             })
         
@@ -1,45 +1,248 @@
 """
 MCP (Model Context Protocol) client integration.
 Provides tools via Memory, Brave Search, and Filesystem MCP servers.
+
+Transport:
+- One pooled httpx.AsyncClient per MCP server with keep-alive, so agent turns
+  reuse connections instead of paying connection setup on every tool call.
+- A per-server semaphore caps concurrent requests (MCP_MAX_CONCURRENCY).
+- Failed attempts are retried with full-jitter exponential backoff. Connection
+  failures are always retried (the request never reached the server); timeouts
+  and 5xx/429 responses only for idempotent tools.
+- A per-server circuit breaker fails fast after MCP_BREAKER_THRESHOLD
+  consecutive failed calls and lets a single trial call through after
+  MCP_BREAKER_RESET seconds.
+- call_tools() sends independent calls concurrently.
 """
 
+import asyncio
+import logging
 import os
-from typing import Any, Dict, List
+import random
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import httpx
 
+logger = logging.getLogger(__name__)
+
+# Tools that are safe to repeat after an ambiguous failure (timeout, 5xx)
+IDEMPOTENT_TOOLS = {
+    "store", "retrieve", "list", "search", "local_search",
+    "read_file", "write_file", "list_directory",
+}
+
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (closed -> open -> half_open -> closed)."""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, clock=time.monotonic):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self.clock() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Whether a call may go out; in half-open state only one trial call at a time."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._trial_in_flight or self.failures >= self.failure_threshold:
+            self.opened_at = self.clock()
+        self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """Let another trial through if the current one ended without an outcome (e.g. cancelled)."""
+        self._trial_in_flight = False
+
+
+class ServerTransport:
+    """Pooled HTTP transport to one MCP server."""
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str,
+        timeout: float,
+        max_concurrency: int,
+        keepalive_expiry: float,
+        retries: int,
+        backoff_base: float,
+        backoff_max: float,
+        breaker: CircuitBreaker,
+    ):
+        self.name = name
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_concurrency = max(1, max_concurrency)
+        self.keepalive_expiry = keepalive_expiry
+        self.retries = max(0, retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_client(self) -> None:
+        # httpx clients and semaphores are bound to an event loop; recreate them if
+        # the loop changed (e.g. tests or scripts calling asyncio.run repeatedly)
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._loop is loop:
+            return
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._loop = loop
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    async def post(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        # in half-open state the call admitted by allow() is the single trial
+        trial = self.breaker.state == "half_open"
+        if not self.breaker.allow():
+            return {"success": False, "error": f"MCP server '{self.name}' unavailable (circuit open)"}
+        try:
+            return await self._post(tool_name, arguments)
+        finally:
+            # a cancelled half-open trial records no outcome; without this the
+            # breaker would refuse every later call. Other calls leave the flag
+            # alone, it may belong to a newer trial.
+            if trial:
+                self.breaker.release_trial()
+
+    async def _post(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        self._ensure_client()
+        url = f"{self.base_url}/tools/{tool_name}"
+        retry_ambiguous = tool_name in IDEMPOTENT_TOOLS
+        attempt = 0
+        while True:
+            error: Optional[str] = None
+            retryable = False
+            try:
+                async with self._semaphore:
+                    response = await self._client.post(url, json=arguments)
+                if response.status_code < 400:
+                    self.breaker.record_success()
+                    return {"success": True, "data": response.json()}
+                error = f"HTTP {response.status_code} from {url}"
+                if response.status_code < 500 and response.status_code != 429:
+                    # client error: the server is healthy, the request is wrong
+                    self.breaker.record_success()
+                    return {"success": False, "error": error}
+                retryable = retry_ambiguous and response.status_code in RETRY_STATUS_CODES
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+                error = f"{type(e).__name__}: {e}"
+                retryable = True
+            except httpx.HTTPError as e:
+                error = f"{type(e).__name__}: {e}"
+                retryable = retry_ambiguous
+            except Exception as e:
+                self.breaker.record_failure()
+                return {"success": False, "error": f"Unexpected error: {str(e)}"}
+
+            if not retryable or attempt >= self.retries:
+                self.breaker.record_failure()
+                return {"success": False, "error": error}
+            delay = self._backoff(attempt)
+            attempt += 1
+            logger.warning(f"MCP {self.name}/{tool_name} failed ({error}); retry {attempt}/{self.retries} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+
 
 class MCPClient:
     """Client for interacting with MCP servers."""
 
-    def __init__(self):
+    def __init__(self, server_urls: Optional[Dict[str, str]] = None):
+        """server_urls: override the MCP_*_URL environment variables (e.g. for tests)."""
         self.memory_url = os.getenv("MCP_MEMORY_URL", "http://localhost:3100")
         self.brave_url = os.getenv("MCP_BRAVE_URL", "http://localhost:3101")
         self.filesystem_url = os.getenv("MCP_FILESYSTEM_URL", "http://localhost:3102")
-        self.timeout = 30.0
-
-    async def call_tool(self, server: str, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Call a tool on the specified MCP server."""
-        server_urls = {
+        self.timeout = float(os.getenv("MCP_TIMEOUT", "30"))
+        self.max_concurrency = int(os.getenv("MCP_MAX_CONCURRENCY", "8"))
+        self.keepalive_expiry = float(os.getenv("MCP_KEEPALIVE_EXPIRY", "30"))
+        self.retries = int(os.getenv("MCP_RETRIES", "2"))
+        self.backoff_base = float(os.getenv("MCP_BACKOFF_BASE", "0.2"))
+        self.backoff_max = float(os.getenv("MCP_BACKOFF_MAX", "2.0"))
+        self.breaker_threshold = int(os.getenv("MCP_BREAKER_THRESHOLD", "5"))
+        self.breaker_reset = float(os.getenv("MCP_BREAKER_RESET", "30"))
+        self.server_urls = server_urls or {
             "memory": self.memory_url,
             "brave": self.brave_url,
             "filesystem": self.filesystem_url,
         }
-        
-        if server not in server_urls:
+        self._transports: Dict[str, ServerTransport] = {}
+
+    def transport(self, server: str) -> ServerTransport:
+        """The shared transport for a server (created on first use)."""
+        if server not in self._transports:
+            self._transports[server] = ServerTransport(
+                server,
+                self.server_urls[server],
+                timeout=self.timeout,
+                max_concurrency=self.max_concurrency,
+                keepalive_expiry=self.keepalive_expiry,
+                retries=self.retries,
+                backoff_base=self.backoff_base,
+                backoff_max=self.backoff_max,
+                breaker=CircuitBreaker(self.breaker_threshold, self.breaker_reset),
+            )
+        return self._transports[server]
+
+    async def call_tool(self, server: str, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a tool on the specified MCP server."""
+        if server not in self.server_urls:
             return {"success": False, "error": f"Unknown MCP server: {server}"}
-        
-        url = f"{server_urls[server]}/tools/{tool_name}"
-        
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, json=arguments)
-                response.raise_for_status()
-                return {"success": True, "data": response.json()}
-        except httpx.HTTPError as e:
-            return {"success": False, "error": str(e)}
-        except Exception as e:
-            return {"success": False, "error": f"Unexpected error: {str(e)}"}
+        return await self.transport(server).post(tool_name, arguments)
+
+    async def call_tools(self, calls: Sequence[Tuple[str, str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Call independent tools concurrently; results are in the order of the calls.
+
+        calls: (server, tool_name, arguments) tuples.
+        """
+        return list(await asyncio.gather(*(self.call_tool(*call) for call in calls)))
+
+    async def aclose(self) -> None:
+        """Close the pooled connections (application shutdown)."""
+        for transport in self._transports.values():
+            await transport.aclose()
 
     # Memory MCP Server tools
     async def memory_store(self, conversation_id: str, key: str, value: str) -> Dict[str, Any]:
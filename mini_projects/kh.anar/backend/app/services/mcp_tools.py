@@ -4,10 +4,29 @@ Provides tool wrappers for accessing Memory, Brave Search, and Filesystem via MC
 """
 
 from typing import Any, Dict, List, Optional
+import asyncio
 import json
 
 from .mcp_client import mcp_client
 
+# MCP server behind each agent tool
+TOOL_SERVERS = {
+    "memory_store": "memory",
+    "memory_retrieve": "memory",
+    "memory_list": "memory",
+    "brave_search": "brave",
+    "brave_local_search": "brave",
+    "filesystem_read": "filesystem",
+    "filesystem_list": "filesystem",
+    "filesystem_search": "filesystem",
+}
+
+# Tools without side effects; they can run in any order
+READ_ONLY_TOOLS = {
+    "memory_retrieve", "memory_list", "brave_search", "brave_local_search",
+    "filesystem_read", "filesystem_list", "filesystem_search",
+}
+
 
 def create_mcp_tools() -> List[Dict[str, Any]]:
     """Create tool definitions for MCP servers.
@@ -170,3 +189,30 @@ async def execute_mcp_tool(tool_name: str, arguments: Dict[str, Any]) -> str:
     except Exception as e:
         return f"Exception executing tool {tool_name}: {str(e)}"
 
+
+async def execute_mcp_tools(tool_calls: List[Dict[str, Any]]) -> List[str]:
+    """Execute the tool calls of one LLM response; results are in the order of the calls.
+    
+    Each call is a dict with "name" and "arguments". Calls to different servers
+    run concurrently, and so do calls to the same server if they are all
+    read-only. Otherwise that server gets its calls one by one in the given
+    order, so e.g. a memory_retrieve after a memory_store sees the stored value.
+    """
+    results: List[Optional[str]] = [None] * len(tool_calls)
+    by_server: Dict[Optional[str], List[int]] = {}
+    for index, call in enumerate(tool_calls):
+        by_server.setdefault(TOOL_SERVERS.get(call.get("name")), []).append(index)
+
+    async def run(index: int) -> None:
+        call = tool_calls[index]
+        results[index] = await execute_mcp_tool(call.get("name"), call.get("arguments", {}))
+
+    async def run_server_calls(indexes: List[int]) -> None:
+        if all(tool_calls[i].get("name") in READ_ONLY_TOOLS for i in indexes):
+            await asyncio.gather(*(run(i) for i in indexes))
+        else:
+            for i in indexes:
+                await run(i)
+
+    await asyncio.gather(*(run_server_calls(indexes) for indexes in by_server.values()))
+    return results
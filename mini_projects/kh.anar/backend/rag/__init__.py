@@ -8,4 +8,5 @@ __all__ = [
     "retrieval",
     "citations",
     "config",
+    "eval",
 ]
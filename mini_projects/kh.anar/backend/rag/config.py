@@ -10,10 +10,24 @@ class RAGConfig:
     chroma_dir: str = os.getenv("CHROMA_DIR", ".chroma")
     chroma_collection: str = os.getenv("CHROMA_COLLECTION", "kb_collection")
     embed_model: str = os.getenv("EMBED_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+    # "hash" (determinisztikus, tesztekhez) vagy "transformer"
+    embedder: str = os.getenv("EMBEDDER", "hash").lower()
+    embed_batch_size: int = int(os.getenv("EMBED_BATCH_SIZE", "32"))
+    embed_workers: int = int(os.getenv("EMBED_WORKERS", "0"))
+    # Tartalom-hash alapú beágyazás-gyorsítótár; üres értéknél kikapcsolva
+    embed_cache_dir: str = os.getenv("EMBED_CACHE_DIR", ".embed_cache")
     k: int = int(os.getenv("RAG_TOP_K", "5"))
     threshold: float = float(os.getenv("RAG_THRESHOLD", "0.25"))
     w_dense: float = float(os.getenv("RAG_W_DENSE", "0.7"))
     w_sparse: float = float(os.getenv("RAG_W_SPARSE", "0.3"))
+    # Fúziós stratégia: minmax | zscore | rrf | learned (lásd rag/retrieval/fusion.py)
+    fusion: str = os.getenv("RAG_FUSION", "minmax").lower()
+    rrf_k: int = int(os.getenv("RAG_RRF_K", "60"))
+    # A learned stratégia súlyai (python -m rag.eval.benchmark --fit-learned írja)
+    fusion_weights_path: str = os.getenv("RAG_FUSION_WEIGHTS", ".fusion_weights.json")
+    # Keresőnkénti jelöltmélység a fúzióhoz (0: k); a válasz legfeljebb k találat
+    candidate_k: int = int(os.getenv("RAG_CANDIDATE_K", "0"))
+    parallel_retrieval: bool = os.getenv("RAG_PARALLEL_RETRIEVAL", "true").lower() == "true"
     chunk_size: int = int(os.getenv("CHUNK_SIZE", "800"))
     chunk_overlap: int = int(os.getenv("CHUNK_OVERLAP", "128"))
     persist: bool = os.getenv("CHROMA_PERSIST", "true").lower() == "true"
@@ -22,6 +36,15 @@ class RAGConfig:
     kb_data_dir: str = os.getenv("KB_DATA_DIR", "docs/kb-data")
     kb_version_store: str = os.getenv("KB_VERSION_STORE", ".kb_versions.json")
     ingest_on_startup: bool = os.getenv("KB_INGEST_ON_STARTUP", "true").lower() == "true"
+    # Szken-manifeszt (stat ujjlenyomatok); üres értéknél a verziótár mellett
+    kb_scan_manifest: str = os.getenv("KB_SCAN_MANIFEST", "")
+    kb_hash_workers: int = int(os.getenv("KB_HASH_WORKERS", "8"))
+    # Betöltési pipeline: beolvasó folyamatok (0: CPU-magok száma), sorméret, beágyazási köteg
+    ingest_parse_workers: int = int(os.getenv("KB_PARSE_WORKERS", "0"))
+    ingest_queue_size: int = int(os.getenv("KB_INGEST_QUEUE_SIZE", "32"))
+    ingest_embed_batch_size: int = int(os.getenv("KB_EMBED_BATCH_SIZE", "64"))
+    # Ritka (BM25) index pillanatképe; üres értéknél csak memóriában él
+    sparse_index_path: str = os.getenv("SPARSE_INDEX_PATH", ".sparse_index.json")
 
 
 # Alapértelmezetten használandó egyetlen konfigurációs példány exportálása. A tesztek másikat is beinjektálhatnak.
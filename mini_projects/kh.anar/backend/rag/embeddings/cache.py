@@ -0,0 +1,117 @@
+"""Tartalom-hash alapú, lemezen tárolt beágyazás-gyorsítótár.
+
+Tervezési indoklás:
+- A kulcs a modell azonosítójából és a szövegből képzett sha256, így a változatlan
+  darabokat újraindexeléskor sem kell újra kódolni, modellcserénél viszont nem
+  keveredhetnek a vektorok.
+- Tárolás: egyetlen SQLite fájl (szabványkönyvtár), a vektorok float64 BLOB-ként,
+  hogy a visszaolvasott érték bitre megegyezzen a kiszámolttal.
+- A CachedEmbedder bármely Embeddert becsomagol (DIP): csak a hiányzó szövegeket
+  adja tovább egyetlen embed_batch hívásban, duplikátumok nélkül.
+- Csak a dokumentumdarabok (embed_batch) kerülnek a tárba; a lekérdezések
+  (embed_text) olvassák, de nem írják, különben minden egyedi kérdés korlát
+  nélkül növelné a fájlt.
+"""
+from __future__ import annotations
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+import hashlib
+import logging
+import sqlite3
+import threading
+
+from .embedder import Embedder
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """Kulcs -> vektor tároló egy SQLite fájlban."""
+
+    DB_NAME = "embeddings.db"
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.cache_dir / self.DB_NAME), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            # az SQLite paraméterkorlátja miatt szeletekben kérdezünk
+            for start in range(0, len(keys), 500):
+                part = keys[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(part))})",
+                    part,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array("d", blob).tolist()
+        return found
+
+    def put_many(self, items: Iterable[Tuple[str, List[float]]]) -> None:
+        rows = [(key, array("d", vector).tobytes()) for key, vector in items]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachedEmbedder(Embedder):
+    """Beágyazó-burkoló, amely csak a gyorsítótárban nem szereplő szövegeket kódolja."""
+
+    def __init__(self, embedder: Embedder, cache: EmbeddingCache, namespace: str):
+        """namespace: a modell azonosítója (pl. név és dimenzió); a kulcs része."""
+        self.embedder = embedder
+        self.cache = cache
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.namespace}\0{text}".encode("utf-8")).hexdigest()
+
+    def embed_text(self, text: str) -> List[float]:
+        """Lekérdezés beágyazása: találat esetén a tárból, egyébként kódolva, tárolás nélkül."""
+        key = self._key(text)
+        found = self.cache.get_many([key])
+        if key in found:
+            self.hits += 1
+            return found[key]
+        self.misses += 1
+        return self.embedder.embed_text(text)
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        keys = [self._key(t) for t in texts]
+        found = self.cache.get_many(list(dict.fromkeys(keys)))
+        # hiányzó szövegek, duplikátumok nélkül, eredeti sorrendben
+        missing = {k: t for k, t in zip(keys, texts) if k not in found}
+        self.hits += len(texts) - sum(1 for k in keys if k in missing)
+        self.misses += len(missing)
+        if missing:
+            vectors = self.embedder.embed_batch(list(missing.values()))
+            computed = dict(zip(missing.keys(), vectors))
+            try:
+                self.cache.put_many(computed.items())
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to write embedding cache: {e}")
+            found.update(computed)
+        return [found[k] for k in keys]
+
+    def close(self) -> None:
+        if hasattr(self.embedder, "close"):
+            self.embedder.close()
+        self.cache.close()
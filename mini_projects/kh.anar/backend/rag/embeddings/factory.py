@@ -0,0 +1,30 @@
+"""Beágyazó létrehozása a konfiguráció alapján.
+
+Alapértelmezés a determinisztikus HashEmbedder (tesztek, offline futás). EMBEDDER=transformer
+esetén sentence-transformers modellt használunk kötegelt kódolással; ha az
+embed_cache_dir meg van adva, a vektorokat tartalom-hash alapján lemezre mentjük.
+"""
+import logging
+
+from rag.config import RAGConfig
+from .cache import CachedEmbedder, EmbeddingCache
+from .embedder import Embedder, HashEmbedder
+
+logger = logging.getLogger(__name__)
+
+
+def create_embedder(config: RAGConfig) -> Embedder:
+    if config.embedder != "transformer":
+        return HashEmbedder()
+
+    from .transformer_embedder import TransformerEmbedder
+
+    embedder = TransformerEmbedder(
+        config.embed_model,
+        batch_size=config.embed_batch_size,
+        num_workers=config.embed_workers,
+    )
+    if not config.embed_cache_dir:
+        return embedder
+    logger.info(f"Embedding cache enabled at {config.embed_cache_dir}")
+    return CachedEmbedder(embedder, EmbeddingCache(config.embed_cache_dir), namespace=config.embed_model)
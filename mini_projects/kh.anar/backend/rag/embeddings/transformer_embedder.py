@@ -3,8 +3,16 @@
 Ha nincs telepítve a transformer csomag, HashEmbedderre lép vissza; ez gyors és
 determinisztikus teszteket biztosít, miközben élesben jobb minőségű beágyazást tesz lehetővé,
 ha a függőség jelen van.
+
+Kötegelt kódolás:
+- Az embed_batch a szövegeket hossz szerint rendezi, és batch_size méretű,
+  közel azonos hosszú kötegekben kódolja, így kevesebb a kitöltő (padding) token.
+- Opcionálisan több CPU-folyamatból álló munkáskészlet (num_workers > 1) kódolja
+  a nagy betöltési kötegeket; a rövid (pl. lekérdezési) hívások a fő folyamatban maradnak.
 """
-from typing import List
+from typing import List, Optional
+import logging
+
 from .embedder import Embedder, HashEmbedder
 
 try:
@@ -12,17 +20,67 @@ try:
 except Exception:
     SentenceTransformer = None
 
+logger = logging.getLogger(__name__)
+
 
 class TransformerEmbedder(Embedder):
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
-        if SentenceTransformer is None:
-            raise RuntimeError("sentence-transformers not installed")
-        self.model = SentenceTransformer(model_name)
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        batch_size: int = 32,
+        num_workers: int = 0,
+        model=None,
+    ):
+        """model: előre betöltött modell (tesztekhez); egyébként model_name alapján töltjük."""
+        if model is None:
+            if SentenceTransformer is None:
+                raise RuntimeError("sentence-transformers not installed")
+            model = SentenceTransformer(model_name)
+        self.model = model
+        self.model_name = model_name
+        self.batch_size = max(1, batch_size)
+        self.num_workers = num_workers
+        self._pool = None
 
     def embed_text(self, text: str) -> List[float]:
         vec = self.model.encode(text)
         return vec.tolist()
 
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Kötegelt kódolás hossz szerint rendezett kötegekben; az eredmény az eredeti sorrendben."""
+        if not texts:
+            return []
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        ordered = [texts[i] for i in order]
+        if self.num_workers > 1 and len(texts) > self.batch_size:
+            vectors = self._encode_multi_process(ordered)
+        else:
+            vectors = []
+            for start in range(0, len(ordered), self.batch_size):
+                part = ordered[start:start + self.batch_size]
+                vectors.extend(self.model.encode(part, batch_size=len(part), show_progress_bar=False))
+        result: List[Optional[List[float]]] = [None] * len(texts)
+        for i, vec in zip(order, vectors):
+            result[i] = vec.tolist()
+        return result
+
+    def _encode_multi_process(self, ordered: List[str]):
+        if self._pool is None:
+            # CPU-folyamatok a sentence-transformers saját munkáskészletével
+            self._pool = self.model.start_multi_process_pool(target_devices=["cpu"] * self.num_workers)
+            logger.info(f"Started embedding worker pool with {self.num_workers} processes")
+        # a szeletek a rendezett listából jönnek, így egy-egy folyamat hasonló hosszú szövegeket kap
+        chunk_size = max(self.batch_size, -(-len(ordered) // self.num_workers))
+        return self.model.encode_multi_process(
+            ordered, self._pool, batch_size=self.batch_size, chunk_size=chunk_size
+        )
+
+    def close(self) -> None:
+        """A munkáskészlet leállítása (ha elindult)."""
+        if self._pool is not None:
+            self.model.stop_multi_process_pool(self._pool)
+            self._pool = None
+
 
 class FallbackEmbedder(HashEmbedder):
     """Álnév a HashEmbedder használatához, amikor a valódi modell nem elérhető."""
@@ -0,0 +1,259 @@
+"""Visszakeresési benchmark: a golden halmaz visszajátszása fúziós stratégiánként.
+
+Stratégiánként méri a recall@1 / recall@k értéket, az MRR-t és a hibrid
+keresés p50/p95 késleltetését (a lekérdezés beágyazása nélkül), valamint a
+küszöb hangolásához a no_hit arányt és a helyes top-1 találatok pontszámának
+5. percentilisét (ennél nem érdemes magasabb küszöböt választani).
+
+Futtatás a backend mappából:
+    python -m rag.eval.benchmark
+    python -m rag.eval.benchmark --strategies minmax rrf --repeat 20 --sweep
+    python -m rag.eval.benchmark --fit-learned      # learned súlyok tanítása és mentése
+    python -m rag.eval.benchmark --kb-dir docs/kb-data --golden cases.json --dense chroma
+
+A golden fájl: {"documents": {doc_id: szöveg}, "cases": [{"query", "expected"}]};
+--kb-dir esetén a dokumentumok a mappából jönnek (a "documents" kulcs elhagyható).
+Az indexelés a valódi KBIndexer pipeline-nal történik, ideiglenes mappában.
+A beágyazót a konfiguráció (EMBEDDER) választja ki, így valódi modellel is mérhető.
+"""
+from __future__ import annotations
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from rag.config import RAGConfig
+from rag.embeddings.embedder import Embedder
+from rag.embeddings.factory import create_embedder
+from rag.ingestion.kb_indexer import KBIndexer
+from rag.ingestion.version_store import VersionStore
+from rag.retrieval.fusion import FUSION_STRATEGIES, FusionStrategy, LearnedFusion, create_fusion
+from rag.retrieval.hybrid import HybridRetriever
+from rag.retrieval.sparse import SparseRetriever
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GOLDEN = Path(__file__).with_name("golden_set.json")
+
+
+def load_golden(path: Optional[str] = None) -> Dict:
+    return json.loads(Path(path or DEFAULT_GOLDEN).read_text(encoding="utf-8"))
+
+
+def doc_of(chunk_id: str) -> str:
+    """A darab dokumentum-azonosítója (a darabok neve doc_id:index)."""
+    return chunk_id.rpartition(":")[0] or chunk_id
+
+
+class InMemoryDenseRetriever:
+    """Teljes bejárású koszinusz-kereső numpy-val, Chroma nélkül (a DenseRetriever interfészével)."""
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.texts: List[str] = []
+        self.metadatas: List[Dict] = []
+        self._vectors: List[List[float]] = []
+        self._matrix: Optional[np.ndarray] = None
+
+    def add_chunks(self, ids, embeddings, texts, metadatas):
+        self.ids.extend(ids)
+        self._vectors.extend(embeddings)
+        self.texts.extend(texts)
+        self.metadatas.extend(metadatas)
+        self._matrix = None
+
+    def delete_by_doc_id(self, doc_id):
+        keep = [i for i, cid in enumerate(self.ids) if doc_of(cid) != doc_id]
+        self.ids = [self.ids[i] for i in keep]
+        self._vectors = [self._vectors[i] for i in keep]
+        self.texts = [self.texts[i] for i in keep]
+        self.metadatas = [self.metadatas[i] for i in keep]
+        self._matrix = None
+
+    def query(self, embedding, k=5, filters=None):
+        if not self.ids:
+            return []
+        if self._matrix is None:
+            m = np.asarray(self._vectors, dtype=float)
+            self._matrix = m / np.maximum(np.linalg.norm(m, axis=1, keepdims=True), 1e-12)
+        q = np.asarray(embedding, dtype=float)
+        scores = self._matrix @ (q / max(np.linalg.norm(q), 1e-12))
+        if filters:
+            allowed = [all(meta.get(key) == value for key, value in filters.items()) for meta in self.metadatas]
+            scores = np.where(allowed, scores, -np.inf)
+        order = np.argsort(-scores, kind="stable")[:k]
+        return [
+            {"id": self.ids[i], "score_vector": float(scores[i]), "document": self.texts[i], "metadata": self.metadatas[i]}
+            for i in order.tolist() if np.isfinite(scores[i])
+        ]
+
+
+def build_index(golden: Dict, config: RAGConfig, workdir: Path, kb_dir: Optional[str] = None, dense: str = "memory"):
+    """A golden dokumentumok indexelése a KBIndexerrel; (HybridRetriever, embedder)."""
+    if kb_dir is None:
+        kb_path = workdir / "kb-data"
+        kb_path.mkdir()
+        for doc_id, text in golden["documents"].items():
+            target = kb_path / doc_id
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(text, encoding="utf-8")
+    else:
+        kb_path = Path(kb_dir)
+
+    config = replace(config, kb_data_dir=str(kb_path), kb_scan_manifest="", chroma_dir=str(workdir / "chroma"))
+    embedder = create_embedder(config)
+    if dense == "chroma":
+        from rag.retrieval.dense import DenseRetriever
+        dense_retriever = DenseRetriever(config, embedder=embedder)
+    else:
+        dense_retriever = InMemoryDenseRetriever()
+    sparse = SparseRetriever()
+    indexer = KBIndexer(config, dense_retriever, sparse, embedder, VersionStore(workdir / "versions.json"))
+    stats = indexer.ingest_incremental()
+    logger.info(f"Indexed {stats['new']} documents, {stats['total_chunks']} chunks")
+    return HybridRetriever(dense_retriever, sparse, config), embedder
+
+
+def evaluate(
+    hybrid: HybridRetriever,
+    embedder: Embedder,
+    cases: Sequence[Dict],
+    fusion: FusionStrategy,
+    k: int,
+    repeat: int = 1,
+) -> Dict[str, float]:
+    """Egy stratégia mérőszámai a golden eseteken."""
+    latencies: List[float] = []
+    reciprocal_ranks: List[float] = []
+    top1_hits = 0
+    no_hits = 0
+    correct_top_scores: List[float] = []
+    for case in cases:
+        embedding = embedder.embed_text(case["query"])
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            out = hybrid.retrieve(embedding, case["query"], k=k, fusion=fusion)
+            latencies.append(time.perf_counter() - start)
+        ranked = [doc_of(r["id"]) for r in out["topk"]]
+        rank = ranked.index(case["expected"]) + 1 if case["expected"] in ranked else None
+        reciprocal_ranks.append(1.0 / rank if rank else 0.0)
+        if rank == 1:
+            top1_hits += 1
+            correct_top_scores.append(out["topk"][0]["score_final"])
+        if out["decision"] == "no_hit":
+            no_hits += 1
+
+    n = len(cases)
+    ms = np.asarray(latencies) * 1000
+    return {
+        "recall@1": top1_hits / n,
+        f"recall@{k}": sum(1 for rr in reciprocal_ranks if rr > 0) / n,
+        "mrr": float(np.mean(reciprocal_ranks)),
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p95_ms": float(np.percentile(ms, 95)),
+        "no_hit_rate": no_hits / n,
+        "top1_score_p05": float(np.percentile(correct_top_scores, 5)) if correct_top_scores else None,
+    }
+
+
+def fit_learned(hybrid: HybridRetriever, embedder: Embedder, cases: Sequence[Dict], k: int, fusion: LearnedFusion) -> Dict[str, float]:
+    """A learned stratégia súlyainak tanítása a golden esetek jelöltlistáin."""
+    xs, ys = [], []
+    for case in cases:
+        dense_res, sparse_res, _ = hybrid.candidates(embedder.embed_text(case["query"]), case["query"], k=k)
+        cands, x = fusion.features(dense_res, sparse_res)
+        xs.append(x)
+        ys.extend(1.0 if doc_of(_id) == case["expected"] else 0.0 for _id in cands.ids)
+    return fusion.fit(np.vstack(xs), np.asarray(ys))
+
+
+def sweep_weights(hybrid, embedder, cases, fusion, k, steps: int = 10) -> List[Dict[str, float]]:
+    """w_dense rácskeresés (w_sparse = 1 - w_dense) egy stratégiára."""
+    base = hybrid.config
+    rows = []
+    try:
+        for i in range(steps + 1):
+            w_dense = round(i / steps, 3)
+            hybrid.config = replace(base, w_dense=w_dense, w_sparse=round(1 - w_dense, 3))
+            metrics = evaluate(hybrid, embedder, cases, fusion, k)
+            rows.append({"w_dense": w_dense, "w_sparse": hybrid.config.w_sparse, **metrics})
+    finally:
+        hybrid.config = base
+    return rows
+
+
+def _format_table(rows: List[Dict], first: str) -> str:
+    columns = [first] + [c for c in rows[0] if c != first]
+    lines = ["  ".join(f"{c:>14}" for c in columns)]
+    for row in rows:
+        cells = []
+        for c in columns:
+            v = row.get(c)
+            cells.append(f"{v:>14.3f}" if isinstance(v, float) else f"{str(v):>14}")
+        lines.append("  ".join(cells))
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay the golden retrieval set per fusion strategy")
+    parser.add_argument("--golden", help="golden set JSON (default: rag/eval/golden_set.json)")
+    parser.add_argument("--kb-dir", help="index this KB folder instead of the golden documents")
+    parser.add_argument("--strategies", nargs="+", choices=FUSION_STRATEGIES, default=list(FUSION_STRATEGIES))
+    parser.add_argument("-k", type=int, default=None, help="top-k (default: RAG_TOP_K)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per query")
+    parser.add_argument("--dense", choices=("memory", "chroma"), default="memory")
+    parser.add_argument("--fit-learned", action="store_true", help="fit the learned weights on the golden set and save them")
+    parser.add_argument("--weights-out", help="where to save the learned weights (default: RAG_FUSION_WEIGHTS)")
+    parser.add_argument("--sweep", action="store_true", help="also sweep w_dense from 0 to 1 per strategy")
+    parser.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    config = RAGConfig()
+    k = args.k or config.k
+    golden = load_golden(args.golden)
+    cases = golden["cases"]
+
+    report: Dict = {"k": k, "cases": len(cases), "threshold": config.threshold, "strategies": {}, "sweep": {}}
+    with tempfile.TemporaryDirectory() as tmp:
+        hybrid, embedder = build_index(golden, config, Path(tmp), kb_dir=args.kb_dir, dense=args.dense)
+        try:
+            for name in args.strategies:
+                fusion = create_fusion(name, config)
+                if name == "learned" and args.fit_learned:
+                    report["learned_weights"] = fit_learned(hybrid, embedder, cases, k, fusion)
+                    fusion.save(args.weights_out or config.fusion_weights_path)
+                metrics = evaluate(hybrid, embedder, cases, fusion, k, repeat=args.repeat)
+                if name == "learned":
+                    # tanítás után a mérés ugyanazon az adaton történik (in-sample)
+                    metrics["fitted"] = fusion.fitted
+                report["strategies"][name] = metrics
+                if args.sweep and name != "learned":
+                    report["sweep"][name] = sweep_weights(hybrid, embedder, cases, fusion, k)
+        finally:
+            hybrid.close()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    print(f"Golden cases: {len(cases)}, k={k}, threshold={config.threshold}, "
+          f"w_dense={config.w_dense}, w_sparse={config.w_sparse}")
+    rows = [{"strategy": name, **m} for name, m in report["strategies"].items()]
+    print(_format_table(rows, "strategy"))
+    if "learned_weights" in report:
+        print(f"\nLearned weights (in-sample): {report['learned_weights']}")
+    for name, sweep_rows in report["sweep"].items():
+        print(f"\nWeight sweep: {name}")
+        print(_format_table(sweep_rows, "w_dense"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
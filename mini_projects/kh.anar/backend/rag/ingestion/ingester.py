@@ -31,9 +31,10 @@ class Ingester:
 
     def ingest(self, doc: Document):
         chunks = self.chunker.chunk(doc.doc_id, doc.text)
+        # egyetlen kötegelt beágyazás a dokumentum összes darabjára
+        embeddings = self.embedder.embed_batch([c.text for c in chunks]) if self.embedder else [None] * len(chunks)
         prepared = []
-        for c in chunks:
-            embedding = self.embedder.embed_text(c.text) if self.embedder else None
+        for c, embedding in zip(chunks, embeddings):
             prepared.append({
                 "id": c.chunk_id,
                 "text": c.text,
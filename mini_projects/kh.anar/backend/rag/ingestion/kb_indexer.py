@@ -13,6 +13,9 @@ Tervezési indoklás:
 4. Törölteknél: darabok eltávolítása az indexekből
 5. Verziótár frissítése
 
+A lépéseket a rag.ingestion.pipeline futtatja párhuzamos, korlátos sorokkal
+összekötött lépcsőkben; az indexekbe egyetlen író ír.
+
 Miért ez a megközelítés:
 - Determinisztikus: ugyanazok a fájlok => ugyanaz az indexállapot.
 - Inkrementális: gyors frissítések; csak a változott fájlokat dolgozza fel.
@@ -20,19 +23,20 @@ Miért ez a megközelítés:
 """
 from __future__ import annotations
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set
 import logging
+import threading
 import time
-from datetime import datetime, timezone
 
 from rag.config import RAGConfig
 from rag.chunking.chunker import DeterministicChunker
 from rag.embeddings.embedder import Embedder
 from rag.retrieval.dense import DenseRetriever
 from rag.retrieval.sparse import SparseRetriever
-from rag.ingestion.scanner import scan_kb_folder
-from rag.ingestion.pdf_parser import parse_pdf
+from rag.ingestion.scanner import ScanResult, scan_kb_changes
+from rag.ingestion.pipeline import IngestionCancelled, IngestionPipeline, ProgressFn, WriteBatch
 from rag.ingestion.version_store import VersionStore
+from rag.persistence.store import DocumentStore
 
 logger = logging.getLogger(__name__)
 
@@ -43,9 +47,12 @@ class KBIndexer:
     Tervezés:
     - Állapot nélküli orkesztrátor; az állapot a version_store-ban és a retrieverekben él.
     - Minden betöltés összehangolja a mappa állapotát az index állapotával.
-    - Egyfolyamatú használatnál szálbiztos.
+    - Egyfolyamatú használatnál szálbiztos: egyszerre egy betöltés írhat az indexekbe
+      (példányok között is).
     """
     
+    _ingest_lock = threading.Lock()
+    
     def __init__(
         self,
         config: RAGConfig,
@@ -54,7 +61,11 @@ class KBIndexer:
         embedder: Embedder,
         version_store: VersionStore,
         chunker: Optional[DeterministicChunker] = None,
+        document_store: Optional[DocumentStore] = None,
     ):
+        """document_store: opcionális; a mappából törölt dokumentumokat innen is eltávolítjuk,
+        hogy egy későbbi /reindex ne hozza vissza őket.
+        """
         self.config = config
         self.dense = dense_retriever
         self.sparse = sparse_retriever
@@ -65,18 +76,35 @@ class KBIndexer:
             chunk_overlap=config.chunk_overlap,
         )
         self.kb_dir = Path(config.kb_data_dir)
+        self.document_store = document_store
+        # A szken-manifeszt alapértelmezetten a verziótár mellett van
+        self.manifest_path = (
+            Path(config.kb_scan_manifest) if config.kb_scan_manifest
+            else version_store.store_path.with_name(f"{version_store.store_path.stem}.manifest.json")
+        )
     
-    def ingest_incremental(self) -> dict:
+    def ingest_incremental(
+        self,
+        progress: Optional[ProgressFn] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> dict:
         """Inkrementális betöltés: csak az új/módosult dokumentumokat dolgozza fel.
         
+        Args:
+            progress: opcionális visszahívás (lépcső, kész, összes) a haladáshoz
+            cancel_event: beállítva a futás a következő írási köteg előtt leáll
+                (IngestionCancelled); a már beírt dokumentumok a verziótárban maradnak,
+                így egy újabb inkrementális futás onnan folytatja
+        
         Returns:
-            Dict statisztikákkal: new, updated, removed, total_chunks
+            Dict statisztikákkal: new, updated, removed, total_chunks, failed, stages
         """
         start_time = time.time()
         logger.info(f"Starting incremental KB ingestion from {self.kb_dir}")
         
         # Mappa átvizsgálása
-        discovered = scan_kb_folder(self.kb_dir)
+        scan = self._scan()
+        discovered = scan.documents
         discovered_ids = {d["doc_id"] for d in discovered}
         
         # Összevetés a verziótárral
@@ -91,48 +119,44 @@ class KBIndexer:
         
         logger.info(f"KB scan: {len(new_docs)} new, {len(updated_docs)} updated, {len(removed_ids)} removed")
         
-        total_chunks = 0
-        
-        # Új dokumentumok feldolgozása
-        for doc_meta in new_docs:
-            chunks = self._process_document(doc_meta)
-            total_chunks += len(chunks)
-            self.version_store.update(
-                doc_meta["doc_id"],
-                doc_meta["version_hash"],
-                doc_meta["file_path"],
-                len(chunks),
+        with self._ingest_lock:
+            # Törölt dokumentumok feldolgozása
+            for doc_id in removed_ids:
+                self._delete_document_chunks(doc_id)
+                if self.document_store is not None:
+                    self.document_store.delete_doc(doc_id)
+                self.version_store.remove(doc_id, save=False)
+            if removed_ids:
+                self.version_store.flush()
+            
+            # Új és módosult dokumentumok (a módosultaknál előbb a régi darabok törlése)
+            result = self._run_pipeline(
+                new_docs + updated_docs,
+                replace={d["doc_id"] for d in updated_docs},
+                progress=progress,
+                cancel_event=cancel_event,
+                changed=bool(removed_ids),
             )
         
-        # Módosult dokumentumok feldolgozása (előbb a régi darabok törlése)
-        for doc_meta in updated_docs:
-            self._delete_document_chunks(doc_meta["doc_id"])
-            chunks = self._process_document(doc_meta)
-            total_chunks += len(chunks)
-            self.version_store.update(
-                doc_meta["doc_id"],
-                doc_meta["version_hash"],
-                doc_meta["file_path"],
-                len(chunks),
-            )
-        
-        # Törölt dokumentumok feldolgozása
-        for doc_id in removed_ids:
-            self._delete_document_chunks(doc_id)
-            self.version_store.remove(doc_id)
-        
         elapsed = time.time() - start_time
-        logger.info(f"KB ingestion complete: {total_chunks} chunks indexed in {elapsed:.2f}s")
+        logger.info(f"KB ingestion complete: {result['total_chunks']} chunks indexed in {elapsed:.2f}s")
         
         return {
             "new": len(new_docs),
             "updated": len(updated_docs),
             "removed": len(removed_ids),
-            "total_chunks": total_chunks,
+            "total_chunks": result["total_chunks"],
+            "failed": result["failed"],
+            "stages": result["stages"],
+            "scan": scan.summary(),
             "elapsed_s": elapsed,
         }
     
-    def ingest_full_reindex(self) -> dict:
+    def ingest_full_reindex(
+        self,
+        progress: Optional[ProgressFn] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> dict:
         """Teljes újraindexelés: verziótár törlése és minden dokumentum újraindexelése.
         
         Akkor használd, ha:
@@ -140,105 +164,125 @@ class KBIndexer:
         - Megváltozott a beágyazó modell
         - Indexsérülés gyanítható
         
+        Megszakítás után egy inkrementális futás folytatja: a verziótárban csak a
+        már újraindexelt dokumentumok szerepelnek.
+        
         Returns:
-            Dict statisztikákkal: total_docs, total_chunks, elapsed_s
+            Dict statisztikákkal: total_docs, total_chunks, failed, stages, elapsed_s
         """
         start_time = time.time()
         logger.info(f"Starting full KB reindex from {self.kb_dir}")
         
-        # Verziótár törlése
-        self.version_store.clear()
-        
         # Megjegyzés: itt nem töröljük a sűrű/ritka indexeket, mert kézzel hozzáadott
         # dokumentumokat tartalmazhatnak. Teljes tiszta induláshoz a hívónak törölnie kell
         # a chroma_dir-t és újrainicializálnia. Inkrementális működéshez a
         # delete_document_chunks-re támaszkodunk a régi adatok eltávolításához.
         
         # Minden dokumentum átvizsgálása és feldolgozása
-        discovered = scan_kb_folder(self.kb_dir)
-        total_chunks = 0
+        scan = self._scan()
+        discovered = scan.documents
         
-        for doc_meta in discovered:
-            chunks = self._process_document(doc_meta)
-            total_chunks += len(chunks)
-            self.version_store.update(
-                doc_meta["doc_id"],
-                doc_meta["version_hash"],
-                doc_meta["file_path"],
-                len(chunks),
-            )
+        with self._ingest_lock:
+            # Verziótár törlése
+            self.version_store.clear()
+            result = self._run_pipeline(discovered, replace=set(), progress=progress, cancel_event=cancel_event)
         
         elapsed = time.time() - start_time
-        logger.info(f"Full reindex complete: {len(discovered)} docs, {total_chunks} chunks in {elapsed:.2f}s")
+        logger.info(f"Full reindex complete: {len(discovered)} docs, {result['total_chunks']} chunks in {elapsed:.2f}s")
         
         return {
             "total_docs": len(discovered),
-            "total_chunks": total_chunks,
+            "total_chunks": result["total_chunks"],
+            "failed": result["failed"],
+            "stages": result["stages"],
+            "scan": scan.summary(),
             "elapsed_s": elapsed,
         }
     
-    def _process_document(self, doc_meta: dict) -> List:
-        """Egyetlen dokumentum feldolgozása: parse, darabolás, beágyazás, indexelés.
+    def _scan(self) -> ScanResult:
+        """Mappaszken a manifeszttel: csak a megváltozott stat-ú fájlokat hash-eli."""
+        return scan_kb_changes(
+            self.kb_dir,
+            manifest_path=self.manifest_path,
+            workers=self.config.kb_hash_workers,
+        )
+    
+    def _run_pipeline(
+        self,
+        docs: List[dict],
+        replace: Set[str],
+        progress: Optional[ProgressFn],
+        cancel_event: Optional[threading.Event],
+        changed: bool = False,
+    ) -> dict:
+        """A dokumentumok átfuttatása a többlépcsős pipeline-on (parse → chunk → embed → write)."""
+        pipeline = IngestionPipeline(
+            chunker=self.chunker,
+            embedder=self.embedder,
+            writer=lambda batch: self._write_batch(batch, replace),
+            parse_workers=self.config.ingest_parse_workers,
+            queue_size=self.config.ingest_queue_size,
+            embed_batch_size=self.config.ingest_embed_batch_size,
+            progress=progress,
+            cancel_event=cancel_event,
+        )
+        written = False
+        try:
+            result = pipeline.run(docs)
+            written = result["documents"] > 0
+            return result
+        except IngestionCancelled as e:
+            written = e.stats["documents"] > 0
+            raise
+        finally:
+            # részleges futás után is, hogy a ritka index egyezzen a verziótárral
+            if written or changed:
+                self._save_sparse_snapshot()
+    
+    def _write_batch(self, batch: WriteBatch, replace: Set[str]) -> None:
+        """Egy beágyazott köteg beírása (a pipeline egyetlen író lépcsője).
         
-        Returns:
-            A beindexelt darabok listája
+        A verziótár a köteg végén egyszer mentődik, így nagy mappánál sem írjuk
+        újra dokumentumonként a teljes JSON fájlt.
         """
-        file_path = Path(doc_meta["file_path"])
-        doc_id = doc_meta["doc_id"]
-        ext = doc_meta["extension"]
-        
-        logger.debug(f"Processing document: {doc_id} ({ext})")
-        
-        # Kiterjesztés alapján történő feldolgozás
-        if ext == ".pdf":
-            parse_result = parse_pdf(file_path)
-            text = parse_result.text
-            doc_metadata = {
-                "doc_id": doc_id,
-                "title": parse_result.metadata.get("title") or file_path.name,
-                "source": str(file_path),
-                "doc_type": "pdf",
-                "version_hash": doc_meta["version_hash"],
-                "created_at": datetime.now(timezone.utc).isoformat(),
-            }
-        elif ext in [".txt", ".md"]:
-            text = file_path.read_text(encoding="utf-8")
-            doc_metadata = {
-                "doc_id": doc_id,
-                "title": file_path.name,
-                "source": str(file_path),
-                "doc_type": ext.lstrip("."),
-                "version_hash": doc_meta["version_hash"],
-                "created_at": datetime.now(timezone.utc).isoformat(),
-            }
-        else:
-            logger.warning(f"Unsupported file type: {ext} for {doc_id}")
-            return []
-        
-        # Darabolás
-        chunks = self.chunker.chunk(doc_id, text, doc_metadata)
-        
-        if not chunks:
-            logger.warning(f"No chunks generated for {doc_id}")
-            return []
-        
-        # Beágyazás és indexelés
-        chunk_texts = [c.text for c in chunks]
-        chunk_ids = [c.chunk_id for c in chunks]
-        chunk_metas = [c.metadata for c in chunks]
-        
-        embeddings = self.embedder.embed_batch(chunk_texts)
-        
-        # Hozzáadás a sűrű indexhez
-        self.dense.add_chunks(chunk_ids, embeddings, chunk_texts, chunk_metas)
-        
-        # Hozzáadás a ritka indexhez
-        for chunk_id, text, meta in zip(chunk_ids, chunk_texts, chunk_metas):
-            self.sparse.add_chunk(chunk_id, text, meta)
-        
-        logger.debug(f"Indexed {len(chunks)} chunks for {doc_id}")
-        
-        return chunks
+        for doc_meta, chunks, embeddings in batch:
+            doc_id = doc_meta["doc_id"]
+            if doc_id in replace:
+                self._delete_document_chunks(doc_id)
+            if chunks:
+                chunk_texts = [c.text for c in chunks]
+                chunk_ids = [c.chunk_id for c in chunks]
+                chunk_metas = [c.metadata for c in chunks]
+                
+                # Hozzáadás a sűrű indexhez
+                self.dense.add_chunks(chunk_ids, embeddings, chunk_texts, chunk_metas)
+                
+                # Hozzáadás a ritka indexhez (egy lépésben, a posting listák helyben bővülnek)
+                self.sparse.add_chunks([
+                    {"id": chunk_id, "text": text, "metadata": meta}
+                    for chunk_id, text, meta in zip(chunk_ids, chunk_texts, chunk_metas)
+                ])
+                logger.debug(f"Indexed {len(chunks)} chunks for {doc_id}")
+            
+            self.version_store.update(
+                doc_id,
+                doc_meta["version_hash"],
+                doc_meta["file_path"],
+                len(chunks),
+                save=False,
+            )
+        self.version_store.flush()
+    
+    def _save_sparse_snapshot(self) -> None:
+        """A ritka index pillanatképének mentése, hogy újraindítás után ne legyen üres.
+
+        A verziótár szerint már indexelt dokumentumokat az inkrementális betöltés
+        nem dolgozza fel újra, ezért a BM25 indexnek is túl kell élnie az újraindítást.
+        """
+        try:
+            self.sparse.save()
+        except AttributeError:
+            logger.warning("SparseRetriever does not support save; sparse index is not persisted")
     
     def _delete_document_chunks(self, doc_id: str) -> None:
         """Törli az adott dokumentumhoz tartozó összes darabot az indexekből.
@@ -0,0 +1,316 @@
+"""Többlépcsős, párhuzamos betöltési folyamat a tudástár-indexelőhöz.
+
+Lépcsők, korlátos sorokkal összekötve:
+1. parse – PDF/szöveg beolvasása folyamatkészletben (minden CPU mag)
+2. chunk – determinisztikus darabolás
+3. embed – kötegelt beágyazás, több dokumentum darabjain át
+4. write – egyetlen író (a hívó szál): régi darabok törlése, sűrű és ritka index,
+   verziótár
+
+Tervezési indoklás:
+- A PDF szövegkinyerés a CPU-igényes rész; folyamatok között osztjuk szét, így egy
+  teljes újraindexelés minden magot kihasznál.
+- A korlátos sorok miatt a memóriahasználat nem nő a mappa méretével; a lassú
+  lépcső visszafogja az előtte lévőket.
+- Egyetlen író: a retrieverek és a verziótár nem szálbiztosak, és a verziótár így
+  csak teljesen beírt dokumentumot jelöl késznek; egy megszakított futás
+  inkrementális betöltéssel folytatható.
+- DIP: a pipeline nem ismeri a retrievereket; az írást a hívó adja át függvényként.
+"""
+from __future__ import annotations
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+
+from rag.chunking.chunker import DeterministicChunker
+from rag.embeddings.embedder import Embedder
+from rag.ingestion.pdf_parser import parse_pdf
+
+logger = logging.getLogger(__name__)
+
+# Sorvég-jelző a lépcsők között
+_DONE = object()
+
+# progress(lépcső, kész, összes)
+ProgressFn = Callable[[str, int, int], None]
+# Egy írási köteg: (doc_meta, darabok, beágyazások) hármasok
+WriteBatch = List[Tuple[dict, list, List[List[float]]]]
+
+STAGES = ("parse", "chunk", "embed", "write")
+
+
+class IngestionCancelled(Exception):
+    """A betöltést megszakították; a stats a már beírt dokumentumokat írja le."""
+
+    def __init__(self, stats: dict):
+        super().__init__("ingestion cancelled")
+        self.stats = stats
+
+
+@dataclass
+class StageStats:
+    """Egy lépcső átviteli statisztikája (feldolgozott elemek / eltelt idő)."""
+    items: int = 0
+    seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "items": self.items,
+            "seconds": round(self.seconds, 3),
+            "per_second": round(self.items / self.seconds, 2) if self.seconds else 0.0,
+        }
+
+
+def read_document(doc_meta: dict) -> Optional[Tuple[str, dict]]:
+    """Egy dokumentum beolvasása: (szöveg, dokumentum-metaadat), vagy None, ha a típus nem támogatott.
+
+    Modulszintű függvény, hogy a folyamatkészlet át tudja adni (pickle).
+    """
+    file_path = Path(doc_meta["file_path"])
+    doc_id = doc_meta["doc_id"]
+    ext = doc_meta["extension"]
+
+    if ext == ".pdf":
+        parse_result = parse_pdf(file_path)
+        text = parse_result.text
+        title = parse_result.metadata.get("title") or file_path.name
+        doc_type = "pdf"
+    elif ext in [".txt", ".md"]:
+        text = file_path.read_text(encoding="utf-8")
+        title = file_path.name
+        doc_type = ext.lstrip(".")
+    else:
+        logger.warning(f"Unsupported file type: {ext} for {doc_id}")
+        return None
+
+    return text, {
+        "doc_id": doc_id,
+        "title": title,
+        "source": str(file_path),
+        "doc_type": doc_type,
+        "version_hash": doc_meta["version_hash"],
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+class IngestionPipeline:
+    """Parse → chunk → embed → write lépcsők futtatása egy dokumentumlistán."""
+
+    def __init__(
+        self,
+        chunker: DeterministicChunker,
+        embedder: Embedder,
+        writer: Callable[[WriteBatch], None],
+        parse_workers: int = 0,
+        queue_size: int = 32,
+        embed_batch_size: int = 64,
+        progress: Optional[ProgressFn] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ):
+        """parse_workers: folyamatok száma a beolvasáshoz (0: CPU-magok száma, 1: szálon belül)."""
+        self.chunker = chunker
+        self.embedder = embedder
+        self.writer = writer
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.queue_size = max(1, queue_size)
+        self.embed_batch_size = max(1, embed_batch_size)
+        self.progress = progress
+        self.cancel_event = cancel_event or threading.Event()
+
+    def run(self, docs: List[dict]) -> dict:
+        """A dokumentumok feldolgozása; IngestionCancelled-et dob megszakításkor.
+
+        Returns:
+            Dict: documents, total_chunks, failed (doc_id lista), stages (lépcsőnkénti átvitel)
+        """
+        self._stop = threading.Event()
+        self._errors: List[BaseException] = []
+        self._failed: List[str] = []
+        self._stats = {name: StageStats() for name in STAGES}
+        self._total = len(docs)
+        parsed_q: queue.Queue = queue.Queue(self.queue_size)
+        chunked_q: queue.Queue = queue.Queue(self.queue_size)
+        embedded_q: queue.Queue = queue.Queue(self.queue_size)
+
+        threads = [
+            self._stage_thread("parse", self._parse_stage, docs, parsed_q),
+            self._stage_thread("chunk", self._chunk_stage, parsed_q, chunked_q),
+            self._stage_thread("embed", self._embed_stage, chunked_q, embedded_q),
+        ]
+        for t in threads:
+            t.start()
+
+        written = 0
+        total_chunks = 0
+        start = time.perf_counter()
+        try:
+            while True:
+                batch = self._get(embedded_q)
+                if batch is _DONE:
+                    break
+                self.writer(batch)
+                written += len(batch)
+                total_chunks += sum(len(chunks) for _, chunks, _ in batch)
+                self._stats["write"].items += len(batch)
+                self._report("write", written)
+        except BaseException as e:
+            self._errors.append(e)
+        finally:
+            self._stats["write"].seconds = time.perf_counter() - start
+            self._stop.set()
+            for t in threads:
+                t.join()
+
+        result = {
+            "documents": written,
+            "total_chunks": total_chunks,
+            "failed": self._failed,
+            "stages": {name: s.to_dict() for name, s in self._stats.items()},
+        }
+        if self._errors:
+            raise self._errors[0]
+        if self.cancel_event.is_set():
+            raise IngestionCancelled(result)
+        return result
+
+    # --- lépcsők -----------------------------------------------------------
+
+    def _stage_thread(self, name: str, fn, source, out_q: queue.Queue) -> threading.Thread:
+        def target():
+            start = time.perf_counter()
+            try:
+                fn(source, out_q)
+            except BaseException as e:
+                self._errors.append(e)
+                self._stop.set()
+            finally:
+                self._stats[name].seconds = time.perf_counter() - start
+                self._put(out_q, _DONE)
+
+        return threading.Thread(target=target, name=f"kb-ingest-{name}", daemon=True)
+
+    def _parse_stage(self, docs: List[dict], out_q: queue.Queue) -> None:
+        if self.parse_workers <= 1 or len(docs) <= 1:
+            for doc_meta in docs:
+                if self._halted():
+                    return
+                try:
+                    parsed = read_document(doc_meta)
+                except Exception as e:
+                    self._parse_failed(doc_meta, e)
+                    continue
+                self._parsed(doc_meta, parsed, out_q)
+            return
+
+        # spawn: a fork from this stage thread would copy locks held by the other
+        # stages, the job executor and the server threads (deadlock risk)
+        pool = ProcessPoolExecutor(
+            max_workers=min(self.parse_workers, len(docs)),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        try:
+            # legfeljebb queue_size dokumentum van úton; a sorrend megmarad
+            window: deque = deque()
+            pending = iter(docs)
+            while not self._halted():
+                while len(window) < self.queue_size:
+                    doc_meta = next(pending, None)
+                    if doc_meta is None:
+                        break
+                    window.append((doc_meta, pool.submit(read_document, doc_meta)))
+                if not window:
+                    break
+                doc_meta, future = window.popleft()
+                try:
+                    parsed = future.result()
+                except Exception as e:
+                    self._parse_failed(doc_meta, e)
+                    continue
+                self._parsed(doc_meta, parsed, out_q)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _parse_failed(self, doc_meta: dict, error: Exception) -> None:
+        # a verziótárba nem kerül be, így a következő betöltés újra megpróbálja
+        logger.error(f"Failed to read {doc_meta['doc_id']}: {error}")
+        self._failed.append(doc_meta["doc_id"])
+
+    def _parsed(self, doc_meta: dict, parsed, out_q: queue.Queue) -> None:
+        self._stats["parse"].items += 1
+        self._report("parse", self._stats["parse"].items)
+        self._put(out_q, (doc_meta, parsed))
+
+    def _chunk_stage(self, in_q: queue.Queue, out_q: queue.Queue) -> None:
+        while True:
+            item = self._get(in_q)
+            if item is _DONE:
+                return
+            doc_meta, parsed = item
+            chunks = []
+            if parsed is not None:
+                text, doc_metadata = parsed
+                chunks = self.chunker.chunk(doc_meta["doc_id"], text, doc_metadata)
+                if not chunks:
+                    logger.warning(f"No chunks generated for {doc_meta['doc_id']}")
+            self._stats["chunk"].items += 1
+            self._report("chunk", self._stats["chunk"].items)
+            self._put(out_q, (doc_meta, chunks))
+
+    def _embed_stage(self, in_q: queue.Queue, out_q: queue.Queue) -> None:
+        group: List[Tuple[dict, list]] = []
+        group_chunks = 0
+        while True:
+            item = self._get(in_q)
+            if item is not _DONE:
+                group.append(item)
+                group_chunks += len(item[1])
+            # a köteg akkor megy tovább, ha elég nagy, vagy épp nincs több várakozó dokumentum
+            if group and (item is _DONE or group_chunks >= self.embed_batch_size or in_q.empty()):
+                texts = [c.text for _, chunks in group for c in chunks]
+                vectors = self.embedder.embed_batch(texts) if texts else []
+                batch: WriteBatch = []
+                offset = 0
+                for doc_meta, chunks in group:
+                    batch.append((doc_meta, chunks, vectors[offset:offset + len(chunks)]))
+                    offset += len(chunks)
+                self._stats["embed"].items += len(group)
+                self._report("embed", self._stats["embed"].items)
+                self._put(out_q, batch)
+                group, group_chunks = [], 0
+            if item is _DONE:
+                return
+
+    # --- segédek -----------------------------------------------------------
+
+    def _halted(self) -> bool:
+        return self._stop.is_set() or self.cancel_event.is_set()
+
+    def _put(self, q: queue.Queue, item) -> bool:
+        while True:
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                if self._halted():
+                    return False
+
+    def _get(self, q: queue.Queue):
+        while not self._halted():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _report(self, stage: str, done: int) -> None:
+        if self.progress is not None:
+            self.progress(stage, done, self._total)
@@ -9,15 +9,48 @@ Tervezési indoklás:
 Miért hashing:
 - Lehetővé teszi az inkrementális frissítést: csak a változott dokumentumokat indexeljük újra.
 - Futások között stabil: azonos fájltartalom => azonos hash => nincs újraindexelés.
+
+Manifeszt (gyors változásfelismerés):
+- Relatív útvonalanként eltároljuk a stat ujjlenyomatot (méret, mtime_ns, inode) és
+  a hozzá tartozó hash-t. Változatlan stat esetén a hash-t innen vesszük, így egy
+  nagyrészt változatlan mappa újraolvasása csak stat hívásokból áll.
+- A ténylegesen hash-elendő fájlokat szálkészlet dolgozza fel (a hashlib nagy
+  blokkoknál elengedi a GIL-t).
+- A szken jelenti a hozzáadott, módosult és törölt dokumentumokat.
 """
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import hashlib
+import json
 import logging
+import stat
+import tempfile
 
 logger = logging.getLogger(__name__)
 
+_READ_BLOCK = 1 << 20
+
+
+@dataclass
+class ScanResult:
+    """Egy mappaszken eredménye; az added/modified/deleted a manifeszthez képest értendő (doc_id-k)."""
+    documents: List[Dict[str, Any]]
+    added: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    hashed: int = 0
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            "added": len(self.added),
+            "modified": len(self.modified),
+            "deleted": len(self.deleted),
+            "hashed": self.hashed,
+        }
+
 
 def compute_file_hash(path: Path) -> str:
     """SHA256 hash számítása a fájltartalomhoz verziódetektáláshoz.
@@ -27,54 +60,146 @@ def compute_file_hash(path: Path) -> str:
     """
     sha = hashlib.sha256()
     with open(path, "rb") as f:
-        while chunk := f.read(8192):
+        while chunk := f.read(_READ_BLOCK):
             sha.update(chunk)
     return sha.hexdigest()
 
 
-def scan_kb_folder(kb_dir: Path, extensions: List[str] = None) -> List[Dict[str, Any]]:
-    """Beolvassa a tudástár mappát és metaadatot ad vissza minden talált fájlhoz.
+def _load_manifest(manifest_path: Optional[Path], kb_dir: Path) -> Dict[str, Dict[str, Any]]:
+    if manifest_path is None or not manifest_path.exists():
+        return {}
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception as e:
+        logger.error(f"Failed to load scan manifest: {e}")
+        return {}
+    # másik mappához tartozó manifeszt nem használható
+    if data.get("kb_dir") != str(kb_dir.resolve()):
+        return {}
+    return data.get("files", {})
+
+
+def _save_manifest(manifest_path: Path, kb_dir: Path, files: Dict[str, Dict[str, Any]]) -> None:
+    """Manifeszt mentése atomikusan (ideiglenes fájl + átnevezés)."""
+    try:
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", delete=False, dir=str(manifest_path.parent), encoding="utf-8") as tf:
+            json.dump({"kb_dir": str(kb_dir.resolve()), "files": files}, tf, ensure_ascii=False)
+            tmp_path = tf.name
+        Path(tmp_path).replace(manifest_path)
+    except Exception as e:
+        logger.error(f"Failed to save scan manifest: {e}")
+
+
+def scan_kb_changes(
+    kb_dir: Path,
+    extensions: List[str] = None,
+    manifest_path: Optional[Path] = None,
+    workers: int = 8,
+) -> ScanResult:
+    """Beolvassa a tudástár mappát; csak a megváltozott stat-ú fájlokat hash-eli.
     
     Args:
         kb_dir: Útvonal a tudástár adatkönyvtárhoz
-        extensions: Fájlkiterjesztések listája (pl. [".pdf", ".txt", ".md"]);
-                   ha None, alapértelmezés [".pdf", ".txt", ".md"]
+        extensions: Fájlkiterjesztések listája; ha None, [".pdf", ".txt", ".md"]
+        manifest_path: A stat ujjlenyomatokat tároló JSON; None esetén minden fájlt hash-elünk
+        workers: Szálak száma a hash-eléshez
     
     Returns:
-        Dict-ek listája a következő kulcsokkal: doc_id, file_path, version_hash, file_size, extension
-    
-    Tervezési jegyzetek:
-    - A doc_id a relatív útvonalból származik (stabil marad a kb-data-n belüli mozgatásoknál)
-    - A version_hash segít felismerni a fájlfrissítéseket
-    - Felfedezési statisztikákat naplózunk az átláthatóságért
+        ScanResult: a dokumentumok (mint scan_kb_folder) és a változások a manifeszthez képest
     """
     if extensions is None:
         extensions = [".pdf", ".txt", ".md"]
     
     if not kb_dir.exists():
         logger.warning(f"KB folder does not exist: {kb_dir}")
-        return []
+        return ScanResult(documents=[])
     
+    manifest_path = Path(manifest_path) if manifest_path else None
+    previous = _load_manifest(manifest_path, kb_dir)
+    files: Dict[str, Dict[str, Any]] = {}
     discovered = []
+    to_hash = []
     for ext in extensions:
         for fpath in kb_dir.rglob(f"*{ext}"):
-            if not fpath.is_file():
+            st = fpath.stat()
+            if not stat.S_ISREG(st.st_mode):
                 continue
             
             # doc_id származtatása a relatív útvonalból ("/" helyett "_")
             # Miért: stabil azonosító; engedi a dokumentumok almappákba rendezését
             relative = fpath.relative_to(kb_dir)
             doc_id = str(relative).replace("/", "_").replace("\\", "_")
+            key = relative.as_posix()
             
-            version_hash = compute_file_hash(fpath)
+            entry = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "inode": st.st_ino}
+            old = previous.get(key)
+            if old is not None and all(old.get(k) == v for k, v in entry.items()):
+                entry["version_hash"] = old["version_hash"]
+            else:
+                to_hash.append((fpath, entry))
+            files[key] = entry
             
             discovered.append({
                 "doc_id": doc_id,
                 "file_path": str(fpath),
-                "version_hash": version_hash,
-                "file_size": fpath.stat().st_size,
+                "version_hash": None,
+                "file_size": st.st_size,
                 "extension": ext,
+                "_key": key,
             })
     
-    logger.info(f"Scanned {kb_dir}: found {len(discovered)} documents")
-    return discovered
+    if to_hash:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(to_hash)))) as pool:
+            for (fpath, entry), digest in zip(to_hash, pool.map(compute_file_hash, [f for f, _ in to_hash])):
+                entry["version_hash"] = digest
+    
+    result = ScanResult(documents=discovered, hashed=len(to_hash))
+    for doc in discovered:
+        key = doc.pop("_key")
+        doc["version_hash"] = files[key]["version_hash"]
+        old = previous.get(key)
+        if old is None:
+            result.added.append(doc["doc_id"])
+        elif old["version_hash"] != doc["version_hash"]:
+            result.modified.append(doc["doc_id"])
+    result.deleted = [
+        key.replace("/", "_") for key in previous if key not in files
+    ]
+    
+    if manifest_path is not None and (files != previous):
+        _save_manifest(manifest_path, kb_dir, files)
+    
+    logger.info(
+        f"Scanned {kb_dir}: found {len(discovered)} documents "
+        f"({len(result.added)} added, {len(result.modified)} modified, "
+        f"{len(result.deleted)} deleted, {result.hashed} hashed)"
+    )
+    return result
+
+
+def scan_kb_folder(
+    kb_dir: Path,
+    extensions: List[str] = None,
+    manifest_path: Optional[Path] = None,
+    workers: int = 8,
+) -> List[Dict[str, Any]]:
+    """Beolvassa a tudástár mappát és metaadatot ad vissza minden talált fájlhoz.
+    
+    Args:
+        kb_dir: Útvonal a tudástár adatkönyvtárhoz
+        extensions: Fájlkiterjesztések listája (pl. [".pdf", ".txt", ".md"]);
+                   ha None, alapértelmezés [".pdf", ".txt", ".md"]
+        manifest_path: opcionális manifeszt a változatlan fájlok hash-elésének kihagyásához
+        workers: Szálak száma a hash-eléshez
+    
+    Returns:
+        Dict-ek listája a következő kulcsokkal: doc_id, file_path, version_hash, file_size, extension
+    
+    Tervezési jegyzetek:
+    - A doc_id a relatív útvonalból származik (stabil marad a kb-data-n belüli mozgatásoknál)
+    - A version_hash segít felismerni a fájlfrissítéseket
+    - Felfedezési statisztikákat naplózunk az átláthatóságért
+    """
+    return scan_kb_changes(kb_dir, extensions, manifest_path, workers).documents
@@ -86,21 +86,30 @@ class VersionStore:
         old_hash = self.get_version(doc_id)
         return old_hash is None or old_hash != new_hash
     
-    def update(self, doc_id: str, version_hash: str, file_path: str, chunk_count: int) -> None:
-        """Frissíti egy dokumentum verzióinformációit."""
+    def update(self, doc_id: str, version_hash: str, file_path: str, chunk_count: int, save: bool = True) -> None:
+        """Frissíti egy dokumentum verzióinformációit.
+        
+        save=False esetén csak memóriában; több frissítés után egy flush() ment.
+        """
         self._data[doc_id] = {
             "version_hash": version_hash,
             "last_indexed": datetime.now(timezone.utc).isoformat(),
             "file_path": file_path,
             "chunk_count": chunk_count,
         }
+        if save:
+            self._save()
+    
+    def flush(self) -> None:
+        """A memóriabeli állapot lemezre mentése."""
         self._save()
     
-    def remove(self, doc_id: str) -> None:
+    def remove(self, doc_id: str, save: bool = True) -> None:
         """Eltávolít egy dokumentumot a verziókövetésből."""
         if doc_id in self._data:
             del self._data[doc_id]
-            self._save()
+            if save:
+                self._save()
     
     def get_all_doc_ids(self) -> list[str]:
         """Visszaadja az összes követett doc_id-t."""
@@ -1,53 +1,122 @@
 """Háttérfeladat-kezelő újraindexeléshez állapotkövetéssel.
 
 Tervezés:
-- ThreadPoolExecutor futtatja a reindex feladatokat háttérben (egyszerű és megbízható
-  demóhoz). A feladatok memóriában tárolódnak státusszal és eredmény metaadatokkal.
-- API: start_reindex(callable) -> job_id, get_status(job_id) -> dict
+- ThreadPoolExecutor futtatja a reindex feladatokat háttérben; maga a betöltési
+  pipeline folyamatkészlettel dolgozik, így a feladatszálak száma kicsi maradhat.
+- A feladat egy JobHandle-t kap: ezen jelenti a lépcsőnkénti haladást, és ezen
+  figyeli a megszakítást (cancel_event).
+- Megszakított vagy hibás feladat folytatható (resume), ha induláskor megadták a
+  folytató függvényt (pl. teljes újraindexelésnél az inkrementális betöltést).
+- A befejezett feladatok rekordjai ttl_seconds után, illetve max_jobs felett
+  (a legrégebbiek) törlődnek, így a nyilvántartás nem nő korlátlanul.
+- API: start_reindex(callable) -> job_id, start_job(fn, resume_fn) -> job_id,
+  cancel(job_id), resume(job_id) -> új job_id, get_status(job_id) -> dict
 
 Megjegyzés: szándékosan kicsi; élesben érdemes valódi feladatsort használni
 (Redis/DB + worker folyamatok).
 """
-from concurrent.futures import ThreadPoolExecutor, Future
-from typing import Callable, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Optional
+import threading
 import uuid
 import time
 
+FINISHED_STATES = ("finished", "failed", "cancelled")
+
+
+class JobHandle:
+    """A futó feladatnak átadott kezelő: haladás jelentése és megszakítás figyelése."""
+
+    def __init__(self):
+        self.cancel_event = threading.Event()
+        self.stages: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def progress(self, stage: str, done: int, total: int) -> None:
+        entry = self.stages.setdefault(stage, {"started_at": time.time()})
+        entry["done"] = done
+        entry["total"] = total
+        entry["updated_at"] = time.time()
+
 
 class ReindexJobManager:
-    def __init__(self, max_workers: int = 1):
+    def __init__(self, max_workers: int = 2, max_jobs: int = 100, ttl_seconds: float = 3600):
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
-        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.max_jobs = max_jobs
+        self.ttl_seconds = ttl_seconds
+        self.jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
 
     def start_reindex(self, fn: Callable[..., Dict[str, Any]], *args, **kwargs) -> str:
+        """Egyszerű feladat indítása (a függvény nem kap JobHandle-t)."""
+        return self.start_job(lambda job: fn(*args, **kwargs))
+
+    def start_job(
+        self,
+        fn: Callable[[JobHandle], Dict[str, Any]],
+        resume_fn: Optional[Callable[[JobHandle], Dict[str, Any]]] = None,
+        resumed_from: Optional[str] = None,
+    ) -> str:
+        """Feladat indítása; fn(job) a JobHandle-en jelent haladást és figyeli a megszakítást."""
         job_id = str(uuid.uuid4())
-        started_at = time.time()
-        future: Future = self.executor.submit(fn, *args, **kwargs)
-        self.jobs[job_id] = {
-            "future": future,
-            "status": "running",
-            "created_at": started_at,
-            "started_at": started_at,
-            "finished_at": None,
-            "result": None,
-            "error": None,
-        }
+        with self._lock:
+            self.jobs[job_id] = {
+                "handle": JobHandle(),
+                "resume_fn": resume_fn,
+                "resumed_from": resumed_from,
+                "status": "queued",
+                "created_at": time.time(),
+                "started_at": None,
+                "finished_at": None,
+                "result": None,
+                "error": None,
+            }
+            self._expire(time.time())
+        self.executor.submit(self._run, job_id, fn)
+        return job_id
 
-        def _cb(fut: Future):
+    def _run(self, job_id: str, fn: Callable[[JobHandle], Dict[str, Any]]) -> None:
+        job = self.jobs[job_id]
+        handle: JobHandle = job["handle"]
+        if not handle.cancelled:
+            job["status"] = "running"
+            job["started_at"] = time.time()
             try:
-                res = fut.result()
-                self.jobs[job_id]["status"] = "finished"
-                self.jobs[job_id]["result"] = res
-                self.jobs[job_id]["finished_at"] = time.time()
+                job["result"] = fn(handle)
             except Exception as e:
-                self.jobs[job_id]["status"] = "failed"
-                self.jobs[job_id]["error"] = str(e)
-                self.jobs[job_id]["finished_at"] = time.time()
+                # megszakításkor a részleges statisztika a kivételben érkezhet
+                job["result"] = getattr(e, "stats", None)
+                if not handle.cancelled:
+                    job["error"] = str(e)
+        job["finished_at"] = time.time()
+        if handle.cancelled:
+            job["status"] = "cancelled"
+        else:
+            job["status"] = "failed" if job["error"] else "finished"
 
-        future.add_done_callback(_cb)
-        return job_id
+    def cancel(self, job_id: str) -> bool:
+        """Megszakítás kérése; False, ha a feladat nem létezik vagy már véget ért."""
+        job = self.jobs.get(job_id)
+        if not job or job["status"] in FINISHED_STATES:
+            return False
+        job["handle"].cancel_event.set()
+        job["status"] = "cancelling"
+        return True
+
+    def resume(self, job_id: str) -> Optional[str]:
+        """Megszakított/hibás feladat folytatása új feladatként; None, ha nem folytatható."""
+        job = self.jobs.get(job_id)
+        if not job or job["status"] not in ("cancelled", "failed") or job["resume_fn"] is None:
+            return None
+        return self.start_job(job["resume_fn"], resume_fn=job["resume_fn"], resumed_from=job_id)
 
     def get_status(self, job_id: str) -> Dict[str, Any]:
+        with self._lock:
+            self._expire(time.time())
         j = self.jobs.get(job_id)
         if not j:
             return {"status": "not_found"}
@@ -58,9 +127,42 @@ class ReindexJobManager:
             "finished_at": j.get("finished_at"),
             "result": j.get("result"),
             "error": j.get("error"),
+            "progress": self._progress(j["handle"]),
+            "resumable": j["status"] in ("cancelled", "failed") and j["resume_fn"] is not None,
+            "resumed_from": j.get("resumed_from"),
         }
         return info
 
+    @staticmethod
+    def _progress(handle: JobHandle) -> Dict[str, Dict[str, Any]]:
+        """Lépcsőnkénti haladás és átvitel (elem/s a lépcső első jelentése óta)."""
+        progress = {}
+        for stage, entry in list(handle.stages.items()):
+            elapsed = entry["updated_at"] - entry["started_at"]
+            progress[stage] = {
+                "done": entry["done"],
+                "total": entry["total"],
+                "per_second": round(entry["done"] / elapsed, 2) if elapsed > 0 else None,
+            }
+        return progress
+
+    def _expire(self, now: float) -> None:
+        """A lejárt, illetve a max_jobs feletti legrégebbi befejezett rekordok törlése."""
+        finished = [
+            job_id for job_id, j in self.jobs.items()
+            if j["status"] in FINISHED_STATES
+        ]
+        for job_id in finished:
+            if now - self.jobs[job_id]["finished_at"] > self.ttl_seconds:
+                del self.jobs[job_id]
+        excess = len(self.jobs) - self.max_jobs
+        for job_id in finished:
+            if excess <= 0:
+                break
+            if job_id in self.jobs:
+                del self.jobs[job_id]
+                excess -= 1
+
 
 # singleton manager az alkalmazáshoz
 manager = ReindexJobManager()
@@ -70,7 +70,11 @@ class DenseRetriever:
         if any(e is None for e in embeddings):
             if not self.embedder:
                 raise RuntimeError("Embeddings missing and no embedder provided")
-            embeddings = [e if e is not None else self.embedder.embed_text(doc) for e, doc in zip(embeddings, documents)]
+            missing = [i for i, e in enumerate(embeddings) if e is None]
+            computed = self.embedder.embed_batch([documents[i] for i in missing])
+            embeddings = list(embeddings)
+            for i, e in zip(missing, computed):
+                embeddings[i] = e
         self.collection.upsert(ids=ids, metadatas=metadatas, documents=documents, embeddings=embeddings)
 
     def delete_chunks(self, ids: List[str]):
@@ -0,0 +1,242 @@
+"""Cserélhető rangfúziós stratégiák a hibrid keresőhöz.
+
+A sűrű (koszinusz) és a ritka (BM25) pontszámok más skálán mozognak, ezért
+összevonás előtt egységes skálára hozzuk őket. Stratégiák:
+
+- minmax: min-max normalizálás [0, 1]-re, majd súlyozott összeg (alapértelmezés,
+  a korábbi viselkedés)
+- zscore: standardizálás (z-pont), majd szigmoid; kevésbé érzékeny egy-egy
+  kiugró pontszámra
+- rrf: Reciprocal Rank Fusion (w / (rrf_k + rang)); csak a rangsort használja,
+  a nyers pontszámok skálája nem számít
+- learned: logisztikus regresszió a min-max jellemzőkön, a golden halmazon
+  tanítva (rag.eval.benchmark --fit-learned); az eredmény relevancia-valószínűség
+
+A küszöb (threshold) stratégiánként mást jelent, ezért váltáskor a benchmarkkal
+érdemes újrahangolni. Minden stratégia azonos alakú bejegyzéseket ad vissza:
+{id, score_vector, score_sparse, score_final, document, metadata}, ahol a
+score_vector/score_sparse a normalizált részpontszám.
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+import json
+import logging
+import math
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _min_max_norm(scores: List[float]):
+    """Min-max normalize a list of scores.
+
+    Why min-max? It's simple and keeps the range [0,1] which plays nicely with
+    weighted combinations. Alternative (z-score) could be more robust to
+    outliers but introduces negative values and depends on distribution.
+    Tradeoff: min-max is sensitive to extremes so we guard the constant case.
+    """
+    if not scores:
+        return []
+    mn = min(scores)
+    mx = max(scores)
+    if math.isclose(mx, mn):
+        return [1.0 for _ in scores]
+    return [(s - mn) / (mx - mn) for s in scores]
+
+
+def _sigmoid(x: float) -> float:
+    return 1.0 / (1.0 + math.exp(-x))
+
+
+class Candidates:
+    """A két kereső eredményeinek azonosító szerinti összevonása (beszúrási sorrendben)."""
+
+    def __init__(self, dense_res: Sequence[Dict], sparse_res: Sequence[Dict]):
+        self.by_id: Dict[str, Dict] = {}
+        self.dense_rank: Dict[str, int] = {}
+        self.sparse_rank: Dict[str, int] = {}
+        for rank, r in enumerate(dense_res, start=1):
+            entry = self.by_id.setdefault(r["id"], {})
+            entry.update({"score_vector": r.get("score_vector", 0), "document": r.get("document"), "metadata": r.get("metadata")})
+            self.dense_rank.setdefault(r["id"], rank)
+        for rank, r in enumerate(sparse_res, start=1):
+            entry = self.by_id.setdefault(r["id"], {})
+            entry["score_sparse"] = r.get("score_sparse", 0)
+            entry.setdefault("document", r.get("document"))
+            if entry.get("metadata") is None:
+                entry["metadata"] = r.get("metadata")
+            self.sparse_rank.setdefault(r["id"], rank)
+        self.ids = list(self.by_id)
+
+    def raw(self, key: str) -> List[Optional[float]]:
+        """Nyers pontszámok azonosítónként; None, ha az adott kereső nem adta vissza."""
+        return [self.by_id[_id].get(key) for _id in self.ids]
+
+    def min_max_features(self) -> Tuple[List[float], List[float]]:
+        """Min-max normalizált (sűrű, ritka) pontszámok; a hiányzó pontszám 0 (nyers)."""
+        dense = _min_max_norm([s if s is not None else 0 for s in self.raw("score_vector")])
+        sparse = _min_max_norm([s if s is not None else 0 for s in self.raw("score_sparse")])
+        return dense, sparse
+
+    def entries(self, dense_part: List[float], sparse_part: List[float], final: List[float]) -> List[Dict]:
+        """Pontszám szerint csökkenő bejegyzéslista; egyenlőségnél a beszúrási sorrend dönt."""
+        merged = []
+        for idx, _id in enumerate(self.ids):
+            item = self.by_id[_id]
+            merged.append({
+                "id": _id,
+                "score_vector": dense_part[idx],
+                "score_sparse": sparse_part[idx],
+                "score_final": final[idx],
+                "document": item.get("document"),
+                "metadata": item.get("metadata"),
+            })
+        merged.sort(key=lambda x: x["score_final"], reverse=True)
+        return merged
+
+
+class FusionStrategy:
+    """Fúziós stratégia interfésze."""
+
+    name = ""
+
+    def fuse(self, dense_res: Sequence[Dict], sparse_res: Sequence[Dict], w_dense: float, w_sparse: float) -> List[Dict]:
+        raise NotImplementedError
+
+
+class MinMaxFusion(FusionStrategy):
+    name = "minmax"
+
+    def fuse(self, dense_res, sparse_res, w_dense, w_sparse):
+        cands = Candidates(dense_res, sparse_res)
+        dense, sparse = cands.min_max_features()
+        final = [w_dense * ds + w_sparse * ss for ds, ss in zip(dense, sparse)]
+        return cands.entries(dense, sparse, final)
+
+
+class ZScoreFusion(FusionStrategy):
+    """z-pont a visszaadott pontszámokon, szigmoiddal (0, 1)-be képezve; a hiányzó pontszám 0."""
+
+    name = "zscore"
+
+    @staticmethod
+    def _normalize(scores: List[Optional[float]]) -> List[float]:
+        present = [s for s in scores if s is not None]
+        if not present:
+            return [0.0 for _ in scores]
+        mean = sum(present) / len(present)
+        std = math.sqrt(sum((s - mean) ** 2 for s in present) / len(present))
+        return [
+            0.0 if s is None else _sigmoid((s - mean) / std if std > 1e-12 else 0.0)
+            for s in scores
+        ]
+
+    def fuse(self, dense_res, sparse_res, w_dense, w_sparse):
+        cands = Candidates(dense_res, sparse_res)
+        dense = self._normalize(cands.raw("score_vector"))
+        sparse = self._normalize(cands.raw("score_sparse"))
+        final = [w_dense * ds + w_sparse * ss for ds, ss in zip(dense, sparse)]
+        return cands.entries(dense, sparse, final)
+
+
+class RRFFusion(FusionStrategy):
+    """Reciprocal Rank Fusion, (rrf_k + 1)-gyel skálázva: mindkét listán első hely = w_dense + w_sparse."""
+
+    name = "rrf"
+
+    def __init__(self, rrf_k: int = 60):
+        self.rrf_k = rrf_k
+
+    def _part(self, ranks: Dict[str, int], _id: str) -> float:
+        rank = ranks.get(_id)
+        return 0.0 if rank is None else (self.rrf_k + 1) / (self.rrf_k + rank)
+
+    def fuse(self, dense_res, sparse_res, w_dense, w_sparse):
+        cands = Candidates(dense_res, sparse_res)
+        dense = [self._part(cands.dense_rank, _id) for _id in cands.ids]
+        sparse = [self._part(cands.sparse_rank, _id) for _id in cands.ids]
+        final = [w_dense * ds + w_sparse * ss for ds, ss in zip(dense, sparse)]
+        return cands.entries(dense, sparse, final)
+
+
+class LearnedFusion(FusionStrategy):
+    """Tanult súlyok: sigmoid(bias + w_dense * ds + w_sparse * ss) a min-max jellemzőkön.
+
+    A súlyokat a weights_path JSON fájlból töltjük; ha még nincs tanítva, a
+    konfigurált súlyokkal min-max fúzióként viselkedik.
+    """
+
+    name = "learned"
+
+    def __init__(self, weights_path: Optional[str] = None):
+        self.weights_path = Path(weights_path) if weights_path else None
+        self.weights: Optional[Dict[str, float]] = None
+        if self.weights_path is not None and self.weights_path.exists():
+            self.weights = json.loads(self.weights_path.read_text(encoding="utf-8"))
+            logger.info(f"Loaded fusion weights from {self.weights_path}")
+
+    @property
+    def fitted(self) -> bool:
+        return self.weights is not None
+
+    def features(self, dense_res, sparse_res) -> Tuple[Candidates, np.ndarray]:
+        cands = Candidates(dense_res, sparse_res)
+        dense, sparse = cands.min_max_features()
+        return cands, np.array([dense, sparse], dtype=float).T.reshape(-1, 2)
+
+    def fuse(self, dense_res, sparse_res, w_dense, w_sparse):
+        cands, x = self.features(dense_res, sparse_res)
+        dense, sparse = x[:, 0].tolist(), x[:, 1].tolist()
+        if self.weights is None:
+            final = [w_dense * ds + w_sparse * ss for ds, ss in zip(dense, sparse)]
+        else:
+            w = self.weights
+            final = [_sigmoid(w["bias"] + w["w_dense"] * ds + w["w_sparse"] * ss) for ds, ss in zip(dense, sparse)]
+        return cands.entries(dense, sparse, final)
+
+    def fit(self, x: np.ndarray, y: np.ndarray, l2: float = 1e-2, lr: float = 0.5, epochs: int = 2000) -> Dict[str, float]:
+        """Logisztikus regresszió gradiensmódszerrel.
+
+        x: (n, 2) min-max jellemzők (features()), y: 1, ha a jelölt releváns, különben 0.
+        Az osztályokat kiegyensúlyozzuk, mert jelöltlistánként tipikusan egy pozitív van.
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if x.size == 0 or y.min() == y.max():
+            raise ValueError("fitting needs both relevant and non-relevant candidates")
+        pos = y.sum()
+        sample_w = np.where(y == 1, len(y) / (2 * pos), len(y) / (2 * (len(y) - pos)))
+        w = np.zeros(2)
+        b = 0.0
+        for _ in range(epochs):
+            p = 1.0 / (1.0 + np.exp(-(x @ w + b)))
+            err = (p - y) * sample_w
+            w -= lr * (x.T @ err / len(y) + l2 * w)
+            b -= lr * err.mean()
+        self.weights = {"w_dense": float(w[0]), "w_sparse": float(w[1]), "bias": float(b), "trained_on": int(len(y))}
+        return self.weights
+
+    def save(self, path: Optional[str] = None) -> None:
+        target = Path(path) if path else self.weights_path
+        if target is None or self.weights is None:
+            raise ValueError("nothing to save or no weights path configured")
+        target.write_text(json.dumps(self.weights, indent=2), encoding="utf-8")
+
+
+FUSION_STRATEGIES = ("minmax", "zscore", "rrf", "learned")
+
+
+def create_fusion(name: str, config=None) -> FusionStrategy:
+    """Stratégia létrehozása név alapján; a config opcionális mezőit getattr-ral olvassuk."""
+    name = (name or "minmax").lower()
+    if name == "minmax":
+        return MinMaxFusion()
+    if name == "zscore":
+        return ZScoreFusion()
+    if name == "rrf":
+        return RRFFusion(rrf_k=getattr(config, "rrf_k", 60))
+    if name == "learned":
+        return LearnedFusion(getattr(config, "fusion_weights_path", "") or None)
+    raise ValueError(f"Unknown fusion strategy: {name} (expected one of {', '.join(FUSION_STRATEGIES)})")
@@ -1,72 +1,87 @@
 """Hibrid kereső, amely egyesíti a sűrű és ritka pontszámokat, majd küszöböt alkalmaz.
 
-Ez a modul végzi a pontszámok normalizálását és a végső pontszám számítását
-konfigurálható súlyokkal. Tartalmazza a 'no_hit' logikát is a visszalépéshez.
-"""
-from typing import List, Dict, Any
-import math
-
+A sűrű és a ritka lekérdezés párhuzamosan fut (a sűrű egy háttérszálon, a ritka
+a hívó szálán), így a késleltetés a lassabbik kereső ideje, nem a kettő összege.
+Az összevonást cserélhető fúziós stratégia végzi (rag.retrieval.fusion:
+minmax, zscore, rrf, learned), konfigurálható súlyokkal. Tartalmazza a 'no_hit'
+logikát is a visszalépéshez.
 
-def _min_max_norm(scores: List[float]):
-    """Min-max normalize a list of scores.
+A keresők candidate_k mélységig adnak jelölteket (a rangfúzió mélyebb listákból
+pontosabb), de a válasz topk listája legfeljebb k elemű.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
+import threading
+import time
 
-    Why min-max? It's simple and keeps the range [0,1] which plays nicely with
-    weighted combinations. Alternative (z-score) could be more robust to
-    outliers but introduces negative values and depends on distribution.
-    Tradeoff: min-max is sensitive to extremes so we guard the constant case.
-    """
-    if not scores:
-        return []
-    mn = min(scores)
-    mx = max(scores)
-    if math.isclose(mx, mn):
-        return [1.0 for _ in scores]
-    return [(s - mn) / (mx - mn) for s in scores]
+from .fusion import FusionStrategy, create_fusion
 
 
 class HybridRetriever:
-    def __init__(self, dense_retriever, sparse_retriever, config):
+    def __init__(self, dense_retriever, sparse_retriever, config, fusion: Optional[FusionStrategy] = None):
+        """fusion: fúziós stratégia; alapértelmezetten a config.fusion név alapján (minmax)."""
         self.dense = dense_retriever
         self.sparse = sparse_retriever
         self.config = config
+        self.fusion = fusion or create_fusion(getattr(config, "fusion", "minmax"), config)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
 
-    def retrieve(self, query_embedding, query_text, k=None, filters=None):
+    def candidates(self, query_embedding, query_text, k=None, filters=None):
+        """Jelöltek a két keresőből: (dense_res, sparse_res, időmérések másodpercben)."""
         k = k or self.config.k
-        dense_res = self.dense.query(query_embedding, k=k, filters=filters)
-        sparse_res = self.sparse.query(query_text, k=k)
+        depth = max(k, getattr(self.config, "candidate_k", 0) or 0)
+        timings = {}
 
-        # Eredmények csoportosítása azonosító alapján az összevonáshoz
-        by_id = {}
-        for i, r in enumerate(dense_res):
-            _id = r["id"]
-            by_id.setdefault(_id, {}).update({"score_vector": r.get("score_vector", 0), "document": r.get("document"), "metadata": r.get("metadata")})
-        for i, r in enumerate(sparse_res):
-            _id = r["id"]
-            by_id.setdefault(_id, {}).update({"score_sparse": r.get("score_sparse", 0), "document": r.get("document")})
+        def run_dense():
+            start = time.perf_counter()
+            res = self.dense.query(query_embedding, k=depth, filters=filters)
+            timings["dense_s"] = time.perf_counter() - start
+            return res
 
-        ids = list(by_id.keys())
-        dense_scores = [by_id[_id].get("score_vector", 0) for _id in ids]
-        sparse_scores = [by_id[_id].get("score_sparse", 0) for _id in ids]
+        if getattr(self.config, "parallel_retrieval", True):
+            future = self._pool().submit(run_dense)
+            start = time.perf_counter()
+            try:
+                sparse_res = self.sparse.query(query_text, k=depth)
+            finally:
+                # a sűrű lekérdezés hibáját is továbbadjuk, ha a ritka sikeres volt
+                timings["sparse_s"] = time.perf_counter() - start
+                dense_res = future.result()
+        else:
+            dense_res = run_dense()
+            start = time.perf_counter()
+            sparse_res = self.sparse.query(query_text, k=depth)
+            timings["sparse_s"] = time.perf_counter() - start
+        return dense_res, sparse_res, timings
 
-        dense_norm = _min_max_norm(dense_scores)
-        sparse_norm = _min_max_norm(sparse_scores)
-
-        merged = []
-        for idx, _id in enumerate(ids):
-            ds = dense_norm[idx] if idx < len(dense_norm) else 0
-            ss = sparse_norm[idx] if idx < len(sparse_norm) else 0
-            final = self.config.w_dense * ds + self.config.w_sparse * ss
-            entry = {"id": _id, "score_vector": ds, "score_sparse": ss, "score_final": final, "document": by_id[_id].get("document"), "metadata": by_id[_id].get("metadata")}
-            merged.append(entry)
+    def retrieve(self, query_embedding, query_text, k=None, filters=None, fusion: Optional[FusionStrategy] = None) -> Dict[str, Any]:
+        """fusion: hívásonkénti stratégia-felülírás (pl. a benchmarkhoz)."""
+        k = k or self.config.k
+        fusion = fusion or self.fusion
+        dense_res, sparse_res, timings = self.candidates(query_embedding, query_text, k=k, filters=filters)
 
-        merged.sort(key=lambda x: x["score_final"], reverse=True)
+        start = time.perf_counter()
+        merged = fusion.fuse(dense_res, sparse_res, self.config.w_dense, self.config.w_sparse)
+        timings["fusion_s"] = time.perf_counter() - start
+        topk = merged[:k]
 
         # küszöblogika
-        if not merged or merged[0]["score_final"] < self.config.threshold:
-            return {"hits": [], "decision": "no_hit", "topk": merged}
-        return {"hits": merged[:k], "decision": "hit", "topk": merged}
+        result = {"hits": topk, "decision": "hit", "topk": topk, "fusion": fusion.name, "timings": timings}
+        if not topk or topk[0]["score_final"] < self.config.threshold:
+            result.update(hits=[], decision="no_hit")
+        return result
 
+    def _pool(self) -> ThreadPoolExecutor:
+        # lusta létrehozás: a tesztek és szkriptek, amelyek nem keresnek, nem indítanak szálat
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="hybrid-dense")
+            return self._executor
 
-def _get(d, idx, key):
-    k = list(d.keys())[idx]
-    return d[k].get(key, 0)
+    def close(self) -> None:
+        """A háttérszálak leállítása (ha elindultak)."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
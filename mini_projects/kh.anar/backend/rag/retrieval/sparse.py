@@ -1,77 +1,259 @@
-"""Ritka kereső: minimalista BM25 burkoló.
+"""Ritka kereső: inkrementális invertált index BM25 pontozással.
 
-A rank_bm25-öt használjuk, ha elérhető; különben egy minimális, memóriában futó
-visszalépést használunk a tesztekhez. A BM25 lexikális egyezést ad és kiegészíti
-a sűrű keresést.
+A korábbi megoldás minden új darabnál újratokenizálta a teljes korpuszt és
+újraépítette a BM25Okapi objektumot, így a betöltés négyzetes volt. Itt
+kifejezésenként posting listát tartunk (darab-slot, kifejezés-gyakoriság),
+amit helyben bővítünk; a dokumentumgyakoriságot és az átlagos dokumentumhosszt
+futó összegként vezetjük.
+
+Tervezési jegyzetek:
+- Hozzáadás: O(a darab tokenjei), nincs korpusz-újraépítés.
+- Törlés: a slot sírkövet kap (alive=0), a df/hossz statisztikák azonnal
+  frissülnek; ha a törölt slotok aránya nagy, az index tömörítődik.
+- Lekérdezés: csak a lekérdezés kifejezéseinek posting listáit járjuk be,
+  numpy tömbökön pontozunk, és argpartition-nel választjuk ki a top-k-t.
+- Tartósság: opcionális JSON pillanatkép (atomikus írás), induláskor
+  visszatöltjük, így újraindítás után sem üres a ritka index.
+
+Pontozás: BM25 (k1=1.5, b=0.75) a Lucene-féle idf-fel
+(log(1 + (N - df + 0.5) / (df + 0.5))), ami mindig pozitív, így nincs szükség
+a rank_bm25 epsilon-korrekciójára, ami a teljes szókincs bejárását igényelné.
 """
-from typing import List, Dict, Optional
+from __future__ import annotations
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import List, Dict, Optional, Set, Tuple
+import json
+import logging
+import math
+import tempfile
+import threading
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
 
-try:
-    from rank_bm25 import BM25Okapi
-except Exception:
-    BM25Okapi = None
+# Tömörítés, ha legalább ennyi törölt slot van, és ez az összes slot negyede felett van
+_COMPACT_MIN_DELETED = 64
+_SNAPSHOT_VERSION = 1
+
+
+def _doc_key(chunk_id: str) -> Optional[str]:
+    """A darab dokumentum-azonosítója (a darabok neve doc_id:index)."""
+    doc_id, sep, _ = chunk_id.rpartition(":")
+    return doc_id if sep else None
 
 
 class SparseRetriever:
-    def __init__(self):
-        self.docs = []
-        self.doc_ids = []
-        self.metadatas = []
-        self.tokenized = []
-        self.bm25 = None
+    def __init__(self, snapshot_path: Optional[str] = None, k1: float = 1.5, b: float = 0.75):
+        """snapshot_path: opcionális pillanatkép-fájl; ha létezik, innen töltünk be,
+        és a save() ide ír.
+        """
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+        self._reset()
+        if self.snapshot_path is not None and self.snapshot_path.exists():
+            self.load()
+
+    def _reset(self) -> None:
+        # Slotonkénti adatok; törölt slotnál None
+        self.doc_ids: List[Optional[str]] = []
+        self.docs: List[Optional[str]] = []
+        self.metadatas: List[Optional[Dict]] = []
+        self._slots: Dict[str, int] = {}
+        self._by_doc: Dict[str, Set[str]] = {}
+        # kifejezés -> (slotok, gyakoriságok); a törölt slotok a tömörítésig bennmaradnak
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._df: Dict[str, int] = {}
+        self._doc_len = array("i")
+        self._alive = bytearray()
+        self._total_len = 0
+        self._deleted = 0
+        # (élő slotok, hossznormalizáló tag) gyorsítótára, módosításkor érvénytelen
+        self._derived: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self._slots)
 
     def add_chunk(self, chunk_id: str, text: str, metadata: Dict):
-        """Add a single chunk (used by KB indexer)."""
-        self.doc_ids.append(chunk_id)
-        self.docs.append(text)
-        self.metadatas.append(metadata)
-        self.tokenized = [d.split() for d in self.docs]
-        if BM25Okapi is not None:
-            self.bm25 = BM25Okapi(self.tokenized)
+        """Egy darab hozzáadása (meglévő azonosítónál felülírja)."""
+        with self._lock:
+            self._add(chunk_id, text, metadata)
 
     def add_chunks(self, chunks: List[Dict]):
-        """Add multiple chunks (legacy dict-based signature)."""
-        for c in chunks:
-            self.doc_ids.append(c["id"])
-            self.docs.append(c.get("text", ""))
-            self.metadatas.append(c.get("metadata", {}))
-        self.tokenized = [d.split() for d in self.docs]
-        if BM25Okapi is not None:
-            self.bm25 = BM25Okapi(self.tokenized)
-    
+        """Több darab hozzáadása egy lépésben (dict-alapú aláírás: id, text, metadata)."""
+        with self._lock:
+            for c in chunks:
+                self._add(c["id"], c.get("text", ""), c.get("metadata", {}))
+            self._maybe_compact()
+
     def delete_by_doc_id(self, doc_id: str):
         """Törli az adott dokumentumhoz tartozó összes darabot.
-        
-        doc_id prefix egyezést használ (a darabok neve doc_id:index).
+
+        A darabok neve doc_id:index; a dokumentumonkénti azonosítóhalmaz miatt
+        nem kell a teljes indexet bejárni.
         """
-        prefix = f"{doc_id}:"
-        # Megtartandó indexek keresése (amelyek nem kezdenek doc_id prefixszel)
-        keep_indices = [i for i, cid in enumerate(self.doc_ids) if not cid.startswith(prefix)]
-        
-        # Listák újraépítése
-        self.doc_ids = [self.doc_ids[i] for i in keep_indices]
-        self.docs = [self.docs[i] for i in keep_indices]
-        self.metadatas = [self.metadatas[i] for i in keep_indices]
-        self.tokenized = [d.split() for d in self.docs]
-        if BM25Okapi is not None:
-            self.bm25 = BM25Okapi(self.tokenized) if self.tokenized else None
+        with self._lock:
+            for chunk_id in self._by_doc.pop(doc_id, set()):
+                self._remove(chunk_id)
+            self._maybe_compact()
+
+    def _add(self, chunk_id: str, text: str, metadata: Dict) -> None:
+        if chunk_id in self._slots:
+            self._remove(chunk_id)
+        slot = len(self.doc_ids)
+        tokens = text.split()
+        self.doc_ids.append(chunk_id)
+        self.docs.append(text)
+        self.metadatas.append(metadata)
+        self._doc_len.append(len(tokens))
+        self._alive.append(1)
+        self._total_len += len(tokens)
+        for term, tf in Counter(tokens).items():
+            posting = self._postings.get(term)
+            if posting is None:
+                posting = self._postings[term] = (array("i"), array("i"))
+            posting[0].append(slot)
+            posting[1].append(tf)
+            self._df[term] = self._df.get(term, 0) + 1
+        self._slots[chunk_id] = slot
+        doc_id = _doc_key(chunk_id)
+        if doc_id is not None:
+            self._by_doc.setdefault(doc_id, set()).add(chunk_id)
+        self._derived = None
+
+    def _remove(self, chunk_id: str) -> None:
+        slot = self._slots.pop(chunk_id)
+        for term in set(self.docs[slot].split()):
+            df = self._df[term] - 1
+            if df:
+                self._df[term] = df
+            else:
+                del self._df[term]
+        self._total_len -= self._doc_len[slot]
+        self._alive[slot] = 0
+        self.doc_ids[slot] = self.docs[slot] = self.metadatas[slot] = None
+        self._deleted += 1
+        doc_id = _doc_key(chunk_id)
+        if doc_id in self._by_doc:
+            self._by_doc[doc_id].discard(chunk_id)
+            if not self._by_doc[doc_id]:
+                del self._by_doc[doc_id]
+        self._derived = None
+
+    def _maybe_compact(self) -> None:
+        """A törölt slotok eltávolítása, ha már a slotok negyedét teszik ki."""
+        if self._deleted < _COMPACT_MIN_DELETED or self._deleted * 4 < len(self.doc_ids):
+            return
+        live = [
+            (cid, doc, meta)
+            for cid, doc, meta in zip(self.doc_ids, self.docs, self.metadatas)
+            if cid is not None
+        ]
+        self._reset()
+        for cid, doc, meta in live:
+            self._add(cid, doc, meta)
+
+    def _derived_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._derived is None:
+            live = np.flatnonzero(np.frombuffer(self._alive, dtype=np.uint8))
+            doc_len = np.array(self._doc_len, dtype=np.float64)
+            avgdl = self._total_len / len(self._slots) if self._slots else 0.0
+            norm = self.k1 * (1 - self.b + self.b * doc_len / (avgdl or 1.0))
+            self._derived = (live, norm)
+        return self._derived
 
     def query(self, query: str, k=5, filter_ids: Optional[List[str]] = None):
         query_tokens = query.split()
-        if self.bm25 is not None:
-            scores = self.bm25.get_scores(query_tokens)
-        else:
-            # naiv visszalépés: token átfedés számolása
-            scores = []
-            for tokens in self.tokenized:
-                overlap = len(set(tokens) & set(query_tokens))
-                scores.append(overlap)
-        scored = list(zip(self.doc_ids, self.docs, scores))
-        # szűrés alkalmazása, ha van
-        if filter_ids is not None:
-            scored = [s for s in scored if s[0] in filter_ids]
-        scored.sort(key=lambda x: x[2], reverse=True)
-        results = []
-        for doc_id, doc, score in scored[:k]:
-            results.append({"id": doc_id, "score_sparse": score, "document": doc})
-        return results
+        with self._lock:
+            n = len(self._slots)
+            if n == 0 or k <= 0:
+                return []
+            live, norm = self._derived_arrays()
+            if filter_ids is not None:
+                candidates = np.array(
+                    sorted({self._slots[i] for i in filter_ids if i in self._slots}), dtype=np.int64
+                )
+                if candidates.size == 0:
+                    return []
+            else:
+                candidates = live
+
+            scores = np.zeros(len(self.doc_ids))
+            for term in query_tokens:
+                df = self._df.get(term)
+                if not df:
+                    continue
+                idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+                slots_buf, tfs_buf = self._postings[term]
+                slots = np.frombuffer(slots_buf, dtype=np.intc)
+                tfs = np.frombuffer(tfs_buf, dtype=np.intc).astype(np.float64)
+                # a törölt slotok pontszáma nem számít, mert nincsenek a jelöltek között
+                scores[slots] += idf * tfs * (self.k1 + 1) / (tfs + norm[slots])
+                del slots, tfs
+
+            cand_scores = scores[candidates]
+            if k < candidates.size:
+                # a k-adik legnagyobb pontszámmal egyezők közül a korábban beszúrtak kerülnek be
+                kth = -np.partition(-cand_scores, k - 1)[k - 1]
+                above = np.flatnonzero(cand_scores > kth)
+                tied = np.flatnonzero(cand_scores == kth)[: k - above.size]
+                top = np.concatenate((above, tied))
+            else:
+                top = np.arange(candidates.size)
+            # csökkenő pontszám, azonos pontszámnál beszúrási sorrend
+            top = top[np.lexsort((candidates[top], -cand_scores[top]))]
+            return [
+                {
+                    "id": self.doc_ids[slot],
+                    "score_sparse": float(cand_scores[i]),
+                    "document": self.docs[slot],
+                }
+                for i, slot in zip(top.tolist(), candidates[top].tolist())
+            ]
+
+    def save(self, path: Optional[str] = None) -> None:
+        """Pillanatkép lemezre írása atomikusan (ideiglenes fájl + átnevezés).
+
+        Útvonal nélkül a snapshot_path-ot használja; ha az sincs, nem csinál semmit.
+        """
+        target = Path(path) if path else self.snapshot_path
+        if target is None:
+            return
+        with self._lock:
+            chunks = [
+                [cid, doc, meta]
+                for cid, doc, meta in zip(self.doc_ids, self.docs, self.metadatas)
+                if cid is not None
+            ]
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", delete=False, dir=str(target.parent), encoding="utf-8") as tf:
+                json.dump({"version": _SNAPSHOT_VERSION, "chunks": chunks}, tf, ensure_ascii=False, default=str)
+                tmp_path = tf.name
+            Path(tmp_path).replace(target)
+            logger.debug(f"Saved sparse index snapshot: {len(chunks)} chunks")
+        except Exception as e:
+            logger.error(f"Failed to save sparse index snapshot: {e}")
+
+    def load(self, path: Optional[str] = None) -> None:
+        """Pillanatkép betöltése; az index egyetlen lineáris menetben épül fel."""
+        source = Path(path) if path else self.snapshot_path
+        if source is None:
+            return
+        try:
+            with open(source, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != _SNAPSHOT_VERSION:
+                raise ValueError(f"unsupported snapshot version {data.get('version')!r}")
+        except Exception as e:
+            logger.error(f"Failed to load sparse index snapshot: {e}")
+            return
+        with self._lock:
+            self._reset()
+            for cid, doc, meta in data["chunks"]:
+                self._add(cid, doc, meta)
+        logger.info(f"Loaded sparse index snapshot: {len(self._slots)} chunks")
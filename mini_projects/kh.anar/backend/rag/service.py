@@ -42,10 +42,12 @@ class RAGService:
         res = self.hybrid.retrieve(embedding, norm_q, k=k or self.config.k, filters=filters)
         hybrid_end = time.time()
         telemetry["latency_retrieval_s"] = hybrid_end - hybrid_start
+        for name, seconds in res.get("timings", {}).items():
+            telemetry[f"latency_{name}"] = seconds
 
         telemetry["decision"] = res.get("decision")
         telemetry["topk"] = res.get("topk", [])
-        telemetry["config_snapshot"] = {"k": self.config.k, "threshold": self.config.threshold, "w_dense": self.config.w_dense, "w_sparse": self.config.w_sparse}
+        telemetry["config_snapshot"] = {"k": self.config.k, "threshold": self.config.threshold, "w_dense": self.config.w_dense, "w_sparse": self.config.w_sparse, "fusion": res.get("fusion")}
         telemetry["elapsed_s"] = time.time() - start
 
         # strukturált napló az átláthatóságért
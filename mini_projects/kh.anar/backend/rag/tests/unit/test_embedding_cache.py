@@ -0,0 +1,73 @@
+import numpy as np
+
+from rag.embeddings.cache import CachedEmbedder, EmbeddingCache
+from rag.embeddings.embedder import HashEmbedder
+from rag.embeddings.transformer_embedder import TransformerEmbedder
+
+
+class CountingEmbedder(HashEmbedder):
+    def __init__(self):
+        super().__init__()
+        self.encoded = []
+
+    def embed_batch(self, texts):
+        self.encoded.extend(texts)
+        return super().embed_batch(texts)
+
+
+class FakeModel:
+    """sentence-transformers helyettesítő: a szöveghossz a vektor első eleme."""
+
+    def __init__(self):
+        self.batches = []
+
+    def encode(self, texts, batch_size=32, show_progress_bar=False):
+        self.batches.append(list(texts))
+        return np.array([[float(len(t)), 1.0] for t in texts])
+
+
+def test_cached_embedder_encodes_each_text_once(tmp_path):
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(inner, EmbeddingCache(str(tmp_path)), namespace="hash-32")
+
+    first = embedder.embed_batch(["a", "b", "a"])
+    second = embedder.embed_batch(["b", "c"])
+
+    assert inner.encoded == ["a", "b", "c"]
+    assert first == HashEmbedder().embed_batch(["a", "b", "a"])
+    assert second[0] == first[1]
+    assert embedder.embed_text("c") == HashEmbedder().embed_text("c")
+    assert (embedder.hits, embedder.misses) == (2, 3)
+
+
+def test_query_embeddings_are_read_but_not_stored(tmp_path):
+    cache = EmbeddingCache(str(tmp_path))
+    embedder = CachedEmbedder(HashEmbedder(), cache, namespace="hash-32")
+    embedder.embed_batch(["chunk"])
+
+    assert embedder.embed_text("chunk") == HashEmbedder().embed_text("chunk")
+    assert embedder.embed_text("unique question") == HashEmbedder().embed_text("unique question")
+    assert len(cache) == 1
+    assert (embedder.hits, embedder.misses) == (1, 2)
+
+
+def test_cache_survives_restart_and_is_model_specific(tmp_path):
+    CachedEmbedder(HashEmbedder(), EmbeddingCache(str(tmp_path)), namespace="m1").embed_batch(["x", "y"])
+
+    inner = CountingEmbedder()
+    CachedEmbedder(inner, EmbeddingCache(str(tmp_path)), namespace="m1").embed_batch(["x", "y"])
+    assert inner.encoded == []
+
+    CachedEmbedder(inner, EmbeddingCache(str(tmp_path)), namespace="m2").embed_batch(["x"])
+    assert inner.encoded == ["x"]
+
+
+def test_transformer_embedder_batches_by_length():
+    model = FakeModel()
+    embedder = TransformerEmbedder(batch_size=2, model=model)
+    texts = ["ccc", "a", "dddd", "bb", "eeeee"]
+
+    vectors = embedder.embed_batch(texts)
+
+    assert [v[0] for v in vectors] == [3.0, 1.0, 4.0, 2.0, 5.0]
+    assert model.batches == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
@@ -0,0 +1,125 @@
+import json
+import threading
+
+import numpy as np
+import pytest
+
+from rag.config import RAGConfig
+from rag.eval import benchmark
+from rag.retrieval.fusion import LearnedFusion, MinMaxFusion, RRFFusion, ZScoreFusion, create_fusion
+from rag.retrieval.hybrid import HybridRetriever
+
+DENSE = [
+    {"id": "a:0", "score_vector": 0.9, "document": "A", "metadata": {"doc_id": "a"}},
+    {"id": "b:0", "score_vector": 0.5, "document": "B", "metadata": {"doc_id": "b"}},
+    {"id": "c:0", "score_vector": 0.1, "document": "C", "metadata": {"doc_id": "c"}},
+]
+SPARSE = [
+    {"id": "b:0", "score_sparse": 7.0, "document": "B"},
+    {"id": "d:0", "score_sparse": 2.0, "document": "D"},
+]
+
+
+def _ids(entries):
+    return [e["id"] for e in entries]
+
+
+def test_min_max_fusion_keeps_weighted_sum():
+    out = MinMaxFusion().fuse(DENSE, SPARSE, 0.7, 0.3)
+
+    assert _ids(out) == ["a:0", "b:0", "d:0", "c:0"]
+    by_id = {e["id"]: e for e in out}
+    # a hiányzó pontszám 0-nak számít a normalizálásban
+    assert by_id["a:0"]["score_final"] == pytest.approx(0.7)
+    assert by_id["b:0"]["score_final"] == pytest.approx(0.7 * 0.5 / 0.9 + 0.3)
+    assert by_id["b:0"]["metadata"] == {"doc_id": "b"}
+
+
+def test_z_score_and_rrf_scales():
+    z = {e["id"]: e for e in ZScoreFusion().fuse(DENSE[:1], SPARSE[:1], 0.5, 0.5)}
+    assert z["a:0"]["score_vector"] == pytest.approx(0.5)
+    assert z["b:0"]["score_vector"] == 0.0
+
+    rrf = RRFFusion(rrf_k=60).fuse(DENSE, SPARSE, 0.7, 0.3)
+    by_id = {e["id"]: e for e in rrf}
+    assert by_id["a:0"]["score_vector"] == pytest.approx(1.0)
+    assert by_id["b:0"]["score_final"] == pytest.approx(0.7 * 61 / 62 + 0.3)
+    assert _ids(rrf)[:2] == ["b:0", "a:0"]
+
+
+def test_learned_fusion_fit_save_and_load(tmp_path):
+    path = tmp_path / "weights.json"
+    fusion = LearnedFusion(str(path))
+    # tanítás előtt min-max fúzióként viselkedik
+    assert fusion.fuse(DENSE, SPARSE, 0.7, 0.3) == MinMaxFusion().fuse(DENSE, SPARSE, 0.7, 0.3)
+
+    x = np.array([[1.0, 0.0], [0.2, 1.0], [0.0, 0.3], [0.9, 0.1], [0.1, 0.9], [0.5, 0.0]])
+    y = np.array([0, 1, 0, 0, 1, 0])
+    weights = fusion.fit(x, y)
+    fusion.save()
+
+    assert weights["w_sparse"] > 0 > weights["w_dense"]
+    loaded = create_fusion("learned", RAGConfig(fusion_weights_path=str(path)))
+    assert json.loads(path.read_text()) == loaded.weights
+    assert _ids(loaded.fuse(DENSE, SPARSE, 0.7, 0.3))[0] == "b:0"
+    with pytest.raises(ValueError):
+        fusion.fit(x, np.zeros(6))
+    with pytest.raises(ValueError):
+        create_fusion("borda")
+
+
+class BlockingDense:
+    """Csak akkor válaszol, ha a ritka lekérdezés már elindult (párhuzamos futás nélkül elakadna)."""
+
+    def __init__(self, started):
+        self.started = started
+        self.depths = []
+
+    def query(self, embedding, k=5, filters=None):
+        self.depths.append(k)
+        assert self.started.wait(5), "dense query did not run concurrently with the sparse one"
+        return DENSE
+
+
+class SignallingSparse:
+    def __init__(self, started):
+        self.started = started
+
+    def query(self, query, k=5, filter_ids=None):
+        self.started.set()
+        return SPARSE
+
+
+def test_hybrid_runs_retrievers_concurrently_and_caps_topk():
+    started = threading.Event()
+    dense = BlockingDense(started)
+    config = RAGConfig(k=2, candidate_k=10, threshold=0.5, fusion="rrf")
+    hr = HybridRetriever(dense, SignallingSparse(started), config)
+    try:
+        out = hr.retrieve([0.1], "query")
+    finally:
+        hr.close()
+
+    assert dense.depths == [10]
+    assert out["fusion"] == "rrf"
+    assert _ids(out["topk"]) == _ids(out["hits"]) == ["b:0", "a:0"]
+    assert set(out["timings"]) == {"dense_s", "sparse_s", "fusion_s"}
+
+
+def test_benchmark_replays_golden_set(tmp_path, capsys):
+    golden = benchmark.load_golden()
+    hybrid, embedder = benchmark.build_index(golden, RAGConfig(embedder="hash"), tmp_path)
+    try:
+        metrics = benchmark.evaluate(hybrid, embedder, golden["cases"], create_fusion("minmax"), k=3)
+    finally:
+        hybrid.close()
+    assert metrics["recall@3"] == 1.0
+    assert 0 < metrics["mrr"] <= 1
+    assert metrics["p95_ms"] >= metrics["p50_ms"] > 0
+
+    weights = tmp_path / "weights.json"
+    assert benchmark.main(["--strategies", "minmax", "learned", "--fit-learned", "--weights-out", str(weights), "--repeat", "1", "--json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert set(report["strategies"]) == {"minmax", "learned"}
+    assert report["strategies"]["learned"]["fitted"]
+    assert json.loads(weights.read_text()) == report["learned_weights"]
@@ -0,0 +1,142 @@
+import threading
+import time
+
+import pytest
+
+from rag.config import RAGConfig
+from rag.embeddings.embedder import HashEmbedder
+from rag.ingestion.kb_indexer import KBIndexer
+from rag.ingestion.pipeline import IngestionCancelled
+from rag.ingestion.version_store import VersionStore
+from rag.jobs import ReindexJobManager
+from rag.retrieval.sparse import SparseRetriever
+
+
+class FakeDense:
+    def __init__(self):
+        self.storage = {}
+
+    def add_chunks(self, ids, embeddings, texts, metadatas):
+        for cid, emb in zip(ids, embeddings):
+            self.storage[cid] = emb
+
+    def delete_by_doc_id(self, doc_id):
+        for cid in [c for c in self.storage if c.startswith(f"{doc_id}:")]:
+            del self.storage[cid]
+
+
+def _indexer(tmp_path, n_docs, parse_workers=2):
+    kb_dir = tmp_path / "kb-data"
+    kb_dir.mkdir(exist_ok=True)
+    for i in range(n_docs):
+        (kb_dir / f"doc{i}.txt").write_text(f"document {i} " + "lorem ipsum " * 200, encoding="utf-8")
+    (kb_dir / "broken.md").write_bytes(b"\xff\xfe invalid utf-8")
+    config = RAGConfig(
+        kb_data_dir=str(kb_dir),
+        chunk_size=300,
+        chunk_overlap=20,
+        ingest_parse_workers=parse_workers,
+        ingest_queue_size=4,
+        ingest_embed_batch_size=8,
+    )
+    return KBIndexer(
+        config=config,
+        dense_retriever=FakeDense(),
+        sparse_retriever=SparseRetriever(),
+        embedder=HashEmbedder(),
+        version_store=VersionStore(tmp_path / "versions.json"),
+    )
+
+
+@pytest.mark.parametrize("parse_workers", [1, 2])
+def test_pipeline_indexes_all_documents(tmp_path, parse_workers):
+    indexer = _indexer(tmp_path, 6, parse_workers=parse_workers)
+    progress = []
+
+    stats = indexer.ingest_incremental(progress=lambda stage, done, total: progress.append((stage, done, total)))
+
+    assert stats["new"] == 7
+    assert stats["failed"] == ["broken.md"]
+    assert stats["total_chunks"] == len(indexer.dense.storage) == len(indexer.sparse) > 6
+    assert sorted(VersionStore(tmp_path / "versions.json").get_all_doc_ids()) == [f"doc{i}.txt" for i in range(6)]
+    assert ("write", 6, 7) in progress
+    assert stats["stages"]["parse"]["items"] == 6
+    # a hibás dokumentumot a következő futás újra megpróbálja
+    assert indexer.ingest_incremental()["new"] == 1
+
+
+def test_cancelled_full_reindex_resumes_incrementally(tmp_path):
+    cancel = threading.Event()
+    indexer = _indexer(tmp_path, 12)
+
+    # megszakítás az első írási köteg után
+    with pytest.raises(IngestionCancelled) as exc:
+        indexer.ingest_full_reindex(
+            progress=lambda stage, done, total: stage == "write" and cancel.set(),
+            cancel_event=cancel,
+        )
+
+    written = exc.value.stats["documents"]
+    assert 0 < written < 12
+    assert len(VersionStore(tmp_path / "versions.json").get_all_doc_ids()) == written
+
+    stats = indexer.ingest_incremental()
+    assert stats["new"] == 13 - written
+    assert len(VersionStore(tmp_path / "versions.json").get_all_doc_ids()) == 12
+
+
+def _wait(manager, job_id, states=("finished", "failed", "cancelled")):
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        info = manager.get_status(job_id)
+        if info["status"] in states:
+            return info
+        time.sleep(0.02)
+    raise AssertionError(f"job {job_id} did not finish: {info}")
+
+
+def test_job_progress_cancel_and_resume():
+    manager = ReindexJobManager()
+    release = threading.Event()
+
+    def job(handle):
+        for i in range(1, 4):
+            handle.progress("write", i, 3)
+            if i == 2:
+                release.wait(5)
+            if handle.cancelled:
+                raise RuntimeError("stopped")
+        return {"documents": 3}
+
+    job_id = manager.start_job(job, resume_fn=lambda handle: {"documents": 1})
+    while manager.get_status(job_id)["progress"].get("write", {}).get("done") != 2:
+        time.sleep(0.01)
+    assert manager.cancel(job_id)
+    release.set()
+
+    info = _wait(manager, job_id)
+    assert info["status"] == "cancelled"
+    assert info["error"] is None
+    assert info["resumable"]
+
+    resumed = manager.resume(job_id)
+    info = _wait(manager, resumed)
+    assert info == {**info, "status": "finished", "result": {"documents": 1}, "resumed_from": job_id}
+    assert manager.resume(resumed) is None
+    assert not manager.cancel(resumed)
+
+
+def test_finished_jobs_expire():
+    manager = ReindexJobManager(max_jobs=3, ttl_seconds=60)
+    ids = []
+    for _ in range(5):
+        ids.append(manager.start_reindex(lambda: {"ok": True}))
+        _wait(manager, ids[-1])
+
+    assert list(manager.jobs) == ids[-3:]
+    assert manager.get_status(ids[0]) == {"status": "not_found"}
+
+    for job in manager.jobs.values():
+        job["finished_at"] -= 120
+    assert manager.get_status(ids[-1]) == {"status": "not_found"}
+    assert not manager.jobs
@@ -0,0 +1,97 @@
+import math
+
+from rag.retrieval.sparse import SparseRetriever
+
+
+def _chunks(n, doc="d"):
+    words = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta"]
+    return [
+        {"id": f"{doc}{i // 3}:{i % 3}", "text": " ".join(words[j % len(words)] for j in range(i, i + 4 + i % 5)), "metadata": {"i": i}}
+        for i in range(n)
+    ]
+
+
+def _reference_scores(chunks, query, k1=1.5, b=0.75):
+    # egyszerű, nem inkrementális BM25 referencia ugyanazzal az idf-fel
+    tokenized = {c["id"]: c["text"].split() for c in chunks}
+    n = len(tokenized)
+    avgdl = sum(len(t) for t in tokenized.values()) / n
+    scores = {}
+    for cid, tokens in tokenized.items():
+        score = 0.0
+        for term in query.split():
+            df = sum(1 for t in tokenized.values() if term in t)
+            if not df:
+                continue
+            tf = tokens.count(term)
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            score += idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len(tokens) / avgdl))
+        scores[cid] = score
+    return scores
+
+
+def test_incremental_matches_bulk_and_reference():
+    chunks = _chunks(30)
+    bulk = SparseRetriever()
+    bulk.add_chunks(chunks)
+    incremental = SparseRetriever()
+    for c in chunks:
+        incremental.add_chunk(c["id"], c["text"], c["metadata"])
+
+    ref = _reference_scores(chunks, "gamma zeta")
+    res = bulk.query("gamma zeta", k=5)
+    assert res == incremental.query("gamma zeta", k=5)
+    assert [r["id"] for r in res] == sorted(ref, key=lambda cid: -ref[cid])[:5]
+    for r in res:
+        assert math.isclose(r["score_sparse"], ref[r["id"]])
+
+
+def test_delete_by_doc_id_updates_statistics():
+    s = SparseRetriever()
+    s.add_chunks(_chunks(12))
+    s.delete_by_doc_id("d1")
+
+    remaining = [c for c in _chunks(12) if not c["id"].startswith("d1:")]
+    ref = _reference_scores(remaining, "beta")
+    res = s.query("beta", k=20)
+    assert len(s) == len(res) == 9
+    assert all(not r["id"].startswith("d1:") for r in res)
+    for r in res:
+        assert math.isclose(r["score_sparse"], ref[r["id"]])
+
+
+def test_readding_chunk_replaces_it():
+    s = SparseRetriever()
+    s.add_chunks([{"id": "d1:0", "text": "old text"}, {"id": "d2:0", "text": "other words"}])
+    s.add_chunk("d1:0", "new text", {})
+
+    assert len(s) == 2
+    assert s.query("old", k=1)[0]["score_sparse"] == 0.0
+    assert s.query("new", k=1)[0]["id"] == "d1:0"
+
+
+def test_compaction_keeps_results():
+    s = SparseRetriever()
+    chunks = _chunks(300)
+    s.add_chunks(chunks)
+    for d in range(0, 100, 2):
+        s.delete_by_doc_id(f"d{d}")
+
+    remaining = [c for c in chunks if int(c["id"].split(":")[0][1:]) % 2]
+    assert len(s.doc_ids) < 300  # a törölt slotok eltűntek
+    ref = _reference_scores(remaining, "alpha delta")
+    res = s.query("alpha delta", k=10)
+    assert [r["id"] for r in res] == sorted(ref, key=lambda cid: -ref[cid])[:10]
+
+
+def test_snapshot_roundtrip(tmp_path):
+    path = tmp_path / "sparse.json"
+    s = SparseRetriever(snapshot_path=str(path))
+    s.add_chunks(_chunks(9))
+    s.delete_by_doc_id("d0")
+    s.save()
+
+    restored = SparseRetriever(snapshot_path=str(path))
+    assert len(restored) == 6
+    assert restored.query("epsilon", k=6) == s.query("epsilon", k=6)
+    assert restored.metadatas[restored._slots["d2:0"]] == {"i": 6}
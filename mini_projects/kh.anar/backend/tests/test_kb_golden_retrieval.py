@@ -11,6 +11,7 @@ from rag.ingestion.kb_indexer import KBIndexer
 from rag.ingestion.version_store import VersionStore
 from rag.embeddings.embedder import HashEmbedder
 from rag.retrieval.hybrid import HybridRetriever
+from rag.eval.benchmark import load_golden
 
 
 class FakeDenseRetriever:
@@ -55,6 +56,10 @@ class FakeSparseRetriever:
     def add_chunk(self, chunk_id, text, metadata):
         self.storage[chunk_id] = {"text": text, "metadata": metadata}
     
+    def add_chunks(self, chunks):
+        for c in chunks:
+            self.add_chunk(c["id"], c["text"], c["metadata"])
+    
     def delete_by_doc_id(self, doc_id):
         prefix = f"{doc_id}:"
         to_delete = [k for k in self.storage if k.startswith(prefix)]
@@ -91,27 +96,10 @@ def test_golden_retrieval():
         kb_dir.mkdir()
         version_store_path = Path(tmpdir) / "versions.json"
         
-        # Teszt dokumentumok létrehozása eltérő témákkal
-        (kb_dir / "python_guide.txt").write_text(
-            "Python is a high-level programming language. "
-            "It supports multiple programming paradigms including object-oriented and functional. "
-            "Python is widely used for web development, data science, and automation.",
-            encoding="utf-8"
-        )
-        
-        (kb_dir / "docker_guide.txt").write_text(
-            "Docker is a platform for containerization. "
-            "Containers package applications with their dependencies. "
-            "Docker enables consistent deployments across environments.",
-            encoding="utf-8"
-        )
-        
-        (kb_dir / "fastapi_guide.txt").write_text(
-            "FastAPI is a modern web framework for building APIs with Python. "
-            "It uses type hints and async support. "
-            "FastAPI is known for high performance and automatic documentation.",
-            encoding="utf-8"
-        )
+        # Teszt dokumentumok létrehozása eltérő témákkal (a benchmarkkal közös golden halmazból)
+        golden = load_golden()
+        for doc_id, text in golden["documents"].items():
+            (kb_dir / doc_id).write_text(text, encoding="utf-8")
         
         config = RAGConfig(
             kb_data_dir=str(kb_dir),
@@ -130,18 +118,7 @@ def test_golden_retrieval():
         indexer.ingest_incremental()
         
         # Golden lekérdezések és a várt doc_id-k
-        golden_cases = [
-            ("Python programming language", "python_guide.txt"),
-            ("web development with Python", "python_guide.txt"),
-            ("Docker containers", "docker_guide.txt"),
-            ("containerization platform", "docker_guide.txt"),
-            ("FastAPI framework", "fastapi_guide.txt"),
-            ("building APIs", "fastapi_guide.txt"),
-            ("async support", "fastapi_guide.txt"),
-            ("high performance web", "fastapi_guide.txt"),
-            ("data science", "python_guide.txt"),
-            ("deployments across environments", "docker_guide.txt"),
-        ]
+        golden_cases = [(case["query"], case["expected"]) for case in golden["cases"]]
         
         hybrid = HybridRetriever(dense, sparse, config)
         
@@ -63,6 +63,10 @@ class FakeSparseRetriever:
     def add_chunk(self, chunk_id, text, metadata):
         self.storage[chunk_id] = {"text": text, "metadata": metadata}
     
+    def add_chunks(self, chunks):
+        for c in chunks:
+            self.add_chunk(c["id"], c["text"], c["metadata"])
+    
     def delete_by_doc_id(self, doc_id):
         prefix = f"{doc_id}:"
         to_delete = [k for k in self.storage if k.startswith(prefix)]
@@ -191,6 +195,33 @@ def test_kb_incremental_ingest_remove_doc():
         assert len(sparse.storage) == 0
 
 
+def test_kb_removed_doc_leaves_document_store(tmp_path):
+    """A mappából törölt dokumentum a DocumentStore-ból is eltűnik."""
+    from rag.persistence.store import DocumentStore
+    
+    kb_dir = tmp_path / "kb-data"
+    kb_dir.mkdir()
+    (kb_dir / "doc1.txt").write_text("Document to be removed", encoding="utf-8")
+    config = RAGConfig(kb_data_dir=str(kb_dir), chunk_size=100, chunk_overlap=10)
+    doc_store = DocumentStore(base_dir=tmp_path)
+    doc_store.save_doc({"doc_id": "doc1.txt", "text": "stored copy"})
+    
+    embedder = HashEmbedder()
+    dense = FakeDenseRetriever(config, embedder)
+    sparse = FakeSparseRetriever()
+    version_store = VersionStore(tmp_path / "versions.json")
+    indexer = KBIndexer(config, dense, sparse, embedder, version_store, document_store=doc_store)
+    
+    indexer.ingest_incremental()
+    (kb_dir / "doc1.txt").unlink()
+    stats = indexer.ingest_incremental()
+    
+    assert stats["removed"] == 1
+    assert stats["scan"]["deleted"] == 1
+    assert doc_store.load_doc("doc1.txt") is None
+    assert not dense.storage and not sparse.storage
+
+
 def test_kb_full_reindex():
     """Test full reindex clears version store and reindexes all."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -98,3 +98,41 @@ def test_scan_kb_folder_nested():
         # a doc_id tükrözze a relatív útvonalat
         assert "root.pdf" in doc_ids
         assert "subdir_nested.pdf" in doc_ids  # a "/" helyett "_" kerül
+
+
+def test_scan_manifest_skips_unchanged_files(monkeypatch):
+    """Változatlan stat => nincs újra-hash-elés; a változások jelentése."""
+    from rag.ingestion import scanner
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        kb_dir = Path(tmpdir) / "kb"
+        kb_dir.mkdir()
+        manifest = Path(tmpdir) / "manifest.json"
+        for name in ("a.txt", "b.txt", "c.md"):
+            (kb_dir / name).write_text(f"content of {name}", encoding="utf-8")
+        
+        hashed = []
+        original = scanner.compute_file_hash
+        monkeypatch.setattr(scanner, "compute_file_hash", lambda p: hashed.append(p.name) or original(p))
+        
+        first = scanner.scan_kb_changes(kb_dir, manifest_path=manifest)
+        assert sorted(first.added) == ["a.txt", "b.txt", "c.md"]
+        assert first.hashed == 3
+        
+        hashed.clear()
+        second = scanner.scan_kb_changes(kb_dir, manifest_path=manifest)
+        assert hashed == []
+        assert second.summary() == {"added": 0, "modified": 0, "deleted": 0, "hashed": 0}
+        assert [d["version_hash"] for d in second.documents] == [d["version_hash"] for d in first.documents]
+        
+        (kb_dir / "a.txt").write_text("changed content", encoding="utf-8")
+        (kb_dir / "b.txt").unlink()
+        (kb_dir / "d.txt").write_text("new", encoding="utf-8")
+        third = scanner.scan_kb_changes(kb_dir, manifest_path=manifest)
+        assert sorted(hashed) == ["a.txt", "d.txt"]
+        assert (third.added, third.modified, third.deleted) == (["d.txt"], ["a.txt"], ["b.txt"])
+        
+        # másik mappára a manifeszt nem érvényes
+        other = Path(tmpdir) / "other"
+        shutil.copytree(kb_dir, other)
+        assert len(scanner.scan_kb_changes(other, manifest_path=manifest).added) == 3
@@ -0,0 +1,251 @@
+"""MCPClient transport tests against local stub HTTP servers."""
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.services import mcp_tools
+from app.services.mcp_client import CircuitBreaker, MCPClient
+
+
+class StubServer:
+    """Threaded HTTP/1.1 stub: records requests, client ports and in-flight concurrency."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.fail_next = 0
+        self.requests = []
+        self.ports = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with stub._lock:
+                    stub.requests.append(self.path)
+                    stub.ports.add(self.client_address[1])
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                    failing = stub.fail_next > 0
+                    stub.fail_next -= failing
+                time.sleep(stub.delay)
+                with stub._lock:
+                    stub.in_flight -= 1
+                status = 503 if failing else 200
+                payload = json.dumps({"path": self.path, "echo": json.loads(body or b"{}")}).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def servers():
+    started = {"memory": StubServer(), "filesystem": StubServer()}
+    yield started
+    for server in started.values():
+        server.close()
+
+
+def _client(servers, monkeypatch, **env):
+    defaults = {"MCP_RETRIES": "2", "MCP_BACKOFF_BASE": "0.01", "MCP_BACKOFF_MAX": "0.02"}
+    for key, value in {**defaults, **env}.items():
+        monkeypatch.setenv(key, value)
+    return MCPClient({name: server.url for name, server in servers.items()})
+
+
+def test_calls_reuse_pooled_connection(servers, monkeypatch):
+    client = _client(servers, monkeypatch)
+
+    async def run():
+        results = [await client.memory_retrieve("c1", f"k{i}") for i in range(5)]
+        await client.aclose()
+        return results
+
+    results = asyncio.run(run())
+    assert all(r["success"] for r in results)
+    assert results[0]["data"]["echo"] == {"conversation_id": "c1", "key": "k0"}
+    assert len(servers["memory"].ports) == 1
+    # új eseményhurokban is működik (a pool újraépül)
+    assert asyncio.run(client.memory_list("c1"))["success"]
+
+
+def test_batch_runs_concurrently_within_server_limits(servers, monkeypatch):
+    for server in servers.values():
+        server.delay = 0.2
+    client = _client(servers, monkeypatch, MCP_MAX_CONCURRENCY="2")
+    calls = [("memory", "retrieve", {"key": str(i)}) for i in range(4)]
+    calls += [("filesystem", "read_file", {"path": f"f{i}"}) for i in range(2)]
+
+    async def run():
+        start = time.perf_counter()
+        results = await client.call_tools(calls)
+        elapsed = time.perf_counter() - start
+        await client.aclose()
+        return results, elapsed
+
+    results, elapsed = asyncio.run(run())
+    assert [r["data"]["echo"] for r in results] == [args for _, _, args in calls]
+    assert servers["memory"].max_in_flight == 2
+    assert servers["filesystem"].max_in_flight == 2
+    # 4 memory call, 2-es korláttal: két kör; soros futásnál 6 * 0.2 s lenne
+    assert elapsed < 0.8
+
+
+def test_retries_only_idempotent_tools(servers, monkeypatch):
+    client = _client(servers, monkeypatch)
+    memory = servers["memory"]
+
+    memory.fail_next = 2
+    assert asyncio.run(client.memory_retrieve("c1", "k"))["success"]
+    assert len(memory.requests) == 3
+
+    memory.fail_next = 1
+    result = asyncio.run(client.memory_delete("c1", "k"))
+    assert not result["success"] and "503" in result["error"]
+    assert len(memory.requests) == 4
+
+
+def test_circuit_breaker_fails_fast_then_recovers(servers, monkeypatch):
+    client = _client(servers, monkeypatch, MCP_RETRIES="0", MCP_BREAKER_THRESHOLD="2", MCP_BREAKER_RESET="0.2")
+    memory = servers["memory"]
+    memory.fail_next = 2
+
+    async def run():
+        first = [await client.memory_list("c1") for _ in range(3)]
+        await asyncio.sleep(0.25)
+        # a félig nyitott állapot egy próbahívást enged át
+        recovered = await client.memory_list("c1")
+        return first, recovered
+
+    first, recovered = asyncio.run(run())
+    assert [r["success"] for r in first] == [False, False, False]
+    assert "circuit open" in first[2]["error"]
+    assert len(memory.requests) == 3
+    assert recovered["success"]
+    assert client.transport("memory").breaker.state == "closed"
+    # más szerver megszakítója független
+    assert asyncio.run(client.filesystem_list("."))["success"]
+
+
+def test_unknown_server_and_half_open_single_trial():
+    client = MCPClient({"memory": "http://127.0.0.1:9"})
+    assert asyncio.run(client.call_tool("nope", "x", {})) == {"success": False, "error": "Unknown MCP server: nope"}
+
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+    now[0] = 10.0
+    assert breaker.allow() and not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+
+def test_only_the_trial_call_releases_the_breaker_trial(servers, monkeypatch):
+    client = _client(servers, monkeypatch, MCP_RETRIES="0", MCP_BREAKER_THRESHOLD="1", MCP_BREAKER_RESET="0.1")
+    memory = servers["memory"]
+    breaker = client.transport("memory").breaker
+
+    async def run():
+        # egy lassú hívás még zárt állapotban indul
+        memory.delay = 0.5
+        slow = asyncio.create_task(client.memory_list("c1"))
+        await asyncio.sleep(0.1)
+        memory.delay = 0.0
+        memory.fail_next = 1
+        assert not (await client.memory_list("c1"))["success"]
+        await asyncio.sleep(0.15)
+        # félig nyitott: a próbahívás folyamatban van, amikor a lassú hívást megszakítjuk
+        memory.delay = 0.3
+        trial = asyncio.create_task(client.memory_list("c1"))
+        await asyncio.sleep(0.05)
+        slow.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await slow
+        extra = await client.memory_list("c1")
+        await trial
+        await client.aclose()
+        return extra
+
+    extra = asyncio.run(run())
+    assert "circuit open" in extra["error"]
+    assert breaker.state == "closed"
+
+
+def test_cancelled_half_open_trial_releases_breaker(servers, monkeypatch):
+    client = _client(servers, monkeypatch, MCP_RETRIES="0", MCP_BREAKER_THRESHOLD="1", MCP_BREAKER_RESET="0.1")
+    memory = servers["memory"]
+    memory.fail_next = 1
+
+    async def run():
+        assert not (await client.memory_list("c1"))["success"]
+        await asyncio.sleep(0.15)
+        breaker = client.transport("memory").breaker
+        assert breaker.state == "half_open"
+        # a próbahívást megszakítjuk, mielőtt válasz érkezne
+        memory.delay = 0.5
+        trial = asyncio.create_task(client.memory_list("c1"))
+        await asyncio.sleep(0.1)
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+        memory.delay = 0.0
+        result = await client.memory_list("c1")
+        await client.aclose()
+        return result, breaker.state
+
+    result, state = asyncio.run(run())
+    assert result["success"]
+    assert state == "closed"
+
+
+def test_tool_calls_on_one_server_keep_order_when_one_writes(servers, monkeypatch):
+    for server in servers.values():
+        server.delay = 0.2
+    monkeypatch.setattr(mcp_tools, "mcp_client", _client(servers, monkeypatch))
+    calls = [
+        {"name": "memory_store", "arguments": {"conversation_id": "c1", "key": "k", "value": "v"}},
+        {"name": "memory_retrieve", "arguments": {"conversation_id": "c1", "key": "k"}},
+        {"name": "filesystem_read", "arguments": {"path": "a"}},
+        {"name": "filesystem_list", "arguments": {"path": "."}},
+    ]
+
+    async def run():
+        start = time.perf_counter()
+        results = await mcp_tools.execute_mcp_tools(calls)
+        elapsed = time.perf_counter() - start
+        await mcp_tools.mcp_client.aclose()
+        return results, elapsed
+
+    results, elapsed = asyncio.run(run())
+    assert [json.loads(r)["path"] for r in results] == [
+        "/tools/store", "/tools/retrieve", "/tools/read_file", "/tools/list_directory"
+    ]
+    # a memory hívások egymás után, a csak olvasó filesystem hívások párhuzamosan
+    assert servers["memory"].requests == ["/tools/store", "/tools/retrieve"]
+    assert servers["memory"].max_in_flight == 1
+    assert servers["filesystem"].max_in_flight == 2
+    # soros futásnál 4 * 0.2 s lenne
+    assert elapsed < 0.6
@@ -8,8 +8,11 @@ Includes support for LangGraph workflow orchestration and metrics monitoring.
 from __future__ import annotations
 
 import json
+import os
 import textwrap
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, List, Optional, Tuple
 
@@ -74,6 +77,35 @@ class EmbeddingApp:
             neighbors = [Neighbor(id=r[0], distance=r[1], text=r[2]) for r in results]
         return uid, neighbors
 
+    def ingest(
+        self, texts: List[str], batch_size: int = 64, workers: int = 4
+    ) -> List[str]:
+        """Embed and store many texts without searching.
+
+        Texts are embedded in batches of `batch_size`, up to `workers` batch
+        requests at a time. Each finished batch is written with a single
+        `add_many` call from the calling thread.
+
+        Returns the stored ids in the order of `texts`.
+        """
+        ids = [uuid.uuid4().hex for _ in texts]
+        batches = [
+            (ids[i : i + batch_size], texts[i : i + batch_size])
+            for i in range(0, len(texts), batch_size)
+        ]
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+            futures = {
+                pool.submit(self.emb.get_embeddings, batch_texts): (
+                    batch_ids,
+                    batch_texts,
+                )
+                for batch_ids, batch_texts in batches
+            }
+            for future in as_completed(futures):
+                batch_ids, batch_texts = futures[future]
+                self.store.add_many(batch_ids, batch_texts, future.result())
+        return ids
+
 
 class CLI:
     def __init__(
@@ -251,6 +283,15 @@ class CLI:
         print(f"  p50 (median): {summary.latency_p50_ms:.2f}ms")
         print(f"  Mean: {summary.latency_mean_ms:.2f}ms")
 
+        cache_lookups = summary.cache_hits + summary.cache_misses
+        if cache_lookups:
+            print(f"\nResponse Cache:")
+            print(
+                f"  Hits: {summary.cache_hits} ({summary.cache_semantic_hits} semantic), "
+                f"Misses: {summary.cache_misses}, "
+                f"Hit Rate: {summary.cache_hits / cache_lookups * 100:.1f}%"
+            )
+
         if summary.agent_execution_latency_mean_ms > 0:
             print(f"\nAgent Execution Latency (milliseconds):")
             print(f"  p95: {summary.agent_execution_latency_p95_ms:.2f}ms")
@@ -500,15 +541,21 @@ class CLI:
                 self._print_results(uid, neighbors)
 
     def process_directory(
-        self, data_dir: str, k: int = 3, mode: str = "hybrid", alpha: float = 0.5
+        self,
+        data_dir: str,
+        k: int = 3,
+        mode: str = "hybrid",
+        alpha: float = 0.5,
+        workers: int = 1,
+        batch_size: int = 64,
     ) -> None:
         """Process all text/markdown files in `data_dir`: embed, store and run search.
 
         This is a batch mode alternative to the interactive CLI. It reads files
         (extensions .md, .txt) and calls `process_query` for each file's content.
+        With `workers` > 1 the files are only indexed: they are read in
+        parallel, embedded in batches of `batch_size` and stored in bulk.
         """
-        import os
-
         if not os.path.isdir(data_dir):
             print(f"Data directory not found: {data_dir}")
             return
@@ -518,9 +565,15 @@ class CLI:
             print(f"No .md or .txt files found in {data_dir}")
             return
 
+        if workers > 1:
+            self._ingest_files(data_dir, files, workers, batch_size)
+            return
+
         print(
             f"Processing {len(files)} files from {data_dir} (mode={mode}, k={k}, alpha={alpha})"
         )
+        start_time = time.perf_counter()
+        processed = 0
         for fname in files:
             path = os.path.join(data_dir, fname)
             try:
@@ -537,5 +590,41 @@ class CLI:
             uid, neighbors = self.app.process_query(
                 content, k=k, mode=mode, alpha=alpha
             )
+            processed += 1
             print("\nFile:", fname)
             self._print_results(uid, neighbors)
+
+        self._print_throughput(processed, time.perf_counter() - start_time)
+
+    def _ingest_files(
+        self, data_dir: str, files: List[str], workers: int, batch_size: int
+    ) -> None:
+        """Read files in parallel and index them with `EmbeddingApp.ingest`."""
+        print(
+            f"Indexing {len(files)} files from {data_dir} "
+            f"(workers={workers}, batch_size={batch_size})"
+        )
+        start_time = time.perf_counter()
+
+        def read(fname: str) -> Optional[str]:
+            path = os.path.join(data_dir, fname)
+            try:
+                with open(path, "r", encoding="utf-8") as fh:
+                    content = fh.read().strip()
+            except Exception as exc:
+                print(f"Failed to read {path}: {exc}")
+                return None
+            if not content:
+                print(f"Skipping empty file: {path}")
+                return None
+            return content
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            contents = [c for c in pool.map(read, files) if c is not None]
+
+        self.app.ingest(contents, batch_size=batch_size, workers=workers)
+        self._print_throughput(len(contents), time.perf_counter() - start_time)
+
+    def _print_throughput(self, count: int, elapsed: float) -> None:
+        rate = count / elapsed if elapsed > 0 else 0.0
+        print(f"\nProcessed {count} files in {elapsed:.2f}s ({rate:.1f} files/s)")
@@ -24,6 +24,12 @@ class Config:
     google_calendar_token_file: str | None = None
     openweather_api_key: str | None = None
     exchangerate_api_key: str | None = None
+    ingest_workers: int = 1
+    ingest_batch_size: int = 64
+    metrics_journal_path: str | None = None
+    response_cache_max_entries: int = 1000
+    response_cache_ttl_hours: float | None = None
+    response_cache_semantic: bool = False
 
 
 def load_config(env_path: str | None = None) -> Config:
@@ -57,6 +63,22 @@ def load_config(env_path: str | None = None) -> Config:
     openweather_key = os.getenv("OPENWEATHER_API_KEY", None)
     exchangerate_key = os.getenv("EXCHANGERATE_API_KEY", None)
 
+    # Batch mode: INGEST_WORKERS > 1 indexes data/ in parallel, in bulk
+    ingest_workers = int(os.getenv("INGEST_WORKERS", "1"))
+    ingest_batch_size = int(os.getenv("INGEST_BATCH_SIZE", "64"))
+
+    # Optional append-only JSON Lines record of every API call
+    metrics_journal_path = os.getenv("METRICS_JOURNAL_PATH", None)
+
+    # LLM response cache: size bound, optional TTL, similarity lookup
+    cache_max_entries = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1000"))
+    cache_ttl = os.getenv("RESPONSE_CACHE_TTL_HOURS", "").strip()
+    cache_semantic = os.getenv("RESPONSE_CACHE_SEMANTIC", "false").lower() in {
+        "1",
+        "true",
+        "yes",
+    }
+
     return Config(
         openai_api_key=api_key,
         embedding_model=model,
@@ -68,4 +90,10 @@ def load_config(env_path: str | None = None) -> Config:
         google_calendar_token_file=google_token_file,
         openweather_api_key=openweather_key,
         exchangerate_api_key=exchangerate_key,
+        ingest_workers=ingest_workers,
+        ingest_batch_size=ingest_batch_size,
+        metrics_journal_path=metrics_journal_path,
+        response_cache_max_entries=cache_max_entries,
+        response_cache_ttl_hours=float(cache_ttl) if cache_ttl else None,
+        response_cache_semantic=cache_semantic,
     )
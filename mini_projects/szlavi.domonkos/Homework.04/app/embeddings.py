@@ -23,6 +23,14 @@ class EmbeddingService(ABC):
     def get_embedding(self, text: str) -> List[float]:
         """Return embedding vector for given text."""
 
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Return one embedding per text, in order.
+
+        The default embeds texts one by one; implementations backed by a
+        batch API should override it.
+        """
+        return [self.get_embedding(text) for text in texts]
+
 
 class OpenAIEmbeddingService(EmbeddingService):
     def __init__(
@@ -30,9 +38,11 @@ class OpenAIEmbeddingService(EmbeddingService):
         api_key: str,
         model: str = "text-embedding-3-small",
         metrics_collector: Optional[MetricCollector] = None,
+        batch_size: int = 100,
     ) -> None:
         openai.api_key = api_key
         self.model = model
+        self.batch_size = batch_size
         self.metrics_middleware = (
             MetricsMiddleware(metrics_collector) if metrics_collector else None
         )
@@ -73,3 +83,53 @@ class OpenAIEmbeddingService(EmbeddingService):
                 )
 
             return []
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts with one API request per `batch_size` texts.
+
+        A failed request yields empty embeddings for its texts only.
+        """
+        embeddings: List[List[float]] = []
+        for offset in range(0, len(texts), self.batch_size):
+            embeddings.extend(
+                self._embed_batch(texts[offset : offset + self.batch_size])
+            )
+        return embeddings
+
+    def _embed_batch(self, batch: List[str]) -> List[List[float]]:
+        start_time = time.time()
+        tokens_in = sum(len(text) for text in batch) // 4
+        try:
+            resp = openai.Embedding.create(model=self.model, input=batch)
+            # The API may return items out of order; each carries its index
+            data = sorted(resp["data"], key=lambda item: item.get("index", 0))
+            embeddings = [item["embedding"] for item in data]
+            if len(embeddings) != len(batch):
+                raise ValueError(
+                    f"expected {len(batch)} embeddings, got {len(embeddings)}"
+                )
+
+            if self.metrics_middleware:
+                latency_ms = (time.time() - start_time) * 1000
+                self.metrics_middleware.record_embedding_call(
+                    model=self.model,
+                    tokens_in=tokens_in,
+                    latency_ms=latency_ms,
+                    success=True,
+                )
+
+            return embeddings
+        except Exception as exc:
+            logger.error("Batch embedding generation failed: %s", exc)
+
+            if self.metrics_middleware:
+                latency_ms = (time.time() - start_time) * 1000
+                self.metrics_middleware.record_embedding_call(
+                    model=self.model,
+                    tokens_in=tokens_in,
+                    latency_ms=latency_ms,
+                    success=False,
+                    error_message=str(exc),
+                )
+
+            return [[] for _ in batch]
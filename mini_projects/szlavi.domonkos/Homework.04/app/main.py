@@ -45,7 +45,9 @@ def main(argv: list[str] | None = None) -> int:
         return 1
 
     # Initialize metrics collector
-    metrics_collector = create_metrics_collector()
+    metrics_collector = create_metrics_collector(
+        journal_path=cfg.metrics_journal_path
+    )
     logging.info("Metrics collector initialized")
 
     # Instantiate services (dependencies injected)
@@ -74,6 +76,15 @@ def main(argv: list[str] | None = None) -> int:
             temperature=cfg.llm_temperature,
             max_tokens=cfg.llm_max_tokens,
             metrics_collector=metrics_collector,
+            cache_max_entries=cfg.response_cache_max_entries,
+            cache_ttl_seconds=(
+                cfg.response_cache_ttl_hours * 3600
+                if cfg.response_cache_ttl_hours
+                else None
+            ),
+            cache_embedding_service=(
+                emb_service if cfg.response_cache_semantic else None
+            ),
         )
         logging.info("RAG agent initialized: %s", cfg.llm_model)
     except Exception as exc:
@@ -165,7 +176,11 @@ def main(argv: list[str] | None = None) -> int:
     try:
         if os.path.isdir(data_dir) and any(os.scandir(data_dir)):
             # batch processing from data directory
-            cli.process_directory(data_dir)
+            cli.process_directory(
+                data_dir,
+                workers=cfg.ingest_workers,
+                batch_size=cfg.ingest_batch_size,
+            )
         else:
             cli.run()
     except KeyboardInterrupt:
@@ -12,12 +12,15 @@ from __future__ import annotations
 
 import json
 import logging
+import math
 import os
+import threading
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from statistics import mean, median, quantiles
-from typing import Dict, List, Optional
+from typing import IO, Deque, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +40,34 @@ class APICallMetric:
     error_message: Optional[str] = None
 
 
+def _metric_to_dict(metric: APICallMetric) -> Dict:
+    return {
+        "timestamp": metric.timestamp.isoformat(),
+        "model": metric.model,
+        "tokens_in": metric.tokens_in,
+        "tokens_out": metric.tokens_out,
+        "latency_ms": metric.latency_ms,
+        "cost_usd": metric.cost_usd,
+        "operation_type": metric.operation_type,
+        "success": metric.success,
+        "error_message": metric.error_message,
+    }
+
+
+def _metric_from_dict(data: Dict) -> APICallMetric:
+    return APICallMetric(
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+        model=data["model"],
+        tokens_in=data["tokens_in"],
+        tokens_out=data["tokens_out"],
+        latency_ms=data["latency_ms"],
+        cost_usd=data["cost_usd"],
+        operation_type=data["operation_type"],
+        success=data.get("success", True),
+        error_message=data.get("error_message"),
+    )
+
+
 @dataclass
 class MetricsSummary:
     """Summary of collected metrics."""
@@ -53,10 +84,54 @@ class MetricsSummary:
     agent_execution_latency_p95_ms: float
     agent_execution_latency_mean_ms: float
     timestamp: datetime = field(default_factory=datetime.now)
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_semantic_hits: int = 0
     by_operation: Dict[str, Dict] = field(default_factory=dict)
     by_model: Dict[str, Dict] = field(default_factory=dict)
 
 
+@dataclass
+class CacheStats:
+    """Response cache lookup counters.
+
+    Kept apart from the API call metrics: a cache lookup is not an inference,
+    and its sub-millisecond latency would skew the latency percentiles.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    semantic_hits: int = 0
+
+    def record(self, hit: bool, semantic: bool = False) -> None:
+        if hit:
+            self.hits += 1
+            self.semantic_hits += 1 if semantic else 0
+        else:
+            self.misses += 1
+
+    def apply_to(self, summary: "MetricsSummary") -> "MetricsSummary":
+        summary.cache_hits = self.hits
+        summary.cache_misses = self.misses
+        summary.cache_semantic_hits = self.semantic_hits
+        return summary
+
+    def to_dict(self) -> Dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "semantic_hits": self.semantic_hits,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "CacheStats":
+        return cls(
+            hits=data.get("hits", 0),
+            misses=data.get("misses", 0),
+            semantic_hits=data.get("semantic_hits", 0),
+        )
+
+
 class MetricCollector(ABC):
     """Abstract base class for metric collection strategies."""
 
@@ -64,6 +139,10 @@ class MetricCollector(ABC):
     def record_call(self, metric: APICallMetric) -> None:
         """Record a single API call metric."""
 
+    @abstractmethod
+    def record_cache_lookup(self, hit: bool, semantic: bool = False) -> None:
+        """Count a response cache lookup (not an API call)."""
+
     @abstractmethod
     def get_summary(self) -> MetricsSummary:
         """Return aggregated metrics summary."""
@@ -88,6 +167,7 @@ class InMemoryMetricsCollector(MetricCollector):
         """Initialize the metrics collector."""
         self._metrics: List[APICallMetric] = []
         self._agent_latencies: List[float] = []
+        self._cache = CacheStats()
         self._start_time = datetime.now()
 
     def record_call(self, metric: APICallMetric) -> None:
@@ -106,6 +186,15 @@ class InMemoryMetricsCollector(MetricCollector):
             f"Cost: ${metric.cost_usd:.6f}"
         )
 
+    def record_cache_lookup(self, hit: bool, semantic: bool = False) -> None:
+        """Count a response cache lookup.
+
+        Args:
+            hit: Whether a cached response was found.
+            semantic: Whether the hit came from similarity lookup.
+        """
+        self._cache.record(hit, semantic)
+
     def get_summary(self) -> MetricsSummary:
         """Calculate and return aggregated metrics summary.
 
@@ -113,7 +202,7 @@ class InMemoryMetricsCollector(MetricCollector):
             MetricsSummary with all aggregated metrics.
         """
         if not self._metrics:
-            return MetricsSummary(
+            return self._cache.apply_to(MetricsSummary(
                 total_inferences=0,
                 total_tokens_in=0,
                 total_tokens_out=0,
@@ -125,7 +214,7 @@ class InMemoryMetricsCollector(MetricCollector):
                 total_errors=0,
                 agent_execution_latency_p95_ms=0.0,
                 agent_execution_latency_mean_ms=0.0,
-            )
+            ))
 
         # Basic aggregations
         total_inferences = len(self._metrics)
@@ -159,7 +248,7 @@ class InMemoryMetricsCollector(MetricCollector):
         # Breakdown by model
         by_model = self._aggregate_by_field("model")
 
-        return MetricsSummary(
+        return self._cache.apply_to(MetricsSummary(
             total_inferences=total_inferences,
             total_tokens_in=total_tokens_in,
             total_tokens_out=total_tokens_out,
@@ -173,12 +262,13 @@ class InMemoryMetricsCollector(MetricCollector):
             agent_execution_latency_mean_ms=agent_exec_mean_ms,
             by_operation=by_operation,
             by_model=by_model,
-        )
+        ))
 
     def reset(self) -> None:
         """Clear all collected metrics."""
         self._metrics.clear()
         self._agent_latencies.clear()
+        self._cache = CacheStats()
         self._start_time = datetime.now()
         logger.info("Metrics collector reset.")
 
@@ -195,20 +285,8 @@ class InMemoryMetricsCollector(MetricCollector):
             metrics_data = {
                 "timestamp": datetime.now().isoformat(),
                 "total_calls": len(self._metrics),
-                "calls": [
-                    {
-                        "timestamp": m.timestamp.isoformat(),
-                        "model": m.model,
-                        "tokens_in": m.tokens_in,
-                        "tokens_out": m.tokens_out,
-                        "latency_ms": m.latency_ms,
-                        "cost_usd": m.cost_usd,
-                        "operation_type": m.operation_type,
-                        "success": m.success,
-                        "error_message": m.error_message,
-                    }
-                    for m in self._metrics
-                ],
+                "calls": [_metric_to_dict(m) for m in self._metrics],
+                "cache": self._cache.to_dict(),
                 "summary": self._summary_to_dict(self.get_summary()),
             }
 
@@ -231,18 +309,8 @@ class InMemoryMetricsCollector(MetricCollector):
 
             self._metrics.clear()
             for call_data in data.get("calls", []):
-                metric = APICallMetric(
-                    timestamp=datetime.fromisoformat(call_data["timestamp"]),
-                    model=call_data["model"],
-                    tokens_in=call_data["tokens_in"],
-                    tokens_out=call_data["tokens_out"],
-                    latency_ms=call_data["latency_ms"],
-                    cost_usd=call_data["cost_usd"],
-                    operation_type=call_data["operation_type"],
-                    success=call_data.get("success", True),
-                    error_message=call_data.get("error_message"),
-                )
-                self._metrics.append(metric)
+                self._metrics.append(_metric_from_dict(call_data))
+            self._cache = CacheStats.from_dict(data.get("cache", {}))
 
             logger.info(f"Loaded {len(self._metrics)} metrics from {filepath}")
         except Exception as exc:
@@ -339,11 +407,476 @@ class InMemoryMetricsCollector(MetricCollector):
             "latency_p95_ms": round(summary.latency_p95_ms, 2),
             "latency_p50_ms": round(summary.latency_p50_ms, 2),
             "latency_mean_ms": round(summary.latency_mean_ms, 2),
+            "cache_hits": summary.cache_hits,
+            "cache_misses": summary.cache_misses,
+            "cache_semantic_hits": summary.cache_semantic_hits,
             "by_operation": summary.by_operation,
             "by_model": summary.by_model,
         }
 
 
+class LatencySketch:
+    """Bounded-memory latency histogram with relative-error quantiles.
+
+    Values are counted in logarithmic buckets (as in HDR histograms and
+    DDSketch): bucket i holds values in (gamma^(i-1), gamma^i]. Recording is
+    O(1), memory grows with the log of the value range rather than the
+    number of values, and every quantile is within `relative_accuracy` of
+    the exact value. Sketches with the same accuracy can be merged.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        """Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of quantiles (0-1).
+        """
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def bucket(self, value: float) -> Optional[int]:
+        """Bucket index of a value (None for values <= 0)."""
+        return math.ceil(math.log(value) / self._log_gamma) if value > 0 else None
+
+    def add(self, value: float, bucket: Optional[int] = None) -> None:
+        """Record one value.
+
+        Args:
+            value: Value to record.
+            bucket: Precomputed `bucket(value)` of a sketch with the same accuracy.
+        """
+        if bucket is None and value > 0:
+            bucket = self.bucket(value)
+        if bucket is not None:
+            self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+        else:
+            self._zero_count += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "LatencySketch") -> None:
+        """Add all values of another sketch with the same accuracy."""
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        self._zero_count += other._zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Approximate q-quantile (0-1) by nearest rank; 0.0 when empty."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = self._zero_count
+        if rank <= seen:
+            return max(self.min, 0.0)
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                # Midpoint of the bucket (in relative terms), within the observed range
+                value = 2 * self._gamma**index / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> Dict:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "buckets": {str(index): count for index, count in self._buckets.items()},
+            "zero_count": self._zero_count,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LatencySketch":
+        sketch = cls(data.get("relative_accuracy", 0.01))
+        sketch._buckets = {int(index): count for index, count in data["buckets"].items()}
+        sketch._zero_count = data.get("zero_count", 0)
+        sketch.count = data["count"]
+        sketch.total = data["total"]
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        return sketch
+
+
+class RollingStats:
+    """Running counters and a latency sketch for one group of calls."""
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        self.count = 0
+        self.errors = 0
+        self.tokens_in = 0
+        self.tokens_out = 0
+        self.cost_usd = 0.0
+        self.latency = LatencySketch(relative_accuracy)
+
+    def add(self, metric: APICallMetric, bucket: Optional[int] = None) -> None:
+        self.count += 1
+        self.errors += 0 if metric.success else 1
+        self.tokens_in += metric.tokens_in
+        self.tokens_out += metric.tokens_out
+        self.cost_usd += metric.cost_usd
+        self.latency.add(metric.latency_ms, bucket)
+
+    def merge(self, other: "RollingStats") -> None:
+        self.count += other.count
+        self.errors += other.errors
+        self.tokens_in += other.tokens_in
+        self.tokens_out += other.tokens_out
+        self.cost_usd += other.cost_usd
+        self.latency.merge(other.latency)
+
+    def breakdown(self) -> Dict:
+        """Per-group entry in the format of MetricsSummary.by_operation/by_model."""
+        return {
+            "count": self.count,
+            "tokens_in": self.tokens_in,
+            "tokens_out": self.tokens_out,
+            "cost_usd": self.cost_usd,
+            "latency_p95_ms": self.latency.quantile(0.95),
+            "latency_p50_ms": self.latency.quantile(0.5),
+            "latency_mean_ms": self.latency.mean,
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "tokens_in": self.tokens_in,
+            "tokens_out": self.tokens_out,
+            "cost_usd": self.cost_usd,
+            "latency": self.latency.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RollingStats":
+        stats = cls()
+        stats.count = data["count"]
+        stats.errors = data["errors"]
+        stats.tokens_in = data["tokens_in"]
+        stats.tokens_out = data["tokens_out"]
+        stats.cost_usd = data["cost_usd"]
+        stats.latency = LatencySketch.from_dict(data["latency"])
+        return stats
+
+
+class _StatsGroup:
+    """Totals plus breakdowns by operation type and by model."""
+
+    def __init__(self, relative_accuracy: float) -> None:
+        self.relative_accuracy = relative_accuracy
+        self.total = RollingStats(relative_accuracy)
+        self.by_operation: Dict[str, RollingStats] = {}
+        self.by_model: Dict[str, RollingStats] = {}
+
+    def add(self, metric: APICallMetric, bucket: Optional[int] = None) -> None:
+        self.total.add(metric, bucket)
+        for groups, key in (
+            (self.by_operation, metric.operation_type),
+            (self.by_model, metric.model),
+        ):
+            stats = groups.get(key)
+            if stats is None:
+                stats = groups[key] = RollingStats(self.relative_accuracy)
+            stats.add(metric, bucket)
+
+    def merge(self, other: "_StatsGroup") -> None:
+        self.total.merge(other.total)
+        for groups, other_groups in (
+            (self.by_operation, other.by_operation),
+            (self.by_model, other.by_model),
+        ):
+            for key, other_stats in other_groups.items():
+                stats = groups.get(key)
+                if stats is None:
+                    stats = groups[key] = RollingStats(self.relative_accuracy)
+                stats.merge(other_stats)
+
+    def summary(self) -> MetricsSummary:
+        total = self.total
+        agent = self.by_operation.get("agent_execution")
+        return MetricsSummary(
+            total_inferences=total.count,
+            total_tokens_in=total.tokens_in,
+            total_tokens_out=total.tokens_out,
+            total_cost_usd=total.cost_usd,
+            latency_p95_ms=total.latency.quantile(0.95),
+            latency_p50_ms=total.latency.quantile(0.5),
+            latency_mean_ms=total.latency.mean,
+            error_rate=(total.errors / total.count * 100) if total.count else 0.0,
+            total_errors=total.errors,
+            agent_execution_latency_p95_ms=agent.latency.quantile(0.95) if agent else 0.0,
+            agent_execution_latency_mean_ms=agent.latency.mean if agent else 0.0,
+            by_operation={key: s.breakdown() for key, s in self.by_operation.items()},
+            by_model={key: s.breakdown() for key, s in self.by_model.items()},
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "total": self.total.to_dict(),
+            "by_operation": {k: s.to_dict() for k, s in self.by_operation.items()},
+            "by_model": {k: s.to_dict() for k, s in self.by_model.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict, relative_accuracy: float) -> "_StatsGroup":
+        group = cls(relative_accuracy)
+        group.total = RollingStats.from_dict(data["total"])
+        group.by_operation = {
+            k: RollingStats.from_dict(s) for k, s in data.get("by_operation", {}).items()
+        }
+        group.by_model = {
+            k: RollingStats.from_dict(s) for k, s in data.get("by_model", {}).items()
+        }
+        return group
+
+
+class StreamingMetricsCollector(MetricCollector):
+    """Bounded-memory metrics collector for long-running processes.
+
+    Individual calls are not kept. Each call updates running counters and a
+    latency sketch (overall, per operation type and per model) in O(1), plus
+    the counters of the current time bucket, so summaries cost the same no
+    matter how long the process has run. Recent buckets (`window_seconds`
+    each, the last `max_windows` kept) give last-N-minutes views.
+
+    If `journal_path` is set, every call is also appended to that file as one
+    JSON line, which `load` can replay.
+    """
+
+    def __init__(
+        self,
+        window_seconds: int = 60,
+        max_windows: int = 60,
+        relative_accuracy: float = 0.01,
+        journal_path: Optional[str] = None,
+    ) -> None:
+        """Initialize the metrics collector.
+
+        Args:
+            window_seconds: Length of one time bucket in seconds.
+            max_windows: Number of most recent buckets kept.
+            relative_accuracy: Maximum relative error of latency percentiles.
+            journal_path: Optional JSON Lines file each call is appended to.
+        """
+        self.window_seconds = window_seconds
+        self.relative_accuracy = relative_accuracy
+        self.journal_path = journal_path
+        self._lock = threading.Lock()
+        self._totals = _StatsGroup(relative_accuracy)
+        self._windows: Deque[Tuple[int, _StatsGroup]] = deque(maxlen=max_windows)
+        self._cache = CacheStats()
+        self._journal: Optional[IO[str]] = None
+        self._start_time = datetime.now()
+
+    def record_call(self, metric: APICallMetric) -> None:
+        """Record a single API call metric.
+
+        Args:
+            metric: APICallMetric instance to record.
+        """
+        if metric.timestamp is None:
+            metric.timestamp = datetime.now()
+        with self._lock:
+            self._add(metric)
+            if self.journal_path:
+                self._append_to_journal(metric)
+        logger.debug(
+            f"Recorded metric: {metric.operation_type} | "
+            f"Tokens: {metric.tokens_in}in/{metric.tokens_out}out | "
+            f"Latency: {metric.latency_ms:.2f}ms | "
+            f"Cost: ${metric.cost_usd:.6f}"
+        )
+
+    def _add(self, metric: APICallMetric) -> None:
+        # Same bucket in all six sketches the call is recorded in
+        bucket = self._totals.total.latency.bucket(metric.latency_ms)
+        self._totals.add(metric, bucket)
+        window = self._window_for(int(metric.timestamp.timestamp() // self.window_seconds))
+        if window is not None:
+            window.add(metric, bucket)
+
+    def _window_for(self, key: int) -> Optional[_StatsGroup]:
+        """Bucket for a window key; None if it is older than the kept buckets."""
+        if not self._windows or key > self._windows[-1][0]:
+            window = _StatsGroup(self.relative_accuracy)
+            self._windows.append((key, window))
+            return window
+        # Late metric: look back through the (bounded) kept buckets
+        for index in range(len(self._windows) - 1, -1, -1):
+            window_key, window = self._windows[index]
+            if window_key == key:
+                return window
+            if window_key < key:
+                if len(self._windows) == self._windows.maxlen:
+                    # deque.insert fails on a full deque; drop the oldest first
+                    self._windows.popleft()
+                    index -= 1
+                window = _StatsGroup(self.relative_accuracy)
+                self._windows.insert(index + 1, (key, window))
+                return window
+        if len(self._windows) < self._windows.maxlen:
+            window = _StatsGroup(self.relative_accuracy)
+            self._windows.appendleft((key, window))
+            return window
+        return None
+
+    def _append_to_journal(self, metric: APICallMetric) -> None:
+        try:
+            if self._journal is None:
+                os.makedirs(os.path.dirname(self.journal_path) or ".", exist_ok=True)
+                self._journal = open(self.journal_path, "a", encoding="utf-8")
+            self._journal.write(json.dumps(_metric_to_dict(metric)) + "\n")
+            self._journal.flush()
+        except Exception as exc:
+            logger.error(f"Failed to append metric to {self.journal_path}: {exc}")
+
+    def record_cache_lookup(self, hit: bool, semantic: bool = False) -> None:
+        """Count a response cache lookup (totals only, not journaled).
+
+        Args:
+            hit: Whether a cached response was found.
+            semantic: Whether the hit came from similarity lookup.
+        """
+        with self._lock:
+            self._cache.record(hit, semantic)
+
+    def get_summary(self) -> MetricsSummary:
+        """Return the aggregated summary of all recorded calls.
+
+        Returns:
+            MetricsSummary with all aggregated metrics.
+        """
+        with self._lock:
+            return self._cache.apply_to(self._totals.summary())
+
+    def get_recent_summary(self, minutes: float) -> MetricsSummary:
+        """Return the summary of calls in the last `minutes` minutes.
+
+        Resolution is one bucket (`window_seconds`), and only the kept
+        buckets are covered.
+
+        Args:
+            minutes: Length of the time window.
+
+        Returns:
+            MetricsSummary of the calls in the window.
+        """
+        oldest = int(
+            (datetime.now().timestamp() - minutes * 60) // self.window_seconds
+        )
+        merged = _StatsGroup(self.relative_accuracy)
+        with self._lock:
+            for key, window in self._windows:
+                if key >= oldest:
+                    merged.merge(window)
+        return merged.summary()
+
+    def reset(self) -> None:
+        """Clear all collected metrics (the journal file is kept)."""
+        with self._lock:
+            self._totals = _StatsGroup(self.relative_accuracy)
+            self._windows.clear()
+            self._cache = CacheStats()
+            self._start_time = datetime.now()
+        logger.info("Metrics collector reset.")
+
+    def close(self) -> None:
+        """Close the journal file."""
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
+    def export(self, filepath: str) -> None:
+        """Export a snapshot of the aggregates (not individual calls) to JSON.
+
+        The size of the file does not depend on the number of calls. Use
+        `journal_path` for a per-call record.
+
+        Args:
+            filepath: Path to save metrics JSON file.
+        """
+        try:
+            os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+            with self._lock:
+                data = {
+                    "timestamp": datetime.now().isoformat(),
+                    "total_calls": self._totals.total.count,
+                    "summary": InMemoryMetricsCollector._summary_to_dict(
+                        self._totals.summary()
+                    ),
+                    "state": self._totals.to_dict(),
+                    "cache": self._cache.to_dict(),
+                }
+            with open(filepath, "w") as f:
+                json.dump(data, f)
+
+            logger.info(f"Metrics exported to {filepath}")
+        except Exception as exc:
+            logger.error(f"Failed to export metrics to {filepath}: {exc}")
+
+    def load(self, filepath: str) -> None:
+        """Load metrics from a file.
+
+        Accepts a snapshot written by `export`, a JSON Lines journal, or the
+        `InMemoryMetricsCollector` export format (calls are replayed).
+
+        Args:
+            filepath: Path to metrics file.
+        """
+        try:
+            with open(filepath, "r") as f:
+                content = f.read()
+            try:
+                data = json.loads(content)
+            except json.JSONDecodeError:
+                data = None
+            if isinstance(data, dict) and ("state" in data or "calls" in data):
+                calls = data.get("calls", [])
+            else:
+                # JSON Lines journal: one call per line (a one-line journal
+                # also parses as a single JSON object, so the keys decide)
+                data = {}
+                calls = [json.loads(line) for line in content.splitlines() if line.strip()]
+
+            self.reset()
+            with self._lock:
+                if "state" in data:
+                    self._totals = _StatsGroup.from_dict(
+                        data["state"], self.relative_accuracy
+                    )
+                self._cache = CacheStats.from_dict(data.get("cache", {}))
+                for call_data in calls:
+                    self._add(_metric_from_dict(call_data))
+
+            logger.info(
+                f"Loaded {self._totals.total.count} metrics from {filepath}"
+            )
+        except Exception as exc:
+            logger.error(f"Failed to load metrics from {filepath}: {exc}")
+
+
 class OpenAIPricingCalculator:
     """Calculate costs for OpenAI API calls.
 
@@ -529,6 +1062,29 @@ class MetricsMiddleware:
 
         self.collector.record_call(metric)
 
+    def record_cache_lookup(
+        self,
+        hit: bool,
+        latency_ms: float,
+        semantic: bool = False,
+    ) -> None:
+        """Record a response cache lookup.
+
+        Lookups are counted as cache hits/misses on the collector, not as API
+        calls, so they do not change the inference count or the latency
+        percentiles.
+
+        Args:
+            hit: Whether a cached response was found.
+            latency_ms: Lookup latency in milliseconds (logged only).
+            semantic: Whether the hit came from similarity lookup.
+        """
+        self.collector.record_cache_lookup(hit, semantic)
+        logger.debug(
+            f"Cache {'hit' if hit else 'miss'}"
+            f"{' (semantic)' if semantic else ''} in {latency_ms:.2f}ms"
+        )
+
     def record_agent_execution(
         self,
         latency_ms: float,
@@ -562,10 +1118,13 @@ class MetricsMiddleware:
         self.collector.record_call(metric)
 
 
-def create_metrics_collector() -> MetricCollector:
+def create_metrics_collector(journal_path: Optional[str] = None) -> MetricCollector:
     """Factory function to create a metrics collector.
 
+    Args:
+        journal_path: Optional JSON Lines file every call is appended to.
+
     Returns:
-        InMemoryMetricsCollector instance.
+        StreamingMetricsCollector instance (bounded memory).
     """
-    return InMemoryMetricsCollector()
+    return StreamingMetricsCollector(journal_path=journal_path)
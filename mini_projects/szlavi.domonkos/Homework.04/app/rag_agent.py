@@ -8,13 +8,16 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 import openai
 
 from .metrics import MetricCollector, MetricsMiddleware
 from .response_cache import ResponseCache
 
+if TYPE_CHECKING:
+    from .embeddings import EmbeddingService
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,15 +33,29 @@ class RAGAgent:
         use_cache: bool = True,
         cache_dir: str = "./response_cache",
         metrics_collector: Optional[MetricCollector] = None,
+        cache_max_entries: int = 1000,
+        cache_ttl_seconds: Optional[float] = None,
+        cache_embedding_service: Optional[EmbeddingService] = None,
     ) -> None:
         openai.api_key = api_key
         self.llm_model = llm_model
         self.temperature = temperature
         self.max_tokens = max_tokens
-        self.cache = ResponseCache(cache_dir) if use_cache else None
         self.metrics_middleware = (
             MetricsMiddleware(metrics_collector) if metrics_collector else None
         )
+        # cache_embedding_service enables similarity lookup for paraphrased queries
+        self.cache = (
+            ResponseCache(
+                cache_dir,
+                max_entries=cache_max_entries,
+                ttl_seconds=cache_ttl_seconds,
+                embedding_service=cache_embedding_service,
+                metrics_middleware=self.metrics_middleware,
+            )
+            if use_cache
+            else None
+        )
 
     def _build_context(self, retrieved_docs: List[Tuple[str, float, str]]) -> str:
         """Build a context string from retrieved documents."""
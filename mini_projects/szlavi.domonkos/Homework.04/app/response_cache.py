@@ -2,6 +2,12 @@
 
 Caches LLM-generated responses based on query and retrieved documents
 to reduce redundant API calls and costs.
+
+Two tiers: an in-process LRU of recently used responses over a single
+SQLite file on disk. The disk tier is bounded by entry count (least
+recently used entries are evicted) and optionally by age (TTL). With an
+embedding service, a query that misses exactly can reuse the answer to a
+similar earlier question over the same retrieved documents.
 """
 
 from __future__ import annotations
@@ -9,18 +15,95 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import math
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .embeddings import EmbeddingService
+    from .metrics import MetricsMiddleware
 
 logger = logging.getLogger(__name__)
 
 
 class ResponseCache:
-    """Simple file-based cache for LLM responses."""
+    """Two-tier (memory LRU + SQLite) cache for LLM responses."""
+
+    DB_NAME = "responses.db"
 
-    def __init__(self, cache_dir: str = "./response_cache") -> None:
+    def __init__(
+        self,
+        cache_dir: str = "./response_cache",
+        max_entries: int = 1000,
+        ttl_seconds: Optional[float] = None,
+        memory_entries: int = 128,
+        embedding_service: Optional[EmbeddingService] = None,
+        similarity_threshold: float = 0.92,
+        metrics_middleware: Optional[MetricsMiddleware] = None,
+    ) -> None:
+        """Open (or create) the cache.
+
+        Args:
+            cache_dir: Directory of the SQLite cache file.
+            max_entries: Maximum responses on disk; least recently used are evicted.
+            ttl_seconds: Maximum age of a response (None: no expiry).
+            memory_entries: Responses kept in the in-process LRU tier.
+            embedding_service: Enables similarity lookup for paraphrased queries.
+            similarity_threshold: Minimum cosine similarity for a similarity hit.
+            metrics_middleware: Counts every lookup as a cache hit or miss.
+        """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # Memory-tier entries are never evicted from disk, so keep it smaller
+        self.memory_entries = min(memory_entries, max_entries)
+        self.embedding_service = embedding_service
+        self.similarity_threshold = similarity_threshold
+        self.metrics_middleware = metrics_middleware
+
+        self._lock = threading.RLock()
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        # Embedding of the last missed query, reused by the following set()
+        self._last_embedding: Optional[Tuple[str, List[float]]] = None
+        self._hits = 0
+        self._semantic_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        self._conn = sqlite3.connect(
+            str(self.cache_dir / self.DB_NAME), check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    docs_key TEXT,
+                    query TEXT NOT NULL,
+                    doc_count INTEGER NOT NULL,
+                    response TEXT NOT NULL,
+                    embedding BLOB,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_docs ON responses(docs_key)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access)"
+            )
+        self._import_json_files()
+        self._purge_expired()
+        self._entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
 
     def _make_key(self, query: str, doc_texts: List[str]) -> str:
         """Generate cache key from query and document texts."""
@@ -29,6 +112,14 @@ class ResponseCache:
         hash_digest = hashlib.sha256(combined.encode()).hexdigest()
         return hash_digest
 
+    @staticmethod
+    def _make_docs_key(doc_texts: List[str]) -> str:
+        """Key of the retrieved documents alone (for similarity lookup)."""
+        return hashlib.sha256("|".join(sorted(doc_texts)).encode()).hexdigest()
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
     def get(self, query: str, doc_texts: List[str]) -> Optional[str]:
         """Retrieve cached response if available.
 
@@ -39,19 +130,88 @@ class ResponseCache:
         Returns:
             Cached response or None if not found.
         """
+        start_time = time.time()
         key = self._make_key(query, doc_texts)
-        cache_file = self.cache_dir / f"{key}.json"
-
-        if not cache_file.exists():
-            return None
-
+        semantic = False
         try:
-            with open(cache_file, "r", encoding="utf-8") as fh:
-                data = json.load(fh)
-                return data.get("response")
+            response = self._get_exact(key, start_time)
+            if response is None and self.embedding_service is not None:
+                response = self._get_similar(query, doc_texts, start_time)
+                semantic = response is not None
         except Exception as exc:
             logger.warning("Failed to read cache: %s", exc)
+            response = None
+
+        with self._lock:
+            if response is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._semantic_hits += semantic
+        if self.metrics_middleware:
+            self.metrics_middleware.record_cache_lookup(
+                hit=response is not None,
+                latency_ms=(time.time() - start_time) * 1000,
+                semantic=semantic,
+            )
+        return response
+
+    def _get_exact(self, key: str, now: float) -> Optional[str]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                response, created_at = entry
+                if not self._expired(created_at, now):
+                    self._memory.move_to_end(key)
+                    return response
+                self._delete(key)
+                return None
+
+            row = self._conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            response, created_at = row
+            if self._expired(created_at, now):
+                self._delete(key)
+                return None
+            self._touch(key, now)
+            self._remember(key, response, created_at)
+            return response
+
+    def _get_similar(
+        self, query: str, doc_texts: List[str], now: float
+    ) -> Optional[str]:
+        """Best answer to a similar query over the same documents."""
+        embedding = self.embedding_service.get_embedding(query)
+        if not embedding:
             return None
+        self._last_embedding = (query, embedding)
+
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT key, response, embedding, created_at FROM responses
+                WHERE docs_key = ? AND embedding IS NOT NULL
+                """,
+                (self._make_docs_key(doc_texts),),
+            ).fetchall()
+            best: Optional[Tuple[float, str, str, float]] = None
+            for key, response, blob, created_at in rows:
+                if self._expired(created_at, now):
+                    continue
+                similarity = _cosine(embedding, array("f", blob))
+                if similarity >= self.similarity_threshold and (
+                    best is None or similarity > best[0]
+                ):
+                    best = (similarity, key, response, created_at)
+            if best is None:
+                return None
+            _, key, response, created_at = best
+            self._touch(key, now)
+            self._remember(key, response, created_at)
+            return response
 
     def set(self, query: str, doc_texts: List[str], response: str) -> None:
         """Cache a response.
@@ -62,29 +222,179 @@ class ResponseCache:
             response: LLM-generated response to cache.
         """
         key = self._make_key(query, doc_texts)
-        cache_file = self.cache_dir / f"{key}.json"
-
+        now = time.time()
         try:
-            data = {"query": query, "doc_count": len(doc_texts), "response": response}
-            with open(cache_file, "w", encoding="utf-8") as fh:
-                json.dump(data, fh, indent=2)
+            blob = None
+            if self.embedding_service is not None:
+                if self._last_embedding and self._last_embedding[0] == query:
+                    embedding = self._last_embedding[1]
+                else:
+                    embedding = self.embedding_service.get_embedding(query)
+                if embedding:
+                    blob = array("f", embedding).tobytes()
+
+            with self._lock:
+                exists = self._conn.execute(
+                    "SELECT 1 FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                with self._conn:
+                    self._conn.execute(
+                        """
+                        INSERT OR REPLACE INTO responses
+                        (key, docs_key, query, doc_count, response, embedding,
+                         created_at, last_access)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (
+                            key,
+                            self._make_docs_key(doc_texts),
+                            query,
+                            len(doc_texts),
+                            response,
+                            blob,
+                            now,
+                            now,
+                        ),
+                    )
+                if not exists:
+                    self._entries += 1
+                self._remember(key, response, now)
+                self._evict()
         except Exception as exc:
             logger.warning("Failed to write cache: %s", exc)
 
+    def _remember(self, key: str, response: str, created_at: float) -> None:
+        """Put a response in the memory tier."""
+        self._memory[key] = (response, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _touch(self, key: str, now: float) -> None:
+        with self._conn:
+            self._conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?", (now, key)
+            )
+
+    def _delete(self, key: str) -> None:
+        self._memory.pop(key, None)
+        with self._conn:
+            cursor = self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+        self._entries -= cursor.rowcount
+
+    def _evict(self) -> None:
+        """Drop least recently used entries above max_entries.
+
+        Memory-tier hits do not update last_access on disk, so entries in the
+        memory tier are treated as recently used and kept.
+        """
+        excess = self._entries - self.max_entries
+        if excess <= 0:
+            return
+        hot = list(self._memory)
+        with self._conn:
+            keys = [
+                row[0]
+                for row in self._conn.execute(
+                    f"""
+                    SELECT key FROM responses
+                    WHERE key NOT IN ({",".join("?" * len(hot))})
+                    ORDER BY last_access, rowid LIMIT ?
+                    """,
+                    (*hot, excess),
+                )
+            ]
+            self._conn.executemany(
+                "DELETE FROM responses WHERE key = ?", [(key,) for key in keys]
+            )
+        for key in keys:
+            self._memory.pop(key, None)
+        self._entries -= len(keys)
+        self._evictions += len(keys)
+
+    def _purge_expired(self) -> None:
+        if self.ttl_seconds is None:
+            return
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+
+    def _import_json_files(self) -> None:
+        """Move responses of the former one-file-per-key format into the database."""
+        files = list(self.cache_dir.glob("*.json"))
+        if not files:
+            return
+        now = time.time()
+        rows = []
+        imported = []
+        for cache_file in files:
+            try:
+                with open(cache_file, "r", encoding="utf-8") as fh:
+                    data = json.load(fh)
+                rows.append(
+                    (
+                        cache_file.stem,
+                        data.get("query", ""),
+                        data.get("doc_count", 0),
+                        data["response"],
+                        now,
+                        now,
+                    )
+                )
+                imported.append(cache_file)
+            except Exception as exc:
+                logger.warning("Skipping unreadable cache file %s: %s", cache_file, exc)
+        with self._conn:
+            self._conn.executemany(
+                """
+                INSERT OR IGNORE INTO responses
+                (key, query, doc_count, response, created_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+        for cache_file in imported:
+            cache_file.unlink(missing_ok=True)
+        logger.info("Imported %d cached responses into %s", len(rows), self.DB_NAME)
+
     def clear(self) -> None:
         """Clear all cached responses."""
         try:
-            for cache_file in self.cache_dir.glob("*.json"):
-                cache_file.unlink()
+            with self._lock:
+                with self._conn:
+                    self._conn.execute("DELETE FROM responses")
+                self._memory.clear()
+                self._entries = 0
             logger.info("Cache cleared")
         except Exception as exc:
             logger.warning("Failed to clear cache: %s", exc)
 
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
     def stats(self) -> dict:
-        """Return cache statistics."""
-        try:
-            files = list(self.cache_dir.glob("*.json"))
-            return {"cache_entries": len(files), "cache_dir": str(self.cache_dir)}
-        except Exception as exc:
-            logger.warning("Failed to get cache stats: %s", exc)
-            return {"error": str(exc)}
+        """Return cache statistics (from running counters, no disk scan)."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "cache_entries": self._entries,
+                "cache_dir": str(self.cache_dir),
+                "memory_entries": len(self._memory),
+                "hits": self._hits,
+                "semantic_hits": self._semantic_hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+            }
+
+
+def _cosine(a: List[float], b: List[float]) -> float:
+    if len(a) != len(b):
+        return 0.0
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
@@ -28,6 +28,17 @@ class VectorStore(ABC):
     def add(self, id: str, text: str, embedding: List[float]) -> None:
         """Add a vector with metadata to the store."""
 
+    def add_many(
+        self, ids: List[str], texts: List[str], embeddings: List[List[float]]
+    ) -> None:
+        """Add several vectors at once.
+
+        The default adds them one by one; stores with a bulk insert should
+        override it.
+        """
+        for ident, text, embedding in zip(ids, texts, embeddings):
+            self.add(ident, text, embedding)
+
     @abstractmethod
     def similarity_search(
         self, embedding: List[float], k: int = 3
@@ -63,6 +74,8 @@ class ChromaVectorStore(VectorStore):
         self._docs: List[str] = []
         self._tokenized_docs: List[List[str]] = []
         self._bm25: Optional[BM25Okapi] = None
+        # BM25 is rebuilt lazily, on the first hybrid search after new documents
+        self._bm25_stale = False
         try:
             all_data = self.collection.get(include=["ids", "documents"]) or {}
             ids = all_data.get("ids", [[]])[0] if all_data.get("ids") else []
@@ -86,25 +99,67 @@ class ChromaVectorStore(VectorStore):
     def add(self, id: str, text: str, embedding: List[float]) -> None:
         try:
             self.collection.add(ids=[id], documents=[text], embeddings=[embedding])
-            # Persist is automatic for duckdb+parquet client, but we call persist to be explicit
-            try:
-                self.client.persist()
-            except Exception:
-                # Some chroma client versions don't expose persist()
-                pass
-            # Update BM25 index state incrementally: append tokenized doc and rebuild BM25 from tokenized list
+            self._persist()
+            self._append_docs([id], [text])
+        except Exception as exc:
+            logger.error("Failed to add vector to Chroma: %s", exc)
+
+    def add_many(
+        self, ids: List[str], texts: List[str], embeddings: List[List[float]]
+    ) -> None:
+        """Add a batch with one Chroma insert and one persist.
+
+        Entries without an embedding (failed embedding requests) are skipped.
+        """
+        rows = [
+            (ident, text, embedding)
+            for ident, text, embedding in zip(ids, texts, embeddings)
+            if embedding
+        ]
+        if len(rows) < len(ids):
+            logger.warning(
+                "Skipping %d documents without embeddings", len(ids) - len(rows)
+            )
+        if not rows:
+            return
+
+        batch_ids, batch_texts, batch_embeddings = (list(col) for col in zip(*rows))
+        try:
+            self.collection.add(
+                ids=batch_ids, documents=batch_texts, embeddings=batch_embeddings
+            )
+            self._persist()
+            self._append_docs(batch_ids, batch_texts)
+        except Exception as exc:
+            logger.error("Failed to add %d vectors to Chroma: %s", len(rows), exc)
+
+    def _persist(self) -> None:
+        # Persist is automatic for duckdb+parquet client, but we call persist to be explicit
+        try:
+            self.client.persist()
+        except Exception:
+            # Some chroma client versions don't expose persist()
+            pass
+
+    def _append_docs(self, ids: List[str], texts: List[str]) -> None:
+        """Track new documents for BM25; the index itself is rebuilt on demand."""
+        self._ids.extend(ids)
+        self._docs.extend(texts)
+        self._tokenized_docs.extend(text.split() for text in texts)
+        self._bm25_stale = True
+
+    def _bm25_index(self) -> Optional[BM25Okapi]:
+        """BM25 over all documents, rebuilt once after any number of adds."""
+        if self._bm25_stale:
             try:
-                self._ids.append(id)
-                self._docs.append(text)
-                tokenized_new = text.split()
-                self._tokenized_docs.append(tokenized_new)
-                # Recreate BM25 using tokenized docs (avoids re-tokenizing existing docs)
-                self._bm25 = BM25Okapi(self._tokenized_docs)
+                self._bm25 = (
+                    BM25Okapi(self._tokenized_docs) if self._tokenized_docs else None
+                )
             except Exception:
                 # Non-critical if BM25 update fails
-                pass
-        except Exception as exc:
-            logger.error("Failed to add vector to Chroma: %s", exc)
+                self._bm25 = None
+            self._bm25_stale = False
+        return self._bm25
 
     def similarity_search(
         self, embedding: List[float], k: int = 3
@@ -188,9 +243,11 @@ class ChromaVectorStore(VectorStore):
                 sem_scores[ident] = s
 
             # BM25 scores across corpus
-            if self._bm25 is not None:
+            bm25_index = self._bm25_index()
+            if bm25_index is not None:
                 tokenized_query = query_text.split()
-                bm25_raw = self._bm25.get_scores(tokenized_query)
+                # numpy array -> list, so the emptiness checks below work
+                bm25_raw = [float(x) for x in bm25_index.get_scores(tokenized_query)]
             else:
                 bm25_raw = [0.0] * len(self._docs)
 
@@ -47,11 +47,14 @@ class TestResponseCache:
             cache.set("q1", ["d1"], "r1")
             cache.set("q2", ["d2"], "r2")
 
+            # One database file instead of one file per response
             cache_dir = Path(tmpdir)
-            assert len(list(cache_dir.glob("*.json"))) == 2
+            assert [p.name for p in cache_dir.glob("*.json")] == []
+            assert cache.stats()["cache_entries"] == 2
 
             cache.clear()
-            assert len(list(cache_dir.glob("*.json"))) == 0
+            assert cache.stats()["cache_entries"] == 0
+            assert cache.get("q1", ["d1"]) is None
 
     def test_cache_stats(self):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -123,3 +123,68 @@ def test_integration_process_query(monkeypatch):
     assert len(store._ids) == 1 or len(store.collection.ids) == 1
     # neighbors should be returned (may be empty if underlying query returns less)
     assert isinstance(neighbors, list)
+
+
+def test_add_many_single_insert_and_lazy_bm25(monkeypatch):
+    store = vs_mod.ChromaVectorStore(persist_dir="./chroma_db_test")
+    inserts = []
+    original_add = store.collection.add
+    monkeypatch.setattr(
+        store.collection,
+        "add",
+        lambda **kwargs: inserts.append(kwargs["ids"]) or original_add(**kwargs),
+    )
+
+    store.add_many(
+        ["a", "b", "c"],
+        ["budget meeting notes", "hiring plan", "failed doc"],
+        [[0.1, 0.2, 0.3], [0.3, 0.2, 0.1], []],
+    )
+    store.add("d", "quarterly review", [0.2, 0.2, 0.2])
+
+    assert inserts == [["a", "b"], ["d"]]
+    assert store._ids == ["a", "b", "d"]
+    assert store._bm25 is None  # not built until a hybrid search needs it
+
+    hits = store.hybrid_search([0.1, 0.2, 0.3], "budget", k=1, alpha=0.0)
+
+    assert hits[0][0] == "a"
+    assert store._bm25 is not None
+
+
+def test_get_embeddings_batches_requests(monkeypatch):
+    calls = []
+
+    def fake_create(model, input):
+        calls.append(list(input))
+        # Out of order on purpose: items are matched by index
+        return {
+            "data": [
+                {"index": i, "embedding": [float(len(text))]}
+                for i, text in reversed(list(enumerate(input)))
+            ]
+        }
+
+    monkeypatch.setattr(embeddings_mod.openai.Embedding, "create", staticmethod(fake_create))
+    emb_srv = embeddings_mod.OpenAIEmbeddingService(api_key="sk-test", batch_size=2)
+
+    embeddings = emb_srv.get_embeddings(["a", "bb", "ccc"])
+
+    assert calls == [["a", "bb"], ["ccc"]]
+    assert embeddings == [[1.0], [2.0], [3.0]]
+
+
+def test_ingest_stores_every_text_in_bulk(monkeypatch):
+    def fake_create(model, input):
+        return {"data": [{"index": i, "embedding": [0.1, 0.2, 0.3]} for i in range(len(input))]}
+
+    monkeypatch.setattr(embeddings_mod.openai.Embedding, "create", staticmethod(fake_create))
+    emb_srv = embeddings_mod.OpenAIEmbeddingService(api_key="sk-test")
+    store = vs_mod.ChromaVectorStore(persist_dir="./chroma_db_test")
+    app = EmbeddingApp(emb_service=emb_srv, vector_store=store)
+    texts = [f"meeting {i}" for i in range(10)]
+
+    ids = app.ingest(texts, batch_size=3, workers=2)
+
+    assert len(ids) == 10
+    assert sorted(zip(store._ids, store._docs)) == sorted(zip(ids, texts))
@@ -12,12 +12,13 @@ Tests cover:
 import json
 import os
 import tempfile
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
 from app.metrics import (APICallMetric, InMemoryMetricsCollector,
-                         MetricCollector, MetricsMiddleware, MetricsSummary,
-                         OpenAIPricingCalculator)
+                         LatencySketch, MetricCollector, MetricsMiddleware,
+                         MetricsSummary, OpenAIPricingCalculator,
+                         StreamingMetricsCollector)
 
 
 class TestAPICallMetric:
@@ -362,6 +363,164 @@ class TestInMemoryMetricsCollector:
                 os.remove(filepath)
 
 
+class TestLatencySketch:
+    """Tests for the bounded latency sketch."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test sketch quantiles against exact nearest-rank quantiles."""
+        values = [((i * 7919) % 10_000) / 10 + 0.5 for i in range(10_000)]
+        sketch = LatencySketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        exact = sorted(values)
+        for q in (0.5, 0.9, 0.95, 0.99):
+            expected = exact[max(0, int(q * len(exact) + 0.999999) - 1)]
+            assert sketch.quantile(q) == pytest.approx(expected, rel=0.01)
+        assert sketch.mean == pytest.approx(sum(values) / len(values))
+        # Memory depends on the value range, not the number of values
+        assert len(sketch._buckets) < 500
+
+    def test_merge(self):
+        """Test merging two sketches equals recording into one."""
+        first, second, both = LatencySketch(), LatencySketch(), LatencySketch()
+        for i in range(1, 101):
+            (first if i % 2 else second).add(float(i))
+            both.add(float(i))
+
+        first.merge(second)
+
+        assert first.count == 100
+        assert first.quantile(0.95) == both.quantile(0.95)
+        assert first.min == 1.0 and first.max == 100.0
+
+
+class TestStreamingMetricsCollector:
+    """Tests for StreamingMetricsCollector."""
+
+    @staticmethod
+    def make_metric(i, **overrides):
+        values = dict(
+            timestamp=datetime.now(),
+            model="gpt-4o-mini" if i % 3 else "text-embedding-3-small",
+            tokens_in=100 + i,
+            tokens_out=10,
+            latency_ms=20.0 + i,
+            cost_usd=0.0001,
+            operation_type="llm_completion" if i % 3 else "embedding",
+            success=i % 10 != 0,
+        )
+        values.update(overrides)
+        return APICallMetric(**values)
+
+    def test_summary_matches_in_memory_collector(self):
+        """Test counters are exact and percentiles close to the exact collector."""
+        streaming = StreamingMetricsCollector()
+        exact = InMemoryMetricsCollector()
+        for i in range(1000):
+            metric = self.make_metric(i)
+            streaming.record_call(metric)
+            exact.record_call(metric)
+
+        got, expected = streaming.get_summary(), exact.get_summary()
+
+        assert got.total_inferences == expected.total_inferences
+        assert got.total_tokens_in == expected.total_tokens_in
+        assert got.total_errors == expected.total_errors
+        assert got.error_rate == pytest.approx(expected.error_rate)
+        assert got.total_cost_usd == pytest.approx(expected.total_cost_usd)
+        assert got.latency_mean_ms == pytest.approx(expected.latency_mean_ms)
+        assert got.latency_p95_ms == pytest.approx(expected.latency_p95_ms, rel=0.02)
+        assert got.latency_p50_ms == pytest.approx(expected.latency_p50_ms, rel=0.02)
+        for key, stats in expected.by_model.items():
+            assert got.by_model[key]["count"] == stats["count"]
+            assert got.by_model[key]["tokens_in"] == stats["tokens_in"]
+
+    def test_recent_summary_uses_time_buckets(self):
+        """Test last-N-minutes view only includes recent calls."""
+        collector = StreamingMetricsCollector(window_seconds=60, max_windows=60)
+        now = datetime.now()
+        collector.record_call(self.make_metric(1, timestamp=now - timedelta(minutes=30)))
+        collector.record_call(self.make_metric(2, timestamp=now - timedelta(minutes=3)))
+        collector.record_call(self.make_metric(4, timestamp=now))
+        # Late arrival for an older bucket
+        collector.record_call(self.make_metric(5, timestamp=now - timedelta(minutes=4)))
+
+        assert collector.get_recent_summary(minutes=10).total_inferences == 3
+        assert collector.get_recent_summary(minutes=60).total_inferences == 4
+        assert collector.get_summary().total_inferences == 4
+
+    def test_agent_execution_latency(self):
+        """Test agent latency is derived from agent_execution calls."""
+        collector = StreamingMetricsCollector()
+        middleware = MetricsMiddleware(collector)
+        for latency in [500.0, 750.0, 900.0, 1000.0, 1100.0, 1200.0, 1500.0]:
+            middleware.record_agent_execution(latency_ms=latency)
+
+        summary = collector.get_summary()
+
+        assert summary.agent_execution_latency_mean_ms == pytest.approx(992.86, abs=0.01)
+        assert summary.agent_execution_latency_p95_ms == pytest.approx(1500.0, rel=0.01)
+
+    def test_export_snapshot_and_journal_replay(self, tmp_path):
+        """Test snapshot export/load and replaying the append-only journal."""
+        journal = tmp_path / "calls.jsonl"
+        collector = StreamingMetricsCollector(journal_path=str(journal))
+        for i in range(50):
+            collector.record_call(self.make_metric(i))
+        collector.close()
+        original = collector.get_summary()
+
+        snapshot = tmp_path / "metrics.json"
+        collector.export(str(snapshot))
+        from_snapshot = StreamingMetricsCollector()
+        from_snapshot.load(str(snapshot))
+        from_journal = StreamingMetricsCollector()
+        from_journal.load(str(journal))
+
+        assert len(journal.read_text().splitlines()) == 50
+        for loaded in (from_snapshot.get_summary(), from_journal.get_summary()):
+            assert loaded.total_inferences == original.total_inferences
+            assert loaded.total_tokens_in == original.total_tokens_in
+            assert loaded.latency_p95_ms == original.latency_p95_ms
+            assert loaded.by_operation == original.by_operation
+
+    def test_cache_lookups_are_counted_apart_from_calls(self, tmp_path):
+        """Test cache lookups do not count as inferences or skew latencies."""
+        collector = StreamingMetricsCollector()
+        middleware = MetricsMiddleware(collector)
+        collector.record_call(self.make_metric(1, latency_ms=100.0))
+        middleware.record_cache_lookup(hit=True, latency_ms=0.1)
+        middleware.record_cache_lookup(hit=True, latency_ms=0.2, semantic=True)
+        middleware.record_cache_lookup(hit=False, latency_ms=0.1)
+
+        summary = collector.get_summary()
+        assert summary.total_inferences == 1
+        assert summary.latency_p50_ms == pytest.approx(100.0, rel=0.01)
+        assert (summary.cache_hits, summary.cache_semantic_hits, summary.cache_misses) == (2, 1, 1)
+        assert set(summary.by_operation) == {"llm_completion"}
+
+        snapshot = tmp_path / "metrics.json"
+        collector.export(str(snapshot))
+        loaded = StreamingMetricsCollector()
+        loaded.load(str(snapshot))
+        assert (loaded.get_summary().cache_hits, loaded.get_summary().cache_misses) == (2, 1)
+
+    def test_one_line_journal_replay(self, tmp_path):
+        """Test a journal with a single call is replayed, not read as a snapshot."""
+        journal = tmp_path / "calls.jsonl"
+        collector = StreamingMetricsCollector(journal_path=str(journal))
+        collector.record_call(self.make_metric(1))
+        collector.close()
+
+        loaded = StreamingMetricsCollector()
+        loaded.load(str(journal))
+
+        assert len(journal.read_text().splitlines()) == 1
+        assert loaded.get_summary().total_inferences == 1
+        assert loaded.get_summary().total_tokens_in == 101
+
+
 class TestMetricsMiddleware:
     """Tests for MetricsMiddleware."""
 
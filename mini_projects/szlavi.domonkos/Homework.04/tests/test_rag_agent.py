@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import tempfile
 from pathlib import Path
@@ -47,11 +48,14 @@ class TestResponseCache:
             cache.set("q1", ["d1"], "r1")
             cache.set("q2", ["d2"], "r2")
 
+            # One database file instead of one file per response
             cache_dir = Path(tmpdir)
-            assert len(list(cache_dir.glob("*.json"))) == 2
+            assert [p.name for p in cache_dir.glob("*.json")] == []
+            assert cache.stats()["cache_entries"] == 2
 
             cache.clear()
-            assert len(list(cache_dir.glob("*.json"))) == 0
+            assert cache.stats()["cache_entries"] == 0
+            assert cache.get("q1", ["d1"]) is None
 
     def test_cache_stats(self):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -64,6 +68,110 @@ class TestResponseCache:
             assert stats["cache_dir"] == tmpdir
 
 
+class FakeEmbeddingService:
+    """Maps known phrasings of a question to the same direction."""
+
+    VECTORS = {
+        "When is the budget meeting?": [1.0, 0.0, 0.1],
+        "What time is the budget meeting?": [0.98, 0.05, 0.12],
+        "Who leads the hiring plan?": [0.0, 1.0, 0.0],
+    }
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_embedding(self, text):
+        self.calls += 1
+        return self.VECTORS.get(text, [0.0, 0.0, 1.0])
+
+
+class TestTwoTierResponseCache:
+    def test_responses_persist_across_instances(self, tmp_path):
+        cache = ResponseCache(str(tmp_path))
+        cache.set("q", ["d1", "d2"], "answer")
+        cache.close()
+
+        reopened = ResponseCache(str(tmp_path))
+        assert reopened.get("q", ["d2", "d1"]) == "answer"
+        assert reopened.stats()["cache_entries"] == 1
+
+    def test_size_bound_evicts_least_recently_used(self, tmp_path):
+        cache = ResponseCache(str(tmp_path), max_entries=3, memory_entries=1)
+        for i in range(3):
+            cache.set(f"q{i}", ["d"], f"r{i}")
+        cache.get("q0", ["d"])  # q1 is now the least recently used
+
+        cache.set("q3", ["d"], "r3")
+
+        stats = cache.stats()
+        assert stats["cache_entries"] == 3
+        assert stats["evictions"] == 1
+        assert cache.get("q1", ["d"]) is None
+        assert cache.get("q0", ["d"]) == "r0"
+
+    def test_ttl_expiry(self, tmp_path, monkeypatch):
+        import app.response_cache as cache_mod
+
+        now = [1000.0]
+        monkeypatch.setattr(cache_mod.time, "time", lambda: now[0])
+        cache = ResponseCache(str(tmp_path), ttl_seconds=60)
+        cache.set("q", ["d"], "r")
+
+        now[0] += 30
+        assert cache.get("q", ["d"]) == "r"
+        now[0] += 31
+        assert cache.get("q", ["d"]) is None
+        assert cache.stats()["cache_entries"] == 0
+
+    def test_similarity_lookup_for_paraphrased_query(self, tmp_path):
+        emb = FakeEmbeddingService()
+        cache = ResponseCache(str(tmp_path), embedding_service=emb)
+        docs = ["Budget meeting: Monday 10:00"]
+
+        assert cache.get("When is the budget meeting?", docs) is None
+        cache.set("When is the budget meeting?", docs, "Monday at 10.")
+        assert emb.calls == 1  # Embedding of the miss is reused by set()
+
+        assert cache.get("What time is the budget meeting?", docs) == "Monday at 10."
+        # Same question, different documents: no reuse
+        assert cache.get("What time is the budget meeting?", ["Other doc"]) is None
+        assert cache.get("Who leads the hiring plan?", docs) is None
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["semantic_hits"], stats["misses"]) == (1, 1, 3)
+        assert stats["hit_rate"] == pytest.approx(0.25)
+
+    def test_lookups_feed_metrics(self, tmp_path):
+        from app.metrics import InMemoryMetricsCollector, MetricsMiddleware
+
+        collector = InMemoryMetricsCollector()
+        cache = ResponseCache(
+            str(tmp_path), metrics_middleware=MetricsMiddleware(collector)
+        )
+        cache.get("q", ["d"])
+        cache.set("q", ["d"], "r")
+        cache.get("q", ["d"])
+        cache.get("q", ["d"])
+
+        summary = collector.get_summary()
+        assert (summary.cache_hits, summary.cache_misses) == (2, 1)
+        # Lookups are not inferences and stay out of the latency aggregates
+        assert summary.total_inferences == 0
+        assert summary.by_operation == {}
+
+    def test_imports_legacy_json_files(self, tmp_path):
+        # Former format: <sha256 of query|docs>.json
+        key = hashlib.sha256("q|d".encode()).hexdigest()
+        (tmp_path / f"{key}.json").write_text(
+            json.dumps({"query": "q", "doc_count": 1, "response": "old answer"})
+        )
+
+        cache = ResponseCache(str(tmp_path))
+
+        assert cache.get("q", ["d"]) == "old answer"
+        assert list(tmp_path.glob("*.json")) == []
+
+
 class TestRAGAgent:
     def test_rag_agent_init(self):
         rag = RAGAgent(api_key="test-key", use_cache=False)
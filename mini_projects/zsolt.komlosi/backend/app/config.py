@@ -26,6 +26,11 @@ class Settings(BaseSettings):
     # External APIs (from HF1)
     ip_api_url: str = "http://ip-api.com/json"
     holidays_api_url: str = "https://date.nager.at/api/v3/PublicHolidays"
+    holidays_cache_dir: Optional[str] = "./data/holidays"  # None: memory only
+
+    # SLA business hours (local time of the customer)
+    business_hours_start: int = 9
+    business_hours_end: int = 18
 
     # Qdrant Vector Database
     qdrant_host: str = "localhost"
@@ -50,12 +55,17 @@ class Settings(BaseSettings):
     rag_rerank_top_k: int = 3
     rag_vector_weight: float = 0.5
     rag_bm25_weight: float = 0.5
+    rag_bm25_index_dir: Optional[str] = "./data/bm25"  # None: memory only
+    rag_enrichment_batch_size: int = 8  # Chunks per translation/keyword request
+    rag_enrichment_concurrency: int = 4  # Enrichment requests in flight
+    rag_enrichment_cache_path: Optional[str] = "./data/enrichment_cache.jsonl"  # None: memory only
     rag_max_context_tokens: int = 6000
     rag_min_score_threshold: float = 0.7
 
     # Memory Settings
     memory_rolling_summary_interval: int = 10
     memory_max_history: int = 50
+    memory_session_cache_size: int = 256  # Sessions whose last messages are cached
 
     # API Settings
     api_host: str = "0.0.0.0"
@@ -141,3 +141,24 @@ Documents to evaluate:
 {documents}
 
 Return a JSON array with scores and reasoning for each document."""
+
+# Chunk enrichment prompts (document ingestion, several chunks per request)
+CHUNK_ENRICHMENT_PROMPT = """You are preparing Hungarian knowledge base chunks for an English search index.
+
+For each chunk below:
+1. Translate the chunk to English. Preserve all formatting, structure, and technical terms.
+   The translation must cover the whole chunk, nothing more.
+2. Extract the {max_keywords} most important English keywords or short phrases that are useful for search and retrieval.
+
+Return one entry per chunk with the chunk's index, its translation and its keywords.
+
+{chunks}"""
+
+CHUNK_KEYWORDS_PROMPT = """You are preparing English knowledge base chunks for a search index.
+
+For each chunk below, extract the {max_keywords} most important keywords or short phrases
+that are useful for search and retrieval. Leave the translation empty.
+
+Return one entry per chunk with the chunk's index and its keywords.
+
+{chunks}"""
@@ -1,13 +1,39 @@
 """
 PII (Personally Identifiable Information) filter.
 Detects and masks sensitive information before logging/storage.
+
+All enabled patterns are compiled into one alternation of named groups, so
+a text is scanned once. Where matches would overlap, the leftmost wins, and
+at the same position the pattern listed first in PATTERNS wins.
 """
 
 import re
-from typing import List, Tuple
+import string
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from app.models import PIIMatch, PIIFilterResult
 
+# PIIMatch.type values; other pattern names are reported as "other"
+MATCH_TYPES = {"email", "phone", "credit_card", "name", "address"}
+
+# No pattern starts a match in the middle of an alphanumeric run, except
+# phone numbers ("+", "0"). Rejecting those positions up front skips most of
+# the text without trying every alternative. A match can still start right
+# where the previous one ended; _finditer checks that position separately.
+START_GUARD = r"(?<![a-z0-9](?![+0]))"
+ALPHANUMERIC = frozenset(string.ascii_letters + string.digits)
+
+# Separator for batch scans: no pattern can match across a NUL character
+BATCH_SEPARATOR = "\x00"
+
+# Characters kept back in streaming mode until more text arrives. Every
+# pattern decides a match within this many characters of where it starts.
+STREAM_LOOKAHEAD = 1024
+
+# Streaming mode scans once this many new characters have arrived
+STREAM_BLOCK = 64 * 1024
+
 
 class PIIFilter:
     """
@@ -63,6 +89,45 @@ class PIIFilter:
         else:
             self.patterns = self.PATTERNS.copy()
 
+        self._masks = {name: mask for name, (_, mask) in self.patterns.items()}
+        self._types = {name: name if name in MATCH_TYPES else "other" for name in self.patterns}
+        self._regex = None
+        self._unguarded = None
+        if self.patterns:
+            alternation = "|".join(
+                f"(?P<{name}>{pattern})" for name, (pattern, _) in self.patterns.items()
+            )
+            self._regex = re.compile(f"{START_GUARD}(?:{alternation})", re.IGNORECASE)
+            self._unguarded = re.compile(alternation, re.IGNORECASE)
+
+    def _finditer(self, text: str, pos: int = 0) -> Iterator[re.Match]:
+        """Non-overlapping matches of the alternation, from pos."""
+        if self._regex is None:
+            return
+        search, match_at = self._regex.search, self._unguarded.match
+        while True:
+            match = None
+            if 0 < pos < len(text) and text[pos - 1] in ALPHANUMERIC:
+                # The guard would reject this position
+                match = match_at(text, pos)
+            if match is None:
+                match = search(text, pos)
+                if match is None:
+                    return
+            yield match
+            pos = match.end()
+
+    def _match(self, match: re.Match, offset: int = 0) -> PIIMatch:
+        name = match.lastgroup
+        # Fields are known to be valid, skip pydantic validation
+        return PIIMatch.model_construct(
+            type=self._types[name],
+            original=match.group(),
+            masked=self._masks[name],
+            start=match.start() - offset,
+            end=match.end() - offset,
+        )
+
     def detect(self, text: str) -> List[PIIMatch]:
         """
         Detect PII in text.
@@ -71,24 +136,9 @@ class PIIFilter:
             text: Text to scan
 
         Returns:
-            List of PIIMatch objects
+            List of non-overlapping PIIMatch objects, by position
         """
-        matches = []
-
-        for pii_type, (pattern, mask) in self.patterns.items():
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                matches.append(PIIMatch(
-                    type=pii_type if pii_type in ["email", "phone", "credit_card", "name", "address"] else "other",
-                    original=match.group(),
-                    masked=mask,
-                    start=match.start(),
-                    end=match.end(),
-                ))
-
-        # Sort by position
-        matches.sort(key=lambda x: x.start)
-
-        return matches
+        return [self._match(match) for match in self._finditer(text)]
 
     def filter(self, text: str) -> PIIFilterResult:
         """
@@ -100,32 +150,130 @@ class PIIFilter:
         Returns:
             PIIFilterResult with filtered text and matches
         """
-        matches = self.detect(text)
+        return self._result(text, self.detect(text))
 
+    @staticmethod
+    def _result(text: str, matches: List[PIIMatch]) -> PIIFilterResult:
         if not matches:
-            return PIIFilterResult(
+            return PIIFilterResult.model_construct(
                 original_text=text,
                 filtered_text=text,
                 matches=[],
                 has_pii=False,
             )
 
-        # Apply masks from end to start to preserve positions
-        filtered_text = text
-        for match in reversed(matches):
-            filtered_text = (
-                filtered_text[:match.start] +
-                match.masked +
-                filtered_text[match.end:]
-            )
+        # Apply masks from start to end in one pass
+        parts = []
+        position = 0
+        for match in matches:
+            parts.append(text[position:match.start])
+            parts.append(match.masked)
+            position = match.end
+        parts.append(text[position:])
 
-        return PIIFilterResult(
+        return PIIFilterResult.model_construct(
             original_text=text,
-            filtered_text=filtered_text,
+            filtered_text="".join(parts),
             matches=matches,
             has_pii=True,
         )
 
+    def filter_many(self, texts: Iterable[str]) -> List[PIIFilterResult]:
+        """
+        Detect and mask PII in many texts with a single scan.
+
+        Args:
+            texts: Texts to filter (e.g. the messages of a session)
+
+        Returns:
+            One PIIFilterResult per text, in order
+        """
+        texts = list(texts)
+        per_text: List[List[PIIMatch]] = [[] for _ in texts]
+        if texts:
+            # Start offset of every text in the joined string
+            starts = []
+            offset = 0
+            for text in texts:
+                starts.append(offset)
+                offset += len(text) + len(BATCH_SEPARATOR)
+            for match in self._finditer(BATCH_SEPARATOR.join(texts)):
+                index = bisect_right(starts, match.start()) - 1
+                per_text[index].append(self._match(match, starts[index]))
+
+        return [self._result(text, matches) for text, matches in zip(texts, per_text)]
+
+    def _scan_stream(self, chunks: Iterable[str]) -> Iterator[Tuple[str, Optional[PIIMatch]]]:
+        """
+        Scan text arriving in chunks.
+
+        Yields (text before the match, match) pairs with positions in the
+        whole stream, then (rest of the text, None). At most STREAM_BLOCK
+        characters plus STREAM_LOOKAHEAD (and any unfinished match) are buffered.
+        """
+        buffer = ""
+        buffer_offset = 0  # Stream position of buffer[0]
+        position = 0  # Buffer position up to which the text has been yielded
+        pending: List[str] = []  # Chunks not yet added to the buffer
+        pending_size = 0
+
+        def scan(final: bool):
+            nonlocal position
+            # Matches starting before this limit cannot change with more text
+            limit = len(buffer) if final else len(buffer) - STREAM_LOOKAHEAD
+            for match in self._finditer(buffer, position):
+                if match.start() >= limit:
+                    break
+                yield buffer[position:match.start()], self._match(match, -buffer_offset)
+                position = match.end()
+            if limit > position:
+                yield buffer[position:limit], None
+                position = limit
+
+        for chunk in chunks:
+            pending.append(chunk)
+            pending_size += len(chunk)
+            if pending_size < STREAM_BLOCK:
+                continue
+            buffer += "".join(pending)
+            pending, pending_size = [], 0
+            yield from scan(final=False)
+            # Keep one character before the scan position for \b
+            keep = max(position - 1, 0)
+            buffer, buffer_offset, position = buffer[keep:], buffer_offset + keep, position - keep
+        buffer += "".join(pending)
+        yield from scan(final=True)
+
+    def detect_stream(self, chunks: Iterable[str]) -> Iterator[PIIMatch]:
+        """
+        Detect PII in a large document, read in chunks.
+
+        Args:
+            chunks: Consecutive pieces of the text (e.g. lines of a file)
+
+        Yields:
+            PIIMatch objects with positions in the whole text
+        """
+        for _, match in self._scan_stream(chunks):
+            if match is not None:
+                yield match
+
+    def filter_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Mask PII in a large document, read in chunks.
+
+        Args:
+            chunks: Consecutive pieces of the text
+
+        Yields:
+            Pieces of the masked text; joined, they equal filter().filtered_text
+        """
+        for text, match in self._scan_stream(chunks):
+            if text:
+                yield text
+            if match is not None:
+                yield match.masked
+
     def mask_for_logging(self, text: str) -> str:
         """
         Quick mask for logging purposes.
@@ -136,7 +284,16 @@ class PIIFilter:
         Returns:
             Masked text
         """
-        return self.filter(text).filtered_text
+        parts = []
+        position = 0
+        for match in self._finditer(text):
+            parts.append(text[position:match.start()])
+            parts.append(self._masks[match.lastgroup])
+            position = match.end()
+        if not parts:
+            return text
+        parts.append(text[position:])
+        return "".join(parts)
 
 
 # Singleton instance
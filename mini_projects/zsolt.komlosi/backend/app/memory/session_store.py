@@ -1,29 +1,58 @@
 """
 Session store using SQLite for persistence.
+
+Each thread keeps one connection open (WAL mode, so readers do not block the
+writer). The last messages of recently used sessions are cached, so a turn
+of a long session reads a fixed-size window instead of the whole history.
 """
 
 import json
 import sqlite3
+import threading
+from collections import OrderedDict, deque
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Deque, List, Optional
 import uuid
 
 from app.config import get_settings
 from app.models import Session, Message, SessionSummary
 
 
+class _SessionWindow:
+    """Cached session row with its last messages."""
+
+    __slots__ = ("session", "messages", "message_count")
+
+    def __init__(self, session: Session, messages: Deque[Message], message_count: int):
+        self.session = session  # Without messages
+        self.messages = messages
+        self.message_count = message_count
+
+    @property
+    def complete(self) -> bool:
+        """Whether the window holds every message of the session."""
+        return len(self.messages) == self.message_count
+
+
 class SessionStore:
     """
     SQLite-based session store for conversation persistence.
     """
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        window_size: Optional[int] = None,
+        cache_size: Optional[int] = None,
+    ):
         """
         Initialize session store.
 
         Args:
             db_path: Path to SQLite database. Defaults to config setting.
+            window_size: Messages cached per session. Defaults to memory_max_history.
+            cache_size: Sessions kept in the cache. Defaults to config setting.
         """
         settings = get_settings()
         if db_path is None:
@@ -37,11 +66,48 @@ class SessionStore:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        self.window_size = window_size or settings.memory_max_history
+        self.cache_size = cache_size or settings.memory_session_cache_size
+        self._cache: "OrderedDict[str, _SessionWindow]" = OrderedDict()
+        self._cache_lock = threading.RLock()
+
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
         self._init_db()
 
+    def _connection(self) -> sqlite3.Connection:
+        """The calling thread's connection, opened on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """Close the connections of all threads and drop the cache."""
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.ProgrammingError:
+                    # Connections of other threads are closed when those exit
+                    pass
+            self._connections.clear()
+        self._local = threading.local()
+        with self._cache_lock:
+            self._cache.clear()
+
     def _init_db(self):
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        conn = self._connection()
+        with conn:
             cursor = conn.cursor()
 
             # Sessions table
@@ -71,13 +137,78 @@ class SessionStore:
                 )
             """)
 
-            # Index for faster lookups
+            # Windowed reads: last N messages of a session. Replaces the
+            # older index on session_id alone.
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_messages_session
-                ON messages(session_id)
+                CREATE INDEX IF NOT EXISTS idx_messages_session_created
+                ON messages(session_id, created_at)
             """)
+            cursor.execute("DROP INDEX IF EXISTS idx_messages_session")
+
+    @staticmethod
+    def _message_from_row(row: sqlite3.Row) -> Message:
+        return Message(
+            id=row["id"],
+            role=row["role"],
+            content=row["content"],
+            content_filtered=row["content_filtered"],
+            citations=json.loads(row["citations"]) if row["citations"] else [],
+            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+            created_at=datetime.fromisoformat(row["created_at"]),
+        )
+
+    @staticmethod
+    def _session_from_row(row: sqlite3.Row, messages: List[Message]) -> Session:
+        return Session(
+            id=row["id"],
+            user_identifier=row["user_identifier"],
+            messages=messages,
+            rolling_summary=row["rolling_summary"],
+            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+            created_at=datetime.fromisoformat(row["created_at"]),
+            updated_at=datetime.fromisoformat(row["updated_at"]),
+        )
 
-            conn.commit()
+    def _query_recent(self, session_id: str, limit: int) -> List[Message]:
+        """Last `limit` messages in chronological order, using the index."""
+        rows = self._connection().execute(
+            """
+            SELECT * FROM messages WHERE session_id = ?
+            ORDER BY created_at DESC, id DESC LIMIT ?
+            """,
+            (session_id, limit)
+        ).fetchall()
+        return [self._message_from_row(row) for row in reversed(rows)]
+
+    def _window(self, session_id: str) -> Optional[_SessionWindow]:
+        """Cached window of a session, loaded on a cache miss."""
+        with self._cache_lock:
+            window = self._cache.get(session_id)
+            if window is not None:
+                self._cache.move_to_end(session_id)
+                return window
+
+            conn = self._connection()
+            session_row = conn.execute(
+                "SELECT * FROM sessions WHERE id = ?", (session_id,)
+            ).fetchone()
+            if not session_row:
+                return None
+            message_count = conn.execute(
+                "SELECT COUNT(*) FROM messages WHERE session_id = ?", (session_id,)
+            ).fetchone()[0]
+            messages = deque(self._query_recent(session_id, self.window_size), maxlen=self.window_size)
+
+            window = _SessionWindow(self._session_from_row(session_row, []), messages, message_count)
+            self._cache_window(session_id, window)
+            return window
+
+    def _cache_window(self, session_id: str, window: _SessionWindow) -> None:
+        with self._cache_lock:
+            self._cache[session_id] = window
+            self._cache.move_to_end(session_id)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
 
     def create_session(
         self,
@@ -99,77 +230,105 @@ class SessionStore:
 
         now = datetime.utcnow()
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+        conn = self._connection()
+        with conn:
+            conn.execute(
                 """
                 INSERT INTO sessions (id, user_identifier, created_at, updated_at)
                 VALUES (?, ?, ?, ?)
                 """,
-                (session_id, user_identifier, now, now)
+                (session_id, user_identifier, now.isoformat(" "), now.isoformat(" "))
             )
-            conn.commit()
 
-        return Session(
+        session = Session(
             id=session_id,
             user_identifier=user_identifier,
             messages=[],
             created_at=now,
             updated_at=now,
         )
+        self._cache_window(
+            session_id, _SessionWindow(session.model_copy(), deque(maxlen=self.window_size), 0)
+        )
+        return session
 
-    def get_session(self, session_id: str) -> Optional[Session]:
+    def get_session(self, session_id: str, recent: Optional[int] = None) -> Optional[Session]:
         """
         Get a session by ID.
 
         Args:
             session_id: Session ID
+            recent: Only load the last N messages (None: all messages)
 
         Returns:
             Session object or None if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            # Get session
-            cursor.execute(
-                "SELECT * FROM sessions WHERE id = ?",
-                (session_id,)
+        if recent is not None:
+            window = self._window(session_id)
+            if window is None:
+                return None
+            return window.session.model_copy(
+                update={"messages": self.get_recent_messages(session_id, recent)}
             )
-            session_row = cursor.fetchone()
 
-            if not session_row:
-                return None
+        conn = self._connection()
+        session_row = conn.execute(
+            "SELECT * FROM sessions WHERE id = ?",
+            (session_id,)
+        ).fetchone()
 
-            # Get messages
-            cursor.execute(
-                "SELECT * FROM messages WHERE session_id = ? ORDER BY created_at",
-                (session_id,)
-            )
-            message_rows = cursor.fetchall()
-
-            messages = []
-            for row in message_rows:
-                messages.append(Message(
-                    id=row["id"],
-                    role=row["role"],
-                    content=row["content"],
-                    content_filtered=row["content_filtered"],
-                    citations=json.loads(row["citations"]) if row["citations"] else [],
-                    metadata=json.loads(row["metadata"]) if row["metadata"] else {},
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                ))
-
-            return Session(
-                id=session_row["id"],
-                user_identifier=session_row["user_identifier"],
-                messages=messages,
-                rolling_summary=session_row["rolling_summary"],
-                metadata=json.loads(session_row["metadata"]) if session_row["metadata"] else {},
-                created_at=datetime.fromisoformat(session_row["created_at"]),
-                updated_at=datetime.fromisoformat(session_row["updated_at"]),
-            )
+        if not session_row:
+            return None
+
+        message_rows = conn.execute(
+            "SELECT * FROM messages WHERE session_id = ? ORDER BY created_at, id",
+            (session_id,)
+        ).fetchall()
+
+        return self._session_from_row(
+            session_row, [self._message_from_row(row) for row in message_rows]
+        )
+
+    def get_recent_messages(self, session_id: str, n: Optional[int] = None) -> List[Message]:
+        """
+        Get the last messages of a session, oldest first.
+
+        Served from the cached window when n is at most window_size, so the
+        cost does not grow with the length of the session.
+
+        Args:
+            session_id: Session ID
+            n: Number of messages (defaults to window_size)
+
+        Returns:
+            Up to n Message objects (empty if the session does not exist)
+        """
+        n = self.window_size if n is None else n
+        if n <= 0:
+            return []
+
+        with self._cache_lock:
+            window = self._window(session_id)
+            if window is None:
+                return []
+            if n <= len(window.messages) or window.complete:
+                return list(window.messages)[-n:]
+
+        # Larger than the cached window
+        return self._query_recent(session_id, n)
+
+    def get_message_count(self, session_id: str) -> int:
+        """
+        Get the number of messages in a session.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Message count (0 if the session does not exist)
+        """
+        window = self._window(session_id)
+        return window.message_count if window is not None else 0
 
     def add_message(
         self,
@@ -196,45 +355,52 @@ class SessionStore:
         """
         now = datetime.utcnow()
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        # Under the cache lock, so the cached window sees writes in order
+        with self._cache_lock:
+            conn = self._connection()
+            with conn:
+                # Insert message
+                cursor = conn.execute(
+                    """
+                    INSERT INTO messages
+                    (session_id, role, content, content_filtered, citations, metadata, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        session_id,
+                        role,
+                        content,
+                        content_filtered,
+                        json.dumps(citations) if citations else None,
+                        json.dumps(metadata) if metadata else None,
+                        now.isoformat(" "),
+                    )
+                )
+                message_id = cursor.lastrowid
 
-            # Insert message
-            cursor.execute(
-                """
-                INSERT INTO messages
-                (session_id, role, content, content_filtered, citations, metadata, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    session_id,
-                    role,
-                    content,
-                    content_filtered,
-                    json.dumps(citations) if citations else None,
-                    json.dumps(metadata) if metadata else None,
-                    now,
+                # Update session timestamp
+                conn.execute(
+                    "UPDATE sessions SET updated_at = ? WHERE id = ?",
+                    (now.isoformat(" "), session_id)
                 )
-            )
-            message_id = cursor.lastrowid
 
-            # Update session timestamp
-            cursor.execute(
-                "UPDATE sessions SET updated_at = ? WHERE id = ?",
-                (now, session_id)
+            message = Message(
+                id=message_id,
+                role=role,
+                content=content,
+                content_filtered=content_filtered,
+                citations=citations or [],
+                metadata=metadata or {},
+                created_at=now,
             )
 
-            conn.commit()
+            window = self._cache.get(session_id)
+            if window is not None:
+                window.messages.append(message)
+                window.message_count += 1
+                window.session.updated_at = now
 
-        return Message(
-            id=message_id,
-            role=role,
-            content=content,
-            content_filtered=content_filtered,
-            citations=citations or [],
-            metadata=metadata or {},
-            created_at=now,
-        )
+        return message
 
     def update_summary(self, session_id: str, summary: str) -> None:
         """
@@ -246,17 +412,22 @@ class SessionStore:
         """
         now = datetime.utcnow()
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                UPDATE sessions
-                SET rolling_summary = ?, updated_at = ?
-                WHERE id = ?
-                """,
-                (summary, now, session_id)
-            )
-            conn.commit()
+        with self._cache_lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    """
+                    UPDATE sessions
+                    SET rolling_summary = ?, updated_at = ?
+                    WHERE id = ?
+                    """,
+                    (summary, now.isoformat(" "), session_id)
+                )
+
+            window = self._cache.get(session_id)
+            if window is not None:
+                window.session.rolling_summary = summary
+                window.session.updated_at = now
 
     def delete_session(self, session_id: str) -> bool:
         """
@@ -268,13 +439,18 @@ class SessionStore:
         Returns:
             True if deleted, False if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "DELETE FROM sessions WHERE id = ?",
-                (session_id,)
-            )
-            conn.commit()
+        with self._cache_lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "DELETE FROM messages WHERE session_id = ?",
+                    (session_id,)
+                )
+                cursor = conn.execute(
+                    "DELETE FROM sessions WHERE id = ?",
+                    (session_id,)
+                )
+            self._cache.pop(session_id, None)
             return cursor.rowcount > 0
 
     def list_sessions(
@@ -292,41 +468,37 @@ class SessionStore:
         Returns:
             List of SessionSummary objects
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                SELECT s.*, COUNT(m.id) as message_count,
-                       (SELECT content FROM messages
-                        WHERE session_id = s.id
-                        ORDER BY created_at DESC LIMIT 1) as last_message
-                FROM sessions s
-                LEFT JOIN messages m ON s.id = m.session_id
-                GROUP BY s.id
-                ORDER BY s.updated_at DESC
-                LIMIT ? OFFSET ?
-                """,
-                (limit, offset)
-            )
+        cursor = self._connection().execute(
+            """
+            SELECT s.*, COUNT(m.id) as message_count,
+                   (SELECT content FROM messages
+                    WHERE session_id = s.id
+                    ORDER BY created_at DESC, id DESC LIMIT 1) as last_message
+            FROM sessions s
+            LEFT JOIN messages m ON s.id = m.session_id
+            GROUP BY s.id
+            ORDER BY s.updated_at DESC
+            LIMIT ? OFFSET ?
+            """,
+            (limit, offset)
+        )
 
-            summaries = []
-            for row in cursor.fetchall():
-                last_preview = row["last_message"]
-                if last_preview and len(last_preview) > 100:
-                    last_preview = last_preview[:100] + "..."
-
-                summaries.append(SessionSummary(
-                    id=row["id"],
-                    message_count=row["message_count"],
-                    last_message_preview=last_preview,
-                    rolling_summary=row["rolling_summary"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                    updated_at=datetime.fromisoformat(row["updated_at"]),
-                ))
-
-            return summaries
+        summaries = []
+        for row in cursor.fetchall():
+            last_preview = row["last_message"]
+            if last_preview and len(last_preview) > 100:
+                last_preview = last_preview[:100] + "..."
+
+            summaries.append(SessionSummary(
+                id=row["id"],
+                message_count=row["message_count"],
+                last_message_preview=last_preview,
+                rolling_summary=row["rolling_summary"],
+                created_at=datetime.fromisoformat(row["created_at"]),
+                updated_at=datetime.fromisoformat(row["updated_at"]),
+            ))
+
+        return summaries
 
 
 # Singleton instance
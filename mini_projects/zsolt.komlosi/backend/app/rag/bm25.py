@@ -1,13 +1,53 @@
 """
 BM25 sparse retrieval for hybrid search.
+
+The index is incremental:
+- New chunks go into an in-memory delta segment (per-term posting lists).
+- Deleted chunks are only marked with a tombstone.
+- When the delta grows past a fraction of the base segment, both are merged
+  into a new base segment of flat posting arrays, dropping deleted chunks.
+
+With an index directory the base segment is stored as .npy files that are
+opened with mmap, and every change since the last merge is appended to a
+journal that is replayed when the index is loaded (lazily, on first use).
 """
 
-from typing import List, Dict, Any, Optional
-from rank_bm25 import BM25Okapi
+import json
+import logging
+import os
 import re
+import shutil
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
 
+from app.config import get_settings
 from app.models import SearchResult
 
+logger = logging.getLogger(__name__)
+
+# Merge the delta segment into the base once it holds this fraction of the
+# base chunks (deleted chunks count as well)...
+MERGE_RATIO = 0.25
+# ...but not before it holds this many chunks
+MIN_MERGE_DOCS = 1000
+# Rewrite the payload file once more than this fraction of it is deleted chunks
+PAYLOAD_COMPACT_RATIO = 0.5
+
+CURRENT_FILE = "CURRENT"
+
+
+def _grow(array: np.ndarray, size: int) -> np.ndarray:
+    """Return array with room for at least `size` items (doubling)."""
+    if size <= len(array):
+        return array
+    grown = np.zeros(max(size, 2 * len(array), 64), dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
 
 class BM25Index:
     """
@@ -15,10 +55,53 @@ class BM25Index:
     Used in combination with vector search for hybrid retrieval.
     """
 
-    def __init__(self):
-        self.documents: List[Dict[str, Any]] = []
-        self.tokenized_docs: List[List[str]] = []
-        self.bm25: Optional[BM25Okapi] = None
+    def __init__(
+        self,
+        index_dir: Optional[str] = None,
+        k1: float = 1.5,
+        b: float = 0.75,
+    ):
+        """
+        Args:
+            index_dir: Directory for the persisted index (memory only if None)
+            k1: BM25 term frequency saturation
+            b: BM25 length normalization
+        """
+        self.index_dir = Path(index_dir) if index_dir else None
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._reset()
+
+    def _reset(self) -> None:
+        # Vocabulary of base and delta segments
+        self._terms: Dict[str, int] = {}
+        # Base segment: postings of term t are [offsets[t], offsets[t + 1])
+        self._base_offsets = np.zeros(1, dtype=np.int64)
+        self._base_docs = np.zeros(0, dtype=np.int32)
+        self._base_tfs = np.zeros(0, dtype=np.int32)
+        self._base_doc_count = 0
+        # Delta segment: term id -> (doc indices, term frequencies)
+        self._delta: Dict[int, Tuple[List[int], List[int]]] = {}
+        # Per-chunk data, indexed by doc index (base chunks first)
+        self._doc_count = 0
+        self._lengths = np.zeros(0, dtype=np.int32)
+        self._deleted = np.zeros(0, dtype=bool)
+        self._chunk_ids: List[str] = []
+        self._doc_ids: List[str] = []
+        self._live: Dict[str, int] = {}  # chunk_id -> doc index
+        # Search result payloads: in memory, or offsets into the payload file
+        self._payloads: List[Dict[str, Any]] = []
+        self._payload_offsets = np.zeros(0, dtype=np.int64)
+        self._payload_lines = 0
+        self._generation = 0
+        self._payload_file = "payloads-0.jsonl"
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._live)
 
     def _tokenize(self, text: str) -> List[str]:
         """
@@ -33,27 +116,139 @@ class BM25Index:
         tokens = [t for t in tokens if len(t) > 2]
         return tokens
 
+    def _document_tokens(self, doc: Dict[str, Any]) -> List[str]:
+        content = doc.get("content_en", "") + " " + doc.get("content_hu", "")
+        tokens = self._tokenize(content)
+        # Add keywords if available
+        keywords = doc.get("keywords", [])
+        tokens.extend([k.lower() for k in keywords])
+        return tokens
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
     def add_documents(self, documents: List[Dict[str, Any]]) -> None:
         """
         Add documents to the BM25 index.
+        A chunk whose chunk_id is already indexed replaces the old one.
 
         Args:
             documents: List of document dicts with at least 'content_en' field
         """
-        self.documents.extend(documents)
+        with self._lock:
+            self._ensure_loaded()
+            journal = []
+            offsets = self._append_payloads(documents)
 
-        # Tokenize all documents
-        for doc in documents:
-            content = doc.get("content_en", "") + " " + doc.get("content_hu", "")
-            tokens = self._tokenize(content)
-            # Add keywords if available
-            keywords = doc.get("keywords", [])
-            tokens.extend([k.lower() for k in keywords])
-            self.tokenized_docs.append(tokens)
+            for doc, offset in zip(documents, offsets):
+                chunk_id = doc.get("chunk_id", "")
+                if chunk_id in self._live:
+                    journal.append(self._tombstone(self._live[chunk_id]))
 
-        # Rebuild BM25 index
-        if self.tokenized_docs:
-            self.bm25 = BM25Okapi(self.tokenized_docs)
+                counts = Counter(self._document_tokens(doc))
+                length = sum(counts.values())
+                self._add_chunk(chunk_id, doc.get("doc_id", ""), length, counts, offset)
+                if offset is None:
+                    self._payloads.append(doc)
+                else:
+                    journal.append({
+                        "op": "add", "chunk_id": chunk_id, "doc_id": doc.get("doc_id", ""),
+                        "length": length, "offset": offset, "terms": counts,
+                    })
+
+            self._write_journal(journal)
+            self._maybe_merge()
+
+    def delete_documents(self, chunk_ids: Iterable[str]) -> int:
+        """Delete chunks by chunk ID. Returns the number of deleted chunks."""
+        with self._lock:
+            self._ensure_loaded()
+            indices = [self._live[c] for c in chunk_ids if c in self._live]
+            return self._delete_indices(indices)
+
+    def delete_by_doc_id(self, doc_id: str) -> int:
+        """Delete all chunks of a document. Returns the number of deleted chunks."""
+        with self._lock:
+            self._ensure_loaded()
+            indices = [i for i in self._live.values() if self._doc_ids[i] == doc_id]
+            return self._delete_indices(indices)
+
+    def _delete_indices(self, indices: List[int]) -> int:
+        self._write_journal([self._tombstone(i) for i in indices])
+        self._maybe_merge()
+        return len(indices)
+
+    def _tombstone(self, index: int) -> Dict[str, Any]:
+        self._deleted[index] = True
+        del self._live[self._chunk_ids[index]]
+        return {"op": "delete", "index": index}
+
+    def _add_chunk(
+        self, chunk_id: str, doc_id: str, length: int,
+        counts: Dict[str, int], offset: Optional[int],
+    ) -> None:
+        index = self._doc_count
+        self._doc_count += 1
+        self._lengths = _grow(self._lengths, self._doc_count)
+        self._deleted = _grow(self._deleted, self._doc_count)
+        self._payload_offsets = _grow(self._payload_offsets, self._doc_count)
+        self._lengths[index] = length
+        self._deleted[index] = False
+        self._payload_offsets[index] = -1 if offset is None else offset
+        self._chunk_ids.append(chunk_id)
+        self._doc_ids.append(doc_id)
+        self._live[chunk_id] = index
+
+        for term, tf in counts.items():
+            term_id = self._terms.setdefault(term, len(self._terms))
+            docs, tfs = self._delta.setdefault(term_id, ([], []))
+            docs.append(index)
+            tfs.append(tf)
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def _postings(self, term_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Doc indices and term frequencies of a term in both segments."""
+        if term_id + 1 < len(self._base_offsets):
+            start, end = self._base_offsets[term_id], self._base_offsets[term_id + 1]
+            docs, tfs = self._base_docs[start:end], self._base_tfs[start:end]
+        else:
+            docs, tfs = self._base_docs[:0], self._base_tfs[:0]
+
+        delta = self._delta.get(term_id)
+        if delta:
+            docs = np.concatenate((docs, np.asarray(delta[0], dtype=np.int32)))
+            tfs = np.concatenate((tfs, np.asarray(delta[1], dtype=np.int32)))
+        return docs, tfs
+
+    def _scores(self, query_tokens: List[str]) -> np.ndarray:
+        """BM25 score of every doc index; deleted chunks score 0.
+
+        Collection statistics include deleted chunks until the next merge.
+        """
+        n = self._doc_count
+        lengths = self._lengths[:n]
+        avgdl = max(float(lengths.mean()), 1e-9)
+        scores = np.zeros(n, dtype=np.float64)
+
+        for token in query_tokens:
+            term_id = self._terms.get(token)
+            if term_id is None:
+                continue
+            docs, tfs = self._postings(term_id)
+            if not len(docs):
+                continue
+            df = len(docs)
+            idf = np.log(1.0 + (n - df + 0.5) / (df + 0.5))
+            tfs = tfs.astype(np.float64)
+            norm = self.k1 * (1.0 - self.b + self.b * lengths[docs] / avgdl)
+            scores[docs] += idf * tfs * (self.k1 + 1.0) / (tfs + norm)
+
+        scores[self._deleted[:n]] = 0.0
+        return scores
 
     def search(
         self,
@@ -70,56 +265,275 @@ class BM25Index:
         Returns:
             List of SearchResult objects with BM25 scores
         """
-        if not self.bm25 or not self.documents:
-            return []
-
         # Tokenize query
         query_tokens = self._tokenize(query)
 
-        if not query_tokens:
+        if not query_tokens or top_k <= 0:
             return []
 
-        # Get BM25 scores
-        scores = self.bm25.get_scores(query_tokens)
+        with self._lock:
+            self._ensure_loaded()
+            if not self._live:
+                return []
 
-        # Get top-k indices
-        top_indices = sorted(
-            range(len(scores)),
-            key=lambda i: scores[i],
-            reverse=True,
-        )[:top_k]
+            scores = self._scores(query_tokens)
+
+            # Top-k without sorting every score
+            candidates = np.flatnonzero(scores > 0)
+            if len(candidates) > top_k:
+                candidates = candidates[np.argpartition(-scores[candidates], top_k - 1)[:top_k]]
+            top_indices = candidates[np.argsort(-scores[candidates], kind="stable")]
+            payloads = [self._payload(int(i)) for i in top_indices]
 
         # Build results
         results = []
-        max_score = max(scores) if scores.any() else 1.0
-
-        for idx in top_indices:
-            if scores[idx] > 0:
-                doc = self.documents[idx]
-                # Normalize score to 0-1 range
-                normalized_score = scores[idx] / max_score if max_score > 0 else 0
-
-                results.append(
-                    SearchResult(
-                        chunk_id=doc.get("chunk_id", ""),
-                        doc_id=doc.get("doc_id", ""),
-                        content_hu=doc.get("content_hu", ""),
-                        content_en=doc.get("content_en", ""),
-                        title=doc.get("title", ""),
-                        doc_type=doc.get("doc_type", ""),
-                        score=normalized_score,
-                        url=doc.get("url"),
-                        search_type="bm25",
-                    )
+        max_score = scores[top_indices[0]] if len(top_indices) else 1.0
+
+        for idx, doc in zip(top_indices, payloads):
+            # Normalize score to 0-1 range
+            normalized_score = float(scores[idx] / max_score) if max_score > 0 else 0
+
+            results.append(
+                SearchResult(
+                    chunk_id=doc.get("chunk_id", ""),
+                    doc_id=doc.get("doc_id", ""),
+                    content_hu=doc.get("content_hu", ""),
+                    content_en=doc.get("content_en", ""),
+                    title=doc.get("title", ""),
+                    doc_type=doc.get("doc_type", ""),
+                    score=normalized_score,
+                    url=doc.get("url"),
+                    search_type="bm25",
                 )
+            )
 
         return results
 
+    # ------------------------------------------------------------------
+    # Merge / compaction
+    # ------------------------------------------------------------------
+
+    def _maybe_merge(self) -> None:
+        pending = self._doc_count - self._base_doc_count
+        pending += int(self._deleted[:self._base_doc_count].sum())
+        if pending >= max(MIN_MERGE_DOCS, MERGE_RATIO * self._base_doc_count):
+            self.compact()
+
+    def compact(self) -> None:
+        """Merge the delta segment into the base and drop deleted chunks."""
+        with self._lock:
+            self._ensure_loaded()
+            n = self._doc_count
+            live = ~self._deleted[:n]
+            new_index = (np.cumsum(live) - 1).astype(np.int32)
+
+            # All postings as (term, doc, tf); the base is already sorted by
+            # term and delta docs come after base docs, so a stable sort by
+            # term keeps each posting list sorted by doc
+            base_terms = np.repeat(
+                np.arange(len(self._base_offsets) - 1, dtype=np.int32),
+                np.diff(self._base_offsets),
+            )
+            delta_terms, delta_docs, delta_tfs = [], [], []
+            for term_id, (docs, tfs) in self._delta.items():
+                delta_terms.append(np.full(len(docs), term_id, dtype=np.int32))
+                delta_docs.append(np.asarray(docs, dtype=np.int32))
+                delta_tfs.append(np.asarray(tfs, dtype=np.int32))
+            terms = np.concatenate([base_terms, *delta_terms])
+            docs = np.concatenate([np.asarray(self._base_docs), *delta_docs])
+            tfs = np.concatenate([np.asarray(self._base_tfs), *delta_tfs])
+
+            keep = live[docs]
+            terms, docs, tfs = terms[keep], new_index[docs[keep]], tfs[keep]
+            order = np.argsort(terms, kind="stable")
+            terms, docs, tfs = terms[order], docs[order], tfs[order]
+
+            # Drop terms without live postings and renumber the rest
+            old_terms = sorted(self._terms, key=self._terms.get)
+            used = np.unique(terms)
+            term_map = np.zeros(len(old_terms), dtype=np.int32)
+            term_map[used] = np.arange(len(used), dtype=np.int32)
+            terms = term_map[terms]
+            offsets = np.zeros(len(used) + 1, dtype=np.int64)
+            offsets[1:] = np.cumsum(np.bincount(terms, minlength=len(used)))
+
+            self._terms = {old_terms[t]: i for i, t in enumerate(used)}
+            self._base_offsets, self._base_docs, self._base_tfs = offsets, docs, tfs
+            self._delta = {}
+
+            live_indices = np.flatnonzero(live)
+            self._lengths = self._lengths[live_indices]
+            self._payload_offsets = self._payload_offsets[live_indices]
+            self._chunk_ids = [self._chunk_ids[i] for i in live_indices]
+            self._doc_ids = [self._doc_ids[i] for i in live_indices]
+            if self._payloads:
+                self._payloads = [self._payloads[i] for i in live_indices]
+            self._doc_count = self._base_doc_count = len(live_indices)
+            self._deleted = np.zeros(self._doc_count, dtype=bool)
+            self._live = {chunk_id: i for i, chunk_id in enumerate(self._chunk_ids)}
+
+            if self.index_dir is not None:
+                self._save_generation()
+            logger.info(f"BM25 index compacted: {self._doc_count} chunks, {len(self._terms)} terms")
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.index_dir is None:
+            return
+
+        current_path = self.index_dir / CURRENT_FILE
+        if current_path.exists():
+            self._load_generation(json.loads(current_path.read_text(encoding="utf-8")))
+
+        self._replay_journal()
+        logger.info(f"BM25 index loaded: {len(self._live)} chunks from {self.index_dir}")
+
+    def _load_generation(self, current: Dict[str, Any]) -> None:
+        """Open the base segment named in CURRENT."""
+        self._generation = current["generation"]
+        self._payload_file = current["payload_file"]
+        self._payload_lines = current["payload_lines"]
+
+        base_dir = self.index_dir / f"gen-{self._generation}"
+        with open(base_dir / "chunks.json", encoding="utf-8") as f:
+            chunks = json.load(f)
+        with open(base_dir / "vocab.json", encoding="utf-8") as f:
+            vocab = json.load(f)
+        self._terms = {term: i for i, term in enumerate(vocab)}
+        self._base_offsets = np.load(base_dir / "offsets.npy", mmap_mode="r")
+        self._base_docs = np.load(base_dir / "postings_docs.npy", mmap_mode="r")
+        self._base_tfs = np.load(base_dir / "postings_tfs.npy", mmap_mode="r")
+        self._lengths = np.load(base_dir / "lengths.npy")
+        self._payload_offsets = np.load(base_dir / "payload_offsets.npy")
+        self._chunk_ids, self._doc_ids = chunks["chunk_ids"], chunks["doc_ids"]
+        self._doc_count = self._base_doc_count = len(self._chunk_ids)
+        self._deleted = np.zeros(self._doc_count, dtype=bool)
+        self._live = {chunk_id: i for i, chunk_id in enumerate(self._chunk_ids)}
+
+    def _replay_journal(self) -> None:
+        journal_path = self._journal_path()
+        if not journal_path.exists():
+            return
+        with open(journal_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn last line after a crash
+                    logger.warning(f"Skipping corrupt BM25 journal line in {journal_path}")
+                    continue
+                if record["op"] == "add":
+                    self._add_chunk(
+                        record["chunk_id"], record["doc_id"], record["length"],
+                        record["terms"], record["offset"],
+                    )
+                elif not self._deleted[record["index"]]:
+                    self._tombstone(record["index"])
+
+    def _journal_path(self) -> Path:
+        return self.index_dir / f"journal-{self._generation}.jsonl"
+
+    def _write_journal(self, records: List[Dict[str, Any]]) -> None:
+        if self.index_dir is None or not records:
+            return
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        with open(self._journal_path(), "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records))
+
+    def _append_payloads(self, documents: List[Dict[str, Any]]) -> List[Optional[int]]:
+        """Append search result payloads to the payload file; returns their offsets."""
+        if self.index_dir is None:
+            return [None] * len(documents)
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        offsets = []
+        with open(self.index_dir / self._payload_file, "ab") as f:
+            for doc in documents:
+                offsets.append(f.tell())
+                f.write(json.dumps(doc, ensure_ascii=False).encode("utf-8") + b"\n")
+        self._payload_lines += len(documents)
+        return offsets
+
+    def _payload(self, index: int) -> Dict[str, Any]:
+        offset = int(self._payload_offsets[index])
+        if offset < 0:
+            return self._payloads[index]
+        with open(self.index_dir / self._payload_file, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    def _rewrite_payloads(self, payload_file: str) -> None:
+        """Copy the payloads of live chunks into a new payload file."""
+        old_path = self.index_dir / self._payload_file
+        new_offsets = np.zeros(self._doc_count, dtype=np.int64)
+        with open(old_path, "rb") as src, open(self.index_dir / payload_file, "wb") as dst:
+            for i, offset in enumerate(self._payload_offsets[:self._doc_count]):
+                src.seek(int(offset))
+                new_offsets[i] = dst.tell()
+                dst.write(src.readline())
+        self._payload_offsets = new_offsets
+        self._payload_file = payload_file
+        self._payload_lines = self._doc_count
+
+    def _save_generation(self) -> None:
+        """Write the base segment as a new generation and switch to it.
+
+        CURRENT is replaced atomically, so a crash leaves either the old
+        generation with its journal or the new one.
+        """
+        old_generation, old_payload_file = self._generation, self._payload_file
+        generation = old_generation + 1
+        base_dir = self.index_dir / f"gen-{generation}"
+        base_dir.mkdir(parents=True, exist_ok=True)
+
+        if self._payload_lines and (
+            self._payload_lines - self._doc_count > PAYLOAD_COMPACT_RATIO * self._payload_lines
+        ):
+            self._rewrite_payloads(f"payloads-{generation}.jsonl")
+
+        vocab = sorted(self._terms, key=self._terms.get)
+        with open(base_dir / "vocab.json", "w", encoding="utf-8") as f:
+            json.dump(vocab, f, ensure_ascii=False)
+        with open(base_dir / "chunks.json", "w", encoding="utf-8") as f:
+            json.dump({"chunk_ids": self._chunk_ids, "doc_ids": self._doc_ids}, f, ensure_ascii=False)
+        np.save(base_dir / "offsets.npy", self._base_offsets)
+        np.save(base_dir / "postings_docs.npy", self._base_docs)
+        np.save(base_dir / "postings_tfs.npy", self._base_tfs)
+        # Serve the posting lists from the page cache instead of the heap
+        self._base_offsets = np.load(base_dir / "offsets.npy", mmap_mode="r")
+        self._base_docs = np.load(base_dir / "postings_docs.npy", mmap_mode="r")
+        self._base_tfs = np.load(base_dir / "postings_tfs.npy", mmap_mode="r")
+        np.save(base_dir / "lengths.npy", self._lengths[:self._doc_count])
+        np.save(base_dir / "payload_offsets.npy", self._payload_offsets[:self._doc_count])
+
+        current = {
+            "generation": generation,
+            "payload_file": self._payload_file,
+            "payload_lines": self._payload_lines,
+        }
+        tmp_path = self.index_dir / f"{CURRENT_FILE}.tmp"
+        tmp_path.write_text(json.dumps(current), encoding="utf-8")
+        os.replace(tmp_path, self.index_dir / CURRENT_FILE)
+        self._generation = generation
+
+        # The old generation is no longer referenced
+        shutil.rmtree(self.index_dir / f"gen-{old_generation}", ignore_errors=True)
+        (self.index_dir / f"journal-{old_generation}.jsonl").unlink(missing_ok=True)
+        if old_payload_file != self._payload_file:
+            (self.index_dir / old_payload_file).unlink(missing_ok=True)
+
     def clear(self) -> None:
         """Clear the index."""
-        self.documents = []
-        self.tokenized_docs = []
-        self.bm25 = None
+        with self._lock:
+            self._reset()
+            self._loaded = True
+            if self.index_dir is not None and self.index_dir.exists():
+                shutil.rmtree(self.index_dir)
 
 
 # Singleton instance
@@ -127,8 +541,8 @@ _bm25_index: Optional[BM25Index] = None
 
 
 def get_bm25_index() -> BM25Index:
-    """Get or create the BM25 index singleton."""
+    """Get or create the BM25 index singleton (loaded on first use)."""
     global _bm25_index
     if _bm25_index is None:
-        _bm25_index = BM25Index()
+        _bm25_index = BM25Index(index_dir=get_settings().rag_bm25_index_dir)
     return _bm25_index
@@ -9,19 +9,26 @@ Pipeline:
 4. Extract English keywords using AI
 5. Generate embeddings for English content
 6. Store in vector DB and BM25 index
+
+Steps 3-4 run as one structured LLM request per batch of chunks, with the
+batches in flight concurrently. Finished batches go through steps 5-6 while
+the remaining batches are still being enriched.
 """
 
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
 import uuid
 import logging
 from datetime import datetime
 
 from app.config import get_settings
+from app.core.prompts import CHUNK_ENRICHMENT_PROMPT, CHUNK_KEYWORDS_PROMPT
 from app.models import Document, Chunk, DocumentInfo
 from .chunker import get_chunker
 from .embeddings import get_embedding_service
 from .vectorstore import get_vectorstore
 from .bm25 import get_bm25_index
+from .enrichment import EnrichmentBatch, EnrichmentCache, RateLimitGate
 
 logger = logging.getLogger(__name__)
 
@@ -33,15 +40,25 @@ class DocumentProcessor:
     Key features:
     - Chunk-by-chunk Hungarian to English translation (ensures alignment)
     - AI-powered keyword extraction (in English)
+    - Batched, concurrent enrichment with a content-hash cache
     - Hybrid storage (vector DB + BM25)
     """
 
+    MAX_KEYWORDS = 10
+
     def __init__(self):
+        settings = get_settings()
         self.chunker = get_chunker()
         self.embedding_service = get_embedding_service()
         self.vectorstore = get_vectorstore()
         self.bm25_index = get_bm25_index()
+        self.enrichment_batch_size = max(1, settings.rag_enrichment_batch_size)
+        self.enrichment_concurrency = max(1, settings.rag_enrichment_concurrency)
+        self.enrichment_cache = EnrichmentCache(settings.rag_enrichment_cache_path)
+        # Shared by all documents, so parallel uploads respect the same limit
+        self.rate_limit_gate = RateLimitGate(self.enrichment_concurrency)
         self._llm = None
+        self._enrichment_llm = None
 
     @property
     def llm(self):
@@ -56,6 +73,13 @@ class DocumentProcessor:
             )
         return self._llm
 
+    @property
+    def enrichment_llm(self):
+        """LLM returning an EnrichmentBatch."""
+        if self._enrichment_llm is None:
+            self._enrichment_llm = self.llm.with_structured_output(EnrichmentBatch)
+        return self._enrichment_llm
+
     def process_document(
         self,
         content: str,
@@ -100,31 +124,21 @@ class DocumentProcessor:
         chunks = self.chunker.chunk_document(document)
         logger.info(f"Created {len(chunks)} chunks for {doc_id}")
 
-        # Step 2: Translate each chunk to English and extract keywords
+        # Step 2: Translate to English and extract keywords, batch by batch
         if language == "hu":
             logger.info(f"Translating {len(chunks)} chunks from Hungarian to English...")
-            for i, chunk in enumerate(chunks):
-                # Translate chunk to English
-                chunk.content_en = self._translate_chunk(chunk.content_hu)
-
-                # Extract English keywords using AI
-                chunk.keywords = self._extract_keywords_ai(chunk.content_en, chunk.title)
-
-                if (i + 1) % 3 == 0 or (i + 1) == len(chunks):
-                    logger.info(f"Processed {i + 1}/{len(chunks)} chunks (translation + keywords)")
         else:
-            # Document is already in English
             logger.info(f"Document is in English, extracting keywords...")
-            for i, chunk in enumerate(chunks):
-                chunk.content_en = chunk.content_hu  # Same content
-                chunk.keywords = self._extract_keywords_ai(chunk.content_en, chunk.title)
 
-        # Step 3: Store in vector database
-        logger.info(f"Storing {len(chunks)} chunks in vector database...")
-        chunks_stored = self.vectorstore.add_chunks(chunks)
+        # Steps 3-4: Store each enriched batch in the vector database and BM25
+        chunks_stored = 0
+        processed = 0
+        for batch in self._enrich_chunks(chunks, language):
+            chunks_stored += self.vectorstore.add_chunks(batch)
+            self._add_to_bm25(batch)
+            processed += len(batch)
+            logger.info(f"Indexed {processed}/{len(chunks)} chunks (translation + keywords)")
 
-        # Step 4: Add to BM25 index
-        self._add_to_bm25(chunks)
         logger.info(f"Document {doc_id} fully indexed with {chunks_stored} chunks")
 
         return DocumentInfo(
@@ -137,16 +151,120 @@ class DocumentProcessor:
             status="indexed",
         )
 
+    def _enrich_chunks(self, chunks: List[Chunk], language: str) -> Iterator[List[Chunk]]:
+        """
+        Fill in content_en and keywords, yielding chunks as they are ready.
+
+        Cached chunks are yielded first, in one batch. The rest are sent to
+        the LLM in batches of enrichment_batch_size, and each batch is yielded
+        as soon as its request completes.
+        """
+        model = get_settings().openai_model
+        keys = [
+            EnrichmentCache.key(chunk.content_hu, chunk.title, language, model)
+            for chunk in chunks
+        ]
+
+        cached, pending = [], []
+        for chunk, key in zip(chunks, keys):
+            hit = self.enrichment_cache.get(key)
+            if hit is None:
+                pending.append((chunk, key))
+            else:
+                chunk.content_en, chunk.keywords = hit[0], list(hit[1])
+                cached.append(chunk)
+
+        if cached:
+            logger.info(f"Reusing cached translation and keywords for {len(cached)}/{len(chunks)} chunks")
+            yield cached
+        if not pending:
+            return
+
+        size = self.enrichment_batch_size
+        batches = [pending[i:i + size] for i in range(0, len(pending), size)]
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.enrichment_concurrency, len(batches)),
+            thread_name_prefix="enrichment",
+        )
+        try:
+            futures = [executor.submit(self._enrich_batch, batch, language) for batch in batches]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # Indexing failed or the caller stopped early: drop queued batches
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _enrich_batch(self, batch: List[Tuple[Chunk, str]], language: str) -> List[Chunk]:
+        """
+        Translate and extract keywords for a batch of chunks in one request.
+
+        Chunks missing from the response (or the whole batch, if the request
+        fails) fall back to the per-chunk methods. Only LLM results are cached.
+        """
+        translate = language == "hu"
+        prompt = (CHUNK_ENRICHMENT_PROMPT if translate else CHUNK_KEYWORDS_PROMPT).format(
+            max_keywords=self.MAX_KEYWORDS,
+            chunks="\n\n".join(
+                f"[Chunk {i}] Title: {chunk.title}\n{chunk.content_hu}"
+                for i, (chunk, _) in enumerate(batch)
+            ),
+        )
+
+        results = {}
+        try:
+            response: EnrichmentBatch = self.rate_limit_gate.call(
+                lambda: self.enrichment_llm.invoke(prompt)
+            )
+            results = {item.index: item for item in response.chunks}
+        except Exception as e:
+            logger.error(f"Batch enrichment failed for {len(batch)} chunks: {e}")
+
+        new_entries: Dict[str, Tuple[str, List[str]]] = {}
+        for i, (chunk, key) in enumerate(batch):
+            item = results.get(i)
+            content_en = (item.translation.strip() if translate else chunk.content_hu) if item else ""
+            keywords = self._clean_keywords(item.keywords) if item else []
+
+            if not content_en or not keywords:
+                # Fallback: one request per chunk, as before batching (the
+                # per-chunk methods go through the same rate limit gate)
+                content_en = content_en or (
+                    self._translate_chunk(chunk.content_hu) if translate else chunk.content_hu
+                )
+                keywords = keywords or self._extract_keywords_ai(content_en, chunk.title)
+            else:
+                new_entries[key] = (content_en, keywords)
+
+            chunk.content_en = content_en
+            chunk.keywords = keywords
+
+        self.enrichment_cache.put_many(new_entries)
+        return [chunk for chunk, _ in batch]
+
+    def _clean_keywords(self, raw_keywords: List[str], max_keywords: int = MAX_KEYWORDS) -> List[str]:
+        """Normalize LLM keywords: strip list markers, lowercase, dedupe."""
+        keywords = []
+        for raw in raw_keywords:
+            keyword = raw.strip().strip("- ").strip("• ").strip("*").strip()
+            if keyword and len(keyword) > 2:
+                # Remove numbering if present
+                if keyword[0].isdigit() and "." in keyword[:3]:
+                    keyword = keyword.split(".", 1)[1].strip()
+                keyword = keyword.lower()
+                if keyword not in keywords:
+                    keywords.append(keyword)
+        return keywords[:max_keywords]
+
     def _translate_chunk(self, text: str) -> str:
         """
         Translate a single chunk from Hungarian to English.
         """
         try:
-            response = self.llm.invoke(
+            response = self.rate_limit_gate.call(lambda: self.llm.invoke(
                 f"Translate the following Hungarian text to English. "
                 f"Preserve all formatting, structure, and technical terms. "
                 f"Only output the translation, nothing else.\n\n{text}"
-            )
+            ))
             return response.content
         except Exception as e:
             logger.error(f"Translation failed for chunk: {e}")
@@ -161,25 +279,16 @@ class DocumentProcessor:
         keywords/phrases from the content.
         """
         try:
-            response = self.llm.invoke(
+            response = self.rate_limit_gate.call(lambda: self.llm.invoke(
                 f"Extract the {max_keywords} most important keywords or short phrases "
                 f"from the following text. These keywords should be useful for search "
                 f"and retrieval. Output only the keywords, one per line, in English.\n\n"
                 f"Title: {title}\n\n"
                 f"Content:\n{text[:2000]}"  # Limit content to avoid token limits
-            )
+            ))
 
             # Parse keywords from response
-            keywords = []
-            for line in response.content.strip().split("\n"):
-                keyword = line.strip().strip("- ").strip("• ").strip("*").strip()
-                if keyword and len(keyword) > 2:
-                    # Remove numbering if present
-                    if keyword[0].isdigit() and "." in keyword[:3]:
-                        keyword = keyword.split(".", 1)[1].strip()
-                    keywords.append(keyword.lower())
-
-            return keywords[:max_keywords]
+            return self._clean_keywords(response.content.strip().split("\n"), max_keywords)
 
         except Exception as e:
             logger.error(f"Keyword extraction failed: {e}")
@@ -253,8 +362,9 @@ class DocumentProcessor:
         # Delete from vector store
         success = self.vectorstore.delete_by_doc_id(doc_id)
 
-        # BM25 index would need to be rebuilt (simplified for now)
-        # In production, implement proper deletion from BM25
+        # Delete from BM25 index (tombstones, compacted on the next merge)
+        deleted = self.bm25_index.delete_by_doc_id(doc_id)
+        logger.info(f"Removed {deleted} chunks of {doc_id} from the BM25 index")
 
         return success
 
@@ -0,0 +1,170 @@
+"""
+Chunk enrichment helpers for the document processor.
+
+- Structured output for translating and extracting keywords for a batch of chunks
+- Content-hash cache, so re-ingesting an unchanged document needs no LLM call
+- Rate-limit gate shared by all enrichment requests
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Bump when the enrichment prompts change, so cached results are not reused
+ENRICHMENT_VERSION = 1
+
+
+class EnrichedChunk(BaseModel):
+    """Translation and keywords for one chunk of a batch."""
+
+    index: int = Field(
+        description="Index of the chunk in the batch, as given in the prompt"
+    )
+    translation: str = Field(
+        default="",
+        description="English translation of the chunk (empty for English chunks)"
+    )
+    keywords: List[str] = Field(
+        default_factory=list,
+        description="Most important English keywords or short phrases"
+    )
+
+
+class EnrichmentBatch(BaseModel):
+    """Structured output for a batch of chunks."""
+
+    chunks: List[EnrichedChunk] = Field(
+        description="One entry per input chunk"
+    )
+
+
+class EnrichmentCache:
+    """
+    Enrichment results keyed by a hash of the chunk content.
+
+    Kept in memory and appended to a JSON Lines file (if a path is given),
+    which is loaded on startup. The last line for a key wins.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else None
+        self._entries: Dict[str, Tuple[str, List[str]]] = {}
+        self._lock = threading.Lock()
+
+        if self.path is not None and self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Partially written last line after a crash
+                        continue
+                    self._entries[record["key"]] = (record["content_en"], record["keywords"])
+            logger.info(f"Loaded {len(self._entries)} cached chunk enrichments")
+
+    @staticmethod
+    def key(content: str, title: str, language: str, model: str) -> str:
+        """Cache key of a chunk: everything the enrichment result depends on."""
+        payload = "\0".join([str(ENRICHMENT_VERSION), model, language, title, content])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[str, List[str]]]:
+        """Cached (content_en, keywords) for a key, or None."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def put_many(self, entries: Dict[str, Tuple[str, List[str]]]) -> None:
+        """Store results and append them to the cache file."""
+        if not entries:
+            return
+        with self._lock:
+            self._entries.update(entries)
+            if self.path is None:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                for key, (content_en, keywords) in entries.items():
+                    f.write(json.dumps(
+                        {"key": key, "content_en": content_en, "keywords": keywords},
+                        ensure_ascii=False,
+                    ) + "\n")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _is_rate_limit(error: Exception) -> bool:
+    """openai.RateLimitError and other HTTP 429 errors."""
+    return getattr(error, "status_code", None) == 429
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds from the Retry-After header of a rate limit error, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitGate:
+    """
+    Limits concurrent LLM requests and backs off together on rate limits.
+
+    A semaphore caps the requests in flight. When one of them is rate limited,
+    every caller waits until the Retry-After time (or an exponential backoff)
+    has passed, instead of each request hitting the limit on its own.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._semaphore = threading.BoundedSemaphore(max(1, max_concurrency))
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+
+    def _wait_for_pause(self) -> None:
+        while True:
+            with self._lock:
+                delay = self._paused_until - time.monotonic()
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    def call(self, func: Callable[[], T]) -> T:
+        """
+        Run func under the concurrency limit, retrying rate limit errors.
+
+        Other errors, and the last rate limit error, are raised.
+        """
+        for attempt in range(self.max_retries + 1):
+            with self._semaphore:
+                self._wait_for_pause()
+                try:
+                    return func()
+                except Exception as e:
+                    if not _is_rate_limit(e) or attempt == self.max_retries:
+                        raise
+                    delay = _retry_after(e) or min(self.base_delay * 2 ** attempt, self.max_delay)
+                    logger.warning(f"Rate limited, pausing enrichment requests for {delay:.1f}s")
+                    with self._lock:
+                        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        raise AssertionError("unreachable")
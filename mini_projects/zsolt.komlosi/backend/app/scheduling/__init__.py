@@ -0,0 +1,13 @@
+"""
+Scheduling package - holiday tables and business-hour SLA calendar.
+"""
+
+from .holiday_store import HolidayStore, get_holiday_store
+from .business_calendar import BusinessCalendar, get_business_calendar
+
+__all__ = [
+    "HolidayStore",
+    "get_holiday_store",
+    "BusinessCalendar",
+    "get_business_calendar",
+]
@@ -0,0 +1,248 @@
+"""
+Business-hour calendar for SLA deadlines.
+
+For every (timezone, country, year) the business hours of the year are
+precomputed once as sorted UTC intervals (working days, 9:00-18:00 local
+time, public holidays excluded), together with the business seconds before
+each interval. Adding N business hours is then two binary searches.
+Tables built from offline (seed) holidays are rebuilt once the holiday
+store has fetched the real table.
+"""
+
+import logging
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from typing import Dict, FrozenSet, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from app.config import get_settings
+from app.models import PRIORITY_SLA_HOURS, PRIORITY_NAMES
+from .holiday_store import HolidayStore, HolidayTable, get_holiday_store
+
+logger = logging.getLogger(__name__)
+
+
+class BusinessIntervals(NamedTuple):
+    """Business hours of one year as UTC timestamps."""
+
+    starts: List[float]
+    ends: List[float]
+    before: List[float]  # Business seconds before each interval
+    through: List[float]  # Business seconds up to the end of each interval
+    next_year: float  # Timestamp where the following year's table starts
+
+
+def resolve_timezone(name: str) -> ZoneInfo:
+    """ZoneInfo for an IANA name, UTC if the name is unknown."""
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        logger.warning(f"Unknown timezone {name!r}, using UTC")
+        return ZoneInfo("UTC")
+
+
+class BusinessCalendar:
+    """
+    Business-hour arithmetic with holiday-aware, precomputed interval tables.
+    """
+
+    # Interval tables kept in memory (one per timezone, country and year)
+    MAX_TABLES = 512
+
+    def __init__(
+        self,
+        holiday_store: Optional[HolidayStore] = None,
+        start_hour: Optional[int] = None,
+        end_hour: Optional[int] = None,
+    ):
+        """
+        Initialize business calendar.
+
+        Args:
+            holiday_store: Source of holiday tables. Defaults to the singleton.
+            start_hour: Start of the business day. Defaults to config setting.
+            end_hour: End of the business day. Defaults to config setting.
+        """
+        settings = get_settings()
+        self.holiday_store = holiday_store or get_holiday_store()
+        self.start_hour = settings.business_hours_start if start_hour is None else start_hour
+        self.end_hour = settings.business_hours_end if end_hour is None else end_hour
+        # Intervals together with the holiday table they were built from
+        self._tables: Dict[Tuple[str, str, int], Tuple[Optional[HolidayTable], BusinessIntervals]] = {}
+        self._lock = threading.Lock()
+
+    def intervals(self, tz: ZoneInfo, country_code: str, year: int) -> BusinessIntervals:
+        """Business hours of a year in a timezone, built on first use."""
+        key = (tz.key, country_code.upper(), year)
+        entry = self._tables.get(key)
+        if entry is not None:
+            holiday_table, table = entry
+            # Offline holidays are only provisional: the store refetches them
+            # after RETRY_AFTER and then hands out a new table
+            if holiday_table is None or holiday_table.source != "seed" or \
+                    self.holiday_store.get(country_code, year) is holiday_table:
+                return table
+
+        holiday_table = self.holiday_store.get(country_code, year) if country_code else None
+        table = self._build(tz, year, holiday_table.dates if holiday_table else frozenset())
+        with self._lock:
+            if key not in self._tables and len(self._tables) >= self.MAX_TABLES:
+                # Drop the oldest table
+                del self._tables[next(iter(self._tables))]
+            self._tables[key] = (holiday_table, table)
+        return table
+
+    def _build(self, tz: ZoneInfo, year: int, holidays: FrozenSet[date]) -> BusinessIntervals:
+        starts, ends, before, through = [], [], [], []
+        total = 0.0
+        day = date(year, 1, 1)
+        while day.year == year:
+            if day.weekday() < 5 and day not in holidays:
+                start = datetime.combine(day, time(self.start_hour), tz).timestamp()
+                end = datetime.combine(day, time(self.end_hour), tz).timestamp()
+                starts.append(start)
+                ends.append(end)
+                before.append(total)
+                total += end - start
+                through.append(total)
+            day += timedelta(days=1)
+        next_year = datetime(year + 1, 1, 1, tzinfo=tz).timestamp()
+        return BusinessIntervals(starts, ends, before, through, next_year)
+
+    def add_business_hours(
+        self,
+        start: datetime,
+        hours: float,
+        timezone: str,
+        country_code: str = "",
+    ) -> datetime:
+        """
+        The moment `hours` business hours after `start`.
+
+        Args:
+            start: Timezone-aware start time (naive times are taken as UTC)
+            hours: Business hours to add
+            timezone: IANA timezone whose business day applies
+            country_code: Country whose public holidays are skipped (optional)
+
+        Returns:
+            Deadline as an aware datetime in `timezone`
+        """
+        tz = resolve_timezone(timezone)
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=dt_timezone.utc)
+        now = start.timestamp()
+        remaining = max(hours, 0) * 3600
+        if remaining == 0:
+            return start.astimezone(tz)
+
+        year = start.astimezone(tz).year
+        while True:
+            table = self.intervals(tz, country_code, year)
+            i = bisect_right(table.ends, now)  # First interval not over yet
+            if i < len(table.starts):
+                target = table.before[i] + max(now - table.starts[i], 0) + remaining
+                if target <= table.through[-1]:
+                    j = bisect_left(table.through, target)
+                    deadline = table.starts[j] + target - table.before[j]
+                    return datetime.fromtimestamp(deadline, tz)
+                remaining = target - table.through[-1]
+            # Continue with the following year
+            year += 1
+            now = table.next_year
+
+    def sla_info(
+        self,
+        priority: str,
+        timezone: str,
+        country_code: str = "",
+        created_at: Optional[datetime] = None,
+    ) -> dict:
+        """
+        SLA deadline of a ticket in business hours.
+
+        Args:
+            priority: Priority level ("P1", "P2", "P3", "P4")
+            timezone: Customer's timezone (e.g., "Europe/Budapest")
+            country_code: Two-letter country code for holidays (optional)
+            created_at: Ticket creation time (defaults to now)
+
+        Returns:
+            Dictionary with SLA deadline information
+        """
+        priority = priority.upper()
+        hours = PRIORITY_SLA_HOURS.get(priority, 24)
+        tz = resolve_timezone(timezone)
+        start = (created_at or datetime.now(dt_timezone.utc))
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=dt_timezone.utc)
+        deadline = self.add_business_hours(start, hours, tz.key, country_code)
+
+        holidays_in_range = []
+        if country_code:
+            first, last = start.astimezone(tz).date(), deadline.date()
+            for year in range(first.year, last.year + 1):
+                holidays_in_range += [
+                    h for h in self.holiday_store.get(country_code, year).holidays
+                    if first.isoformat() <= h["date"] <= last.isoformat()
+                    and date.fromisoformat(h["date"]).weekday() < 5
+                ]
+
+        return {
+            "priority": priority,
+            "priority_name": PRIORITY_NAMES.get(priority, "Unknown"),
+            "sla_hours": hours,
+            "deadline": deadline.strftime("%Y-%m-%d %H:%M"),
+            "deadline_local_format": deadline.strftime("%Y. %m. %d. %H:%M"),
+            "deadline_utc": deadline.astimezone(dt_timezone.utc).isoformat(),
+            "timezone": tz.key,
+            "business_hours": f"{self.start_hour:02d}:00-{self.end_hour:02d}:00",
+            "holidays_affecting": holidays_in_range,
+            "adjusted_for_holidays": len(holidays_in_range) > 0,
+        }
+
+    def sla_info_many(
+        self,
+        tickets: Iterable[Mapping[str, Union[str, datetime, None]]],
+        now: Optional[datetime] = None,
+    ) -> List[dict]:
+        """
+        SLA deadlines for a whole ticket queue.
+
+        Tickets of the same timezone and country share one interval table,
+        so each ticket costs two binary searches.
+
+        Args:
+            tickets: Mappings with "priority", "timezone", optional
+                "country_code" and "created_at" (datetime or ISO string)
+            now: Start time for tickets without "created_at" (defaults to now)
+
+        Returns:
+            One sla_info dictionary per ticket, in order
+        """
+        now = now or datetime.now(dt_timezone.utc)
+        results = []
+        for ticket in tickets:
+            created_at = ticket.get("created_at") or now
+            if isinstance(created_at, str):
+                created_at = datetime.fromisoformat(created_at)
+            results.append(self.sla_info(
+                priority=ticket.get("priority") or "P3",
+                timezone=ticket.get("timezone") or "UTC",
+                country_code=ticket.get("country_code") or "",
+                created_at=created_at,
+            ))
+        return results
+
+
+# Singleton instance
+_business_calendar: Optional[BusinessCalendar] = None
+
+
+def get_business_calendar() -> BusinessCalendar:
+    """Get or create the business calendar singleton."""
+    global _business_calendar
+    if _business_calendar is None:
+        _business_calendar = BusinessCalendar()
+    return _business_calendar
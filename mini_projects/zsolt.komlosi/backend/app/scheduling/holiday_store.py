@@ -0,0 +1,256 @@
+"""
+Public holiday tables per (country, year).
+
+Each table is fetched from Nager.Date at most once and persisted as JSON.
+Later lookups are served from memory or from disk. If the API cannot be
+reached, holidays computed offline for the supported countries are used,
+and the API is retried later.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+import requests
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# ISO 3166-1 alpha-2; the code is also part of the cache file name and the API URL
+COUNTRY_CODE_RE = re.compile(r"^[A-Z]{2}$")
+
+# Fixed-date national holidays: (month, day, name, local name)
+FIXED_HOLIDAYS: Dict[str, List[Tuple[int, int, str, str]]] = {
+    "HU": [
+        (1, 1, "New Year's Day", "Újév"),
+        (3, 15, "1848 Revolution Memorial Day", "Nemzeti ünnep"),
+        (5, 1, "Labour Day", "A munka ünnepe"),
+        (8, 20, "State Foundation Day", "Az államalapítás ünnepe"),
+        (10, 23, "1956 Revolution Memorial Day", "Nemzeti ünnep"),
+        (11, 1, "All Saints Day", "Mindenszentek"),
+        (12, 25, "Christmas Day", "Karácsony"),
+        (12, 26, "St. Stephen's Day", "Karácsony másnapja"),
+    ],
+    "DE": [
+        (1, 1, "New Year's Day", "Neujahr"),
+        (5, 1, "Labour Day", "Tag der Arbeit"),
+        (10, 3, "German Unity Day", "Tag der Deutschen Einheit"),
+        (12, 25, "Christmas Day", "Erster Weihnachtstag"),
+        (12, 26, "St. Stephen's Day", "Zweiter Weihnachtstag"),
+    ],
+    "AT": [
+        (1, 1, "New Year's Day", "Neujahr"),
+        (1, 6, "Epiphany", "Heilige Drei Könige"),
+        (5, 1, "National Holiday", "Staatsfeiertag"),
+        (8, 15, "Assumption Day", "Maria Himmelfahrt"),
+        (10, 26, "National Holiday", "Nationalfeiertag"),
+        (11, 1, "All Saints' Day", "Allerheiligen"),
+        (12, 8, "Immaculate Conception", "Mariä Empfängnis"),
+        (12, 25, "Christmas Day", "Christtag"),
+        (12, 26, "St. Stephen's Day", "Stefanitag"),
+    ],
+}
+
+# Holidays relative to Easter Sunday: (days, name, local name)
+EASTER_HOLIDAYS: Dict[str, List[Tuple[int, str, str]]] = {
+    "HU": [
+        (-2, "Good Friday", "Nagypéntek"),
+        (0, "Easter Sunday", "Húsvétvasárnap"),
+        (1, "Easter Monday", "Húsvéthétfő"),
+        (49, "Pentecost", "Pünkösdvasárnap"),
+        (50, "Whit Monday", "Pünkösdhétfő"),
+    ],
+    "DE": [
+        (-2, "Good Friday", "Karfreitag"),
+        (1, "Easter Monday", "Ostermontag"),
+        (39, "Ascension Day", "Christi Himmelfahrt"),
+        (50, "Whit Monday", "Pfingstmontag"),
+    ],
+    "AT": [
+        (1, "Easter Monday", "Ostermontag"),
+        (39, "Ascension Day", "Christi Himmelfahrt"),
+        (50, "Whit Monday", "Pfingstmontag"),
+        (60, "Corpus Christi", "Fronleichnam"),
+    ],
+}
+
+
+def easter_sunday(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous Gregorian algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def seed_holidays(country_code: str, year: int) -> List[dict]:
+    """Holidays computed offline; empty for unsupported countries."""
+    country_code = country_code.upper()
+    holidays = [
+        (date(year, month, day), name, local_name)
+        for month, day, name, local_name in FIXED_HOLIDAYS.get(country_code, [])
+    ]
+    easter = easter_sunday(year)
+    holidays += [
+        (easter + timedelta(days=offset), name, local_name)
+        for offset, name, local_name in EASTER_HOLIDAYS.get(country_code, [])
+    ]
+    return [
+        {"date": day.isoformat(), "name": name, "local_name": local_name}
+        for day, name, local_name in sorted(holidays)
+    ]
+
+
+class HolidayTable(NamedTuple):
+    """Holidays of a country in a year and where they came from."""
+
+    country_code: str
+    year: int
+    holidays: List[dict]
+    source: str  # "api", "disk" or "seed"
+
+    @property
+    def dates(self) -> FrozenSet[date]:
+        return frozenset(date.fromisoformat(h["date"]) for h in self.holidays)
+
+
+class HolidayStore:
+    """
+    Holiday tables, fetched once per (country, year) and kept on disk.
+    """
+
+    # Seconds before the API is tried again after a failed fetch
+    RETRY_AFTER = 3600
+
+    def __init__(self, cache_dir: Optional[str] = None, api_url: Optional[str] = None):
+        """
+        Initialize holiday store.
+
+        Args:
+            cache_dir: Directory for the JSON tables (None: memory only)
+            api_url: Nager.Date PublicHolidays endpoint. Defaults to config setting.
+        """
+        settings = get_settings()
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.api_url = api_url or settings.holidays_api_url
+        self._tables: Dict[Tuple[str, int], HolidayTable] = {}
+        self._retry_at: Dict[Tuple[str, int], float] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Tuple[str, int], threading.Lock] = {}
+
+    def get(self, country_code: str, year: int) -> HolidayTable:
+        """
+        Holiday table of a country, fetching it only if it is not stored yet.
+
+        Raises:
+            ValueError: If country_code is not a two-letter code
+        """
+        key = (country_code.upper(), year)
+        if not COUNTRY_CODE_RE.match(key[0]):
+            raise ValueError(f"Invalid country code: {country_code!r}")
+        table = self._tables.get(key)
+        if table is not None and (table.source != "seed" or time.monotonic() < self._retry_at[key]):
+            return table
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        # One fetch per key, even if many tickets ask at the same time
+        with key_lock:
+            table = self._tables.get(key)
+            if table is not None and (table.source != "seed" or time.monotonic() < self._retry_at[key]):
+                return table
+            table = self._load(*key) or self._fetch(*key)
+            if table is None:
+                logger.warning(f"Holiday API unavailable, using offline holidays for {key[0]} {key[1]}")
+                table = HolidayTable(key[0], key[1], seed_holidays(*key), "seed")
+                self._retry_at[key] = time.monotonic() + self.RETRY_AFTER
+            self._tables[key] = table
+            return table
+
+    def _path(self, country_code: str, year: int) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{country_code}-{year}.json"
+
+    def _load(self, country_code: str, year: int) -> Optional[HolidayTable]:
+        path = self._path(country_code, year)
+        if path is None or not path.exists():
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            holidays = data["holidays"]
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Ignoring unreadable holiday table {path}: {e}")
+            return None
+        if not data.get("national_only"):
+            # Written before regional holidays were filtered out: fetch again
+            return None
+        return HolidayTable(country_code, year, holidays, "disk")
+
+    def _fetch(self, country_code: str, year: int) -> Optional[HolidayTable]:
+        try:
+            response = requests.get(f"{self.api_url}/{year}/{country_code}", timeout=10)
+            if response.status_code == 404:
+                # Country not covered by the API: no holidays
+                data = []
+            else:
+                response.raise_for_status()
+                data = response.json()
+        except (requests.RequestException, ValueError) as e:
+            logger.error(f"Holiday query failed for {country_code} {year}: {e}")
+            return None
+
+        holidays = [
+            {
+                "date": h.get("date"),
+                "name": h.get("name"),
+                "local_name": h.get("localName", h.get("name")),
+            }
+            for h in data
+            # Regional holidays (e.g. German state holidays) are not national
+            # non-working days
+            if h.get("global", True)
+        ]
+        self._save(country_code, year, holidays)
+        return HolidayTable(country_code, year, holidays, "api")
+
+    def _save(self, country_code: str, year: int, holidays: List[dict]) -> None:
+        path = self._path(country_code, year)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"country_code": country_code, "year": year, "national_only": True,
+                           "holidays": holidays}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error(f"Could not store holiday table {path}: {e}")
+
+
+# Singleton instance
+_holiday_store: Optional[HolidayStore] = None
+
+
+def get_holiday_store() -> HolidayStore:
+    """Get or create the holiday store singleton."""
+    global _holiday_store
+    if _holiday_store is None:
+        _holiday_store = HolidayStore(cache_dir=get_settings().holidays_cache_dir)
+    return _holiday_store
@@ -2,12 +2,9 @@
 SLA calculation tools.
 """
 
-from datetime import datetime, timedelta
-
 from langchain_core.tools import tool
 
-from app.models import PRIORITY_SLA_HOURS, PRIORITY_NAMES
-from .holidays import get_holidays
+from app.scheduling import get_business_calendar
 
 
 @tool
@@ -18,7 +15,8 @@ def calculate_sla_deadline(
 ) -> dict:
     """
     Calculate SLA deadline based on priority and timezone.
-    Takes into account business hours (9:00-18:00) and holidays.
+    SLA hours are business hours (9:00-18:00 local time, Monday-Friday),
+    public holidays of the country are skipped.
 
     Args:
         timezone: Customer's timezone (e.g., "Europe/Budapest", "America/New_York")
@@ -28,38 +26,7 @@ def calculate_sla_deadline(
     Returns:
         Dictionary with SLA deadline information
     """
-    hours = PRIORITY_SLA_HOURS.get(priority.upper(), 24)
-    priority_name = PRIORITY_NAMES.get(priority.upper(), "Unknown")
-
-    # Current time
-    now = datetime.now()
-    deadline = now + timedelta(hours=hours)
-
-    # Check for holidays (if country code provided)
-    holidays_in_range = []
-    if country_code:
-        try:
-            holidays_result = get_holidays.invoke({
-                "country_code": country_code,
-                "year": now.year
-            })
-            if not holidays_result.get("error"):
-                for h in holidays_result.get("holidays", []):
-                    holiday_date = datetime.strptime(h["date"], "%Y-%m-%d").date()
-                    if now.date() <= holiday_date <= deadline.date():
-                        holidays_in_range.append(h)
-                        # If a holiday falls within the range, add 24 hours
-                        deadline += timedelta(hours=24)
-        except Exception:
-            pass  # If query fails, continue without it
-
-    return {
-        "priority": priority.upper(),
-        "priority_name": priority_name,
-        "sla_hours": hours,
-        "deadline": deadline.strftime("%Y-%m-%d %H:%M"),
-        "deadline_local_format": deadline.strftime("%Y. %m. %d. %H:%M"),
-        "timezone": timezone,
-        "holidays_affecting": holidays_in_range,
-        "adjusted_for_holidays": len(holidays_in_range) > 0,
-    }
+    try:
+        return get_business_calendar().sla_info(priority, timezone, country_code)
+    except ValueError as e:
+        return {"error": True, "message": str(e)}
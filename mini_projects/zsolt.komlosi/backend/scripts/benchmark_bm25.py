@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Benchmark: rank_bm25 rebuild-per-document vs. the incremental BM25Index.
+
+Ingests synthetic chunks document by document (like DocumentProcessor does),
+then measures query latency, deleting a document and a restart.
+The rebuild-per-document baseline is quadratic, so it only ingests the first
+--baseline-chunks chunks.
+
+Usage (from the backend directory):
+    python scripts/benchmark_bm25.py [--chunks 50000] [--baseline-chunks 5000]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from rank_bm25 import BM25Okapi
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.rag.bm25 import BM25Index
+
+
+def make_chunks(count: int, chunks_per_doc: int, words: int, vocab_size: int, seed: int = 42):
+    """Synthetic chunks with a Zipf-distributed vocabulary."""
+    rng = np.random.default_rng(seed)
+    vocab = np.array([f"term{i}" for i in range(vocab_size)])
+    ranks = np.minimum(rng.zipf(1.3, size=count * words), vocab_size) - 1
+    texts = [" ".join(row) for row in vocab[ranks].reshape(count, words)]
+    return [
+        {
+            "chunk_id": f"chunk-{i}",
+            "doc_id": f"DOC-{i // chunks_per_doc}",
+            "content_en": text,
+            "content_hu": "",
+            "title": f"Document {i // chunks_per_doc}",
+            "doc_type": "faq",
+            "keywords": [],
+        }
+        for i, text in enumerate(texts)
+    ]
+
+
+def make_queries(count: int, vocab_size: int, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    return [
+        " ".join(f"term{t}" for t in rng.integers(5, min(vocab_size, 2000), size=rng.integers(2, 6)))
+        for _ in range(count)
+    ]
+
+
+def documents(chunks, chunks_per_doc):
+    for start in range(0, len(chunks), chunks_per_doc):
+        yield chunks[start:start + chunks_per_doc]
+
+
+class RebuildingBM25:
+    """Previous BM25Index: BM25Okapi rebuilt after every add, full sort per query."""
+
+    def __init__(self):
+        self.documents, self.tokenized = [], []
+        self.bm25 = None
+
+    def add_documents(self, docs):
+        self.documents.extend(docs)
+        self.tokenized.extend(BM25Index()._document_tokens(d) for d in docs)
+        self.bm25 = BM25Okapi(self.tokenized)
+
+    def search(self, query, top_k):
+        scores = self.bm25.get_scores(BM25Index()._tokenize(query))
+        return sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:top_k]
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def median_ms(search, queries):
+    durations = []
+    for query in queries:
+        start = time.perf_counter()
+        search(query)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunks", type=int, default=50_000)
+    parser.add_argument("--baseline-chunks", type=int, default=5_000)
+    parser.add_argument("--chunks-per-doc", type=int, default=10)
+    parser.add_argument("--words", type=int, default=100, help="Words per chunk")
+    parser.add_argument("--vocab", type=int, default=30_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=20)
+    args = parser.parse_args()
+
+    chunks = make_chunks(args.chunks, args.chunks_per_doc, args.words, args.vocab)
+    queries = make_queries(args.queries, args.vocab)
+    baseline_chunks = chunks[:args.baseline_chunks]
+    print(f"{args.chunks:,} chunks ({args.chunks_per_doc} per document, {args.words} words), "
+          f"vocabulary {args.vocab:,}, top_k={args.top_k}\n")
+
+    # Baseline: rebuild per document
+    old = RebuildingBM25()
+    old_ingest, _ = timed(lambda: [old.add_documents(d) for d in documents(baseline_chunks, args.chunks_per_doc)])
+    old_query_small = median_ms(lambda q: old.search(q, args.top_k), queries)
+    full = RebuildingBM25()
+    old_rebuild, _ = timed(lambda: full.add_documents(chunks))
+    old_query = median_ms(lambda q: full.search(q, args.top_k), queries)
+    del old, full
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = BM25Index(index_dir=tmp)
+        new_ingest_small, _ = timed(
+            lambda: [index.add_documents(d) for d in documents(baseline_chunks, args.chunks_per_doc)]
+        )
+        new_ingest_rest, _ = timed(
+            lambda: [index.add_documents(d) for d in documents(chunks[len(baseline_chunks):], args.chunks_per_doc)]
+        )
+        new_query = median_ms(lambda q: index.search(q, args.top_k), queries)
+        new_delete, _ = timed(lambda: index.delete_by_doc_id("DOC-3"))
+        compact_time, _ = timed(index.compact)
+        expected = [r.chunk_id for r in index.search(queries[0], args.top_k)]
+
+        restart_load, restarted = timed(lambda: len(BM25Index(index_dir=tmp)))
+        reloaded = BM25Index(index_dir=tmp)
+        first_query, results = timed(lambda: reloaded.search(queries[0], args.top_k))
+        assert [r.chunk_id for r in results] == expected
+
+    rows = [
+        (f"Ingest first {len(baseline_chunks):,} chunks", f"{old_ingest:.1f} s", f"{new_ingest_small:.2f} s"),
+        (f"Ingest all {args.chunks:,} chunks", "quadratic, not run", f"{new_ingest_small + new_ingest_rest:.2f} s"),
+        ("Query (median)", f"{old_query:.1f} ms", f"{new_query:.2f} ms"),
+        ("Delete a document", f"{old_rebuild:.1f} s (rebuild)", f"{new_delete * 1000:.1f} ms"),
+        ("Compact", "-", f"{compact_time:.2f} s"),
+        ("Restart until first result", f"{old_rebuild:.1f} s (re-ingest)",
+         f"{(restart_load + first_query) * 1000:.0f} ms"),
+    ]
+    print(f"{'':<32}{'rebuild (before)':<26}incremental (after)")
+    for name, before, after in rows:
+        print(f"{name:<32}{before:<26}{after}")
+    print(f"\nQuery speed-up: {old_query / new_query:.0f}x "
+          f"(baseline on {len(baseline_chunks):,} chunks: {old_query_small:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
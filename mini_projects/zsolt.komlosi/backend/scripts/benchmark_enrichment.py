@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-chunk translation/keyword requests vs. batched, concurrent enrichment.
+
+Uses a simulated LLM (no API key needed): every request costs a fixed
+overhead plus generation time, per chunk translated (--per-chunk-ms) and per
+chunk's keywords (a fifth of that), so a batch request is slower than a
+single-chunk one. Embedding/storage is skipped.
+
+Usage (from the backend directory):
+    python scripts/benchmark_enrichment.py [--chunks 60] [--overhead-ms 400] [--per-chunk-ms 150]
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+from app.config import get_settings
+from app.models import Chunk
+from app.rag import document_processor
+from app.rag.enrichment import EnrichedChunk, EnrichmentBatch
+
+
+class SimulatedLLM:
+    def __init__(self, overhead: float, per_chunk: float):
+        self.overhead = overhead
+        self.per_chunk = per_chunk
+        self.requests = 0
+
+    def invoke(self, prompt):
+        self.requests += 1
+        chunks = re.findall(r"\[Chunk (\d+)\] Title: .*\n(.*)", prompt)
+        if chunks:
+            generation = 1.2 * len(chunks)  # Translation and keywords
+        else:
+            generation = 1.0 if prompt.startswith("Translate") else 0.2
+        time.sleep(self.overhead + self.per_chunk * generation)
+        if not chunks:
+            return SimpleNamespace(content="keyword one\nkeyword two")
+        return EnrichmentBatch(chunks=[
+            EnrichedChunk(index=int(i), translation=f"EN {text}", keywords=["keyword one"])
+            for i, text in chunks
+        ])
+
+
+class ListChunker:
+    def __init__(self, count: int):
+        self.count = count
+
+    def chunk_document(self, document):
+        return [
+            Chunk(
+                chunk_id=f"{document.doc_id}-chunk-{i:03d}", doc_id=document.doc_id,
+                content_hu=f"{i}. szakasz: a visszatérítési kérelmeket 14 napon belül bíráljuk el.",
+                content_en="", title=document.title, doc_type=document.doc_type,
+                chunk_index=i, start_char=0, end_char=0, token_count=0,
+            )
+            for i in range(self.count)
+        ]
+
+
+def make_processor(llm):
+    processor = document_processor.DocumentProcessor()
+    processor.vectorstore.add_chunks.side_effect = len
+    processor._llm = llm
+    processor._enrichment_llm = llm
+    return processor
+
+
+def before(processor, chunk_list):
+    """Previous process_document loop: two blocking requests per chunk."""
+    for chunk in chunk_list:
+        chunk.content_en = processor._translate_chunk(chunk.content_hu)
+        chunk.keywords = processor._extract_keywords_ai(chunk.content_en, chunk.title)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunks", type=int, default=60)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--overhead-ms", type=float, default=400, help="Fixed latency per request")
+    parser.add_argument("--per-chunk-ms", type=float, default=150, help="Generation time per chunk")
+    args = parser.parse_args()
+
+    document_processor.get_chunker = lambda: ListChunker(args.chunks)
+    for name in ("get_embedding_service", "get_vectorstore", "get_bm25_index"):
+        setattr(document_processor, name, MagicMock)
+    settings = get_settings()
+    settings.rag_enrichment_batch_size = args.batch_size
+    settings.rag_enrichment_concurrency = args.concurrency
+
+    print(f"{args.chunks} Hungarian chunks, {args.overhead_ms:.0f} ms per request + "
+          f"{args.per_chunk_ms:.0f} ms per chunk, batches of {args.batch_size}, "
+          f"{args.concurrency} requests in flight\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.rag_enrichment_cache_path = str(Path(tmp) / "cache.jsonl")
+        llm = SimulatedLLM(args.overhead_ms / 1000, args.per_chunk_ms / 1000)
+
+        processor = make_processor(llm)
+        start = time.perf_counter()
+        before(processor, processor.chunker.chunk_document(SimpleNamespace(doc_id="DOC-1", title="T", doc_type="faq")))
+        rows = [("before (2 requests per chunk)", time.perf_counter() - start, llm.requests)]
+
+        for name in ("after (batched, concurrent)", "after, re-ingest (cached)"):
+            llm.requests = 0
+            start = time.perf_counter()
+            make_processor(llm).process_document("", "T", "faq", doc_id="DOC-1")
+            rows.append((name, time.perf_counter() - start, llm.requests))
+
+    print(f"{'':<34}{'wall time':>10}{'requests':>10}")
+    for name, elapsed, requests in rows:
+        print(f"{name:<34}{elapsed:>9.2f}s{requests:>10}")
+    print(f"\nSpeed-up: {rows[0][1] / rows[1][1]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
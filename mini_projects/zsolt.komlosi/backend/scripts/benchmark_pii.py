@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark: one re.finditer pass per PII pattern vs. the single-pass scanner.
+
+Generates chat messages (about one in five contains PII) and reports
+throughput in MB/s for filter(), mask_for_logging(), filter_many() on the
+whole batch, and filter_stream() over one large document.
+
+Usage (from the backend directory):
+    python scripts/benchmark_pii.py [--messages 20000] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+from app.memory.pii_filter import PIIFilter
+from app.models import PIIMatch, PIIFilterResult
+
+
+class MultiPassPIIFilter:
+    """Previous PIIFilter.detect/filter: one finditer per pattern, then sort."""
+
+    def __init__(self):
+        self.patterns = PIIFilter.PATTERNS.copy()
+
+    def detect(self, text):
+        matches = []
+        for pii_type, (pattern, mask) in self.patterns.items():
+            for match in re.finditer(pattern, text, re.IGNORECASE):
+                matches.append(PIIMatch(
+                    type=pii_type if pii_type in ["email", "phone", "credit_card", "name", "address"] else "other",
+                    original=match.group(),
+                    masked=mask,
+                    start=match.start(),
+                    end=match.end(),
+                ))
+        matches.sort(key=lambda x: x.start)
+        return matches
+
+    def filter(self, text):
+        matches = self.detect(text)
+        if not matches:
+            return PIIFilterResult(original_text=text, filtered_text=text, matches=[], has_pii=False)
+        filtered_text = text
+        for match in reversed(matches):
+            filtered_text = filtered_text[:match.start] + match.masked + filtered_text[match.end:]
+        return PIIFilterResult(original_text=text, filtered_text=filtered_text, matches=matches, has_pii=True)
+
+    def mask_for_logging(self, text):
+        return self.filter(text).filtered_text
+
+
+SENTENCES = [
+    "Nem tudok bejelentkezni a fiókomba, a jelszó visszaállítás sem működik.",
+    "A számlán szereplő összeg nem egyezik a megrendelésemmel.",
+    "Mikor érkezik meg a visszatérítés? Már két hete várok rá.",
+    "The export to PDF fails with error code 500 since yesterday.",
+    "Kérem, hívjanak vissza a lehető leghamarabb, sürgős az ügy.",
+]
+PII = [
+    "kovacs.janos{n}@example.com",
+    "+36 30 {n:03d} 4567",
+    "4111-2222-3333-{n:04d}",
+    "12345678-1-{n:02d}",
+    "192.168.{n}.1",
+]
+
+
+def make_messages(count: int, seed: int = 42):
+    rng = random.Random(seed)
+    messages = []
+    for n in range(count):
+        words = [rng.choice(SENTENCES) for _ in range(rng.randint(1, 4))]
+        if rng.random() < 0.2:
+            words.insert(rng.randint(0, len(words)), rng.choice(PII).format(n=n % 100))
+        messages.append(" ".join(words))
+    return messages
+
+
+def throughput(func, megabytes: float, repeat: int) -> float:
+    best = min(timed(func) for _ in range(repeat))
+    return megabytes / best
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    messages = make_messages(args.messages)
+    document = "\n".join(messages)
+    lines = document.splitlines(keepends=True)
+    megabytes = len(document.encode("utf-8")) / 1e6
+    old, new = MultiPassPIIFilter(), PIIFilter()
+
+    # Same masked text wherever the old patterns did not overlap
+    clean = [m for m in messages if not any(p in m for p in ("+36", "4111"))]
+    assert [old.mask_for_logging(m) for m in clean] == [new.mask_for_logging(m) for m in clean]
+    assert "".join(new.filter_stream(lines)) == new.filter(document).filtered_text
+
+    print(f"{len(messages):,} messages, {megabytes:.1f} MB, "
+          f"{sum(r.has_pii for r in new.filter_many(messages)):,} with PII\n")
+    rows = [
+        ("filter() per message",
+         throughput(lambda: [old.filter(m) for m in messages], megabytes, args.repeat),
+         throughput(lambda: [new.filter(m) for m in messages], megabytes, args.repeat)),
+        ("mask_for_logging() per message",
+         throughput(lambda: [old.mask_for_logging(m) for m in messages], megabytes, args.repeat),
+         throughput(lambda: [new.mask_for_logging(m) for m in messages], megabytes, args.repeat)),
+        ("filter_many() on all messages",
+         None,
+         throughput(lambda: new.filter_many(messages), megabytes, args.repeat)),
+        ("one document, filter()",
+         throughput(lambda: old.filter(document), megabytes, args.repeat),
+         throughput(lambda: new.filter(document), megabytes, args.repeat)),
+        ("one document, filter_stream()",
+         None,
+         throughput(lambda: "".join(new.filter_stream(lines)), megabytes, args.repeat)),
+    ]
+    print(f"{'':<34}{'multi-pass (before)':>20}{'single-pass (after)':>21}")
+    for name, before, after in rows:
+        before_text = f"{before:.1f} MB/s" if before else "-"
+        print(f"{name:<34}{before_text:>20}{after:>16.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
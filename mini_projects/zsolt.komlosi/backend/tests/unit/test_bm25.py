@@ -0,0 +1,128 @@
+"""
+Unit tests for the incremental BM25 index.
+"""
+
+import pytest
+from rank_bm25 import BM25Okapi
+
+from app.rag import bm25
+from app.rag.bm25 import BM25Index
+
+
+def make_chunk(chunk_id: str, doc_id: str, content_en: str, **extra) -> dict:
+    return {
+        "chunk_id": chunk_id,
+        "doc_id": doc_id,
+        "content_en": content_en,
+        "content_hu": "",
+        "title": f"Title {doc_id}",
+        "doc_type": "faq",
+        **extra,
+    }
+
+
+CHUNKS = [
+    make_chunk("c1", "DOC-1", "How to reset your password in the account settings"),
+    make_chunk("c2", "DOC-1", "Password requirements: at least twelve characters"),
+    make_chunk("c3", "DOC-2", "Invoices are sent by email every month"),
+    make_chunk("c4", "DOC-2", "Refund requests are processed within fourteen days"),
+    make_chunk("c5", "DOC-3", "Login problems: clear cookies and try another browser",
+               keywords=["login", "cookies"]),
+]
+
+
+class TestBM25Index:
+    """Tests for BM25 search, deletes and compaction in memory."""
+
+    @pytest.fixture
+    def index(self):
+        index = BM25Index()
+        index.add_documents(CHUNKS[:3])
+        index.add_documents(CHUNKS[3:])
+        return index
+
+    def test_search_returns_best_match_first(self, index):
+        results = index.search("reset password", top_k=2)
+
+        assert [r.chunk_id for r in results] == ["c1", "c2"]
+        assert results[0].score == 1.0
+        assert 0 < results[1].score < 1.0
+        assert results[0].search_type == "bm25"
+        assert results[0].title == "Title DOC-1"
+
+    def test_ranking_matches_rank_bm25(self, index):
+        tokenized = [index._document_tokens(chunk) for chunk in CHUNKS]
+        reference = BM25Okapi(tokenized).get_scores(index._tokenize("password login cookies"))
+        expected = [CHUNKS[i]["chunk_id"] for i in reference.argsort()[::-1] if reference[i] > 0]
+
+        results = index.search("password login cookies", top_k=10)
+
+        assert [r.chunk_id for r in results] == expected
+
+    def test_keywords_are_searchable(self, index):
+        assert index.search("cookies", top_k=1)[0].chunk_id == "c5"
+
+    def test_delete_by_doc_id_hides_chunks(self, index):
+        assert index.delete_by_doc_id("DOC-1") == 2
+
+        assert len(index) == 3
+        assert index.search("password", top_k=5) == []
+        assert index.delete_documents(["c1", "c3"]) == 1
+
+    def test_readding_a_chunk_replaces_it(self, index):
+        index.add_documents([make_chunk("c3", "DOC-2", "Invoices can be downloaded as PDF")])
+
+        assert len(index) == 5
+        assert [r.chunk_id for r in index.search("invoices", top_k=5)] == ["c3"]
+        assert index.search("email", top_k=5) == []
+
+    def test_compaction_drops_deleted_chunks(self, index):
+        index.delete_by_doc_id("DOC-2")
+
+        index.compact()
+
+        assert index._doc_count == 3
+        assert not index._delta
+        # Same statistics as an index that never saw the deleted chunks
+        fresh = BM25Index()
+        fresh.add_documents([c for c in CHUNKS if c["doc_id"] != "DOC-2"])
+        compacted = [(r.chunk_id, r.score) for r in index.search("password login", top_k=5)]
+        assert compacted == [(r.chunk_id, r.score) for r in fresh.search("password login", top_k=5)]
+
+
+class TestBM25Persistence:
+    """Tests for the on-disk base segment and journal."""
+
+    def test_journal_is_replayed_after_restart(self, tmp_path):
+        index = BM25Index(index_dir=str(tmp_path))
+        index.add_documents(CHUNKS)
+        index.delete_documents(["c2"])
+
+        reloaded = BM25Index(index_dir=str(tmp_path))
+
+        assert len(reloaded) == 4
+        assert [r.chunk_id for r in reloaded.search("password", top_k=5)] == ["c1"]
+
+    def test_merged_segment_is_loaded_with_mmap(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(bm25, "MIN_MERGE_DOCS", 4)
+        index = BM25Index(index_dir=str(tmp_path))
+        index.add_documents(CHUNKS)  # 5 pending chunks trigger a merge
+        index.add_documents([make_chunk("c6", "DOC-4", "Password change by phone")])
+        expected = [(r.chunk_id, r.score) for r in index.search("password", top_k=5)]
+
+        reloaded = BM25Index(index_dir=str(tmp_path))
+        results = [(r.chunk_id, r.score) for r in reloaded.search("password", top_k=5)]
+
+        assert (tmp_path / "gen-1" / "postings_docs.npy").exists()
+        assert reloaded._base_doc_count == 5
+        assert results == expected
+        assert reloaded.search("phone", top_k=1)[0].content_en == "Password change by phone"
+
+    def test_clear_removes_files(self, tmp_path):
+        index = BM25Index(index_dir=str(tmp_path / "bm25"))
+        index.add_documents(CHUNKS)
+
+        index.clear()
+
+        assert not (tmp_path / "bm25").exists()
+        assert len(BM25Index(index_dir=str(tmp_path / "bm25"))) == 0
@@ -0,0 +1,184 @@
+"""
+Unit tests for the holiday store and the business-hour calendar.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+from zoneinfo import ZoneInfo
+
+import pytest
+import requests
+
+from app.scheduling.business_calendar import BusinessCalendar
+from app.scheduling.holiday_store import HolidayStore, easter_sunday
+
+BUDAPEST = ZoneInfo("Europe/Budapest")
+
+API_HOLIDAYS = [
+    {"date": "2025-12-25", "name": "Christmas Day", "localName": "Karácsony"},
+    {"date": "2025-12-26", "name": "St. Stephen's Day", "localName": "Karácsony másnapja"},
+]
+
+
+def api_response(data, status_code=200):
+    response = MagicMock(status_code=status_code)
+    response.json.return_value = data
+    return response
+
+
+class TestHolidayStore:
+    """Tests for fetching, persisting and seeding holiday tables."""
+
+    def test_table_is_fetched_once_and_persisted(self, tmp_path):
+        with patch("app.scheduling.holiday_store.requests.get",
+                   return_value=api_response(API_HOLIDAYS)) as get:
+            store = HolidayStore(cache_dir=str(tmp_path))
+            store.get("hu", 2025)
+            table = store.get("HU", 2025)
+
+        assert get.call_count == 1
+        assert table.source == "api"
+        assert table.holidays[0]["local_name"] == "Karácsony"
+
+        # A new store (after a restart) reads the file instead of the API
+        with patch("app.scheduling.holiday_store.requests.get") as get:
+            table = HolidayStore(cache_dir=str(tmp_path)).get("HU", 2025)
+
+        get.assert_not_called()
+        assert table.source == "disk"
+        assert len(table.holidays) == 2
+
+    def test_regional_holidays_are_skipped(self, tmp_path):
+        regional = {"date": "2025-10-31", "name": "Reformation Day", "localName": "Reformationstag",
+                    "global": False, "counties": ["DE-BB", "DE-SN"]}
+        national = {"date": "2025-10-03", "name": "German Unity Day", "localName": "Tag der Deutschen Einheit",
+                    "global": True, "counties": None}
+        with patch("app.scheduling.holiday_store.requests.get",
+                   return_value=api_response([national, regional])):
+            table = HolidayStore(cache_dir=str(tmp_path)).get("DE", 2025)
+
+        assert [h["date"] for h in table.holidays] == ["2025-10-03"]
+
+    def test_table_without_regional_filter_is_refetched(self, tmp_path):
+        (tmp_path / "HU-2025.json").write_text(
+            '{"country_code": "HU", "year": 2025, "holidays": [{"date": "2025-06-01"}]}', encoding="utf-8"
+        )
+        with patch("app.scheduling.holiday_store.requests.get",
+                   return_value=api_response(API_HOLIDAYS)) as get:
+            table = HolidayStore(cache_dir=str(tmp_path)).get("HU", 2025)
+
+        get.assert_called_once()
+        assert table.source == "api" and len(table.holidays) == 2
+
+    def test_offline_seed_when_api_fails(self, tmp_path):
+        with patch("app.scheduling.holiday_store.requests.get",
+                   side_effect=requests.ConnectionError("offline")):
+            table = HolidayStore(cache_dir=str(tmp_path)).get("HU", 2026)
+
+        assert table.source == "seed"
+        assert "2026-04-06" in {h["date"] for h in table.holidays}  # Easter Monday
+        assert not list(tmp_path.iterdir())
+
+    @pytest.mark.parametrize("country_code", ["../etc/passwd", "H", "HUN", "h/", ""])
+    def test_invalid_country_code_is_rejected(self, tmp_path, country_code):
+        with patch("app.scheduling.holiday_store.requests.get") as get:
+            with pytest.raises(ValueError):
+                HolidayStore(cache_dir=str(tmp_path)).get(country_code, 2025)
+
+        get.assert_not_called()
+        assert not list(tmp_path.iterdir())
+
+    def test_easter_sunday(self):
+        assert easter_sunday(2024).isoformat() == "2024-03-31"
+        assert easter_sunday(2025).isoformat() == "2025-04-20"
+
+
+class TestBusinessCalendar:
+    """Tests for business-hour deadline arithmetic."""
+
+    @pytest.fixture
+    def calendar(self):
+        store = HolidayStore()
+        with patch("app.scheduling.holiday_store.requests.get",
+                   side_effect=requests.ConnectionError("offline")):
+            yield BusinessCalendar(holiday_store=store, start_hour=9, end_hour=18)
+
+    def test_deadline_within_the_same_day(self, calendar):
+        start = datetime(2025, 10, 15, 10, 0, tzinfo=BUDAPEST)  # Wednesday
+
+        deadline = calendar.add_business_hours(start, 4, "Europe/Budapest", "HU")
+
+        assert deadline == datetime(2025, 10, 15, 14, 0, tzinfo=BUDAPEST)
+
+    def test_deadline_rolls_over_weekend_and_holiday(self, calendar):
+        # Wednesday 16:00, Thursday 23 October is a Hungarian holiday
+        start = datetime(2025, 10, 22, 16, 0, tzinfo=BUDAPEST)
+
+        deadline = calendar.add_business_hours(start, 8, "Europe/Budapest", "HU")
+
+        # 2 hours on Wednesday, 6 on Friday
+        assert deadline == datetime(2025, 10, 24, 15, 0, tzinfo=BUDAPEST)
+        assert calendar.add_business_hours(start, 13, "Europe/Budapest", "HU") == \
+            datetime(2025, 10, 27, 11, 0, tzinfo=BUDAPEST)
+
+    def test_deadline_outside_business_hours_starts_next_morning(self, calendar):
+        start = datetime(2025, 10, 17, 20, 30, tzinfo=BUDAPEST)  # Friday evening
+
+        deadline = calendar.add_business_hours(start, 9, "Europe/Budapest")
+
+        assert deadline == datetime(2025, 10, 20, 18, 0, tzinfo=BUDAPEST)
+
+    def test_deadline_crosses_year_end(self, calendar):
+        start = datetime(2025, 12, 31, 17, 0, tzinfo=BUDAPEST)
+
+        deadline = calendar.add_business_hours(start, 2, "Europe/Budapest", "HU")
+
+        assert deadline == datetime(2026, 1, 2, 10, 0, tzinfo=BUDAPEST)
+
+    def test_sla_info_reports_holidays(self, calendar):
+        created = datetime(2025, 10, 22, 14, 0, tzinfo=timezone.utc)  # 16:00 in Budapest
+
+        info = calendar.sla_info("p2", "Europe/Budapest", "HU", created_at=created)
+
+        assert info["priority"] == "P2"
+        assert info["deadline"] == "2025-10-24 15:00"
+        assert [h["date"] for h in info["holidays_affecting"]] == ["2025-10-23"]
+        assert info["adjusted_for_holidays"] is True
+
+    def test_batch_matches_single_calls(self, calendar):
+        now = datetime(2025, 3, 28, 12, 0, tzinfo=timezone.utc)
+        tickets = [
+            {"priority": "P1", "timezone": "Europe/Budapest", "country_code": "HU"},
+            {"priority": "P4", "timezone": "America/New_York", "created_at": "2025-03-07T15:00:00+00:00"},
+            {"priority": "P3", "timezone": "Not/AZone"},
+        ]
+
+        results = calendar.sla_info_many(tickets, now=now)
+
+        assert results[0] == calendar.sla_info("P1", "Europe/Budapest", "HU", created_at=now)
+        assert results[1]["deadline"] == calendar.sla_info(
+            "P4", "America/New_York", created_at=datetime.fromisoformat(tickets[1]["created_at"])
+        )["deadline"]
+        assert results[2]["timezone"] == "UTC"
+
+    def test_seed_table_is_rebuilt_after_api_refetch(self):
+        store = HolidayStore()
+        calendar = BusinessCalendar(holiday_store=store, start_hour=9, end_hour=18)
+        start = datetime(2025, 12, 24, 17, 0, tzinfo=BUDAPEST)  # Wednesday
+
+        with patch("app.scheduling.holiday_store.requests.get",
+                   side_effect=requests.ConnectionError("offline")):
+            # Seed: 25-26 December are holidays
+            assert calendar.add_business_hours(start, 2, "Europe/Budapest", "HU") == \
+                datetime(2025, 12, 29, 10, 0, tzinfo=BUDAPEST)
+
+        store._retry_at[("HU", 2025)] = 0  # Retry is due
+        with patch("app.scheduling.holiday_store.requests.get",
+                   return_value=api_response(API_HOLIDAYS[:1])) as get:
+            # The API only knows Christmas Day: Friday the 26th is a working day
+            deadline = calendar.add_business_hours(start, 2, "Europe/Budapest", "HU")
+            calendar.add_business_hours(start, 2, "Europe/Budapest", "HU")
+
+        assert deadline == datetime(2025, 12, 26, 10, 0, tzinfo=BUDAPEST)
+        assert get.call_count == 1
+
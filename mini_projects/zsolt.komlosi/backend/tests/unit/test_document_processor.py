@@ -0,0 +1,196 @@
+"""
+Unit tests for batched chunk enrichment in the document processor.
+"""
+
+import re
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.config import get_settings
+from app.models import Chunk
+from app.rag import document_processor
+from app.rag.document_processor import DocumentProcessor
+from app.rag.enrichment import EnrichedChunk, EnrichmentBatch, RateLimitGate
+
+
+class FakeChunker:
+    """Splits the content on blank lines."""
+
+    def chunk_document(self, document):
+        return [
+            Chunk(
+                chunk_id=f"{document.doc_id}-chunk-{i:03d}",
+                doc_id=document.doc_id,
+                content_hu=text,
+                content_en="",
+                title=document.title,
+                doc_type=document.doc_type,
+                chunk_index=i,
+                start_char=0,
+                end_char=len(text),
+                token_count=len(text.split()),
+            )
+            for i, text in enumerate(document.content.split("\n\n"))
+        ]
+
+
+class FakeEnrichmentLLM:
+    """Answers enrichment prompts, optionally leaving out some chunks."""
+
+    def __init__(self, skip=()):
+        self.prompts = []
+        self.skip = set(skip)
+        self._lock = threading.Lock()
+
+    def invoke(self, prompt):
+        with self._lock:
+            self.prompts.append(prompt)
+        chunks = re.findall(r"\[Chunk (\d+)\] Title: .*\n(.*)", prompt)
+        return EnrichmentBatch(chunks=[
+            EnrichedChunk(index=int(i), translation=f"EN {text}", keywords=[f"- {text.split()[0]}", "Refund"])
+            for i, text in chunks
+            if text not in self.skip
+        ])
+
+
+class FailingLLM:
+    def invoke(self, prompt):
+        raise RuntimeError("API error")
+
+
+class RateLimitedLLM:
+    """Per-chunk LLM that is rate limited on the first request."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, prompt):
+        self.calls += 1
+        if self.calls == 1:
+            raise RateLimitError()
+        return MagicMock(content="translated" if prompt.startswith("Translate") else "- alpha\n- beta")
+
+
+CONTENT = "\n\n".join(f"szakasz {i} fizetes" for i in range(5))
+
+
+@pytest.fixture
+def processor(monkeypatch, tmp_path):
+    monkeypatch.setattr(document_processor, "get_chunker", FakeChunker)
+    monkeypatch.setattr(document_processor, "get_embedding_service", MagicMock)
+    monkeypatch.setattr(document_processor, "get_vectorstore", MagicMock)
+    monkeypatch.setattr(document_processor, "get_bm25_index", MagicMock)
+    settings = get_settings()
+    monkeypatch.setattr(settings, "rag_enrichment_batch_size", 2)
+    monkeypatch.setattr(settings, "rag_enrichment_cache_path", str(tmp_path / "cache.jsonl"))
+
+    def make(llm):
+        processor = DocumentProcessor()
+        processor._enrichment_llm = llm
+        processor._llm = FailingLLM()  # Per-chunk fallback requests
+        processor.vectorstore.add_chunks.side_effect = len
+        return processor
+
+    return make
+
+
+class TestBatchedEnrichment:
+    """Tests for batching, caching and fallbacks."""
+
+    def test_chunks_are_enriched_in_batches(self, processor):
+        llm = FakeEnrichmentLLM()
+        proc = processor(llm)
+
+        info = proc.process_document(CONTENT, "Visszatérítés", "policy", doc_id="DOC-1")
+
+        assert info.chunks_count == 5
+        assert len(llm.prompts) == 3  # 5 chunks, 2 per request
+        batches = [call.args[0] for call in proc.vectorstore.add_chunks.call_args_list]
+        assert sorted(len(batch) for batch in batches) == [1, 2, 2]
+        chunks = sorted((c for batch in batches for c in batch), key=lambda c: c.chunk_index)
+        assert chunks[3].content_en == "EN szakasz 3 fizetes"
+        assert chunks[3].keywords == ["szakasz", "refund"]
+        assert proc.bm25_index.add_documents.call_count == 3
+
+    def test_reingesting_unchanged_document_uses_cache(self, processor):
+        processor(FakeEnrichmentLLM()).process_document(CONTENT, "Visszatérítés", "policy", doc_id="DOC-1")
+
+        # New processor, as after a restart: the cache file is reloaded
+        llm = FakeEnrichmentLLM()
+        proc = processor(llm)
+        info = proc.process_document(CONTENT, "Visszatérítés", "policy", doc_id="DOC-1")
+
+        assert llm.prompts == []
+        assert info.chunks_count == 5
+        chunks = proc.vectorstore.add_chunks.call_args.args[0]
+        assert chunks[0].content_en == "EN szakasz 0 fizetes"
+
+    def test_missing_chunk_falls_back_and_is_not_cached(self, processor):
+        proc = processor(FakeEnrichmentLLM(skip={"szakasz 1 fizetes"}))
+
+        proc.process_document(CONTENT, "Visszatérítés", "policy", doc_id="DOC-1")
+
+        chunks = {c.chunk_index: c for call in proc.vectorstore.add_chunks.call_args_list for c in call.args[0]}
+        # Translation fallback keeps the original, keywords fall back to word counts
+        assert chunks[1].content_en == "szakasz 1 fizetes"
+        assert chunks[1].keywords == ["szakasz", "fizetes"]
+        assert len(proc.enrichment_cache) == 4
+
+    def test_english_documents_only_get_keywords(self, processor):
+        llm = FakeEnrichmentLLM()
+        proc = processor(llm)
+
+        proc.process_document("password reset", "Login", "faq", language="en", doc_id="DOC-2")
+
+        chunk = proc.vectorstore.add_chunks.call_args.args[0][0]
+        assert chunk.content_en == "password reset"
+        assert chunk.keywords == ["password", "refund"]
+        assert "Leave the translation empty" in llm.prompts[0]
+
+    def test_per_chunk_fallback_goes_through_rate_limit_gate(self, processor):
+        proc = processor(FakeEnrichmentLLM(skip={"szakasz 0 fizetes"}))
+        proc._llm = RateLimitedLLM()
+        proc.rate_limit_gate = RateLimitGate(max_concurrency=1, base_delay=0.01)
+
+        proc.process_document("szakasz 0 fizetes", "Visszatérítés", "policy", doc_id="DOC-3")
+
+        chunk = proc.vectorstore.add_chunks.call_args.args[0][0]
+        # The rate limited translation was retried instead of falling back to the original
+        assert chunk.content_en == "translated"
+        assert chunk.keywords == ["alpha", "beta"]
+        assert proc._llm.calls == 3
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class TestRateLimitGate:
+    """Tests for the shared rate limit backoff."""
+
+    def test_rate_limited_calls_are_retried(self):
+        gate = RateLimitGate(max_concurrency=2, base_delay=0.01)
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise RateLimitError()
+            return "ok"
+
+        assert gate.call(flaky) == "ok"
+        assert len(attempts) == 3
+
+    def test_other_errors_are_raised(self):
+        gate = RateLimitGate(base_delay=0.01)
+
+        with pytest.raises(ValueError):
+            gate.call(lambda: (_ for _ in ()).throw(ValueError("bad")))
+
+    def test_gives_up_after_max_retries(self):
+        gate = RateLimitGate(max_retries=1, base_delay=0.01)
+
+        with pytest.raises(RateLimitError):
+            gate.call(lambda: (_ for _ in ()).throw(RateLimitError()))
@@ -93,3 +93,40 @@ class TestPIIFilter:
 
         ip_matches = [m for m in matches if m.masked == "[IP_ADDRESS]"]
         assert len(ip_matches) == 1
+
+    def test_overlapping_patterns_are_masked_once(self):
+        """Test that a phone number matching two patterns is masked once."""
+        pii_filter = PIIFilter()
+        text = "Hívj a +36 30 123 4567 számon."
+        result = pii_filter.filter(text)
+
+        assert [m.masked for m in result.matches] == ["[PHONE]"]
+        assert result.filtered_text == "Hívj a [PHONE] számon."
+        assert pii_filter.mask_for_logging(text) == result.filtered_text
+
+
+class TestPIIFilterBatchAndStream:
+    """Tests for the batch and streaming APIs."""
+
+    def test_filter_many_matches_filter(self, sample_pii_text):
+        """Test that a batch gives the same results as filtering one by one."""
+        pii_filter = PIIFilter()
+        texts = [sample_pii_text, "Nincs itt semmi.", "", "IP: 10.0.0.1, email: a@b.hu"]
+
+        results = pii_filter.filter_many(texts)
+
+        assert [r.model_dump() for r in results] == [pii_filter.filter(t).model_dump() for t in texts]
+
+    def test_stream_matches_whole_text(self, sample_pii_text, monkeypatch):
+        """Test that matches spanning chunk boundaries are found in streaming mode."""
+        from app.memory import pii_filter as module
+        monkeypatch.setattr(module, "STREAM_LOOKAHEAD", 40)
+        monkeypatch.setattr(module, "STREAM_BLOCK", 50)
+        pii_filter = PIIFilter()
+        text = sample_pii_text * 20
+        chunks = [text[i:i + 7] for i in range(0, len(text), 7)]
+
+        expected = pii_filter.filter(text)
+
+        assert "".join(pii_filter.filter_stream(chunks)) == expected.filtered_text
+        assert list(pii_filter.detect_stream(chunks)) == expected.matches
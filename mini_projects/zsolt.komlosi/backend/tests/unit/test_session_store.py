@@ -0,0 +1,95 @@
+"""
+Unit tests for the SQLite session store and its message window cache.
+"""
+
+import threading
+
+import pytest
+
+from app.memory.session_store import SessionStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SessionStore(db_path=str(tmp_path / "sessions.db"), window_size=5, cache_size=2)
+    yield store
+    store.close()
+
+
+def add_turns(store, session_id, count):
+    for i in range(count):
+        store.add_message(session_id, "user" if i % 2 == 0 else "assistant", f"message {i}")
+
+
+class TestSessionStore:
+    """Tests for windowed reads, write-through caching and connections."""
+
+    def test_recent_messages_in_chronological_order(self, store):
+        store.create_session("s1")
+        add_turns(store, "s1", 12)
+
+        assert [m.content for m in store.get_recent_messages("s1", 3)] == \
+            ["message 9", "message 10", "message 11"]
+        assert store.get_message_count("s1") == 12
+        # Larger than the cached window: read from the database
+        assert [m.content for m in store.get_recent_messages("s1", 8)] == \
+            [f"message {i}" for i in range(4, 12)]
+        assert len(store.get_session("s1").messages) == 12
+        assert len(store.get_session("s1", recent=2).messages) == 2
+
+    def test_cold_session_is_loaded_once(self, tmp_path):
+        db_path = str(tmp_path / "sessions.db")
+        writer = SessionStore(db_path=db_path, window_size=5)
+        writer.create_session("s1")
+        add_turns(writer, "s1", 20)
+
+        store = SessionStore(db_path=db_path, window_size=5)
+        assert [m.content for m in store.get_recent_messages("s1", 5)] == \
+            [f"message {i}" for i in range(15, 20)]
+
+        # Served from the cache without touching the database
+        queries = []
+        store._connection().set_trace_callback(queries.append)
+        store.get_recent_messages("s1", 4)
+        store.get_message_count("s1")
+        assert queries == []
+
+    def test_add_message_writes_through(self, store):
+        store.create_session("s1")
+        add_turns(store, "s1", 7)
+        store.update_summary("s1", "summary")
+
+        session = store.get_session("s1", recent=5)
+
+        assert [m.content for m in session.messages] == [f"message {i}" for i in range(2, 7)]
+        assert session.rolling_summary == "summary"
+        assert store.get_message_count("s1") == 7
+
+    def test_delete_session_removes_messages_and_cache(self, store):
+        store.create_session("s1")
+        add_turns(store, "s1", 3)
+
+        assert store.delete_session("s1") is True
+
+        assert store.get_session("s1") is None
+        assert store.get_recent_messages("s1", 3) == []
+        assert store._connection().execute("SELECT COUNT(*) FROM messages").fetchone()[0] == 0
+
+    def test_cache_keeps_most_recently_used_sessions(self, store):
+        for session_id in ("s1", "s2", "s3"):
+            store.create_session(session_id)
+        store.get_recent_messages("s2", 1)
+        store.get_recent_messages("s1", 1)
+
+        assert list(store._cache) == ["s2", "s1"]
+
+    def test_connection_is_reused_per_thread_in_wal_mode(self, store):
+        assert store._connection() is store._connection()
+        assert store._connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(store._connection()))
+        thread.start()
+        thread.join()
+
+        assert other[0] is not store._connection()